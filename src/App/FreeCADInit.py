@@ -83,6 +83,202 @@ def setupSearchPaths(PathExtension):
 FreeCAD._importFromFreeCAD = removeFromPath
 
 
+class InitManifest(object):
+	"""Cache of module discovery, stored between sessions.
+
+	For every module directory the top-level Python modules, the Init file
+	(compiled) and the lazy flag are kept. An entry is reused as long as the
+	modification times of the directory and of the Init file are unchanged.
+	"""
+
+	version = 1
+	lazyMarker = r'^#\s*FreeCAD:\s*lazy-init\s*$'
+
+	def __init__(self, filename):
+		self.filename = filename
+		self.modules = {}
+		self.dirLists = {}
+		self.changed = False
+		try:
+			with open(filename, 'rb') as f:
+				data = marshal.load(f)
+			if data.get('version') == (self.version, tuple(sys.version_info[:2])):
+				self.modules = data['modules']
+				self.dirLists = data['dirLists']
+		except Exception:
+			pass
+
+	@staticmethod
+	def _mtime(path):
+		try:
+			return os.stat(path).st_mtime
+		except OSError:
+			return None
+
+	def listDir(self, Dir):
+		"""listDir(Dir): os.listdir(), reused while the mtime of Dir is unchanged"""
+		mtime = self._mtime(Dir)
+		cached = self.dirLists.get(Dir)
+		if cached is not None and mtime is not None and cached[0] == mtime:
+			return list(cached[1])
+		entries = os.listdir(Dir)
+		self.dirLists[Dir] = (mtime, entries)
+		self.changed = True
+		return list(entries)
+
+	def moduleEntry(self, Dir, InitName):
+		"""moduleEntry(Dir, InitName): returns (InitFile or None, code, lazy, names).
+		names are the top-level Python modules and packages of the directory."""
+		InitFile = os.path.join(Dir, InitName)
+		dirTime = self._mtime(Dir)
+		initTime = self._mtime(InitFile)
+		cached = self.modules.get(Dir)
+		# an Init.py that failed to compile is read again, to report the error again
+		if cached is not None and cached[0] == dirTime and cached[1] == initTime \
+				and (cached[2] is not None or initTime is None):
+			return (InitFile if initTime is not None else None,) + tuple(cached[2:])
+
+		names = []
+		try:
+			for entry in os.listdir(Dir):
+				name, ext = os.path.splitext(entry)
+				if ext == '.py' and name not in ('Init', 'InitGui', 'init', 'init_gui'):
+					names.append(name)
+				elif ext == '' and os.path.exists(os.path.join(Dir, entry, '__init__.py')):
+					names.append(entry)
+		except OSError:
+			pass
+		code = None
+		lazy = False
+		if initTime is not None:
+			try:
+				with open(InitFile, 'rb') as f:
+					source = f.read().decode('utf-8')
+				code = compile(source, InitFile, 'exec')
+			except Exception as inst:
+				Log('Init:      Initializing ' + Dir + '... failed\n')
+				Log('-'*100+'\n')
+				Log(traceback.format_exc())
+				Log('-'*100+'\n')
+				Err('During initialization the error "' + str(inst) + '" occurred in ' + InitFile + '\n')
+				Err('Please look into the log file for further information\n')
+			else:
+				lazy = re.search(self.lazyMarker, source, re.MULTILINE) is not None
+		self.modules[Dir] = (dirTime, initTime, code, lazy, names)
+		self.changed = True
+		return (InitFile if initTime is not None else None, code, lazy, names)
+
+	def save(self):
+		if not self.changed:
+			return
+		try:
+			with open(self.filename, 'wb') as f:
+				marshal.dump({'version': (self.version, tuple(sys.version_info[:2])),
+							  'modules': self.modules,
+							  'dirLists': self.dirLists}, f)
+		except Exception as e:
+			Log('Init: Writing module manifest ' + self.filename + ' failed: ' + str(e) + '\n')
+
+
+class LazyInitFinder(object):
+	"""Runs the deferred Init of a module directory right after one of its
+	top-level Python modules or packages is imported for the first time.
+	It is installed into sys.meta_path and available as FreeCAD.__LazyInit__.
+	"""
+
+	def __init__(self):
+		self.pending = {} # module name -> key of deferred Init
+		self.inits = {}   # key -> function running the Init
+
+	def add(self, key, names, init):
+		self.inits[key] = init
+		for name in names:
+			self.pending.setdefault(name, key)
+
+	def run(self, key):
+		"""run(key): runs a deferred Init, if not yet done"""
+		init = self.inits.pop(key, None)
+		if init is None:
+			return
+		for name in [n for n, k in self.pending.items() if k == key]:
+			del self.pending[name]
+		init()
+
+	def runAll(self):
+		"""runAll(): runs all deferred Init files"""
+		for key in list(self.inits.keys()):
+			self.run(key)
+
+	def find_spec(self, fullname, path=None, target=None):
+		key = self.pending.get(fullname)
+		if key is None:
+			return None
+		import importlib.machinery
+		spec = importlib.machinery.PathFinder.find_spec(fullname, path)
+		if spec is None or spec.loader is None or not hasattr(spec.loader, 'exec_module'):
+			self.run(key)
+			return spec
+		loader = spec.loader
+		finder = self
+		class DeferredInitLoader(object):
+			def create_module(self, spec):
+				return loader.create_module(spec)
+			def exec_module(self, module):
+				spec.loader = loader
+				module.__loader__ = loader
+				loader.exec_module(module)
+				finder.run(key)
+		spec.loader = DeferredInitLoader()
+		return spec
+
+
+def runInitFile(InitFile, code, Dir):
+	"""runInitFile(InitFile, code, Dir): executes a module's Init.py and logs the time it took"""
+	start = time.time()
+	try:
+		# XXX: This looks scary securitywise...
+		exec(code, globals(), {'Dir': Dir, 'InstallFile': InitFile})
+	except Exception as inst:
+		Log('Init:      Initializing ' + Dir + '... failed\n')
+		Log('-'*100+'\n')
+		Log(traceback.format_exc())
+		Log('-'*100+'\n')
+		Err('During initialization the error "' + str(inst) + '" occurred in ' + InitFile + '\n')
+		Err('Please look into the log file for further information\n')
+	else:
+		Log('Init:      Initializing ' + Dir + '... done\n')
+	InitTimes.append((time.time() - start, Dir))
+	FreeCAD.Logger('Init').log('{} initialized in {:.1f} ms', Dir, 1000.0 * InitTimes[-1][0])
+
+InitTimes = [] # (seconds, module) of executed Init files
+
+
+def initExtensionModule(freecad_module_name, has_init):
+	"""initExtensionModule(freecad_module_name, has_init): imports a freecad.* extension
+	module and its init module. Returns False if the import failed."""
+	import importlib
+	start = time.time()
+	try:
+		importlib.import_module(freecad_module_name)
+		if has_init:
+			importlib.import_module(freecad_module_name + '.init')
+			Log('Init: Initializing ' + freecad_module_name + '... done\n')
+		else:
+			Log('Init: No init module found in ' + freecad_module_name + ', skipping\n')
+	except Exception as inst:
+		Err('During initialization the error "' + str(inst) + '" occurred in ' + freecad_module_name + '\n')
+		Err('-'*80+'\n')
+		Err(traceback.format_exc())
+		Err('-'*80+'\n')
+		Log('Init:      Initializing ' + freecad_module_name + '... failed\n')
+		Log('-'*80+'\n')
+		Log(traceback.format_exc())
+		Log('-'*80+'\n')
+		return False
+	InitTimes.append((time.time() - start, freecad_module_name))
+	FreeCAD.Logger('Init').log('{} initialized in {:.1f} ms', freecad_module_name, 1000.0 * InitTimes[-1][0])
+	return True
+
 def InitApplications():
 	# Checking on FreeCAD module path ++++++++++++++++++++++++++++++++++++++++++
 	ModDir = FreeCAD.getHomePath()+'Mod'
@@ -121,21 +317,38 @@ def InitApplications():
 
 
 
+	# Module discovery is cached in a manifest, Init files of lazy modules
+	# are deferred until the first import of the module, see LazyInitFinder.
+	# A module is lazy if its Init file contains the line "# FreeCAD: lazy-init"
+	# or if it is listed in the LazyInitModules parameter (separated by ";").
+	# The time of every Init is logged with the tag 'Init', to see it use
+	# FreeCAD.setLogLevel('Init', 'Log') and restart.
+	Manifest = InitManifest(os.path.join(FreeCAD.getUserAppDataDir(), "InitManifest.cache"))
+	LazyInit = LazyInitFinder()
+	LazyModules = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/General").GetString("LazyInitModules")
+	LazyModules = set([i.strip().lower() for i in LazyModules.split(";") if i.strip()])
+	# the import hook needs Python 3
+	UseLazyInit = sys.version_info.major >= 3
+	if UseLazyInit:
+		sys.meta_path.insert(0, LazyInit)
+	FreeCAD.__LazyInit__ = LazyInit
+	InitStart = time.time()
+
 	# Searching for module dirs +++++++++++++++++++++++++++++++++++++++++++++++++++
 	# Use dict to handle duplicated module names
 	ModDict = {}
 	if os.path.isdir(ModDir):
-		ModDirs = os.listdir(ModDir)
+		ModDirs = Manifest.listDir(ModDir)
 		for i in ModDirs: ModDict[i.lower()] = os.path.join(ModDir,i)
 	else:
 		Wrn ("No modules found in " + ModDir + "\n")
 	# Search for additional modules in the home directory
 	if os.path.isdir(HomeMod):
-		HomeMods = os.listdir(HomeMod)
+		HomeMods = Manifest.listDir(HomeMod)
 		for i in HomeMods: ModDict[i.lower()] = os.path.join(HomeMod,i)
 	# Search for additional modules in the macro directory
 	if os.path.isdir(MacroMod):
-		MacroMods = os.listdir(MacroMod)
+		MacroMods = Manifest.listDir(MacroMod)
 		for i in MacroMods:
 			key = i.lower()
 			if key not in ModDict: ModDict[key] = os.path.join(MacroMod,i)
@@ -169,57 +382,51 @@ def InitApplications():
 		if ((Dir != '') & (Dir != 'CVS') & (Dir != '__init__.py')):
 			sys.path.insert(0,Dir)
 			PathExtension.append(Dir)
-			InstallFile = os.path.join(Dir,"Init.py")
-			if (os.path.exists(InstallFile)):
-				try:
-					# XXX: This looks scary securitywise...
-					if sys.version_info.major < 3:
-						with open(InstallFile) as f:
-							exec(f.read())
-					else:
-						with open(file=InstallFile, encoding="utf-8") as f:
-							exec(f.read())
-				except Exception as inst:
-					Log('Init:      Initializing ' + Dir + '... failed\n')
-					Log('-'*100+'\n')
-					Log(traceback.format_exc())
-					Log('-'*100+'\n')
-					Err('During initialization the error "' + str(inst) + '" occurred in ' + InstallFile + '\n')
-					Err('Please look into the log file for further information\n')
+			InstallFile, code, lazy, names = Manifest.moduleEntry(Dir, "Init.py")
+			if InstallFile and code is None:
+				pass # the error was reported when reading the file
+			elif InstallFile:
+				if UseLazyInit and (lazy or os.path.basename(Dir).lower() in LazyModules) and names:
+					LazyInit.add(Dir, names, lambda f=InstallFile, c=code, d=Dir: runInitFile(f, c, d))
+					Log('Init:      Initializing ' + Dir + '... deferred until first import\n')
 				else:
-					Log('Init:      Initializing ' + Dir + '... done\n')
+					runInitFile(InstallFile, code, Dir)
 			else:
 				Log('Init:      Initializing ' + Dir + '(Init.py not found)... ignore\n')
 
 	extension_modules = []
 
 	try:
-		import pkgutil
-		import importlib
 		import freecad
-		for _, freecad_module_name, freecad_module_ispkg in pkgutil.iter_modules(freecad.__path__, "freecad."):
-			if freecad_module_ispkg:
+		seen = set()
+		for freecad_path in freecad.__path__:
+			if not os.path.isdir(freecad_path):
+				continue
+			for entry in sorted(Manifest.listDir(freecad_path)):
+				freecad_module_dir = os.path.join(freecad_path, entry)
+				if entry in seen or not os.path.exists(os.path.join(freecad_module_dir, '__init__.py')):
+					continue
+				seen.add(entry)
+				freecad_module_name = 'freecad.' + entry
 				Log('Init: Initializing ' + freecad_module_name + '\n')
-				try:
-					freecad_module = importlib.import_module(freecad_module_name)
+				init_file, init_code, lazy, names = Manifest.moduleEntry(freecad_module_dir, "init.py")
+				if UseLazyInit and (lazy or entry.lower() in LazyModules):
 					extension_modules += [freecad_module_name]
-					if any (module_name == 'init' for _, module_name, ispkg in pkgutil.iter_modules(freecad_module.__path__)):
-						importlib.import_module(freecad_module_name + '.init')
-						Log('Init: Initializing ' + freecad_module_name + '... done\n')
-					else:
-						Log('Init: No init module found in ' + freecad_module_name + ', skipping\n')
-				except Exception as inst:
-					Err('During initialization the error "' + str(inst) + '" occurred in ' + freecad_module_name + '\n')
-					Err('-'*80+'\n')
-					Err(traceback.format_exc())
-					Err('-'*80+'\n')
-					Log('Init:      Initializing ' + freecad_module_name + '... failed\n')
-					Log('-'*80+'\n')
-					Log(traceback.format_exc())
-					Log('-'*80+'\n')
+					LazyInit.add(freecad_module_name, [freecad_module_name],
+								 lambda n=freecad_module_name, h=init_file is not None: initExtensionModule(n, h))
+					Log('Init: Initializing ' + freecad_module_name + '... deferred until first import\n')
+				else:
+					if initExtensionModule(freecad_module_name, init_file is not None):
+						extension_modules += [freecad_module_name]
 	except ImportError as inst:
 		Err('During initialization the error "' + str(inst) + '" occurred\n')
 
+	Manifest.save()
+	InitTimes.sort(reverse=True)
+	FreeCAD.Logger('Init').log('{} modules initialized in {:.1f} ms, slowest: {}',
+		len(InitTimes), 1000.0 * (time.time() - InitStart),
+		', '.join(['{} ({:.1f} ms)'.format(os.path.basename(m), 1000.0 * t) for t, m in InitTimes[:5]]))
+
 	Log("Using "+ModDir+" as module path!\n")
 	# In certain cases the PathExtension list can contain invalid strings. We concatenate them to a single string
 	# but check that the output is a valid string
@@ -254,7 +461,7 @@ App.__unit_test__ = []
 Log ('Init: starting App::FreeCADInit.py\n')
 
 try:
-    import sys,os,traceback,inspect
+    import sys,os,traceback,inspect,re,marshal,time
     from datetime import datetime
 except ImportError:
     FreeCAD.Console.PrintError("\n\nSeems the python standard libs are not installed, bailing out!\n\n")
@@ -263,7 +470,6 @@ except ImportError:
 # Backward compatibility to Py2
 import sys
 if sys.version_info.major < 3:
-    import time
     time.process_time = time.clock
 
 class FCADLogger(object):
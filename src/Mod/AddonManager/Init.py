@@ -2,3 +2,5 @@
 # FreeCAD init script of the AddonManager module
 # (c) 2001 Juergen Riegel
 # License LGPL
+
+FreeCAD.__unit_test__ += ["TestAddonManagerApp"]
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+#***************************************************************************
+#*                                                                         *
+#*   Copyright (c) 2026 FreeCAD developers                                 *
+#*                                                                         *
+#*   This program is free software; you can redistribute it and/or modify  *
+#*   it under the terms of the GNU Lesser General Public License (LGPL)    *
+#*   as published by the Free Software Foundation; either version 2 of     *
+#*   the License, or (at your option) any later version.                   *
+#*   for detail see the LICENCE text file.                                 *
+#*                                                                         *
+#*   This program is distributed in the hope that it will be useful,       *
+#*   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+#*   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+#*   GNU Library General Public License for more details.                  *
+#*                                                                         *
+#*   You should have received a copy of the GNU Library General Public     *
+#*   License along with this program; if not, write to the Free Software   *
+#*   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+#*   USA                                                                   *
+#*                                                                         *
+#***************************************************************************
+
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+
+import addonmanager_fetch
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    "serves server.pages, with ETag revalidation, and counts the requests"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            time.sleep(server.delay)
+            if self.path not in server.pages:
+                server.count("404")
+                self.send_error(404)
+                return
+            data = server.pages[self.path]
+            etag = '"%d"' % hash(data)
+            if self.headers.get("If-None-Match") == etag:
+                server.count("304")
+                self.send_response(304)
+                self.end_headers()
+                return
+            server.count("200")
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+class StandInServer(ThreadingMixIn, HTTPServer):
+    "a local http server standing in for the addon hosts"
+
+    daemon_threads = True
+
+    def __init__(self, pages, delay=0.0):
+        HTTPServer.__init__(self, ("127.0.0.1", 0), StandInHandler)
+        self.pages = pages
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.counts = {}
+        self.thread = threading.Thread(target=self.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def count(self, status):
+        with self.lock:
+            self.counts[status] = self.counts.get(status, 0) + 1
+
+    def url(self, path):
+        return "http://127.0.0.1:%d%s" % (self.server_address[1], path)
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class TestAddonManagerFetch(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = addonmanager_fetch.HttpCache(self.cache_dir)
+        self.pages = {"/README.md": b"# Readme", "/.gitmodules": b"[submodule]"}
+        self.server = StandInServer(self.pages)
+
+    def tearDown(self):
+        self.server.stop()
+        shutil.rmtree(self.cache_dir)
+
+    def test_revalidation(self):
+        fetcher = addonmanager_fetch.Fetcher(cache=self.cache)
+        url = self.server.url("/README.md")
+        self.assertEqual(fetcher.fetch(url), b"# Readme")
+        self.assertEqual(fetcher.fetch(url), b"# Readme")
+        self.assertEqual(self.server.counts, {"200": 1, "304": 1})
+
+        # the cache persists between sessions
+        fetcher = addonmanager_fetch.Fetcher(cache=addonmanager_fetch.HttpCache(self.cache_dir))
+        self.assertEqual(fetcher.fetch(url), b"# Readme")
+        self.assertEqual(self.server.counts, {"200": 1, "304": 2})
+
+        # changed data is downloaded again
+        self.pages["/README.md"] = b"# New readme"
+        self.assertEqual(fetcher.fetch(url), b"# New readme")
+        self.assertEqual(self.server.counts, {"200": 2, "304": 2})
+
+        self.assertEqual(fetcher.fetch(self.server.url("/missing")), None)
+
+    def test_offline(self):
+        fetcher = addonmanager_fetch.Fetcher(cache=self.cache, timeout=1)
+        url = self.server.url("/.gitmodules")
+        self.assertEqual(fetcher.fetch(url), b"[submodule]")
+        self.server.stop()
+        self.server = StandInServer(self.pages)
+        # the first server is gone, cached data is used
+        self.assertEqual(fetcher.fetch(url), b"[submodule]")
+        self.assertEqual(fetcher.fetch(self.server.url("/unknown")), None)
+
+    def test_fetch_all(self):
+        self.server.stop()
+        pages = {"/icon%d.svg" % i: b"<svg/>" for i in range(12)}
+        self.server = StandInServer(pages, delay=0.2)
+        urls = [self.server.url(path) for path in sorted(pages)]
+        fetcher = addonmanager_fetch.Fetcher(connections=4, cache=self.cache)
+        data = fetcher.fetch_all(urls)
+        self.assertEqual(sorted(data), sorted(urls))
+        self.assertTrue(all(d == b"<svg/>" for d in data.values()))
+        # the pool is bounded, but requests do overlap
+        self.assertLessEqual(self.server.max_active, 4)
+        self.assertGreater(self.server.max_active, 1)
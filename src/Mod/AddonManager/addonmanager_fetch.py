@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+#***************************************************************************
+#*                                                                         *
+#*   Copyright (c) 2026 FreeCAD developers                                 *
+#*                                                                         *
+#*   This program is free software; you can redistribute it and/or modify  *
+#*   it under the terms of the GNU Lesser General Public License (LGPL)    *
+#*   as published by the Free Software Foundation; either version 2 of     *
+#*   the License, or (at your option) any later version.                   *
+#*   for detail see the LICENCE text file.                                 *
+#*                                                                         *
+#*   This program is distributed in the hope that it will be useful,       *
+#*   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+#*   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+#*   GNU Library General Public License for more details.                  *
+#*                                                                         *
+#*   You should have received a copy of the GNU Library General Public     *
+#*   License along with this program; if not, write to the Free Software   *
+#*   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+#*   USA                                                                   *
+#*                                                                         *
+#***************************************************************************
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+import urllib.request as urllib2
+from urllib.error import HTTPError
+from concurrent.futures import ThreadPoolExecutor
+
+import FreeCAD
+
+# check for SSL support
+
+ssl_ctx = None
+try:
+    import ssl
+except ImportError:
+    pass
+else:
+    try:
+        ssl_ctx = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+    except AttributeError:
+        pass
+
+
+#  @package AddonManager_fetch
+#  \ingroup ADDONMANAGER
+#  \brief Concurrent and cached http downloads for the addon manager
+#  @{
+
+
+def build_opener():
+    "returns an url opener set up with the proxy settings of the addon manager"
+
+    pref = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Addons")
+    proxies = {}
+    if not pref.GetBool("NoProxyCheck", True):
+        if pref.GetBool("SystemProxyCheck", False):
+            proxy = urllib2.getproxies()
+            proxies = {"http": proxy.get('http'), "https": proxy.get('http')}
+        elif pref.GetBool("UserProxyCheck", False):
+            proxy = pref.GetString("ProxyUrl", "")
+            proxies = {"http": proxy, "https": proxy}
+
+    if ssl_ctx:
+        handlers = [urllib2.HTTPSHandler(context=ssl_ctx)]
+    else:
+        handlers = []
+    return urllib2.build_opener(urllib2.ProxyHandler(proxies), *handlers)
+
+
+class HttpCache:
+    """An on-disk cache of downloaded urls
+
+    The data of each url is stored in its own file, the index keeps the
+    ETag and Last-Modified headers the server sent with it, so the next
+    request can be a conditional one, answered by 304 Not Modified.
+    """
+
+    def __init__(self, cache_dir=None):
+
+        if cache_dir is None:
+            cache_dir = os.path.join(FreeCAD.getUserAppDataDir(), "AddonManager", "Cache")
+        self.cache_dir = cache_dir
+        self.index_file = os.path.join(cache_dir, "index.json")
+        self.lock = threading.Lock()
+        self.index = {}
+        if os.path.exists(self.index_file):
+            try:
+                with open(self.index_file, "r") as f:
+                    self.index = json.load(f)
+            except (OSError, ValueError):
+                FreeCAD.Console.PrintWarning("AddonManager: Unable to read the download cache index\n")
+
+    def lookup(self, url):
+        "returns the cached data of url and its index entry, or (None, None)"
+
+        with self.lock:
+            entry = self.index.get(url)
+        if entry:
+            try:
+                with open(os.path.join(self.cache_dir, entry["file"]), "rb") as f:
+                    return f.read(), entry
+            except OSError:
+                pass
+        return None, None
+
+    def store(self, url, data, headers):
+        "stores the data of url, together with its validators from the response headers"
+
+        name = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        entry = {"file": name,
+                 "etag": headers.get("ETag"),
+                 "last_modified": headers.get("Last-Modified"),
+                 "time": time.time()}
+        with self.lock:
+            try:
+                if not os.path.isdir(self.cache_dir):
+                    os.makedirs(self.cache_dir)
+                with open(os.path.join(self.cache_dir, name), "wb") as f:
+                    f.write(data)
+            except OSError:
+                return
+            self.index[url] = entry
+            self.save()
+
+    def touch(self, url):
+        "marks the cached data of url as just revalidated"
+
+        with self.lock:
+            if url in self.index:
+                self.index[url]["time"] = time.time()
+                self.save()
+
+    def save(self):
+        "writes the index, the lock must be held"
+
+        try:
+            with open(self.index_file, "w") as f:
+                json.dump(self.index, f)
+        except OSError:
+            pass
+
+    def clear(self):
+        "removes all cached data"
+
+        with self.lock:
+            for entry in self.index.values():
+                try:
+                    os.remove(os.path.join(self.cache_dir, entry["file"]))
+                except OSError:
+                    pass
+            self.index = {}
+            self.save()
+
+
+class Fetcher:
+    """Downloads urls on a bounded pool of connections
+
+    Every download goes through the HttpCache: a cached url is revalidated
+    with If-None-Match/If-Modified-Since and only downloaded again if it
+    changed. Cached data is also returned when the server can't be reached.
+    """
+
+    def __init__(self, connections=None, cache=None, timeout=5):
+
+        pref = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Addons")
+        if connections is None:
+            connections = pref.GetInt("FetchConnections", 8)
+        if cache is None and pref.GetBool("FetchCache", True):
+            cache = get_cache()
+        self.connections = max(1, connections)
+        self.cache = cache
+        self.timeout = timeout
+        # seconds during which cached data is used without asking the server
+        self.max_age = pref.GetInt("FetchCacheMaxAge", 0)
+        self.opener = build_opener()
+
+    def fetch(self, url):
+        "returns the data of url as bytes, or None if it could not be retrieved"
+
+        if not url:
+            return None
+        cached, entry = None, None
+        if self.cache:
+            cached, entry = self.cache.lookup(url)
+            if entry and self.max_age > 0 and time.time() - entry["time"] < self.max_age:
+                return cached
+        headers = {'User-Agent': "Magic Browser"}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        req = urllib2.Request(url, headers=headers)
+        try:
+            u = self.opener.open(req, timeout=self.timeout)
+            data = u.read()
+            u.close()
+        except HTTPError as e:
+            if e.code == 304 and entry:
+                self.cache.touch(url)
+                return cached
+            return None
+        except Exception:
+            # offline, use what we have
+            return cached
+        if self.cache:
+            self.cache.store(url, data, u.headers)
+        return data
+
+    def fetch_text(self, url):
+        "returns the data of url decoded as utf-8 text, or None"
+
+        data = self.fetch(url)
+        if data is None:
+            return None
+        return data.decode("utf-8", errors="replace")
+
+    def fetch_all(self, urls):
+        "downloads all urls concurrently, returns a dict url: data (None on failure)"
+
+        return dict(zip(urls, self.map(self.fetch, urls)))
+
+    def map(self, function, items):
+        "returns the list of function(item) for all items, run on the pool"
+
+        items = list(items)
+        if len(items) < 2 or self.connections == 1:
+            return [function(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.connections, len(items))) as pool:
+            return list(pool.map(function, items))
+
+
+_cache = None
+
+
+def get_cache():
+    "returns the download cache shared by all fetchers"
+
+    global _cache
+    if _cache is None:
+        _cache = HttpCache()
+    return _cache
+
+#  @}
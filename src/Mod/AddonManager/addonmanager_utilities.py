@@ -42,18 +42,7 @@ from PySide import QtGui, QtCore
 import FreeCAD
 import FreeCADGui
 
-# check for SSL support
-
-ssl_ctx = None
-try:
-    import ssl
-except ImportError:
-    pass
-else:
-    try:
-        ssl_ctx = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-    except AttributeError:
-        pass
+import addonmanager_fetch
 
 
 #  @package AddonManager_utilities
@@ -101,23 +90,7 @@ def urlopen(url):
     timeout = 5
 
     # Proxy an ssl configuration
-    pref = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Addons")
-    if pref.GetBool("NoProxyCheck", True):
-        proxies = {}
-    else:
-        if pref.GetBool("SystemProxyCheck", False):
-            proxy = urllib2.getproxies()
-            proxies = {"http": proxy.get('http'), "https": proxy.get('http')}
-        elif pref.GetBool("UserProxyCheck", False):
-            proxy = pref.GetString("ProxyUrl", "")
-            proxies = {"http": proxy, "https": proxy}
-
-    if ssl_ctx:
-        handler = urllib2.HTTPSHandler(context=ssl_ctx)
-    else:
-        handler = {}
-    proxy_support = urllib2.ProxyHandler(proxies)
-    opener = urllib2.build_opener(proxy_support, handler)
+    opener = addonmanager_fetch.build_opener()
     urllib2.install_opener(opener)
 
     # Url opening
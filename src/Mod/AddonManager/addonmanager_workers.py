@@ -34,6 +34,7 @@ if FreeCAD.GuiUp:
     import FreeCADGui
 
 import addonmanager_utilities as utils
+import addonmanager_fetch as fetch
 from addonmanager_utilities import translate  # this needs to be as is for pylupdate
 from addonmanager_macro import Macro
 
@@ -105,10 +106,11 @@ class UpdateWorker(QtCore.QThread):
 
         # update info lists
         global obsolete, macros_blacklist, py2only
-        u = utils.urlopen("https://raw.githubusercontent.com/FreeCAD/FreeCAD-addons/master/addonflags.json")
-        if u:
-            p = u.read()
-            u.close()
+        flagsurl = "https://raw.githubusercontent.com/FreeCAD/FreeCAD-addons/master/addonflags.json"
+        modulesurl = "https://raw.githubusercontent.com/FreeCAD/FreeCAD-addons/master/.gitmodules"
+        data = fetch.Fetcher().fetch_all([flagsurl, modulesurl])
+        p = data[flagsurl]
+        if p:
             j = json.loads(p)
             if "obsolete" in j and "Mod" in j["obsolete"]:
                 obsolete = j["obsolete"]["Mod"]
@@ -121,16 +123,13 @@ class UpdateWorker(QtCore.QThread):
         else:
             print("Debug: addon_flags.json not found")
 
-        u = utils.urlopen("https://raw.githubusercontent.com/FreeCAD/FreeCAD-addons/master/.gitmodules")
-        if not u:
+        p = data[modulesurl]
+        if not p:
             self.progressbar_show.emit(False)
             self.done.emit()
             self.stop = True
             return
-        p = u.read()
-        if sys.version_info.major >= 3 and isinstance(p, bytes):
-            p = p.decode("utf-8")
-        u.close()
+        p = p.decode("utf-8")
         p = re.findall((r'(?m)\[submodule\s*"(?P<name>.*)"\]\s*'
                         r"path\s*=\s*(?P<path>.+)\s*"
                         r"url\s*=\s*(?P<url>https?://.*)"), p)
@@ -186,16 +185,13 @@ class InfoWorker(QtCore.QThread):
     def run(self):
 
         i = 0
+        pages = fetch.Fetcher().fetch_all([repo[1] for repo in self.repos])
         for repo in self.repos:
-            url = repo[1]
-            u = utils.urlopen(url)
-            if not u:
+            p = pages[repo[1]]
+            if p is None:
                 self.stop = True
                 return
-            p = u.read()
-            if sys.version_info.major >= 3 and isinstance(p, bytes):
-                p = p.decode("utf-8")
-            u.close()
+            p = p.decode("utf-8")
             desc = re.findall('<meta property="og:description" content="(.*?)"', p)
             if desc:
                 desc = desc[0]
@@ -227,6 +223,7 @@ class CheckWBWorker(QtCore.QThread):
         basedir = FreeCAD.getUserAppDataDir()
         moddir = basedir + os.sep + "Mod"
         upds = []
+        tocheck = []
         gitpython_warning = False
         for repo in self.repos:
             if repo[2] == 1:  # installed
@@ -235,6 +232,7 @@ class CheckWBWorker(QtCore.QThread):
                 if os.path.exists(clonedir):
                     # mark as already installed AND already checked for updates
                     self.repos[self.repos.index(repo)][2] = 2
+                    tocheck.append((self.repos.index(repo), clonedir))
                     if not os.path.exists(clonedir + os.sep + ".git"):
                         # Repair addon installed with raw download
                         bare_repo = git.Repo.clone_from(repo[1], clonedir + os.sep + ".git", bare=True)
@@ -252,17 +250,24 @@ class CheckWBWorker(QtCore.QThread):
                             del cw
                         repo = git.Repo(clonedir)
                         repo.head.reset("--hard")
-                    gitrepo = git.Git(clonedir)
-                    try:
-                        gitrepo.fetch()
-                    except Exception:
-                        print("AddonManager: Unable to fetch git updates for repo", repo[0])
-                    else:
-                        if "git pull" in gitrepo.status():
-                            self.mark.emit(repo[0])
-                            upds.append(repo[0])
-                            # mark as already installed AND already checked for updates AND update available
-                            self.repos[self.repos.index(repo)][2] = 3
+
+        # the remotes are fetched concurrently, each fetch is a separate git process
+        def check(item):
+            idx, clonedir = item
+            gitrepo = git.Git(clonedir)
+            try:
+                gitrepo.fetch()
+            except Exception:
+                print("AddonManager: Unable to fetch git updates for repo", self.repos[idx][0])
+                return False
+            return "git pull" in gitrepo.status()
+
+        for (idx, clonedir), upd in zip(tocheck, fetch.Fetcher(cache=False).map(check, tocheck)):
+            if upd:
+                self.mark.emit(self.repos[idx][0])
+                upds.append(self.repos[idx][0])
+                # mark as already installed AND already checked for updates AND update available
+                self.repos[idx][2] = 3
         self.addon_repos.emit(self.repos)
         self.enable.emit(len(upds))
         self.stop = True
@@ -381,7 +386,6 @@ class ShowWorker(QtCore.QThread):
         if len(self.repos[self.idx]) == 4:
             desc = self.repos[self.idx][3]
         else:
-            u = None
             url = self.repos[self.idx][1]
             self.info_label.emit(translate("AddonsInstaller", "Retrieving info from") + " " + str(url))
             desc = ""
@@ -389,59 +393,44 @@ class ShowWorker(QtCore.QThread):
             if regex:
                 # extract readme from html via regex
                 readmeurl = utils.get_readme_html_url(url)
-                if not readmeurl:
-                    print("Debug: README not found for", url)
-                u = utils.urlopen(readmeurl)
-                if not u:
-                    print("Debug: README not found at", readmeurl)
-                u = utils.urlopen(readmeurl)
-                if u:
-                    p = u.read()
-                    if sys.version_info.major >= 3 and isinstance(p, bytes):
-                        p = p.decode("utf-8")
-                    u.close()
-                    readme = re.findall(regex, p, flags=re.MULTILINE | re.DOTALL)
-                    if readme:
-                        desc = readme[0]
-                else:
-                    print("Debug: README not found at", readmeurl)
             else:
                 # convert raw markdown using lib
                 readmeurl = utils.get_readme_url(url)
-                if not readmeurl:
-                    print("Debug: README not found for", url)
-                u = utils.urlopen(readmeurl)
-                if u:
-                    p = u.read()
-                    if sys.version_info.major >= 3 and isinstance(p, bytes):
-                        p = p.decode("utf-8")
-                    u.close()
-                    desc = utils.fix_relative_links(p, readmeurl.rsplit("/README.md")[0])
-                    if not NOMARKDOWN and have_markdown:
-                        desc = markdown.markdown(desc, extensions=["md_in_html"])
-                    else:
-                        message = """
+            if not readmeurl:
+                print("Debug: README not found for", url)
+            # the repository page is the fallback for the description, both are fetched at once
+            pages = fetch.Fetcher().fetch_all([readmeurl, url])
+            p = pages[readmeurl]
+            if p is None:
+                print("Debug: README not found at", readmeurl)
+            elif regex:
+                p = p.decode("utf-8")
+                readme = re.findall(regex, p, flags=re.MULTILINE | re.DOTALL)
+                if readme:
+                    desc = readme[0]
+            else:
+                p = p.decode("utf-8")
+                desc = utils.fix_relative_links(p, readmeurl.rsplit("/README.md")[0])
+                if not NOMARKDOWN and have_markdown:
+                    desc = markdown.markdown(desc, extensions=["md_in_html"])
+                else:
+                    message = """
 <div style="width: 100%; text-align:center;background: #91bbe0;">
     <strong style="color: #FFFFFF;">
 """
-                        message += translate("AddonsInstaller", "Raw markdown displayed")
-                        message += "</strong><br/><br/>"
-                        message += translate("AddonsInstaller", "Python Markdown library is missing.")
-                        message += "<br/></div><hr/><pre>" + desc + "</pre>"
-                        desc = message
-                else:
-                    print("Debug: README not found at", readmeurl)
+                    message += translate("AddonsInstaller", "Raw markdown displayed")
+                    message += "</strong><br/><br/>"
+                    message += translate("AddonsInstaller", "Python Markdown library is missing.")
+                    message += "<br/></div><hr/><pre>" + desc + "</pre>"
+                    desc = message
             if desc == "":
                 # fall back to the description text
-                u = utils.urlopen(url)
-                if not u:
+                p = pages[url]
+                if p is None:
                     self.progressbar_show.emit(False)
                     self.stop = True
                     return
-                p = u.read()
-                if sys.version_info.major >= 3 and isinstance(p, bytes):
-                    p = p.decode("utf-8")
-                u.close()
+                p = p.decode("utf-8")
                 descregex = utils.get_desc_regex(url)
                 if descregex:
                     desc = re.findall(descregex, p)
@@ -584,9 +573,8 @@ class ShowWorker(QtCore.QThread):
             store = os.path.join(FreeCAD.getUserAppDataDir(), "AddonManager", "Images")
             if not os.path.exists(store):
                 os.makedirs(store)
+            todownload = []
             for path in imagepaths:
-                if not self.mustLoadImages:
-                    return None
                 origpath = path
                 if "?" in path:
                     # remove everything after the ?
@@ -599,31 +587,37 @@ class ShowWorker(QtCore.QThread):
                     if len(storename) >= 260:
                         remainChars = 259 - (len(store) + len(wbName) + 1)
                         storename = os.path.join(store, wbName+name[-remainChars:])
-                    if not os.path.exists(storename):
+                    todownload.append((origpath, path, storename))
+            if not self.mustLoadImages:
+                return None
+            # all missing images are downloaded at once
+            images = fetch.Fetcher().fetch_all([path for origpath, path, storename in todownload
+                                                if not os.path.exists(storename)])
+            for origpath, path, storename in todownload:
+                if not self.mustLoadImages:
+                    return None
+                if path in images:
+                    imagedata = images[path]
+                    if imagedata is None:
+                        print("AddonManager: Debug: Error retrieving image from", path)
+                    else:
                         try:
-                            u = utils.urlopen(path)
-                            imagedata = u.read()
-                            u.close()
-                        except Exception:
-                            print("AddonManager: Debug: Error retrieving image from", path)
-                        else:
-                            try:
-                                f = open(storename, "wb")
-                            except OSError:
-                                # ecryptfs (and probably not only ecryptfs) has lower length limit for path
-                                storename = storename[-140:]
-                                f = open(storename, "wb")
-                            f.write(imagedata)
-                            f.close()
-                            # resize the image to 300x300px if needed
-                            img = QtGui.QImage(storename)
-                            if (img.width() > 300) or (img.height() > 300):
-                                pix = QtGui.QPixmap()
-                                pix = pix.fromImage(img.scaled(300, 300,
-                                                               QtCore.Qt.KeepAspectRatio,
-                                                               QtCore.Qt.FastTransformation))
-                                pix.save(storename, "jpeg", 100)
-                    message = message.replace("src=\""+origpath, "src=\"file:///"+storename.replace("\\", "/"))
+                            f = open(storename, "wb")
+                        except OSError:
+                            # ecryptfs (and probably not only ecryptfs) has lower length limit for path
+                            storename = storename[-140:]
+                            f = open(storename, "wb")
+                        f.write(imagedata)
+                        f.close()
+                        # resize the image to 300x300px if needed
+                        img = QtGui.QImage(storename)
+                        if (img.width() > 300) or (img.height() > 300):
+                            pix = QtGui.QPixmap()
+                            pix = pix.fromImage(img.scaled(300, 300,
+                                                           QtCore.Qt.KeepAspectRatio,
+                                                           QtCore.Qt.FastTransformation))
+                            pix.save(storename, "jpeg", 100)
+                message = message.replace("src=\""+origpath, "src=\"file:///"+storename.replace("\\", "/"))
             # print(message)
             return message
         return None
@@ -158,6 +158,257 @@ def removeFromComponent(compobject,subobject):
 
 
 
+areaCache = {} # { hashCode: (shape,(verticalArea,horizontalArea,perimeterLength)) }
+areaCacheMax = 256
+
+
+def getTrianglesUnion(triangles,tolerance=1e-6):
+    """Compute the area and outer perimeter of the union of 2D triangles.
+
+    Each edge of each triangle is clipped against the triangles around it,
+    which are found through a spatial grid shaped after the triangles.
+    The parts of the edge lying inside another triangle, or on an edge shared
+    with a triangle on its other side, are removed. The remaining segments form
+    the boundary of the union, which gives its area. Once joined into loops, the
+    counter-clockwise loops are outer boundaries, the others are holes.
+
+    Parameters
+    ----------
+    triangles: list of tuples
+        The triangles, as ((x,y),(x,y),(x,y)) tuples, in any orientation.
+    tolerance: float, optional
+        The distance under which points are considered coincident.
+
+    Returns
+    -------
+    tuple of floats
+        The area of the union and the length of its outer boundaries.
+    """
+
+    import math
+
+    # orient all triangles counter-clockwise, drop the flat ones
+    tris = []
+    areas = []
+    for a,b,c in triangles:
+        d = (b[0]-a[0])*(c[1]-a[1])-(b[1]-a[1])*(c[0]-a[0])
+        if d > tolerance:
+            tris.append((a,b,c))
+        elif d < -tolerance:
+            tris.append((a,c,b))
+        else:
+            continue
+        areas.append(abs(d)/2.0)
+    if not tris:
+        return 0.0,0.0
+
+    # an edge shared with a triangle on its other side is inside the union, these
+    # are the inner edges of the tessellation of each face
+    edges = set()
+    for t in tris:
+        for i in range(3):
+            edges.add((t[i],t[(i+1)%3]))
+
+    # spatial grid of the triangles. The cells have the shape of the bounding box
+    # of the median triangle, at most a few times its area, and a triangle is only
+    # registered in the cells it overlaps, so that long thin triangles, as in fans
+    # or strips, don't fill the cells around them
+    boxes = [(min(a[0],b[0],c[0]),min(a[1],b[1],c[1]),max(a[0],b[0],c[0]),max(a[1],b[1],c[1])) for a,b,c in tris]
+    xmin = min([box[0] for box in boxes])
+    ymin = min([box[1] for box in boxes])
+    xmax = max([box[2] for box in boxes])
+    ymax = max([box[3] for box in boxes])
+    median = len(tris)//2
+    sx = max(sorted([box[2]-box[0] for box in boxes])[median],tolerance)
+    sy = max(sorted([box[3]-box[1] for box in boxes])[median],tolerance)
+    scale = math.sqrt(4*sorted(areas)[median]/(sx*sy))
+    if scale < 1:
+        sx,sy = sx*scale,sy*scale
+    scale = math.sqrt(max(xmax-xmin,tolerance)*max(ymax-ymin,tolerance)/(16*len(tris)*sx*sy))
+    if scale > 1:
+        sx,sy = sx*scale,sy*scale
+    # offset by half a cell, so the vertices of regular meshes are not on the borders
+    xmin,ymin = xmin-sx/2,ymin-sy/2
+    def cells(points,box):
+        # the cells crossed by a triangle or a segment
+        i0,i1 = int(math.floor((box[0]-tolerance-xmin)/sx)),int(math.floor((box[2]+tolerance-xmin)/sx))
+        j0,j1 = int(math.floor((box[1]-tolerance-ymin)/sy)),int(math.floor((box[3]+tolerance-ymin)/sy))
+        if (i1-i0+1)*(j1-j0+1) <= 4:
+            return [(i,j) for i in range(i0,i1+1) for j in range(j0,j1+1)]
+        # otherwise row by row
+        result = []
+        for j in range(j0,j1+1):
+            lo,hi = ymin+j*sy-tolerance,ymin+(j+1)*sy+tolerance
+            xs = []
+            for k in range(len(points)):
+                a,b = points[k-1],points[k]
+                if lo <= a[1] <= hi:
+                    xs.append(a[0])
+                for y in (lo,hi):
+                    if (a[1]-y)*(b[1]-y) < 0:
+                        xs.append(a[0]+(y-a[1])*(b[0]-a[0])/(b[1]-a[1]))
+            if xs:
+                for i in range(int(math.floor((min(xs)-tolerance-xmin)/sx)),int(math.floor((max(xs)+tolerance-xmin)/sx))+1):
+                    result.append((i,j))
+        return result
+    grid = {}
+    lines = []
+    for k,t in enumerate(tris):
+        for cell in cells(t,boxes[k]):
+            grid.setdefault(cell,[]).append(k)
+        # the edges of the triangle as points and unit directions
+        line = []
+        for j in range(3):
+            a,b = t[j],t[(j+1)%3]
+            el = math.hypot(b[0]-a[0],b[1]-a[1])
+            line.append((a[0],a[1],(b[0]-a[0])/el,(b[1]-a[1])/el))
+        lines.append(line)
+
+    # clip the edges
+    area = 0.0
+    segments = []
+    for k,t in enumerate(tris):
+        for i in range(3):
+            p,q = t[i],t[(i+1)%3]
+            if (q,p) in edges:
+                continue
+            dx,dy = q[0]-p[0],q[1]-p[1]
+            length = math.hypot(dx,dy)
+            if length < tolerance:
+                continue
+            x0,y0,x1,y1 = min(p[0],q[0]),min(p[1],q[1]),max(p[0],q[0]),max(p[1],q[1])
+            candidates = set()
+            for cell in cells((p,q),(x0,y0,x1,y1)):
+                candidates.update(grid.get(cell,[]))
+            candidates.discard(k)
+            removed = []
+            for n in candidates:
+                box = boxes[n]
+                if (box[0] > x1+tolerance) or (box[1] > y1+tolerance) or (box[2] < x0-tolerance) or (box[3] < y0-tolerance):
+                    continue
+                lo,hi = 0.0,1.0
+                opposite = None
+                for ax,ay,ux,uy in lines[n]:
+                    # signed distances of p and q to the edge line, positive inside
+                    sp = ux*(p[1]-ay)-uy*(p[0]-ax)
+                    sq = ux*(q[1]-ay)-uy*(q[0]-ax)
+                    if (abs(sp) <= tolerance) and (abs(sq) <= tolerance):
+                        opposite = (ux*dx+uy*dy) < 0
+                    elif (sp <= tolerance) and (sq <= tolerance):
+                        lo,hi = 1.0,0.0
+                        break
+                    elif sp <= tolerance:
+                        lo = max(lo,-sp/(sq-sp))
+                    elif sq <= tolerance:
+                        hi = min(hi,sp/(sp-sq))
+                if (hi-lo)*length <= tolerance:
+                    continue
+                # an edge lying on an edge of the other triangle is removed if the
+                # triangles are on both sides of it, or if it is a duplicate
+                if (opposite is None) or opposite or (n < k):
+                    removed.append((lo,hi))
+            removed.sort()
+            start = 0.0
+            pieces = []
+            for lo,hi in removed:
+                if lo > start:
+                    pieces.append((start,lo))
+                start = max(start,hi)
+            if start < 1.0:
+                pieces.append((start,1.0))
+            for lo,hi in pieces:
+                if (hi-lo)*length > tolerance:
+                    a = (p[0]+lo*dx,p[1]+lo*dy)
+                    b = (p[0]+hi*dx,p[1]+hi*dy)
+                    area += (a[0]*b[1]-b[0]*a[1])/2.0
+                    segments.append((a,b))
+
+    # join the segments into loops
+    snap = 10*tolerance
+    points = {}
+    parent = []
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+    def index(pt):
+        cx,cy = int(math.floor(pt[0]/snap)),int(math.floor(pt[1]/snap))
+        for cell in [(cx+i,cy+j) for i in (-1,0,1) for j in (-1,0,1)]:
+            for other,n in points.get(cell,[]):
+                if (abs(other[0]-pt[0]) <= snap) and (abs(other[1]-pt[1]) <= snap):
+                    return n
+        parent.append(len(parent))
+        points.setdefault((cx,cy),[]).append((pt,parent[-1]))
+        return parent[-1]
+    starts = []
+    for a,b in segments:
+        i,j = index(a),index(b)
+        starts.append(i)
+        parent[find(i)] = find(j)
+    loops = {}
+    for (a,b),i in zip(segments,starts):
+        loop = loops.setdefault(find(i),[0.0,0.0])
+        loop[0] += a[0]*b[1]-b[0]*a[1]
+        loop[1] += math.hypot(b[0]-a[0],b[1]-a[1])
+    perimeter = sum([length for signedarea,length in loops.values() if signedarea > 0])
+    return area,perimeter
+
+
+def getShapeAreas(shape):
+    """Compute the vertical area, horizontal area and perimeter of a shape.
+
+    The vertical area is the area of the faces perpendicular to the ground.
+    The faces turned upwards are tessellated and their triangles projected
+    on the XY plane. The horizontal area and perimeter length are the area
+    and outer perimeter of the union of these triangles.
+
+    The results are cached by shape, so unchanged shapes are not computed
+    again.
+
+    Parameters
+    ----------
+    shape: <Part.Shape>
+        The shape to compute the areas of.
+
+    Returns
+    -------
+    tuple of floats or None
+        The vertical area, the horizontal area and the perimeter length, or
+        None if the faces of the shape can't be evaluated.
+    """
+
+    import Part
+    key = shape.hashCode()
+    if key in areaCache:
+        cached,result = areaCache[key]
+        if cached.isSame(shape):
+            return result
+
+    up = FreeCAD.Vector(0,0,1)
+    deflection = max(shape.BoundBox.DiagonalLength*0.0001,0.01)
+    verticalArea = 0
+    triangles = []
+    for f in shape.Faces:
+        try:
+            ang = f.normalAt(0,0).getAngle(up)
+            if (ang > 1.57) and (ang < 1.571):
+                verticalArea += f.Area
+            if ang < 1.5707:
+                points,tris = f.tessellate(deflection)
+                points = [(p.x,p.y) for p in points]
+                triangles.extend([(points[a],points[b],points[c]) for a,b,c in tris])
+        except Part.OCCError:
+            return None
+    horizontalArea,perimeterLength = getTrianglesUnion(triangles,10**(-Draft.precision()))
+
+    if len(areaCache) >= areaCacheMax:
+        areaCache.clear()
+    result = (verticalArea,horizontalArea,perimeterLength)
+    areaCache[key] = (shape,result)
+    return result
+
+
 class Component(ArchIFC.IfcProduct):
     """The Arch Component object.
 
@@ -972,64 +1223,20 @@ class Component(ArchIFC.IfcProduct):
             obj.PerimeterLength = 0
             return
 
-        import Drawing,Part
-        fmax = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Arch").GetInt("MaxComputeAreas",20)
-        if len(obj.Shape.Faces) > fmax:
-            obj.VerticalArea = 0
-            obj.HorizontalArea = 0
-            obj.PerimeterLength = 0
-            return
-
-        a = 0
-        fset = []
-        for i,f in enumerate(obj.Shape.Faces):
-            try:
-                ang = f.normalAt(0,0).getAngle(FreeCAD.Vector(0,0,1))
-            except Part.OCCError:
-                print("Debug: Error computing areas for ",obj.Label,": normalAt() Face ",i)
-                obj.VerticalArea = 0
-                obj.HorizontalArea = 0
-                obj.PerimeterLength = 0
-                return
-            else:
-                if (ang > 1.57) and (ang < 1.571):
-                    a += f.Area
-                if ang < 1.5707:
-                    fset.append(f)
-
-        if a and hasattr(obj,"VerticalArea"):
-            if obj.VerticalArea.Value != a:
-                obj.VerticalArea = a
-        if fset and hasattr(obj,"HorizontalArea"):
-            pset = []
-            for f in fset:
-                if f.normalAt(0,0).getAngle(FreeCAD.Vector(0,0,1)) < 0.00001:
-                    # already horizontal
-                    pset.append(f)
-                else:
-                    try:
-                        pf = Part.Face(Part.Wire(Drawing.project(f,FreeCAD.Vector(0,0,1))[0].Edges))
-                    except Part.OCCError:
-                        # error in computing the areas. Better set them to zero than show a wrong value
-                        if obj.HorizontalArea.Value != 0:
-                            print("Debug: Error computing areas for ",obj.Label,": unable to project face: ",str([v.Point for v in f.Vertexes])," (face normal:",f.normalAt(0,0),")")
-                            obj.HorizontalArea = 0
-                        if hasattr(obj,"PerimeterLength"):
-                            if obj.PerimeterLength.Value != 0:
-                                obj.PerimeterLength = 0
-                    else:
-                        pset.append(pf)
-
-            if pset:
-                self.flatarea = pset.pop()
-                for f in pset:
-                    self.flatarea = self.flatarea.fuse(f)
-                self.flatarea = self.flatarea.removeSplitter()
-                if obj.HorizontalArea.Value != self.flatarea.Area:
-                    obj.HorizontalArea = self.flatarea.Area
-                if hasattr(obj,"PerimeterLength") and (len(self.flatarea.Faces) == 1):
-                    if obj.PerimeterLength.Value != self.flatarea.Faces[0].OuterWire.Length:
-                        obj.PerimeterLength = self.flatarea.Faces[0].OuterWire.Length
+        result = getShapeAreas(obj.Shape)
+        if not result:
+            print("Debug: Error computing areas for ",obj.Label)
+            result = (0,0,0)
+        verticalArea,horizontalArea,perimeterLength = result
+        if hasattr(obj,"VerticalArea"):
+            if obj.VerticalArea.Value != verticalArea:
+                obj.VerticalArea = verticalArea
+        if hasattr(obj,"HorizontalArea"):
+            if obj.HorizontalArea.Value != horizontalArea:
+                obj.HorizontalArea = horizontalArea
+        if hasattr(obj,"PerimeterLength"):
+            if obj.PerimeterLength.Value != perimeterLength:
+                obj.PerimeterLength = perimeterLength
 
     def isStandardCase(self,obj):
         """Determine if the component is a standard case of its IFC type.
@@ -149,19 +149,183 @@ def looksLikeDraft(o):
     return o.Shape.Volume < 0.0000001 # add a little tolerance...
 
 
-def getCutShapes(objs,cutplane,onlySolids,clip,joinArch,showHidden,groupSshapesByObject=False):
+# results of cutting single solids, by cut plane, then by solid hash. Solids
+# which didn't change since the last cut by the same plane aren't cut again
+cutCache = {}
+
+# solids to be cut by the worker processes, and the cut shapes. The workers
+# are forked, so they find them here without having to receive them
+cutJobs = []
+
+
+def getCutPlaneKey(cutplane,clip):
+
+    """returns a key identifying the results of a cut by cutplane. Without clip, only
+    the plane matters, not the extent of the cut face"""
+
+    if hasattr(cutplane,"Shape"):
+        p = cutplane.Shape.Faces[0]
+    else:
+        p = cutplane.Faces[0]
+    if clip:
+        points = [v.Point for v in p.Vertexes]
+    else:
+        points = [p.CenterOfMass,p.normalAt(0,0)]
+    return (clip,)+tuple([round(c,7) for pt in points for c in pt])
+
+
+def classifyShape(shape,point,normal,tolerance):
+
+    """returns 1 if the bounding box of shape lies completely on the side of the
+    plane through point the normal points to, -1 if it lies completely on the
+    other side, 0 if it crosses the plane"""
+
+    bb = shape.BoundBox
+    d = [Vector(x,y,z).sub(point).dot(normal) for x in (bb.XMin,bb.XMax) for y in (bb.YMin,bb.YMax) for z in (bb.ZMin,bb.ZMax)]
+    if min(d) > tolerance:
+        return 1
+    if max(d) < -tolerance:
+        return -1
+    return 0
+
+
+def cutSolid(sol,cutface,cutvolume,invcutvolume,showHidden):
+
+    """returns the visible solids, the section faces and the hidden shape
+    (or None) of a solid cut by the cut volumes"""
+
+    import Part,DraftGeomUtils
+    c = sol.cut(cutvolume)
+    s = sol.section(cutface)
+    faces = []
+    try:
+        wires = DraftGeomUtils.findWires(s.Edges)
+        for w in wires:
+            f = Part.Face(w)
+            faces.append(f)
+    except Part.OCCError:
+        #print "ArchDrawingView: unable to get a face"
+        faces.append(s)
+    h = None
+    if showHidden:
+        h = sol.cut(invcutvolume)
+    return c.Solids,faces,h
+
+
+def cutJob(i):
+
+    """cuts the solid i of cutJobs in a worker process, returns the results as brep strings"""
+
+    sol,cutface,cutvolume,invcutvolume,showHidden = cutJobs[i]
+    c,faces,h = cutSolid(sol,cutface,cutvolume,invcutvolume,showHidden)
+    return ([sh.exportBrepToString() for sh in c],
+            [sh.exportBrepToString() for sh in faces],
+            h.exportBrepToString() if h else None)
+
+
+def cutSolidsInPool(solids,cutface,cutvolume,invcutvolume,showHidden,processes):
+
+    """cuts solids in a pool of forked processes, returns the list of results or
+    None if processes can't be forked on this platform. Forking copies the whole
+    running process, which isn't safe with the threads of the GUI, so this is
+    only used when FreeCAD runs without GUI"""
+
+    import multiprocessing,Part
+    if FreeCAD.GuiUp:
+        return None
+    try:
+        context = multiprocessing.get_context("fork")
+    except ValueError:
+        return None
+    def toShape(brep):
+        sh = Part.Shape()
+        sh.importBrepFromString(brep)
+        return sh
+    global cutJobs
+    cutJobs = [(sol,cutface,cutvolume,invcutvolume,showHidden) for sol in solids]
+    try:
+        pool = context.Pool(processes)
+        try:
+            breps = pool.map(cutJob,range(len(solids)),chunksize=max(1,len(solids)//(4*processes)))
+        finally:
+            pool.terminate()
+    finally:
+        cutJobs = []
+    results = []
+    for c,faces,h in breps:
+        results.append(([toShape(b) for b in c],[toShape(b) for b in faces],toShape(h) if h else None))
+    return results
+
+
+def cutSolids(solids,cutplane,cutface,cutvolume,invcutvolume,clip,showHidden):
+
+    """cutSolids(solids,cutplane,cutface,cutvolume,invcutvolume,clip,showHidden):
+    returns a (visible solids, section faces, hidden shape) tuple for each of the
+    given solids. Solids lying completely on one side of the cut plane are not
+    cut, only the solids crossing it. Those are cut in a pool of processes if
+    the CutProcesses preference is set and there is no GUI, and their results
+    are cached. The cache of a cut plane only keeps the solids of its last cut"""
+
+    if hasattr(cutplane,"Shape"):
+        p = cutplane.Shape.Faces[0]
+    else:
+        p = cutplane.Faces[0]
+    point = p.CenterOfMass
+    normal = p.normalAt(0,0)
+    tolerance = 10**(-Draft.precision())
+    key = getCutPlaneKey(cutplane,clip)
+    if not key in cutCache:
+        if len(cutCache) >= 8:
+            cutCache.clear()
+        cutCache[key] = {}
+    cache = cutCache[key]
+    results = [None]*len(solids)
+    todo = []
+    current = set()
+    for i,sol in enumerate(solids):
+        side = classifyShape(sol,point,normal,tolerance)
+        if side > 0:
+            # in front of the plane, only hidden
+            results[i] = ([],[],sol if showHidden else None)
+        elif (side < 0) and not clip:
+            # behind the plane, all visible. With clip, parts outside of
+            # the cut plane face are cut off as well
+            results[i] = ([sol],[],None)
+        else:
+            current.add((sol.hashCode(),showHidden))
+            cached = cache.get((sol.hashCode(),showHidden))
+            if cached and cached[0].isSame(sol):
+                results[i] = cached[1]
+            else:
+                todo.append(i)
+    if todo:
+        cut = None
+        processes = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Arch").GetInt("CutProcesses",0)
+        if (processes > 1) and (len(todo) > processes):
+            cut = cutSolidsInPool([solids[i] for i in todo],cutface,cutvolume,invcutvolume,showHidden,processes)
+        if cut is None:
+            cut = [cutSolid(solids[i],cutface,cutvolume,invcutvolume,showHidden) for i in todo]
+        for i,result in zip(todo,cut):
+            results[i] = result
+            cache[(solids[i].hashCode(),showHidden)] = (solids[i],result)
+    # forget the solids which were removed or changed since the last cut
+    for k in list(cache.keys()):
+        if not k in current:
+            del cache[k]
+    return results
+
+
+def getObjectCutShapes(objs,cutplane,onlySolids,clip,joinArch,showHidden):
 
     """
-    returns a list of shapes (visible, hidden, cut lines...)
-    obtained from performing a series of booleans against the given cut plane
+    returns a list of (object, visible shapes, hidden shapes, section faces)
+    obtained from performing a series of booleans against the given cut plane,
+    and the cut face and volumes used. With joinArch, walls and structures are
+    fused by material and the material name is given instead of an object
     """
 
-    import Part,DraftGeomUtils
     shapes = []
-    hshapes = []
-    sshapes = []
     objectShapes = []
-    objectSshapes = []
 
     if joinArch:
         shtypes = {}
@@ -208,39 +372,54 @@ def getCutShapes(objs,cutplane,onlySolids,clip,joinArch,showHidden,groupSshapesB
                     objectShapes.append((o,[o.Shape]))
 
     cutface,cutvolume,invcutvolume = ArchCommands.getCutVolume(cutplane,shapes,clip)
-    shapes = []
-    for o, shapeList in objectShapes:
-        tmpSshapes = []
-        for sh in shapeList:
-            for sol in sh.Solids:
-                if cutvolume:
-                    if sol.Volume < 0:
-                        sol.reverse()
-                    c = sol.cut(cutvolume)
-                    s = sol.section(cutface)
-                    try:
-                        wires = DraftGeomUtils.findWires(s.Edges)
-                        for w in wires:
-                            f = Part.Face(w)
-                            tmpSshapes.append(f)
-                        #s = Part.Wire(s.Edges)
-                        #s = Part.Face(s)
-                    except Part.OCCError:
-                        #print "ArchDrawingView: unable to get a face"
-                        tmpSshapes.append(s)
-                    shapes.extend(c.Solids)
-                    #sshapes.append(s)
-                    if showHidden:
-                        c = sol.cut(invcutvolume)
-                        hshapes.append(c)
-                else:
-                    shapes.extend(sol.Solids)
+    objectSolids = [(o,[sol for sh in shapeList for sol in sh.Solids]) for o,shapeList in objectShapes]
+    results = []
+    if cutvolume:
+        solids = []
+        for o,solList in objectSolids:
+            for sol in solList:
+                if sol.Volume < 0:
+                    sol.reverse()
+                solids.append(sol)
+        results = iter(cutSolids(solids,cutplane,cutface,cutvolume,invcutvolume,clip,showHidden))
+    objectResults = []
+    for o,solList in objectSolids:
+        vshapes = []
+        hshapes = []
+        sshapes = []
+        for sol in solList:
+            if cutvolume:
+                c,faces,h = next(results)
+                sshapes.extend(faces)
+                vshapes.extend(c)
+                if h is not None:
+                    hshapes.append(h)
+            else:
+                vshapes.extend(sol.Solids)
+        objectResults.append((o,vshapes,hshapes,sshapes))
+    return objectResults,cutface,cutvolume,invcutvolume
+
 
-            if len(tmpSshapes) > 0:
-                sshapes.extend(tmpSshapes)
+def getCutShapes(objs,cutplane,onlySolids,clip,joinArch,showHidden,groupSshapesByObject=False):
 
-                if groupSshapesByObject:
-                    objectSshapes.append((o, tmpSshapes))
+    """
+    returns a list of shapes (visible, hidden, cut lines...)
+    obtained from performing a series of booleans against the given cut plane
+    """
+
+    shapes = []
+    hshapes = []
+    sshapes = []
+    objectSshapes = []
+    objectResults,cutface,cutvolume,invcutvolume = getObjectCutShapes(objs,cutplane,onlySolids,clip,joinArch,showHidden)
+    for o,v,h,s in objectResults:
+        shapes.extend(v)
+        hshapes.extend(h)
+        if len(s) > 0:
+            sshapes.extend(s)
+
+            if groupSshapesByObject:
+                objectSshapes.append((o, s))
 
     if groupSshapesByObject:
         return shapes,hshapes,sshapes,cutface,cutvolume,invcutvolume,objectSshapes
@@ -310,6 +489,195 @@ def update_svg_cache(source, renderMode, showHidden, showFill, fillSpaces, joinA
     return svgcache
 
 
+def getObjectCacheKey(o,source,renderMode,onlySolids,clip,showHidden):
+
+    """returns the key of the cached section data of an object: the hash of its
+    shape, its placement relative to the section plane and the render settings.
+    The hash of a freed shape can be reused by a new one, so a cached entry is
+    only valid if its shape isSame the shape of the object"""
+
+    shapeHash = None
+    if hasattr(o,"Shape") and not o.Shape.isNull():
+        shapeHash = o.Shape.hashCode()
+    placement = None
+    if hasattr(o,"Placement"):
+        m = source.Placement.inverse().multiply(o.Placement).toMatrix()
+        placement = tuple([round(v,7) for v in m.A])
+    return (shapeHash,placement,renderMode,onlySolids,clip,showHidden)
+
+
+def groupByProjection(items,direction):
+
+    """groupByProjection(items,direction): items is a list of (key,shapes). Returns
+    lists of the items whose shapes overlap when seen along direction. Shapes of
+    different groups can't hide each other, so the groups can be projected one by
+    one, with the same result as projecting all shapes at once"""
+
+    u = direction.cross(FreeCAD.Vector(0,0,1))
+    if u.Length < 0.001:
+        u = direction.cross(FreeCAD.Vector(1,0,0))
+    u.normalize()
+    v = direction.cross(u)
+    v.normalize()
+    boxes = []
+    for item in items:
+        bb = item[1][0].BoundBox
+        for sh in item[1][1:]:
+            bb.add(sh.BoundBox)
+        corners = [FreeCAD.Vector(x,y,z) for x in (bb.XMin,bb.XMax) for y in (bb.YMin,bb.YMax) for z in (bb.ZMin,bb.ZMax)]
+        cu = [c.dot(u) for c in corners]
+        cv = [c.dot(v) for c in corners]
+        boxes.append((min(cu),max(cu),min(cv),max(cv)))
+    # sweep along u, joining the groups of overlapping boxes
+    parent = list(range(len(items)))
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+    active = []
+    for i in sorted(range(len(items)),key=lambda i: boxes[i][0]):
+        b = boxes[i]
+        active = [j for j in active if boxes[j][1] >= b[0]]
+        for j in active:
+            if (boxes[j][2] <= b[3]) and (b[2] <= boxes[j][3]):
+                parent[find(j)] = find(i)
+        active.append(i)
+    groups = {}
+    for i in range(len(items)):
+        groups.setdefault(find(i),[]).append(items[i])
+    return [groups[k] for k in sorted(groups)]
+
+
+def getProjectedSVG(items,direction,style,cache,newcache):
+
+    """returns the SVG projection of the shapes of items, a list of (key,shapes).
+    The projections of groups of overlapping shapes are taken from cache, if
+    the keys of the group didn't change, and stored in newcache"""
+
+    import Drawing,Part
+    svg = ""
+    for group in groupByProjection(items,direction):
+        key = (tuple([item[0] for item in group]),tuple(direction),tuple(sorted(style.items())))
+        if key in cache:
+            gsvg = cache[key]
+        else:
+            shape = Part.makeCompound([sh for item in group for sh in item[1]])
+            gsvg = Drawing.projectToSVG(
+                shape, direction,
+                hStyle=style, h0Style=style, h1Style=style,
+                vStyle=style, v0Style=style, v1Style=style)
+        newcache[key] = gsvg
+        svg += gsvg
+    return svg
+
+
+def getWireframeSVG(source,objs,cutplane,onlySolids,clip,direction,showHidden,showFill,fillColor,lineColor):
+
+    """returns the SVG of the given objects rendered in wireframe mode, with
+    placeholders for the line styles, and the cut face. The cut shapes and the
+    section SVG are cached per object, the projections of the visible and hidden
+    shapes per group of overlapping objects. Only objects whose shape or
+    placement relative to the section plane changed are cut and projected again"""
+
+    import Drawing,Part
+    cache = {}
+    if hasattr(source,"Proxy") and getattr(source.Proxy,"objectcache",None):
+        cache = source.Proxy.objectcache
+    planeKey = getCutPlaneKey(cutplane,clip)
+    keys = [(o.Name,planeKey)+getObjectCacheKey(o,source,"Wireframe",onlySolids,clip,showHidden) for o in objs]
+    shapes = dict([(key,o.Shape) for key,o in zip(keys,objs) if hasattr(o,"Shape") and not o.Shape.isNull()])
+    cachedShapes = cache.get("shapes",{})
+    for key,shape in shapes.items():
+        if (key in cachedShapes) and not cachedShapes[key].isSame(shape):
+            # same hash, but another shape
+            cache = {}
+            break
+    objectCache = cache.get("objects",{})
+    fills = [(getFillForObject(o,fillColor,source) if showFill else None) for o in objs]
+    viewKey = (tuple(keys),tuple(fills),tuple(direction),showFill,tuple(lineColor))
+    if cache.get("key") == viewKey:
+        return cache["svg"],cache["cutface"]
+
+    if all([key in objectCache for key in keys]):
+        cutface = cache.get("cutface")
+        objectResults = [(o,)+objectCache[key] for o,key in zip(objs,keys)]
+    else:
+        # unchanged solids are taken from the cache of getObjectCutShapes
+        results,cutface,cutvolume,invcutvolume = getObjectCutShapes(objs,cutplane,onlySolids,clip,False,showHidden)
+        results = dict([(r[0].Name,r) for r in results])
+        objectResults = [results.get(o.Name,(o,[],[],[])) for o in objs]
+
+    newObjectCache = {}
+    for key,(o,vshapes,hshapes,sshapes) in zip(keys,objectResults):
+        newObjectCache[key] = (vshapes,hshapes,sshapes)
+
+    groupCache = cache.get("groups",{})
+    newGroupCache = {}
+    svg = ""
+    items = [(key,r[1]) for key,r in zip(keys,objectResults) if r[1]]
+    if items:
+        style = {'stroke':       "SVGLINECOLOR",
+                 'stroke-width': "SVGLINEWIDTH"}
+        svg += getProjectedSVG(items,direction,style,groupCache,newGroupCache)
+    items = [(key,r[2]) for key,r in zip(keys,objectResults) if r[2]]
+    if items:
+        style = {'stroke':           "SVGLINECOLOR",
+                 'stroke-width':     "SVGLINEWIDTH",
+                 'stroke-dasharray': "SVGHIDDENPATTERN"}
+        svg += getProjectedSVG(items,direction,style,groupCache,newGroupCache)
+
+    # section faces lie all in the cut plane and can't hide each other
+    sectionCache = cache.get("sections",{})
+    newSectionCache = {}
+    fillsvg = ""
+    linesvg = ""
+    hasSections = False
+    for key,fill,(o,vshapes,hshapes,sshapes) in zip(keys,fills,objectResults):
+        if not sshapes:
+            continue
+        hasSections = True
+        skey = (key,fill,tuple(direction),tuple(lineColor))
+        if skey in sectionCache:
+            ofill,olines = sectionCache[skey]
+        else:
+            ofill = ""
+            if showFill:
+                for s in sshapes:
+                    if s.Edges:
+                        # temporarily disabling fill patterns
+                        ofill += Draft.get_svg(s,
+                                               linewidth=0,
+                                               fillstyle=Draft.getrgb(fill,testbw=False),
+                                               direction=direction.negative(),
+                                               color=lineColor)
+            style = {'stroke':       "SVGLINECOLOR",
+                     'stroke-width': "SVGCUTLINEWIDTH"}
+            olines = Drawing.projectToSVG(
+                Part.makeCompound(sshapes), direction,
+                hStyle=style, h0Style=style, h1Style=style,
+                vStyle=style, v0Style=style, v1Style=style)
+        newSectionCache[skey] = (ofill,olines)
+        fillsvg += ofill
+        linesvg += olines
+    if hasSections:
+        if showFill:
+            svg += '<g transform="rotate(180)">\n'
+            svg += fillsvg
+            svg += "</g>\n"
+        svg += linesvg
+
+    if hasattr(source,"Proxy"):
+        source.Proxy.objectcache = {"key":viewKey,
+                                    "svg":svg,
+                                    "cutface":cutface,
+                                    "shapes":shapes,
+                                    "objects":newObjectCache,
+                                    "groups":newGroupCache,
+                                    "sections":newSectionCache}
+    return svg,cutface
+
+
 def getSVG(source,
            renderMode="Wireframe",
            allOn=False,
@@ -461,8 +829,11 @@ def getSVG(source,
                 svgcache += render.getHiddenSVG(linewidth="SVGLINEWIDTH")
             svgcache += '</g>\n'
             # print(render.info())
+    elif not joinArch:
+        # Wireframe (0) mode, cached per object
+        svgcache,cutface = getWireframeSVG(source,objs,cutplane,onlySolids,clip,direction,showHidden,showFill,fillColor,lineColor)
     else:
-        # Wireframe (0) mode
+        # Wireframe (0) mode, Arch objects fused by material
 
         if hasattr(source,"Proxy") and hasattr(source.Proxy,"shapecache") and source.Proxy.shapecache:
             vshapes = source.Proxy.shapecache[0]
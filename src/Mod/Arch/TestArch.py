@@ -438,6 +438,48 @@ class ArchTest(unittest.TestCase):
         s = Arch.makeStructure(length=2,width=3,height=5)
         self.failUnless(s,"Arch Structure failed")
 
+    def testComponentAreas(self):
+        App.Console.PrintLog ('Checking Arch Component areas...\n')
+        import ArchComponent
+        outer = Part.Face(Part.makePolygon([App.Vector(0,0,0),App.Vector(1000,0,0),
+                                            App.Vector(1000,1000,0),App.Vector(0,1000,0),
+                                            App.Vector(0,0,0)]))
+        holes = [Part.makeBox(50,50,10,App.Vector(100+150*i,100+150*j,-5)) for i in range(5) for j in range(5)]
+        face = outer.cut(Part.makeCompound(holes)).Faces[0]
+        b = App.ActiveDocument.addObject('Part::Feature','Slab')
+        b.Shape = face
+        s = Arch.makeStructure(b,height=200)
+        App.ActiveDocument.recompute()
+        # far more faces than the former MaxComputeAreas limit
+        self.failUnless(len(s.Shape.Faces) > 100,"Arch Structure has too few faces")
+        self.assertAlmostEqual(s.HorizontalArea.Value,1000*1000-25*50*50,3)
+        self.assertAlmostEqual(s.PerimeterLength.Value,4000,3)
+        self.assertAlmostEqual(s.VerticalArea.Value,(4000+25*200)*200,3)
+        self.assertEqual(ArchComponent.getShapeAreas(s.Shape),
+                         (s.VerticalArea.Value,s.HorizontalArea.Value,s.PerimeterLength.Value))
+
+        # overlapping triangles and a shared edge
+        tris = [((0,0),(2,0),(2,2)),((0,0),(2,2),(0,2)),((1,1),(3,1),(3,3)),((1,1),(3,3),(1,3))]
+        self.assertEqual(ArchComponent.getTrianglesUnion(tris),(7.0,12.0))
+
+        # a many-sided planar face, tessellated into long thin triangles
+        import math
+        n = 500
+        points = [App.Vector(1000*math.cos(2*math.pi*i/n),1000*math.sin(2*math.pi*i/n),0) for i in range(n)]
+        face = Part.Face(Part.makePolygon(points+[points[0]]))
+        verticalArea,horizontalArea,perimeterLength = ArchComponent.getShapeAreas(face.extrude(App.Vector(0,0,200)))
+        self.assertAlmostEqual(horizontalArea,face.Area,3)
+        self.assertAlmostEqual(perimeterLength,face.Length,3)
+        self.assertAlmostEqual(verticalArea,face.Length*200,3)
+
+        # a fan of slivers
+        n = 2000
+        points = [(1000*math.cos(2*math.pi*i/n),1000*math.sin(2*math.pi*i/n)) for i in range(n)]
+        tris = [(points[0],points[i],points[i+1]) for i in range(1,n-1)]
+        area,perimeter = ArchComponent.getTrianglesUnion(tris)
+        self.assertAlmostEqual(area,1000*1000*n*math.sin(2*math.pi/n)/2,3)
+        self.assertAlmostEqual(perimeter,2000*n*math.sin(math.pi/n),3)
+
     def testRebar(self):
         App.Console.PrintLog ('Checking Arch Rebar...\n')
         s = Arch.makeStructure(length=2,width=3,height=5)
@@ -607,6 +649,124 @@ class ArchTest(unittest.TestCase):
         v = Arch.makeSectionView(s)
         self.failUnless(v,"Arch Section failed")
 
+    def testSectionCut(self):
+        App.Console.PrintLog ('Checking Arch Section cut...\n')
+        import ArchSectionPlane
+        objs = []
+        for z in [0,10,4]: # behind, in front of and crossing the plane
+            b = App.ActiveDocument.addObject('Part::Feature','Box')
+            b.Shape = Part.makeBox(2,2,2,App.Vector(z,0,z))
+            objs.append(b)
+        cutplane = Part.makePlane(100,100,App.Vector(-50,-50,5))
+        ArchSectionPlane.cutCache.clear()
+        for i in range(2):
+            vshapes,hshapes,sshapes,cutface,cutvolume,invcutvolume = ArchSectionPlane.getCutShapes(objs,cutplane,True,False,False,True)
+            self.assertAlmostEqual(sum([s.Volume for s in vshapes]),12,6,"Arch Section cut has wrong visible solids")
+            self.assertAlmostEqual(sum([s.Volume for s in hshapes]),12,6,"Arch Section cut has wrong hidden solids")
+            self.assertEqual(len(sshapes),1)
+            self.assertAlmostEqual(sshapes[0].Area,4,6)
+            # only the crossing box is cut, and cached
+            self.assertEqual(len(list(ArchSectionPlane.cutCache.values())[0]),1)
+
+        # changing one object only cuts that one again
+        objs[2].Shape = Part.makeBox(2,2,4,App.Vector(4,0,4))
+        vshapes,hshapes,sshapes,cutface,cutvolume,invcutvolume = ArchSectionPlane.getCutShapes(objs,cutplane,True,False,False,True)
+        self.assertAlmostEqual(sum([s.Volume for s in hshapes]),8+12,6)
+        # the result of the previous shape is dropped from the cache
+        self.assertEqual(len(list(ArchSectionPlane.cutCache.values())[0]),1)
+
+    def testSectionViewCache(self):
+        App.Console.PrintLog ('Checking Arch Section view cache...\n')
+        import ArchSectionPlane
+        objs = []
+        for x in [0,10,20]:
+            b = App.ActiveDocument.addObject('Part::Feature','Box')
+            b.Shape = Part.makeBox(2,2,8,App.Vector(x,0,0))
+            objs.append(b)
+        s = Arch.makeSectionPlane(objs)
+        s.Placement = App.Placement(App.Vector(10,1,4),App.Rotation())
+        App.ActiveDocument.recompute()
+        svg1 = ArchSectionPlane.getSVG(s,allOn=True,showFill=True)
+        self.failUnless(svg1,"Arch Section view is empty")
+        cache = s.Proxy.objectcache
+        self.assertEqual(len(cache["groups"]),3)
+        self.assertEqual(len(cache["sections"]),3)
+        self.assertEqual(ArchSectionPlane.getSVG(s,allOn=True,showFill=True),svg1)
+        self.assertTrue(s.Proxy.objectcache is cache)
+
+        # only the changed object is projected again
+        objs[2].Shape = Part.makeBox(3,2,8,App.Vector(20,0,0))
+        svg2 = ArchSectionPlane.getSVG(s,allOn=True,showFill=True)
+        self.assertNotEqual(svg2,svg1)
+        newcache = s.Proxy.objectcache
+        self.assertEqual(len(set(newcache["groups"]) & set(cache["groups"])),2)
+        self.assertEqual(len(set(newcache["sections"]) & set(cache["sections"])),2)
+
+        # a cached entry whose shape isn't the same as the object's, with the
+        # same hash, is not used
+        key = list(newcache["shapes"].keys())[0]
+        newcache["shapes"][key] = Part.makeSphere(1)
+        self.assertEqual(ArchSectionPlane.getSVG(s,allOn=True,showFill=True),svg2)
+        self.assertFalse(s.Proxy.objectcache is newcache)
+        self.assertTrue(s.Proxy.objectcache["shapes"][key].isSame(objs[[o.Name for o in objs].index(key[0])].Shape))
+
+    def testIfcInstances(self):
+        App.Console.PrintLog ('Checking IFC export instances...\n')
+        try:
+            import ifcopenshell
+        except ImportError:
+            self.skipTest("IfcOpenShell is not installed")
+        import exportIFC
+        import tempfile
+        objs = []
+        for i in range(4):
+            b = App.ActiveDocument.addObject('Part::Feature','Box')
+            b.Shape = Part.makeCylinder(1,3) if i == 3 else Part.makeBox(1,2,3)
+            b.Placement = App.Placement(App.Vector(5*i,0,0),App.Rotation(App.Vector(0,0,1),30*i))
+            objs.append(b)
+        App.ActiveDocument.recompute()
+        f = [exportIFC.getShapeFingerprint(o.Shape) for o in objs]
+        self.assertEqual(f[0],f[1])
+        self.assertEqual(f[0],f[2])
+        self.assertNotEqual(f[0],f[3])
+        self.assertNotEqual(exportIFC.getShapeFingerprint(objs[0].Shape,local=False),
+                            exportIFC.getShapeFingerprint(objs[1].Shape,local=False))
+
+        filename = os.path.join(tempfile.gettempdir(),"TestArchInstances.ifc")
+        exportIFC.export(objs,filename)
+        ifcfile = ifcopenshell.open(filename)
+        os.remove(filename)
+        self.assertEqual(len(ifcfile.by_type("IfcRepresentationMap")),1)
+        self.assertEqual(len(ifcfile.by_type("IfcMappedItem")),3)
+        self.assertEqual(exportIFC.instancestats["groups"],1)
+        self.assertEqual(exportIFC.instancestats["instances"],3)
+
+    def testIfcInstancesWithOpenings(self):
+        App.Console.PrintLog ('Checking IFC export instances of walls with windows...\n')
+        try:
+            import ifcopenshell
+        except ImportError:
+            self.skipTest("IfcOpenShell is not installed")
+        import exportIFC
+        import tempfile
+        objs = []
+        for i in range(2):
+            l = Draft.makeLine(App.Vector(10000*i,0,0),App.Vector(10000*i+4000,0,0))
+            w = Arch.makeWall(l,width=200,height=3000)
+            pl = App.Placement(App.Vector(10000*i+1000,0,500),App.Rotation(App.Vector(1,0,0),90))
+            r = Draft.makeRectangle(1000,1000,placement=pl)
+            win = Arch.makeWindow(r)
+            win.Hosts = [w]
+            objs.extend([w,win])
+        App.ActiveDocument.recompute()
+        filename = os.path.join(tempfile.gettempdir(),"TestArchInstancesOpenings.ifc")
+        exportIFC.export(objs,filename)
+        ifcfile = ifcopenshell.open(filename)
+        os.remove(filename)
+        # each wall keeps the opening of its window
+        self.assertEqual(len(ifcfile.by_type("IfcOpeningElement")),2)
+        self.assertEqual(len(ifcfile.by_type("IfcRelVoidsElement")),2)
+
     def testSpace(self):
         App.Console.PrintLog ('Checking Arch Space...\n')
         sb = Part.makeBox(1,1,1)
@@ -148,6 +148,7 @@ def getPreferences():
     preferences = {
         'DEBUG': p.GetBool("ifcDebug", False),
         'CREATE_CLONES': p.GetBool("ifcCreateClones", True),
+        'CREATE_INSTANCES': p.GetBool("ifcCreateInstances", True),
         'FORCE_BREP': p.GetBool("ifcExportAsBrep", False),
         'STORE_UID': p.GetBool("ifcStoreUid", True),
         'SERIALIZE': p.GetBool("ifcSerialize", False),
@@ -159,7 +160,8 @@ def getPreferences():
         'IFC_UNIT': u,
         'SCALE_FACTOR': f,
         'GET_STANDARD': p.GetBool("getStandardType", False),
-        'EXPORT_MODEL': ['arch', 'struct', 'hybrid'][p.GetInt("ifcExportModel", 0)]
+        'EXPORT_MODEL': ['arch', 'struct', 'hybrid'][p.GetInt("ifcExportModel", 0)],
+        'MULTICORE': p.GetInt("ifcExportMulticore", 0)
     }
 
     if hasattr(ifcopenshell, "schema_identifier"):
@@ -247,7 +249,7 @@ def export(exportList, filename, colors=None, preferences=None):
     os.close(templatefilehandle)
 
     # create IFC file
-    global ifcfile, surfstyles, clones, sharedobjects, profiledefs, shapedefs
+    global ifcfile, surfstyles, clones, sharedobjects, profiledefs, shapedefs, instances, instancestats
     ifcfile = ifcopenshell.open(templatefile)
     ifcfile = exportIFCHelper.writeUnits(ifcfile,preferences["IFC_UNIT"])
     history = ifcfile.by_type("IfcOwnerHistory")[0]
@@ -303,7 +305,9 @@ def export(exportList, filename, colors=None, preferences=None):
     count = 1
     groups = {} # { Host: [Child,Child,...] }
     profiledefs = {} # { ProfileDefString:profiledef,...}
-    shapedefs = {} # { ShapeDefString:[shapes],... }
+    shapedefs = {} # { ShapeFingerprint:[shapes],... }
+    instances = {} # { Name: (ShapeFingerprint,Appearance) }
+    instancestats = {"groups":0,"instances":0,"breps":0,"profiles":0}
     spatialelements = {} # {Name:IfcEntity, ... }
 
     # build clones table
@@ -314,6 +318,11 @@ def export(exportList, filename, colors=None, preferences=None):
             if b:
                 clones.setdefault(b.Name,[]).append(o.Name)
 
+    # build instances table: objects that only differ by their placement
+
+    if preferences.get('CREATE_INSTANCES',False) and not preferences['SERIALIZE']:
+        instances = getInstances(objectslist,colors,preferences)
+
     #print("clones table: ",clones)
     #print(objectslist)
 
@@ -1565,6 +1574,12 @@ def export(exportList, filename, colors=None, preferences=None):
     endtime = time.time() - starttime
 
     _msg("Finished exporting in {} seconds".format(int(endtime)))
+    if instancestats["groups"] or instancestats["breps"] or instancestats["profiles"]:
+        _msg("Reused geometry: {} objects exported as instances of {} shapes, "
+             "{} breps and {} profiles reused".format(instancestats["instances"],
+                                                      instancestats["groups"],
+                                                      instancestats["breps"],
+                                                      instancestats["profiles"]))
 
 
 # ************************************************************************************************
@@ -1905,6 +1920,167 @@ def getProfile(ifcfile,p):
     return profile
 
 
+def getShapeFingerprint(shape,local=True,precision=None):
+
+    """getShapeFingerprint(shape,[local],[precision]): returns a compact, hashable
+    fingerprint of the geometry of the shape: its volume, area, principal moments of
+    inertia and a hash of its sorted vertices, rounded to the given number of decimals
+    (the Draft precision by default). If local is True, the placement of the shape is
+    ignored, and copies of a shape placed differently get the same fingerprint. Returns
+    None if the mass properties of the shape can't be computed"""
+
+    import hashlib
+    if precision is None:
+        precision = Draft.precision()
+    sh = shape.copy()
+    if local:
+        sh.Placement = FreeCAD.Placement()
+    moments = []
+    try:
+        for sol in (sh.Solids or sh.Shells):
+            moments.extend(sol.PrincipalProperties["Moments"])
+        volume = sh.Volume
+        area = sh.Area
+    except Part.OCCError:
+        return None
+    moments = tuple(sorted(["%.10g" % m for m in moments]))
+    verts = sorted([tuple([round(c,precision)+0.0 for c in v.Point]) for v in sh.Vertexes])
+    vhash = hashlib.sha1(repr(verts).encode("utf8")).hexdigest()
+    return ("%.10g" % volume,"%.10g" % area,moments,len(verts),vhash)
+
+
+def getAppearance(obj,colors=None):
+
+    """getAppearance(obj,[colors]): returns a string describing the color and material
+    the object will be exported with, so only objects looking the same share a
+    representation map"""
+
+    color = None
+    if colors:
+        if obj.Name in colors:
+            color = colors[obj.Name]
+    elif FreeCAD.GuiUp and hasattr(obj.ViewObject,"ShapeColor"):
+        color = (obj.ViewObject.ShapeColor[:3],obj.ViewObject.Transparency)
+        if hasattr(obj.ViewObject,"DiffuseColor"):
+            color = color + (tuple(obj.ViewObject.DiffuseColor),)
+    material = None
+    if hasattr(obj,"Material") and obj.Material:
+        material = obj.Material.Name
+    return repr((color,material))
+
+
+def isInstanceCandidate(obj,preferences):
+
+    """isInstanceCandidate(obj,preferences): returns True if the representation of the
+    object can be exported as a mapped item of another object with the same geometry"""
+
+    if not obj.isDerivedFrom("Part::Feature"):
+        return False
+    if obj.Shape.isNull() or not obj.Shape.Faces:
+        return False
+    if getBrepFlag(obj,preferences):
+        return False
+    if hasattr(obj,"Proxy") and hasattr(obj.Proxy,"getRebarData"):
+        return False
+    # additions, subtractions and the openings of hosted objects are exported
+    # separately from the object itself, only when it is not an instance
+    if getattr(obj,"Additions",None) or getattr(obj,"Subtractions",None):
+        return False
+    for o in obj.InList:
+        if obj in getattr(o,"Hosts",[]):
+            return False
+    if (len(obj.Shape.Solids) > 1) and getattr(obj,"Axis",None):
+        return False
+    for k,v in clones.items():
+        if (obj.Name == k) or (obj.Name in v):
+            return False
+    return True
+
+
+instanceJobs = []
+
+
+def fingerprintJob(i):
+
+    """computes the fingerprint of the shape i of instanceJobs in a worker process"""
+
+    return getShapeFingerprint(instanceJobs[i])
+
+
+def getFingerprintsInPool(shapes,processes):
+
+    """computes the fingerprints of the shapes in a pool of forked processes, returns
+    the list of fingerprints or None if processes can't be forked on this platform.
+    Forking copies the whole running process, which isn't safe with the threads of
+    the GUI, so this is only used when FreeCAD runs without GUI"""
+
+    import multiprocessing
+    if FreeCAD.GuiUp:
+        return None
+    try:
+        context = multiprocessing.get_context("fork")
+    except (ValueError,AttributeError):
+        return None
+    global instanceJobs
+    instanceJobs = shapes
+    try:
+        pool = context.Pool(processes)
+        try:
+            return pool.map(fingerprintJob,range(len(shapes)),chunksize=max(1,len(shapes)//(4*processes)))
+        finally:
+            pool.terminate()
+    finally:
+        instanceJobs = []
+
+
+def getInstances(objectslist,colors=None,preferences=None):
+
+    """getInstances(objectslist,[colors],[preferences]): returns a { Name: InstanceKey }
+    dictionary of the objects of the list that have the same geometry and appearance
+    as at least one other object of the list, and differ from it only by their
+    placement. Objects with the same key are exported as mapped items of a single
+    representation map. The fingerprints are computed in a pool of processes if the
+    MULTICORE preference is set and FreeCAD runs without GUI"""
+
+    if preferences is None:
+        preferences = getPreferences()
+    candidates = [obj for obj in objectslist if isInstanceCandidate(obj,preferences)]
+    shapes = [obj.Shape for obj in candidates]
+    fingerprints = None
+    processes = preferences.get('MULTICORE',0)
+    if (processes > 0) and (len(shapes) > processes):
+        fingerprints = getFingerprintsInPool(shapes,processes)
+    if fingerprints is None:
+        fingerprints = [getShapeFingerprint(sh) for sh in shapes]
+    groups = {}
+    for obj,fingerprint in zip(candidates,fingerprints):
+        if fingerprint:
+            groups.setdefault((fingerprint,getAppearance(obj,colors)),[]).append(obj.Name)
+    instances = {}
+    for key,names in groups.items():
+        if len(names) > 1:
+            for name in names:
+                instances[name] = key
+    return instances
+
+
+def createMappedItem(ifcfile,repmap,obj,preferences,delta=None):
+
+    """creates an IfcMappedItem placing the given representation map at the global
+    placement of the object, moved by delta if given"""
+
+    pla = obj.getGlobalPlacement()
+    pos = FreeCAD.Vector(pla.Base)
+    if delta:
+        pos += delta
+    axis1 = ifcbin.createIfcDirection(tuple(pla.Rotation.multVec(FreeCAD.Vector(1,0,0))))
+    axis2 = ifcbin.createIfcDirection(tuple(pla.Rotation.multVec(FreeCAD.Vector(0,1,0))))
+    axis3 = ifcbin.createIfcDirection(tuple(pla.Rotation.multVec(FreeCAD.Vector(0,0,1))))
+    origin = ifcbin.createIfcCartesianPoint(tuple(pos.multiply(preferences['SCALE_FACTOR'])))
+    transf = ifcbin.createIfcCartesianTransformationOperator3D(axis1,axis2,origin,1.0,axis3)
+    return ifcfile.createIfcMappedItem(repmap,transf)
+
+
 def getRepresentation(ifcfile,context,obj,forcebrep=False,subtraction=False,tessellation=1,colors=None,preferences=None,forceclone=False,skipshape=False):
 
     """returns an IfcShapeRepresentation object or None. forceclone can be False (does nothing),
@@ -1930,24 +2106,27 @@ def getRepresentation(ifcfile,context,obj,forcebrep=False,subtraction=False,tess
             if (obj.Name == k) or (obj.Name in v):
                 if k in sharedobjects:
                     # base shape already exists
-                    repmap = sharedobjects[k]
-                    pla = obj.getGlobalPlacement()
-                    pos = FreeCAD.Vector(pla.Base)
-                    if isinstance(forceclone,FreeCAD.Vector):
-                        pos += forceclone
-                    axis1 = ifcbin.createIfcDirection(tuple(pla.Rotation.multVec(FreeCAD.Vector(1,0,0))))
-                    axis2 = ifcbin.createIfcDirection(tuple(pla.Rotation.multVec(FreeCAD.Vector(0,1,0))))
-                    axis3 = ifcbin.createIfcDirection(tuple(pla.Rotation.multVec(FreeCAD.Vector(0,0,1))))
-                    origin = ifcbin.createIfcCartesianPoint(tuple(pos.multiply(preferences['SCALE_FACTOR'])))
-                    transf = ifcbin.createIfcCartesianTransformationOperator3D(axis1,axis2,origin,1.0,axis3)
-                    mapitem = ifcfile.createIfcMappedItem(repmap,transf)
-                    shapes = [mapitem]
+                    delta = forceclone if isinstance(forceclone,FreeCAD.Vector) else None
+                    shapes = [createMappedItem(ifcfile,sharedobjects[k],obj,preferences,delta)]
                     solidType = "MappedRepresentation"
                     shapetype = "clone"
                 else:
                     # base shape not yet created
                     tostore = k
 
+    # check for instances: objects with the same geometry as others, placed differently
+
+    if (not shapes) and (not tostore) and (not subtraction) and (not forcebrep) and (not skipshape) \
+            and (obj.Name in instances):
+        k = instances[obj.Name]
+        if k in sharedobjects:
+            shapes = [createMappedItem(ifcfile,sharedobjects[k],obj,preferences)]
+            solidType = "MappedRepresentation"
+            shapetype = "instance"
+            instancestats["instances"] += 1
+        else:
+            tostore = k
+
     # unhandled case: object is duplicated because of Axis
     if obj.isDerivedFrom("Part::Feature") and (len(obj.Shape.Solids) > 1) and hasattr(obj,"Axis") and obj.Axis:
         forcebrep = True
@@ -2005,6 +2184,7 @@ def getRepresentation(ifcfile,context,obj,forcebrep=False,subtraction=False,tess
                             if pstr in profiledefs:
                                 profile = profiledefs[pstr]
                                 shapetype = "reusing profile"
+                                instancestats["profiles"] += 1
                             else:
                                 profile = getProfile(ifcfile,pi)
                                 if profile:
@@ -2089,10 +2269,14 @@ def getRepresentation(ifcfile,context,obj,forcebrep=False,subtraction=False,tess
                                 fcshape = obj.Shape.copy()
                                 fcshape.Placement = obj.getGlobalPlacement()
             if fcshape:
-                shapedef = str([v.Point for v in fcshape.Vertexes])
-                if shapedef in shapedefs:
+                # if this is a clone, place back the shape in null position
+                if tostore:
+                    fcshape.Placement = FreeCAD.Placement()
+                shapedef = getShapeFingerprint(fcshape,local=False)
+                if shapedef and (shapedef in shapedefs):
                     shapes = shapedefs[shapedef]
                     shapetype = "reusing brep"
+                    instancestats["breps"] += 1
                 else:
 
                     # new ifcopenshell serializer
@@ -2125,10 +2309,6 @@ def getRepresentation(ifcfile,context,obj,forcebrep=False,subtraction=False,tess
 
                         solids = []
 
-                        # if this is a clone, place back the shape in null position
-                        if tostore:
-                            fcshape.Placement = FreeCAD.Placement()
-
                         if fcshape.Solids:
                             dataset = fcshape.Solids
                         elif fcshape.Shells:
@@ -2217,7 +2397,8 @@ def getRepresentation(ifcfile,context,obj,forcebrep=False,subtraction=False,tess
                                 shape = ifcfile.createIfcFacetedBrep(shell)
                                 shapes.append(shape)
 
-                        shapedefs[shapedef] = shapes
+                        if shapedef:
+                            shapedefs[shapedef] = shapes
 
     if shapes:
 
@@ -2226,16 +2407,12 @@ def getRepresentation(ifcfile,context,obj,forcebrep=False,subtraction=False,tess
             subrep = ifcfile.createIfcShapeRepresentation(context,'Body',solidType,shapes)
             gpl = ifcbin.createIfcAxis2Placement3D()
             repmap = ifcfile.createIfcRepresentationMap(gpl,subrep)
-            pla = obj.getGlobalPlacement()
-            axis1 = ifcbin.createIfcDirection(tuple(pla.Rotation.multVec(FreeCAD.Vector(1,0,0))))
-            axis2 = ifcbin.createIfcDirection(tuple(pla.Rotation.multVec(FreeCAD.Vector(0,1,0))))
-            origin = ifcbin.createIfcCartesianPoint(tuple(FreeCAD.Vector(pla.Base).multiply(preferences['SCALE_FACTOR'])))
-            axis3 = ifcbin.createIfcDirection(tuple(pla.Rotation.multVec(FreeCAD.Vector(0,0,1))))
-            transf = ifcbin.createIfcCartesianTransformationOperator3D(axis1,axis2,origin,1.0,axis3)
-            mapitem = ifcfile.createIfcMappedItem(repmap,transf)
-            shapes = [mapitem]
+            shapes = [createMappedItem(ifcfile,repmap,obj,preferences)]
             sharedobjects[tostore] = repmap
             solidType = "MappedRepresentation"
+            if isinstance(tostore,tuple):
+                instancestats["groups"] += 1
+                instancestats["instances"] += 1
 
         # set surface style
 
@@ -2259,7 +2436,7 @@ def getRepresentation(ifcfile,context,obj,forcebrep=False,subtraction=False,tess
             transparency = obj.ViewObject.Transparency/100.0
             if hasattr(obj.ViewObject,"DiffuseColor"):
                 diffusecolor = obj.ViewObject.DiffuseColor
-        if shapecolor and (shapetype != "clone"): # cloned objects are already colored
+        if shapecolor and (shapetype not in ["clone","instance"]): # cloned objects are already colored
             key = None
             rgbt = [shapecolor+(transparency,)] * len(shapes)
             if diffusecolor \
@@ -32,6 +32,7 @@ may not be removed completely yet. This must be checked.
 # \ingroup draftfuctions
 # \brief Provides functions to return the SVG representation of shapes.
 
+import io
 import math
 import lazy_loader.lazy_loader as lz
 
@@ -42,7 +43,8 @@ import draftutils.utils as utils
 import draftfunctions.svgtext as svgtext
 
 from draftfunctions.svgshapes import get_proj, get_circle, get_path
-from draftutils.utils import param
+from draftfunctions.svgshapes import get_export_params
+from draftfunctions.svgshapes import begin_export, end_export
 from draftutils.messages import _wrn, _err
 
 # Delay import of module until first use because it is heavy
@@ -59,12 +61,8 @@ def get_line_style(line_style, scale):
     """Return a linestyle scaled by a factor."""
     style = None
 
-    if line_style == "Dashed":
-        style = param.GetString("svgDashedLine", "0.09,0.05")
-    elif line_style == "Dashdot":
-        style = param.GetString("svgDashdotLine", "0.09,0.05,0.02,0.05")
-    elif line_style == "Dotted":
-        style = param.GetString("svgDottedLine", "0.02,0.02")
+    if line_style in ("Dashed", "Dashdot", "Dotted"):
+        style = get_export_params()[line_style]
     elif line_style:
         if "," in line_style:
             style = line_style
@@ -424,6 +422,24 @@ def get_svg(obj,
     override: bool, optional
         It defaults to `True`.
     """
+    # The parameters are read once for the object and all its children
+    started = begin_export()
+    try:
+        return _get_svg(obj,
+                        scale, linewidth, fontsize,
+                        fillstyle, direction, linestyle,
+                        color, linespacing, techdraw, rotation,
+                        fillspaces, override)
+    finally:
+        end_export(started)
+
+
+def _get_svg(obj,
+             scale, linewidth, fontsize,
+             fillstyle, direction, linestyle,
+             color, linespacing, techdraw, rotation,
+             fillspaces, override):
+    """Return the SVG representation of the object, see `get_svg`."""
     # If this is a group, recursively call this function to gather
     # all the SVG strings from the contents of the group
     if hasattr(obj, "isDerivedFrom"):
@@ -438,7 +454,7 @@ def get_svg(obj,
                                rotation, fillspaces, override)
             return svg
 
-    pathdata = []
+    pathdata = set()
     svg = ""
     linewidth = float(linewidth)/scale
     if not override:
@@ -869,34 +885,44 @@ def get_svg(obj,
             fill = 'none'
 
         if len(obj.Shape.Vertexes) > 1:
+            paths = io.StringIO()
             wiredEdges = []
             if obj.Shape.Faces:
                 for i, f in enumerate(obj.Shape.Faces):
                     # place outer wire first
                     wires = [f.OuterWire]
                     wires.extend([w for w in f.Wires if w.hashCode() != f.OuterWire.hashCode()])
-                    svg += get_path(obj, plane,
-                                    fill, pathdata, stroke, linewidth, lstyle,
-                                    fill_opacity=fill_opacity,
-                                    wires=f.Wires,
-                                    pathname='%s_f%04d' % (obj.Name, i))
+                    paths.write(get_path(obj, plane,
+                                         fill, pathdata, stroke, linewidth,
+                                         lstyle, fill_opacity=fill_opacity,
+                                         wires=f.Wires,
+                                         pathname='%s_f%04d' % (obj.Name, i)))
                     wiredEdges.extend(f.Edges)
             else:
                 for i, w in enumerate(obj.Shape.Wires):
-                    svg += get_path(obj, plane,
-                                    fill, pathdata, stroke, linewidth, lstyle,
-                                    fill_opacity=fill_opacity,
-                                    edges=w.Edges,
-                                    pathname='%s_w%04d' % (obj.Name, i))
+                    paths.write(get_path(obj, plane,
+                                         fill, pathdata, stroke, linewidth,
+                                         lstyle, fill_opacity=fill_opacity,
+                                         edges=w.Edges,
+                                         pathname='%s_w%04d' % (obj.Name, i)))
                     wiredEdges.extend(w.Edges)
             if len(wiredEdges) != len(obj.Shape.Edges):
+                # edges shared with the wires are found by their hash,
+                # confirmed with isSame, before comparing them with all
+                # the edges of the wires
+                wiredHashes = {}
+                for e in wiredEdges:
+                    wiredHashes.setdefault(e.hashCode(), []).append(e)
                 for i, e in enumerate(obj.Shape.Edges):
+                    if any(e.isSame(w) for w in wiredHashes.get(e.hashCode(), [])):
+                        continue
                     if DraftGeomUtils.findEdge(e, wiredEdges) is None:
-                        svg += get_path(obj, plane,
-                                        fill, pathdata, stroke, linewidth,
-                                        lstyle, fill_opacity=fill_opacity,
-                                        edges=[e],
-                                        pathname='%s_nwe%04d' % (obj.Name, i))
+                        paths.write(get_path(obj, plane,
+                                             fill, pathdata, stroke, linewidth,
+                                             lstyle, fill_opacity=fill_opacity,
+                                             edges=[e],
+                                             pathname='%s_nwe%04d' % (obj.Name, i)))
+            svg += paths.getvalue()
         else:
             # closed circle or spline
             if obj.Shape.Edges:
@@ -32,7 +32,9 @@ may not be removed completely yet. This must be checked.
 # \ingroup draftfuctions
 # \brief Provides functions to return the SVG representation of some shapes.
 
+import io
 import math
+import re
 import lazy_loader.lazy_loader as lz
 
 import FreeCAD as App
@@ -93,30 +95,191 @@ def getProj(vec, plane=None):
     return get_proj(vec, plane)
 
 
-def get_discretized(edge, plane):
-    """Get a discretized edge on a plane."""
-    pieces = param.GetFloat("svgDiscretization", 10.0)
+def get_proj_matrix(plane=None):
+    """Get the rows of the projection in the plane's u and v directions.
+
+    Projecting a point with these rows gives the same coordinates as
+    `get_proj`, but without creating intermediate vectors, so it is used
+    to project many points at once.
+
+    Parameters
+    ----------
+    plane: WorkingPlane.Plane, optional
+        An object of type `WorkingPlane`.
+
+    Returns
+    -------
+    tuple
+        The six components `(ux, uy, uz, vx, vy, vz)` of the normalized
+        u and v directions, or `None` if there is no plane.
+    """
+    if not plane:
+        return None
+
+    u = App.Vector(plane.u)
+    v = App.Vector(plane.v)
+    u.normalize()
+    v.normalize()
+    return (u.x, u.y, u.z, v.x, v.y, v.z)
+
 
+def project_points(points, matrix=None):
+    """Project a list of points with the rows given by `get_proj_matrix`.
+
+    Returns
+    -------
+    list
+        The flat list of coordinates `[x0, y0, x1, y1, ...]`.
+    """
+    if matrix is None:
+        return [c for p in points for c in (p.x, p.y)]
+
+    ux, uy, uz, vx, vy, vz = matrix
+    coords = []
+    for p in points:
+        x, y, z = p.x, p.y, p.z
+        coords.append(ux * x + uy * y + uz * z)
+        coords.append(vx * x + vy * y + vz * z)
+    return coords
+
+
+# Number of decimals of the coordinates written by SvgPathWriter
+PRECISION = 6
+
+# Trailing zeros of the fixed precision numbers, they are removed
+_trailing_zeros = re.compile(r"\.?0+(?= )")
+
+# Parameters of the current export, see begin_export
+_export_params = None
+
+
+def _read_export_params():
+    """Read the parameters used to write the SVG of shapes."""
+    pieces = param.GetFloat("svgDiscretization", 10.0)
     if pieces == 0:
         pieces = 10
 
-    d = int(edge.Length/pieces)
-    if d == 0:
-        d = 1
+    return {"discretization": pieces,
+            "Dashed": param.GetString("svgDashedLine", "0.09,0.05"),
+            "Dashdot": param.GetString("svgDashdotLine",
+                                       "0.09,0.05,0.02,0.05"),
+            "Dotted": param.GetString("svgDottedLine", "0.02,0.02")}
 
-    edata = ""
-    for i in range(d + 1):
-        _length = edge.LastParameter - edge.FirstParameter
-        _point = edge.FirstParameter + float(i)/d * _length
-        _vec = edge.valueAt(_point)
-        v = get_proj(_vec, plane)
 
-        if not edata:
-            edata += 'M ' + str(v.x) + ' ' + str(v.y) + ' '
-        else:
-            edata += 'L ' + str(v.x) + ' ' + str(v.y) + ' '
+def get_export_params():
+    """Get the parameters used to write the SVG of shapes.
 
-    return edata
+    Inside an export started with `begin_export` the parameters
+    are only read once, otherwise they are read every time.
+    """
+    if _export_params is not None:
+        return _export_params
+    return _read_export_params()
+
+
+def begin_export():
+    """Start an export, the parameters are cached until `end_export`.
+
+    Returns
+    -------
+    bool
+        `True` if this call started the export, `False` if an export
+        was already running, for example in recursive calls of `get_svg`.
+    """
+    global _export_params
+    if _export_params is not None:
+        return False
+    _export_params = _read_export_params()
+    return True
+
+
+def end_export(started):
+    """End the export if it was started by the matching `begin_export`."""
+    global _export_params
+    if started:
+        _export_params = None
+
+
+class SvgPathWriter:
+    """Write the `d` data of an SVG path into a buffer.
+
+    The end points of consecutive straight segments are kept until
+    something else is written, then they are projected and formatted in
+    a single pass. Numbers are written with `PRECISION` decimals, without
+    trailing zeros.
+
+    Parameters
+    ----------
+    plane: WorkingPlane.Plane, optional
+        The points are projected in the plane's u and v directions.
+    """
+
+    def __init__(self, plane=None):
+        self.matrix = get_proj_matrix(plane)
+        self.number = "%.{}f ".format(PRECISION)
+        self.buffer = io.StringIO()
+        self.pending = []
+
+    def write(self, text):
+        """Write a string as it is."""
+        if self.pending:
+            self.flush()
+        self.buffer.write(text)
+
+    def write_points(self, points, command=""):
+        """Write the projected coordinates of the points.
+
+        If a command is given, it is written before every point.
+        """
+        if self.pending:
+            self.flush()
+        if not points:
+            return
+        coords = project_points(points, self.matrix)
+        fmt = (command + " " if command else "") + self.number * 2
+        text = (fmt * len(points)) % tuple(coords)
+        self.buffer.write(_trailing_zeros.sub("", text))
+
+    def move_to(self, point):
+        """Start a new subpath at the point."""
+        self.write_points([point], "M")
+
+    def line_to(self, point):
+        """Add a straight segment to the point."""
+        self.pending.append(point)
+
+    def discretize(self, edge, pieces):
+        """Add an edge as a polyline, with segments of about `pieces` length.
+
+        The edge is discretized in a single call, in points evenly spaced
+        along its length. This starts a new subpath.
+        """
+        d = int(edge.Length/pieces)
+        if d == 0:
+            d = 1
+
+        points = edge.discretize(Number=d + 1)
+        self.move_to(points[0])
+        self.write_points(points[1:], "L")
+
+    def flush(self):
+        """Write the pending straight segments."""
+        pending = self.pending
+        self.pending = []
+        self.write_points(pending, "L")
+
+    def getvalue(self):
+        """Return the data written so far."""
+        if self.pending:
+            self.flush()
+        return self.buffer.getvalue()
+
+
+def get_discretized(edge, plane):
+    """Get a discretized edge on a plane."""
+    writer = SvgPathWriter(plane)
+    writer.discretize(edge, get_export_params()["discretization"])
+    return writer.getvalue()
 
 
 def getDiscretized(edge, plane):
@@ -125,10 +288,14 @@ def getDiscretized(edge, plane):
     return get_discretized(edge, plane)
 
 
-def _get_path_circ_ellipse(plane, edge, vertex, edata,
+def _get_path_circ_ellipse(plane, edge, vertex, writer,
                            iscircle, isellipse,
                            fill, stroke, linewidth, lstyle):
-    """Get the edge data from a path that is a circle or ellipse."""
+    """Write the edge data from a path that is a circle or ellipse.
+
+    Returns the final SVG string if the edge is a complete circle,
+    otherwise `None`.
+    """
     if hasattr(App, "DraftWorkingPlane"):
         drawing_plane_normal = App.DraftWorkingPlane.axis
     else:
@@ -143,8 +310,8 @@ def _get_path_circ_ellipse(plane, edge, vertex, edata,
     # The angle between the curve axis and the plane is not 0 nor 180 degrees
     _angle = math.degrees(ax.getAngle(drawing_plane_normal))
     if round(_angle, 2) not in (0, 180):
-        edata += get_discretized(edge, plane)
-        return "edata", edata
+        writer.discretize(edge, get_export_params()["discretization"])
+        return None
 
     # The angle is 0 or 180, coplanar
     occversion = Part.OCC_VERSION.split(".")
@@ -167,7 +334,7 @@ def _get_path_circ_ellipse(plane, edge, vertex, edata,
                      "obtained by 'projectToSVG', "
                      "continue manually.")
             else:
-                edata += A
+                writer.write(A)
                 done = True
 
     if not done:
@@ -177,8 +344,8 @@ def _get_path_circ_ellipse(plane, edge, vertex, edata,
                              fill, stroke, linewidth, lstyle,
                              edge)
             # If it's a circle we will return the final SVG string,
-            # otherwise it will process the `edata` further
-            return "svg", svg
+            # otherwise it will process the path data further
+            return svg
         elif len(edge.Vertexes) == 1 and isellipse:
             # Complete ellipse not only arc
             # svg = get_ellipse(plane,
@@ -188,10 +355,9 @@ def _get_path_circ_ellipse(plane, edge, vertex, edata,
 
             # Difference in angles
             _diff = (center.LastParameter - center.FirstParameter)/2.0
-            endpoints = [get_proj(center.value(_diff), plane),
-                         get_proj(vertex[-1].Point, plane)]
+            endpoints = [center.value(_diff), vertex[-1].Point]
         else:
-            endpoints = [get_proj(vertex[-1].Point, plane)]
+            endpoints = [vertex[-1].Point]
 
         # Arc with more than one vertex
         if iscircle:
@@ -224,17 +390,16 @@ def _get_path_circ_ellipse(plane, edge, vertex, edata,
         flag_sweep = DraftVecUtils.angle(t1, t2, drawing_plane_normal) < 0
 
         for v in endpoints:
-            edata += ('A {} {} {} '
-                      '{} {} '
-                      '{} {} '.format(rx, ry, rot,
-                                      int(flag_large_arc),
-                                      int(flag_sweep),
-                                      v.x, v.y))
+            writer.write('A {} {} {} '
+                         '{} {} '.format(rx, ry, rot,
+                                         int(flag_large_arc),
+                                         int(flag_sweep)))
+            writer.write_points([v])
 
-    return "edata", edata
+    return None
 
 
-def _get_path_bspline(plane, edge, edata):
+def _get_path_bspline(plane, edge, writer):
     """Convert the edge to a BSpline and discretize it."""
     bspline = edge.Curve.toBSpline(edge.FirstParameter, edge.LastParameter)
     if bspline.Degree > 3 or bspline.isRational():
@@ -249,25 +414,19 @@ def _get_path_bspline(plane, edge, edata):
                 _wrn("Bezier segment of degree > 3")
                 raise AssertionError
             elif bezierseg.Degree == 1:
-                edata += 'L '
+                writer.write('L ')
             elif bezierseg.Degree == 2:
-                edata += 'Q '
+                writer.write('Q ')
             elif bezierseg.Degree == 3:
-                edata += 'C '
+                writer.write('C ')
 
-            for pole in bezierseg.getPoles()[1:]:
-                v = get_proj(pole, plane)
-                edata += '{} {} '.format(v.x, v.y)
+            writer.write_points(bezierseg.getPoles()[1:])
     else:
         _msg("Debug: one edge (hash {}) "
              "has been discretized "
              "with parameter 0.1".format(edge.hashCode()))
 
-        for linepoint in bspline.discretize(0.1)[1:]:
-            v = get_proj(linepoint, plane)
-            edata += 'L {} {} '.format(v.x, v.y)
-
-    return edata
+        writer.write_points(bspline.discretize(0.1)[1:], "L")
 
 
 def get_circle(plane,
@@ -357,6 +516,9 @@ def get_path(obj, plane,
     `edges` and `wires` are mutually exclusive. If no `wires` are provided,
     sort the `edges`, and use them. If `wires` are provided, sort the edges
     in these `wires`, and use them.
+
+    `pathdata` is a list or a set of the path data already written,
+    the path is omitted if its data was already written.
     """
     svg = "<path "
 
@@ -383,8 +545,9 @@ def get_path(obj, plane,
             wire.fixWire()
             egroups.append(Part.__sortEdges__(wire.Edges))
 
+    paths = io.StringIO()
     for _, _edges in enumerate(egroups):
-        edata = ""
+        writer = SvgPathWriter(plane)
         vertex = ()  # skipped for the first edge
 
         for edgeindex, edge in enumerate(_edges):
@@ -396,45 +559,48 @@ def get_path(obj, plane,
                     vertex.reverse()
 
             if edgeindex == 0:
-                v = get_proj(vertex[0].Point, plane)
-                edata += 'M {} {} '.format(v.x, v.y)
+                writer.move_to(vertex[0].Point)
             else:
                 if (vertex[0].Point - previousvs[-1].Point).Length > 1e-6:
                     raise ValueError('edges not ordered')
 
-            iscircle = DraftGeomUtils.geomType(edge) == "Circle"
-            isellipse = DraftGeomUtils.geomType(edge) == "Ellipse"
+            geomtype = DraftGeomUtils.geomType(edge)
+            iscircle = geomtype == "Circle"
+            isellipse = geomtype == "Ellipse"
 
             if iscircle or isellipse:
-                _type, data = _get_path_circ_ellipse(plane, edge, vertex,
-                                                     edata,
-                                                     iscircle, isellipse,
-                                                     fill, stroke,
-                                                     linewidth, lstyle)
-                if _type == "svg":
+                data = _get_path_circ_ellipse(plane, edge, vertex,
+                                              writer,
+                                              iscircle, isellipse,
+                                              fill, stroke,
+                                              linewidth, lstyle)
+                if data is not None:
                     # final svg string already calculated, so just return it
                     return data
-
-                # else the `edata` was properly augmented, so re-assing it
-                edata = data
-            elif DraftGeomUtils.geomType(edge) == "Line":
-                v = get_proj(vertex[-1].Point, plane)
-                edata += 'L {} {} '.format(v.x, v.y)
+            elif geomtype == "Line":
+                writer.line_to(vertex[-1].Point)
             else:
                 # If it's not a circle nor ellipse nor straight line
                 # convert the curve to BSpline
-                edata = _get_path_bspline(plane, edge, edata)
+                _get_path_bspline(plane, edge, writer)
 
         if fill != 'none':
-            edata += 'Z '
+            writer.write('Z ')
 
+        edata = writer.getvalue()
         if edata in pathdata:
             # do not draw a path on another identical path
             return ""
         else:
-            svg += edata
-            pathdata.append(edata)
+            paths.write(edata)
+            # `pathdata` can be a set, which is faster to search
+            # when the same list is used for many paths
+            if isinstance(pathdata, set):
+                pathdata.add(edata)
+            else:
+                pathdata.append(edata)
 
+    svg += paths.getvalue()
     svg += '" '
     svg += 'stroke="{}" '.format(stroke)
     svg += 'stroke-width="{} px" '.format(linewidth)
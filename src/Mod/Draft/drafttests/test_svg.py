@@ -21,7 +21,17 @@
 # *   USA                                                                   *
 # *                                                                         *
 # ***************************************************************************
-"""Unit tests for the Draft Workbench, SVG import and export tests."""
+"""Unit tests for the Draft Workbench, SVG import and export tests.
+
+The import of large SVG files can be benchmarked from the Python console::
+
+    from drafttests import test_svg
+    test_svg.benchmark_import_svg((1000, 10000, 100000))
+
+and the export of shapes with many edges with::
+
+    test_svg.benchmark_get_svg((1000, 10000, 100000))
+"""
 ## @package test_svg
 # \ingroup drafttests
 # \brief Unit tests for the Draft Workbench, SVG import and export tests.
@@ -29,6 +39,8 @@
 ## \addtogroup drafttests
 # @{
 import os
+import tempfile
+import time
 import unittest
 
 import FreeCAD as App
@@ -38,6 +50,101 @@ import drafttests.auxiliary as aux
 from draftutils.messages import _msg
 
 
+def make_svg_file(filename, paths=1000, groups=10):
+    """Write an SVG file like the ones of laser-cutting software.
+
+    The paths are closed outlines made of straight segments, every
+    tenth one also has a bezier curve. They are spread over the given
+    number of groups, which are Inkscape layers.
+    """
+    f = open(filename, "w")
+    f.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<svg xmlns="http://www.w3.org/2000/svg"'
+            ' xmlns:inkscape="http://www.inkscape.org/namespaces/inkscape"'
+            ' xmlns:sodipodi="http://sodipodi.sourceforge.net/DTD/sodipodi-0.dtd"'
+            ' inkscape:version="1.0" sodipodi:docname="{0}"'
+            ' width="1000mm" height="1000mm" viewBox="0 0 1000 1000">\n'
+            .format(os.path.basename(filename)))
+    per_group = -(-paths // groups)
+    for i in range(paths):
+        if i % per_group == 0:
+            if i:
+                f.write('</g>\n')
+            f.write('<g id="layer{0}" inkscape:groupmode="layer"'
+                    ' inkscape:label="Layer {0}">\n'.format(i // per_group))
+        x, y = 10 * (i % 100), 10 * (i // 100 % 100)
+        if i % 10 == 9:
+            d = "M {0} {1} h 8 v 4 c 0 2 -2 4 -4 4 c -2 0 -4 -2 -4 -4 z".format(x, y)
+        else:
+            d = "M {0} {1} h 8 l 0 8 l -8 0 z".format(x, y)
+        f.write('<path id="path{0}" d="{1}"'
+                ' style="fill:none;stroke:#ff0000;stroke-width:0.1"/>\n'.format(i, d))
+    if paths:
+        f.write('</g>\n')
+    f.write('</svg>\n')
+    f.close()
+
+
+def benchmark_import_svg(path_counts=(1000, 10000, 100000), compound=True):
+    """Time the import of generated SVG files.
+
+    Returns a list of (number of paths, seconds).
+    """
+    import importSVG
+    results = []
+    for paths in path_counts:
+        filename = os.path.join(tempfile.gettempdir(), "benchmark_{}.svg".format(paths))
+        make_svg_file(filename, paths, max(1, paths // 1000))
+        doc = App.newDocument("SVGBenchmark")
+        start = time.time()
+        importSVG.insert(filename, doc.Name, compound=compound)
+        seconds = time.time() - start
+        _msg("  importSVG: {0} paths, {1} objects, {2:.3f} s".format(paths, len(doc.Objects), seconds))
+        App.closeDocument(doc.Name)
+        os.remove(filename)
+        results.append((paths, seconds))
+    return results
+
+
+def make_edges_shape(edges=1000):
+    """Return a compound of wires with about the given number of edges.
+
+    The wires are squares, written as straight segments, and circles,
+    which are discretized because they are tilted from the drawing plane.
+    """
+    import Part
+    shapes = []
+    for i in range(edges // 4):
+        x, y = 10 * (i % 100), 10 * (i // 100)
+        if i % 5 == 4:
+            circle = Part.makeCircle(4, App.Vector(x, y, 0), App.Vector(0, 1, 1))
+            shapes.append(Part.Wire(circle))
+        else:
+            square = Part.makePolygon([App.Vector(x, y, 0),
+                                       App.Vector(x + 8, y, 0),
+                                       App.Vector(x + 8, y + 8, 0),
+                                       App.Vector(x, y + 8, 0),
+                                       App.Vector(x, y, 0)])
+            shapes.append(square)
+    return Part.makeCompound(shapes)
+
+
+def benchmark_get_svg(edge_counts=(1000, 10000, 100000)):
+    """Time the SVG export of shapes with many edges.
+
+    Returns a list of (number of edges, seconds).
+    """
+    results = []
+    for edges in edge_counts:
+        shape = make_edges_shape(edges)
+        start = time.time()
+        svg = Draft.get_svg(shape, direction=App.Vector(0, 0, 1))
+        seconds = time.time() - start
+        _msg("  get_svg: {0} edges, {1} characters, {2:.3f} s".format(edges, len(svg), seconds))
+        results.append((edges, seconds))
+    return results
+
+
 class DraftSVG(unittest.TestCase):
     """Test reading and writing of SVGs with Draft."""
 
@@ -109,6 +216,119 @@ class DraftSVG(unittest.TestCase):
         else:
             self.fail("no exception thrown")
 
+    def test_import_svg_compounds(self):
+        """Import the paths of each layer of an SVG file as one compound."""
+        import importSVG
+        filename = os.path.join(tempfile.gettempdir(), "test_import_svg_compounds.svg")
+        make_svg_file(filename, 60, 3)
+
+        importSVG.insert(filename, self.doc_name, compound=False)
+        objs = self.doc.Objects
+        self.assertEqual(len(objs), 60)
+        edges = sum([len(o.Shape.Edges) for o in objs])
+        length = sum([o.Shape.Length for o in objs])
+        for o in objs:
+            self.doc.removeObject(o.Name)
+
+        importSVG.insert(filename, self.doc_name, compound=True)
+        os.remove(filename)
+        objs = self.doc.Objects
+        self.assertEqual([o.Label for o in objs], ["Layer 0", "Layer 1", "Layer 2"])
+        self.assertEqual([len(o.Shape.Wires) for o in objs], [20, 20, 20])
+        self.assertEqual(sum([len(o.Shape.Edges) for o in objs]), edges)
+        self.assertAlmostEqual(sum([o.Shape.Length for o in objs]), length, 6)
+
+    def test_import_svg_compounds_geometry(self):
+        """The compound import gives the same geometry as the default one."""
+        import importSVG
+        filename = os.path.join(tempfile.gettempdir(), "test_import_svg_geometry.svg")
+        make_svg_file(filename, 60, 3)
+
+        def get_wires(objs):
+            wires = []
+            for o in objs:
+                for w in o.Shape.Wires:
+                    c = w.CenterOfMass
+                    wires.append((round(w.Length, 6), len(w.Edges), w.isClosed(),
+                                  round(c.x, 6), round(c.y, 6), round(c.z, 6)))
+            return sorted(wires)
+
+        def get_bound_box(objs):
+            bb = App.BoundBox()
+            for o in objs:
+                bb.add(o.Shape.BoundBox)
+            return bb
+
+        importSVG.insert(filename, self.doc_name, compound=False)
+        objs = self.doc.Objects
+        wires = get_wires(objs)
+        bb = get_bound_box(objs)
+        for o in objs:
+            self.doc.removeObject(o.Name)
+
+        importSVG.insert(filename, self.doc_name, compound=True)
+        os.remove(filename)
+        objs = self.doc.Objects
+        self.assertEqual(get_wires(objs), wires)
+        compound_bb = get_bound_box(objs)
+        for attr in ["XMin", "YMin", "ZMin", "XMax", "YMax", "ZMax"]:
+            self.assertAlmostEqual(getattr(compound_bb, attr), getattr(bb, attr), 6)
+
+    def test_svg_get_contents(self):
+        """Read the patterns of an SVG file."""
+        import importSVG
+        svg = ('<svg><defs>\n<pattern id="a">\n<path d="M0 0 L1 1"/>\n</pattern>'
+               '<pattern\nid="b"></pattern></defs></svg>')
+        result = importSVG.getContents(svg, 'pattern', True)
+        self.assertEqual(sorted(result), ["a", "b"])
+        self.assertEqual(result["a"], '<pattern id="a">\n<path d="M0 0 L1 1"/>\n</pattern>')
+
+    def test_get_svg_path(self):
+        """Write the path data of straight and discretized edges."""
+        import Part
+        square = Part.makePolygon([App.Vector(0, 0, 0),
+                                   App.Vector(10, 0, 0),
+                                   App.Vector(10, 10.5, 0),
+                                   App.Vector(0, 10.5, 0),
+                                   App.Vector(0, 0, 0)])
+        svg = Draft.get_svg(square, fillstyle="none")
+        self.assertIn('d="M 0 0 L 10 0 L 10 10.5 L 0 10.5 L 0 0 "', svg)
+
+        # a circle seen at 45 degrees is discretized
+        import WorkingPlane
+        from draftfunctions.svgshapes import get_proj
+        plane = WorkingPlane.plane()
+        plane.alignToPointAndAxis_SVG(App.Vector(0, 0, 0), App.Vector(0, 0, 1), 0)
+        circle = Part.Wire(Part.makeCircle(10, App.Vector(0, 0, 0), App.Vector(0, 1, 1)))
+        svg = Draft.get_svg(circle, direction=plane, fillstyle="none")
+        data = svg.split(' d="')[1].split('"')[0].split()
+        self.assertEqual(set(data[0::3]), set(["M", "L"]))
+        self.assertGreater(data.count("L"), 5)
+        coords = [float(c) for i, c in enumerate(data) if i % 3]
+        points = circle.Edges[0].discretize(Number=data.count("L") + 1)
+        for i, point in enumerate(points):
+            v = get_proj(point, plane)
+            self.assertAlmostEqual(coords[2 * i + 2], v.x, 5)
+            self.assertAlmostEqual(coords[2 * i + 3], v.y, 5)
+
+    def test_get_svg_loose_edges(self):
+        """Edges which are not part of a face are exported once."""
+        import Part
+        face = Part.Face(Part.makePolygon([App.Vector(0, 0, 0),
+                                           App.Vector(10, 0, 0),
+                                           App.Vector(10, 10, 0),
+                                           App.Vector(0, 0, 0)]))
+        edge = Part.makeLine(App.Vector(20, 0, 0), App.Vector(30, 0, 0))
+        obj = self.doc.addObject("Part::Feature", "Loose")
+        obj.Shape = Part.makeCompound([face, edge])
+        svg = Draft.get_svg(obj, direction=App.Vector(0, 0, 1))
+        self.assertEqual(svg.count("Loose_f"), 1)
+        self.assertEqual(svg.count("Loose_nwe"), 1)
+
+        obj.Shape = face
+        svg = Draft.get_svg(obj, direction=App.Vector(0, 0, 1))
+        self.assertEqual(svg.count("Loose_nwe"), 0)
+
     def tearDown(self):
         """Finish the test.
 
@@ -76,6 +76,17 @@ else:
 if open.__module__ in ['__builtin__', 'io']:
     pythonopen = open
 
+# Tokenizers, compiled once for all the elements of all files
+pathcommandsre = re.compile(r'\s*?([mMlLhHvVaAcCqQsStTzZ])'
+                            r'\s*?([^mMlLhHvVaAcCqQsStTzZ]*)\s*?', re.DOTALL)
+pointsre = re.compile(r'([-+]?[0-9]*\.?[0-9]+([eE][-+]?[0-9]+)?)', re.DOTALL)
+sizere = re.compile(r'([-+]?[0-9]*\.?[0-9]+([eE][-+]?[0-9]+)?)'
+                    r'(px|pt|pc|mm|cm|in|em|ex|%)?')
+transformre = re.compile(r'(matrix|translate|scale|rotate|skewX|skewY)'
+                         r'\s*?\((.*?)\)', re.DOTALL)
+versionre = re.compile(r'\d+\.\d+')
+tagidre = re.compile('id="(.*?)"')
+
 svgcolors = {
     'Pink': (255, 192, 203),
     'Blue': (0, 0, 255),
@@ -403,10 +414,7 @@ def getsize(length, mode='discard', base=1):
         }
 
     # Extract a number from a string like '+56215.14565E+6mm'
-    _num = '([-+]?[0-9]*\.?[0-9]+([eE][-+]?[0-9]+)?)'
-    _unit = '(px|pt|pc|mm|cm|in|em|ex|%)?'
-    _full_num = _num + _unit
-    number, exponent, unit = re.findall(_full_num, length)[0]
+    number, exponent, unit = sizere.findall(length)[0]
     if mode == 'discard':
         return float(number)
     elif mode == 'tuple':
@@ -640,9 +648,16 @@ def getrgb(color):
 
 
 class svgHandler(xml.sax.ContentHandler):
-    """Parse SVG files and create FreeCAD objects."""
+    """Parse SVG files and create FreeCAD objects.
+
+    By default each path, subpath and basic shape becomes its own
+    `Part::Feature`. In compound mode the shapes of each group, layer
+    or symbol are collected and added as a single compound, the straight
+    segments of paths are built as polygons, and no message is printed
+    for each element, which is much faster for large files.
+    """
 
-    def __init__(self):
+    def __init__(self, compound=None):
         super().__init__()
         """Retrieve Draft parameters and initialize."""
         _prefs = "User parameter:BaseApp/Preferences/Mod/Draft"
@@ -650,6 +665,12 @@ class svgHandler(xml.sax.ContentHandler):
         self.style = params.GetInt("svgstyle")
         self.disableUnitScaling = params.GetBool("svgDisableUnitScaling",
                                                  False)
+        if compound is None:
+            compound = params.GetBool("svgImportCompounds", False)
+        self.compound = compound
+        self.verbose = not compound
+        # In compound mode, the (name, style, shapes) of the open groups
+        self.groupshapes = [("Shapes", None, [])]
         self.count = 0
         self.transform = None
         self.grouptransform = []
@@ -675,16 +696,102 @@ class svgHandler(xml.sax.ContentHandler):
             b = float(((c >> 8) & 0xFF)/255)
         self.col = (r, g, b, 0.0)
 
-    def format(self, obj):
+    def format(self, obj, style=None):
         """Apply styles to the object if the graphical interface is up."""
         if FreeCAD.GuiUp:
+            color, width, fill = style or (self.color, self.width, self.fill)
             v = obj.ViewObject
-            if self.color:
-                v.LineColor = self.color
-            if self.width:
-                v.LineWidth = self.width
-            if self.fill:
-                v.ShapeColor = self.fill
+            if color:
+                v.LineColor = color
+            if width:
+                v.LineWidth = width
+            if fill:
+                v.ShapeColor = fill
+
+    def addShape(self, sh, name, style=True):
+        """Add a shape to the document, as a new `Part::Feature`.
+
+        In compound mode the shape is only collected, and added later
+        with the other shapes of its group by `addGroupShapes()`.
+
+        Parameters
+        ----------
+        sh : Part.Shape
+            The shape to add, already transformed.
+        name : str
+            The name of the new object.
+        style : bool, optional
+            If `False`, the current style isn't applied to the object.
+        """
+        if self.compound:
+            groupname, groupstyle, shapes = self.groupshapes[-1]
+            if not shapes:
+                groupstyle = (self.color, self.width, self.fill)
+                self.groupshapes[-1] = (groupname, groupstyle, shapes)
+            shapes.append(sh)
+            return None
+        obj = self.doc.addObject("Part::Feature", name)
+        obj.Shape = sh
+        if style:
+            self.format(obj)
+        if self.currentsymbol:
+            self.symbols[self.currentsymbol].append(obj)
+        return obj
+
+    def addGroupShapes(self):
+        """Add the shapes collected in the last group as one compound.
+
+        The object takes the style of the first shape of the group.
+
+        Returns
+        -------
+        Part::Feature
+            The new object, or `None` if the group had no shapes.
+        """
+        name, style, shapes = self.groupshapes.pop()
+        if not shapes:
+            return None
+        obj = self.doc.addObject("Part::Feature", name)
+        obj.Label = name
+        if len(shapes) == 1:
+            obj.Shape = shapes[0]
+        else:
+            obj.Shape = Part.makeCompound(shapes)
+        self.format(obj, style)
+        if self.currentsymbol:
+            self.symbols[self.currentsymbol].append(obj)
+        return obj
+
+    def makeLine(self, v1, v2):
+        """Return a straight segment between two points.
+
+        In compound mode the segment is kept as a pair of points, so that
+        `makePath()` can build consecutive segments in a single polygon.
+        """
+        if self.compound:
+            return (v1, v2)
+        return Part.LineSegment(v1, v2).toShape()
+
+    def makePath(self, path):
+        """Return a wire from a list of segments.
+
+        Parameters
+        ----------
+        path : list
+            Edges, or pairs of points made by `makeLine()`.
+
+        Returns
+        -------
+        Part::Wire
+            A polygon if all segments are straight, otherwise the result
+            of `makewire()`.
+        """
+        if self.compound and all(isinstance(seg, tuple) for seg in path):
+            return Part.makePolygon([path[0][0]] + [seg[1] for seg in path])
+        path = [Part.LineSegment(*seg).toShape()
+                if isinstance(seg, tuple) else seg
+                for seg in path]
+        return makewire(path)
 
     def startElement(self, name, attrs):
         """Re-organize data into a nice clean dictionary.
@@ -698,8 +805,9 @@ class svgHandler(xml.sax.ContentHandler):
             Dictionary of content of the elements
         """
         self.count += 1
-        _msg('processing element {0}: {1}'.format(self.count, name))
-        _msg('existing group transform: {}'.format(self.grouptransform))
+        if self.verbose:
+            _msg('processing element {0}: {1}'.format(self.count, name))
+            _msg('existing group transform: {}'.format(self.grouptransform))
 
         data = {}
         for (keyword, content) in list(attrs.items()):
@@ -717,7 +825,7 @@ class svgHandler(xml.sax.ContentHandler):
             if 'inkscape:version' in data:
                 inks_doc_name = attrs.getValue('sodipodi:docname')
                 inks_full_ver = attrs.getValue('inkscape:version')
-                inks_ver_pars = re.search("\d+\.\d+", inks_full_ver)
+                inks_ver_pars = versionre.search(inks_full_ver)
                 if inks_ver_pars != None:
                     inks_ver_f = float(inks_ver_pars.group(0))
                 else:
@@ -853,6 +961,14 @@ class svgHandler(xml.sax.ContentHandler):
             if name == "g":
                 self.grouptransform.append(FreeCAD.Matrix())
 
+        if self.compound and name in ("svg", "g", "symbol"):
+            groupname = name.capitalize()
+            if 'inkscape:label' in data:
+                groupname = ' '.join(data['inkscape:label'])
+            elif 'id' in data:
+                groupname = data['id'][0]
+            self.groupshapes.append((groupname, None, []))
+
         if self.style == 1:
             self.color = self.col
             self.width = self.lw
@@ -860,11 +976,13 @@ class svgHandler(xml.sax.ContentHandler):
         pathname = None
         if 'id' in data:
             pathname = data['id'][0]
-            _msg('name: {}'.format(pathname))
+            if self.verbose:
+                _msg('name: {}'.format(pathname))
 
         # Process paths
         if name == "path":
-            _msg('data: {}'.format(data))
+            if self.verbose:
+                _msg('data: {}'.format(data))
 
             if not pathname:
                 pathname = 'Path'
@@ -890,15 +1008,6 @@ class svgHandler(xml.sax.ContentHandler):
                 self.lastdim = obj
                 data['d'] = []
 
-            _op = '([mMlLhHvVaAcCqQsStTzZ])'
-            _op2 = '([^mMlLhHvVaAcCqQsStTzZ]*)'
-            _command = '\s*?' + _op + '\s*?' + _op2 + '\s*?'
-            pathcommandsre = re.compile(_command, re.DOTALL)
-
-            _num = '[-+]?[0-9]*\.?[0-9]+'
-            _exp = '([eE][-+]?[0-9]+)?'
-            _point = '(' + _num + _exp + ')'
-            pointsre = re.compile(_point, re.DOTALL)
             _commands = pathcommandsre.findall(' '.join(data['d']))
             for d, pointsstr in _commands:
                 relative = d.islower()
@@ -910,15 +1019,11 @@ class svgHandler(xml.sax.ContentHandler):
                     y = pointlist.pop(0)
                     if path:
                         # sh = Part.Wire(path)
-                        sh = makewire(path)
+                        sh = self.makePath(path)
                         if self.fill and sh.isClosed():
                             sh = Part.Face(sh)
                         sh = self.applyTrans(sh)
-                        obj = self.doc.addObject("Part::Feature", pathname)
-                        obj.Shape = sh
-                        self.format(obj)
-                        if self.currentsymbol:
-                            self.symbols[self.currentsymbol].append(obj)
+                        self.addShape(sh, pathname)
                         path = []
                         # if firstvec:
                         #    Move relative to last move command
@@ -929,7 +1034,8 @@ class svgHandler(xml.sax.ContentHandler):
                     else:
                         lastvec = Vector(x, -y, 0)
                     firstvec = lastvec
-                    _msg('move {}'.format(lastvec))
+                    if self.verbose:
+                        _msg('move {}'.format(lastvec))
                     lastpole = None
 
                 if (d == "L" or d == "l") \
@@ -940,9 +1046,9 @@ class svgHandler(xml.sax.ContentHandler):
                         else:
                             currentvec = Vector(x, -y, 0)
                         if not DraftVecUtils.equals(lastvec, currentvec):
-                            _seg = Part.LineSegment(lastvec, currentvec)
-                            seg = _seg.toShape()
-                            _msg("line {} {}".format(lastvec, currentvec))
+                            seg = self.makeLine(lastvec, currentvec)
+                            if self.verbose:
+                                _msg("line {} {}".format(lastvec, currentvec))
                             lastvec = currentvec
                             path.append(seg)
                         lastpole = None
@@ -952,7 +1058,7 @@ class svgHandler(xml.sax.ContentHandler):
                             currentvec = lastvec.add(Vector(x, 0, 0))
                         else:
                             currentvec = Vector(x, lastvec.y, 0)
-                        seg = Part.LineSegment(lastvec, currentvec).toShape()
+                        seg = self.makeLine(lastvec, currentvec)
                         lastvec = currentvec
                         lastpole = None
                         path.append(seg)
@@ -963,8 +1069,7 @@ class svgHandler(xml.sax.ContentHandler):
                         else:
                             currentvec = Vector(lastvec.x, -y, 0)
                         if lastvec != currentvec:
-                            _seg = Part.LineSegment(lastvec, currentvec)
-                            seg = _seg.toShape()
+                            seg = self.makeLine(lastvec, currentvec)
                             lastvec = currentvec
                             lastpole = None
                             path.append(seg)
@@ -1118,8 +1223,7 @@ class svgHandler(xml.sax.ContentHandler):
                                     _d1 < _precision and \
                                     _d2 < _precision:
                                 # print("straight segment")
-                                _seg = Part.LineSegment(lastvec, currentvec)
-                                seg = _seg.toShape()
+                                seg = self.makeLine(lastvec, currentvec)
                             else:
                                 # print("cubic bezier segment")
                                 b = Part.BezierCurve()
@@ -1165,8 +1269,7 @@ class svgHandler(xml.sax.ContentHandler):
                             if True and \
                                     _distance < _precision:
                                 # print("straight segment")
-                                _seg = Part.LineSegment(lastvec, currentvec)
-                                seg = _seg.toShape()
+                                seg = self.makeLine(lastvec, currentvec)
                             else:
                                 # print("quadratic bezier segment")
                                 b = Part.BezierCurve()
@@ -1179,7 +1282,7 @@ class svgHandler(xml.sax.ContentHandler):
                 elif (d == "Z") or (d == "z"):
                     if not DraftVecUtils.equals(lastvec, firstvec):
                         try:
-                            seg = Part.LineSegment(lastvec, firstvec).toShape()
+                            seg = self.makeLine(lastvec, firstvec)
                         except Part.OCCError:
                             pass
                         else:
@@ -1187,34 +1290,26 @@ class svgHandler(xml.sax.ContentHandler):
                     if path:
                         # The path should be closed by now
                         # sh = makewire(path, True)
-                        sh = makewire(path, donttry=False)
+                        sh = self.makePath(path)
                         if self.fill \
                                 and len(sh.Wires) == 1 \
                                 and sh.Wires[0].isClosed():
                             sh = Part.Face(sh)
                         sh = self.applyTrans(sh)
-                        obj = self.doc.addObject("Part::Feature", pathname)
-                        obj.Shape = sh
-                        self.format(obj)
+                        self.addShape(sh, pathname)
                         path = []
                         if firstvec:
                             # Move relative to recent draw command
                             lastvec = firstvec
                         point = []
                         # command = None
-                        if self.currentsymbol:
-                            self.symbols[self.currentsymbol].append(obj)
             if path:
-                sh = makewire(path, checkclosed=False)
+                sh = self.makePath(path)
                 # sh = Part.Wire(path)
                 if self.fill and sh.isClosed():
                     sh = Part.Face(sh)
                 sh = self.applyTrans(sh)
-                obj = self.doc.addObject("Part::Feature", pathname)
-                obj.Shape = sh
-                self.format(obj)
-                if self.currentsymbol:
-                    self.symbols[self.currentsymbol].append(obj)
+                self.addShape(sh, pathname)
         # end process paths
 
         # Process rects
@@ -1309,11 +1404,7 @@ class svgHandler(xml.sax.ContentHandler):
             if self.fill:
                 sh = Part.Face(sh)
             sh = self.applyTrans(sh)
-            obj = self.doc.addObject("Part::Feature", pathname)
-            obj.Shape = sh
-            self.format(obj)
-            if self.currentsymbol:
-                self.symbols[self.currentsymbol].append(obj)
+            self.addShape(sh, pathname)
 
         # Process lines
         if name == "line":
@@ -1323,11 +1414,7 @@ class svgHandler(xml.sax.ContentHandler):
             p2 = Vector(data['x2'], -data['y2'], 0)
             sh = Part.LineSegment(p1, p2).toShape()
             sh = self.applyTrans(sh)
-            obj = self.doc.addObject("Part::Feature", pathname)
-            obj.Shape = sh
-            self.format(obj)
-            if self.currentsymbol:
-                self.symbols[self.currentsymbol].append(obj)
+            self.addShape(sh, pathname)
 
         # Process polylines and polygons
         if name == "polyline" or name == "polygon":
@@ -1342,7 +1429,8 @@ class svgHandler(xml.sax.ContentHandler):
             if not pathname:
                 pathname = 'Polyline'
             points = [float(d) for d in data['points']]
-            _msg('points {}'.format(points))
+            if self.verbose:
+                _msg('points {}'.format(points))
             lenpoints = len(points)
             if lenpoints >= 4 and lenpoints % 2 == 0:
                 lastvec = Vector(points[0], -points[1], 0)
@@ -1352,19 +1440,19 @@ class svgHandler(xml.sax.ContentHandler):
                 for svgx, svgy in zip(points[2::2], points[3::2]):
                     currentvec = Vector(svgx, -svgy, 0)
                     if not DraftVecUtils.equals(lastvec, currentvec):
-                        seg = Part.LineSegment(lastvec, currentvec).toShape()
+                        seg = self.makeLine(lastvec, currentvec)
                         # print("polyline seg ", lastvec, currentvec)
                         lastvec = currentvec
                         path.append(seg)
                 if path:
-                    sh = Part.Wire(path)
+                    if self.compound:
+                        sh = self.makePath(path)
+                    else:
+                        sh = Part.Wire(path)
                     if self.fill and sh.isClosed():
                         sh = Part.Face(sh)
                     sh = self.applyTrans(sh)
-                    obj = self.doc.addObject("Part::Feature", pathname)
-                    obj.Shape = sh
-                    if self.currentsymbol:
-                        self.symbols[self.currentsymbol].append(obj)
+                    self.addShape(sh, pathname, style=False)
 
         # Process ellipses
         if name == "ellipse":
@@ -1393,11 +1481,7 @@ class svgHandler(xml.sax.ContentHandler):
                 sh = Part.Wire([sh])
                 sh = Part.Face(sh)
             sh = self.applyTrans(sh)
-            obj = self.doc.addObject("Part::Feature", pathname)
-            obj.Shape = sh
-            self.format(obj)
-            if self.currentsymbol:
-                self.symbols[self.currentsymbol].append(obj)
+            self.addShape(sh, pathname)
 
         # Process circles
         if name == "circle" and "freecad:skip" not in data:
@@ -1411,16 +1495,13 @@ class svgHandler(xml.sax.ContentHandler):
                 sh = Part.Face(sh)
             sh.translate(c)
             sh = self.applyTrans(sh)
-            obj = self.doc.addObject("Part::Feature", pathname)
-            obj.Shape = sh
-            self.format(obj)
-            if self.currentsymbol:
-                self.symbols[self.currentsymbol].append(obj)
+            self.addShape(sh, pathname)
 
         # Process texts
         if name in ["text", "tspan"]:
             if "freecad:skip" not in data:
-                _msg("processing a text")
+                if self.verbose:
+                    _msg("processing a text")
                 if 'x' in data:
                     self.x = data['x']
                 else:
@@ -1449,7 +1530,8 @@ class svgHandler(xml.sax.ContentHandler):
             if "xlink:href" in data:
                 symbol = data["xlink:href"][0][1:]
                 if symbol in self.symbols:
-                    _msg("using symbol " + symbol)
+                    if self.verbose:
+                        _msg("using symbol " + symbol)
                     shapes = []
                     for o in self.symbols[symbol]:
                         if o.isDerivedFrom("Part::Feature"):
@@ -1459,19 +1541,25 @@ class svgHandler(xml.sax.ContentHandler):
                         v = Vector(float(data['x']), -float(data['y']), 0)
                         sh.translate(v)
                         sh = self.applyTrans(sh)
-                        obj = self.doc.addObject("Part::Feature", symbol)
-                        obj.Shape = sh
-                        self.format(obj)
+                        if self.compound:
+                            self.addShape(sh, symbol)
+                        else:
+                            obj = self.doc.addObject("Part::Feature", symbol)
+                            obj.Shape = sh
+                            self.format(obj)
                 else:
-                    _msg("no symbol data")
+                    if self.verbose:
+                        _msg("no symbol data")
 
-        _msg("done processing element {}".format(self.count))
+        if self.verbose:
+            _msg("done processing element {}".format(self.count))
     # startElement()
 
     def characters(self, content):
         """Read characters from the given string."""
         if self.text:
-            _msg("reading characters {}".format(content))
+            if self.verbose:
+                _msg("reading characters {}".format(content))
             obj = self.doc.addObject("App::Annotation", 'Text')
             # use ignore to not break import if char is not found in latin1
             obj.LabelText = content.encode('latin1', 'ignore')
@@ -1505,8 +1593,11 @@ class svgHandler(xml.sax.ContentHandler):
             self.transform = None
             self.text = None
         if name == "g" or name == "svg":
-            _msg("closing group")
+            if self.verbose:
+                _msg("closing group")
             self.grouptransform.pop()
+        if self.compound and name in ("svg", "g", "symbol"):
+            self.addGroupShapes()
         if name == "symbol":
             if self.doc.getObject("svgsymbols"):
                 group = self.doc.getObject("svgsymbols")
@@ -1527,12 +1618,14 @@ class svgHandler(xml.sax.ContentHandler):
         """
         if isinstance(sh, Part.Shape):
             if self.transform:
-                _msg("applying object transform: {}".format(self.transform))
+                if self.verbose:
+                    _msg("applying object transform: {}".format(self.transform))
                 # sh = transformCopyShape(sh, self.transform)
                 # see issue #2062
                 sh = sh.transformGeometry(self.transform)
             for transform in self.grouptransform[::-1]:
-                _msg("applying group transform: {}".format(transform))
+                if self.verbose:
+                    _msg("applying group transform: {}".format(transform))
                 # sh = transformCopyShape(sh, transform)
                 # see issue #2062
                 sh = sh.transformGeometry(transform)
@@ -1542,11 +1635,13 @@ class svgHandler(xml.sax.ContentHandler):
             for p in [sh.Start, sh.End, sh.Dimline]:
                 cp = Vector(p)
                 if self.transform:
-                    _msg("applying object transform: "
-                         "{}".format(self.transform))
+                    if self.verbose:
+                        _msg("applying object transform: "
+                             "{}".format(self.transform))
                     cp = self.transform.multiply(cp)
                 for transform in self.grouptransform[::-1]:
-                    _msg("applying group transform: {}".format(transform))
+                    if self.verbose:
+                        _msg("applying group transform: {}".format(transform))
                     cp = transform.multiply(cp)
                 pts.append(cp)
             sh.Start = pts[0]
@@ -1581,10 +1676,6 @@ class svgHandler(xml.sax.ContentHandler):
         Base::Matrix4D
             The translated matrix.
         """
-        _op = '(matrix|translate|scale|rotate|skewX|skewY)'
-        _val = '\((.*?)\)'
-        _transf = _op + '\s*?' + _val
-        transformre = re.compile(_transf, re.DOTALL)
         m = FreeCAD.Matrix()
         for transformation, arguments in transformre.findall(tr):
             _args_rep = arguments.replace(',', ' ').split()
@@ -1693,37 +1784,59 @@ def getContents(filename, tag, stringmode=False):
     """
     result = {}
     if stringmode:
-        contents = filename
+        lines = filename.splitlines(True)
     else:
         # Use the native Python open which was saved as `pythonopen`
-        f = pythonopen(filename)
-        contents = f.read()
-        f.close()
-
-    # Replace the newline character with a string
-    # so that it's easiert to parse; later on the newline character
-    # will be restored
-    contents = contents.replace('\n', '_linebreak')
-    searchpat = '<' + tag + '.*?</' + tag + '>'
-    tags = re.findall(searchpat, contents)
-    for t in tags:
-        tagid = re.findall('id="(.*?)"', t)
-        if tagid:
-            tagid = tagid[0]
-        else:
-            tagid = 'none'
-        res = t.replace('_linebreak', '\n')
-        result[tagid] = res
+        lines = pythonopen(filename)
+
+    # The file is read line by line, only the text of the tags is kept
+    start = '<' + tag
+    end = '</' + tag + '>'
+    buf = ''
+    inside = False
+    searchfrom = 0
+    try:
+        for line in lines:
+            buf += line
+            while True:
+                if not inside:
+                    i = buf.find(start)
+                    if i < 0:
+                        # keep what could be the beginning of a tag
+                        buf = buf[-len(start):]
+                        break
+                    buf = buf[i:]
+                    inside = True
+                    searchfrom = len(start)
+                i = buf.find(end, searchfrom)
+                if i < 0:
+                    searchfrom = max(len(start), len(buf) - len(end) + 1)
+                    break
+                t = buf[:i + len(end)]
+                buf = buf[i + len(end):]
+                inside = False
+                tagid = tagidre.findall(t)
+                if tagid:
+                    tagid = tagid[0]
+                else:
+                    tagid = 'none'
+                result[tagid] = t
+    finally:
+        if not stringmode:
+            lines.close()
     return result
 
 
-def open(filename):
+def open(filename, compound=None):
     """Open filename and parse using the svgHandler().
 
     Parameters
     ----------
     filename : str
         The path to the filename to be opened.
+    compound : bool, optional
+        If `True`, import one compound per group or layer, see
+        `svgHandler`. Defaults to the `svgImportCompounds` preference.
 
     Returns
     -------
@@ -1737,7 +1850,7 @@ def open(filename):
     # Set up the parser
     parser = xml.sax.make_parser()
     parser.setFeature(xml.sax.handler.feature_external_ges, False)
-    parser.setContentHandler(svgHandler())
+    parser.setContentHandler(svgHandler(compound))
     parser._cont_handler.doc = doc
 
     # Use the native Python open which was saved as `pythonopen`
@@ -1748,7 +1861,7 @@ def open(filename):
     return doc
 
 
-def insert(filename, docname):
+def insert(filename, docname, compound=None):
     """Get an active document and parse using the svgHandler().
 
     If no document exist, it is created.
@@ -1760,6 +1873,9 @@ def insert(filename, docname):
     docname : str
         The name of the active App::Document if one exists, or
         of the new one created.
+    compound : bool, optional
+        If `True`, import one compound per group or layer, see
+        `svgHandler`. Defaults to the `svgImportCompounds` preference.
 
     Returns
     -------
@@ -1776,7 +1892,7 @@ def insert(filename, docname):
     # Set up the parser
     parser = xml.sax.make_parser()
     parser.setFeature(xml.sax.handler.feature_external_ges, False)
-    parser.setContentHandler(svgHandler())
+    parser.setContentHandler(svgHandler(compound))
     parser._cont_handler.doc = doc
 
     # Use the native Python open which was saved as `pythonopen`
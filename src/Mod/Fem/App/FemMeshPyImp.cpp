@@ -580,6 +580,182 @@ PyObject* FemMeshPy::addVolume(PyObject *args)
     return 0;
 }
 
+namespace {
+
+// Holds a contiguous view on a Python object exporting the buffer protocol
+// (numpy arrays, array.array, bytes) and releases it again on destruction.
+class BufferView
+{
+public:
+    BufferView() : valid(false) {
+        view = Py_buffer();
+    }
+    ~BufferView() {
+        if (valid)
+            PyBuffer_Release(&view);
+    }
+    bool acquire(PyObject* obj) {
+        if (PyObject_GetBuffer(obj, &view, PyBUF_SIMPLE) < 0)
+            return false;
+        valid = true;
+        return true;
+    }
+    Py_buffer view;
+
+private:
+    bool valid;
+};
+
+const SMDS_MeshElement* addElementWithID(SMESHDS_Mesh* meshDS, int dim,
+                                         const std::vector<const SMDS_MeshNode*>& Nodes,
+                                         int ElementId)
+{
+    const std::vector<const SMDS_MeshNode*>& N = Nodes;
+    if (dim == 1) {
+        switch (N.size()) {
+            case 2:
+                return meshDS->AddEdgeWithID(N[0],N[1],ElementId);
+            case 3:
+                return meshDS->AddEdgeWithID(N[0],N[1],N[2],ElementId);
+            default:
+                throw std::runtime_error("Unknown node count, [2|3] are allowed"); //unknown edge type
+        }
+    }
+    else if (dim == 2) {
+        switch (N.size()) {
+            case 3:
+                return meshDS->AddFaceWithID(N[0],N[1],N[2],ElementId);
+            case 4:
+                return meshDS->AddFaceWithID(N[0],N[1],N[2],N[3],ElementId);
+            case 6:
+                return meshDS->AddFaceWithID(N[0],N[1],N[2],N[3],N[4],N[5],ElementId);
+            case 8:
+                return meshDS->AddFaceWithID(N[0],N[1],N[2],N[3],N[4],N[5],N[6],N[7],ElementId);
+            default:
+                throw std::runtime_error("Unknown node count, [3|4|6|8] are allowed"); //unknown face type
+        }
+    }
+    else if (dim == 3) {
+        switch (N.size()) {
+            case 4:
+                return meshDS->AddVolumeWithID(N[0],N[1],N[2],N[3],ElementId);
+            case 5:
+                return meshDS->AddVolumeWithID(N[0],N[1],N[2],N[3],N[4],ElementId);
+            case 6:
+                return meshDS->AddVolumeWithID(N[0],N[1],N[2],N[3],N[4],N[5],ElementId);
+            case 8:
+                return meshDS->AddVolumeWithID(N[0],N[1],N[2],N[3],N[4],N[5],N[6],N[7],ElementId);
+            case 10:
+                return meshDS->AddVolumeWithID(N[0],N[1],N[2],N[3],N[4],N[5],N[6],N[7],N[8],N[9],ElementId);
+            case 13:
+                return meshDS->AddVolumeWithID(N[0],N[1],N[2],N[3],N[4],N[5],N[6],N[7],N[8],N[9],N[10],N[11],N[12],
+                                               ElementId);
+            case 15:
+                return meshDS->AddVolumeWithID(N[0],N[1],N[2],N[3],N[4],N[5],N[6],N[7],N[8],N[9],N[10],N[11],N[12],
+                                               N[13],N[14],ElementId);
+            case 20:
+                return meshDS->AddVolumeWithID(N[0],N[1],N[2],N[3],N[4],N[5],N[6],N[7],N[8],N[9],N[10],N[11],N[12],
+                                               N[13],N[14],N[15],N[16],N[17],N[18],N[19],ElementId);
+            default:
+                throw std::runtime_error("Unknown node count, [4|5|6|8|10|13|15|20] are allowed"); //unknown volume type
+        }
+    }
+    throw std::runtime_error("Unknown dimension, [1|2|3] are allowed");
+}
+
+}
+
+PyObject* FemMeshPy::addNodes(PyObject *args)
+{
+    PyObject* coordObj;
+    PyObject* idObj;
+    if (!PyArg_ParseTuple(args, "OO", &coordObj, &idObj))
+        return 0;
+
+    BufferView coords, ids;
+    if (!coords.acquire(coordObj) || !ids.acquire(idObj))
+        return 0;
+
+    const Py_ssize_t coordSize = static_cast<Py_ssize_t>(3 * sizeof(double));
+    if (coords.view.len % coordSize != 0 || ids.view.len % static_cast<Py_ssize_t>(sizeof(int)) != 0) {
+        PyErr_SetString(PyExc_ValueError, "addNodes() expects a buffer of doubles (x,y,z per node) "
+                                          "and a buffer of ints (one id per node)");
+        return 0;
+    }
+    Py_ssize_t count = ids.view.len / static_cast<Py_ssize_t>(sizeof(int));
+    if (coords.view.len / coordSize != count) {
+        PyErr_SetString(PyExc_ValueError, "addNodes(): number of coordinates does not match number of ids");
+        return 0;
+    }
+
+    const double* xyz = static_cast<const double*>(coords.view.buf);
+    const int* nodeIds = static_cast<const int*>(ids.view.buf);
+    try {
+        SMESHDS_Mesh* meshDS = getFemMeshPtr()->getSMesh()->GetMeshDS();
+        for (Py_ssize_t i = 0; i < count; i++) {
+            if (!meshDS->AddNodeWithID(xyz[3*i], xyz[3*i+1], xyz[3*i+2], nodeIds[i]))
+                throw std::runtime_error("Failed to add node");
+        }
+    }
+    catch (const std::exception& e) {
+        PyErr_SetString(Base::BaseExceptionFreeCADError, e.what());
+        return 0;
+    }
+    Py_Return;
+}
+
+PyObject* FemMeshPy::addElements(PyObject *args)
+{
+    int dim;
+    int nodeCount;
+    PyObject* connObj;
+    PyObject* idObj;
+    if (!PyArg_ParseTuple(args, "iiOO", &dim, &nodeCount, &connObj, &idObj))
+        return 0;
+
+    if (nodeCount <= 0) {
+        PyErr_SetString(PyExc_ValueError, "addElements(): number of nodes per element must be positive");
+        return 0;
+    }
+
+    BufferView conn, ids;
+    if (!conn.acquire(connObj) || !ids.acquire(idObj))
+        return 0;
+
+    const Py_ssize_t elemSize = static_cast<Py_ssize_t>(nodeCount * sizeof(int));
+    if (conn.view.len % elemSize != 0 || ids.view.len % static_cast<Py_ssize_t>(sizeof(int)) != 0) {
+        PyErr_SetString(PyExc_ValueError, "addElements() expects a buffer of ints (node ids per element) "
+                                          "and a buffer of ints (one id per element)");
+        return 0;
+    }
+    Py_ssize_t count = ids.view.len / static_cast<Py_ssize_t>(sizeof(int));
+    if (conn.view.len / elemSize != count) {
+        PyErr_SetString(PyExc_ValueError, "addElements(): number of elements does not match number of ids");
+        return 0;
+    }
+
+    const int* nodeIds = static_cast<const int*>(conn.view.buf);
+    const int* elemIds = static_cast<const int*>(ids.view.buf);
+    try {
+        SMESHDS_Mesh* meshDS = getFemMeshPtr()->getSMesh()->GetMeshDS();
+        std::vector<const SMDS_MeshNode*> Nodes(nodeCount);
+        for (Py_ssize_t i = 0; i < count; i++) {
+            for (int j = 0; j < nodeCount; j++) {
+                Nodes[j] = meshDS->FindNode(nodeIds[i * nodeCount + j]);
+                if (!Nodes[j])
+                    throw std::runtime_error("Failed to get node of the given indices");
+            }
+            if (!addElementWithID(meshDS, dim, Nodes, elemIds[i]))
+                throw std::runtime_error("Failed to add element with given ElementId");
+        }
+    }
+    catch (const std::exception& e) {
+        PyErr_SetString(Base::BaseExceptionFreeCADError, e.what());
+        return 0;
+    }
+    Py_Return;
+}
+
 PyObject* FemMeshPy::copy(PyObject *args)
 {
     if (!PyArg_ParseTuple(args, ""))
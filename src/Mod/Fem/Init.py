@@ -78,11 +78,19 @@ FreeCAD.addExportType(
     "FEM mesh YAML/JSON (*.meshyaml *.meshjson *.yaml *.json)", "feminout.importYamlJsonMesh"
 )
 
+FreeCAD.addImportType("FEM mesh binary (*.meshnpz)", "feminout.importNpzMesh")
+FreeCAD.addExportType("FEM mesh binary (*.meshnpz)", "feminout.importNpzMesh")
+
 FreeCAD.addImportType("FEM mesh Z88 (*i1.txt)", "feminout.importZ88Mesh")
 FreeCAD.addExportType("FEM mesh Z88 (*i1.txt)", "feminout.importZ88Mesh")
 
 FreeCAD.addImportType("FEM result Z88 displacements (*o2.txt)", "feminout.importZ88O2Results")
 
+FreeCAD.addExportType(
+    "FEM result binary VTU or XDMF time series (*.vtu *.pvd *.xdmf)",
+    "feminout.writeResultArrays"
+)
+
 if "BUILD_FEM_VTK" in FreeCAD.__cmake__:
     FreeCAD.addImportType("FEM result VTK (*.vtk *.vtu)", "feminout.importVTKResults")
     FreeCAD.addExportType("FEM result VTK (*.vtk *.vtu)", "feminout.importVTKResults")
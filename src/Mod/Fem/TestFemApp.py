@@ -38,6 +38,7 @@ from femtest.app.test_ccxtools import TestCcxTools as FemTest11
 from femtest.app.test_solver_calculix import TestSolverCalculix as FemTest12
 from femtest.app.test_solver_elmer import TestSolverElmer as FemTest13
 from femtest.app.test_solver_z88 import TestSolverZ88 as FemTest14
+from femtest.app.test_mesh import TestMeshGmshCache as FemTest15
 
 # dummy usage to get flake8 and lgtm quiet
 False if FemTest01.__name__ else True
@@ -54,3 +55,4 @@ False if FemTest11.__name__ else True
 False if FemTest12.__name__ else True
 False if FemTest13.__name__ else True
 False if FemTest14.__name__ else True
+False if FemTest15.__name__ else True
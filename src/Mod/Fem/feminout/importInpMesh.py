@@ -67,9 +67,9 @@ def read(filename):
     """read a FemMesh from a inp mesh file and return the FemMesh
     """
     # no document object is created, just the FemMesh is returned
-    mesh_data = read_inp(filename)
+    mesh_arrays = read_inp_arrays(filename)
     from . import importToolsFem
-    return importToolsFem.make_femmesh(mesh_data)
+    return importToolsFem.make_femmesh_from_arrays(mesh_arrays)
 
 
 def import_inp(filename):
@@ -82,191 +82,157 @@ def import_inp(filename):
         mesh_object.FemMesh = femmesh
 
 
-def read_inp(file_name):
-    """read .inp file """
-    # ATM only mesh reading is supported (no boundary conditions)
-
-    class elements():
-
-        tria3 = {}
-        tria6 = {}
-        quad4 = {}
-        quad8 = {}
-        tetra4 = {}
-        tetra10 = {}
-        hexa8 = {}
-        hexa20 = {}
-        penta6 = {}
-        penta15 = {}
-        seg2 = {}
-        seg3 = {}
-    error_seg3 = False  # to print "not supported"
-    nodes = {}
-    model_definition = True
-
-    f = pyopen(file_name, "r")
-    line = "\n"
-    include = ""
-    f_include = None
-    while line != "":
-        if include:
-            line = f_include.readline()
+# inp element types, FEM mesh dictionary key and
+# node order to switch from the CalculiX node numbering to the FreeCAD node numbering
+# numbering do not change: tria3, tria6, quad4, quad8, seg2
+INP_ELEMENT_TYPES = {}
+for _elem_key, _inp_types, _node_order in (
+    ("Tria3Elem", ("S3", "CPS3", "CPE3", "CAX3"), None),
+    ("Tria6Elem", ("S6", "CPS6", "CPE6", "CAX6"), None),
+    (
+        "Quad4Elem",
+        ("S4", "S4R", "CPS4", "CPS4R", "CPE4", "CPE4R", "CAX4", "CAX4R"),
+        None
+    ),
+    (
+        "Quad8Elem",
+        ("S8", "S8R", "CPS8", "CPS8R", "CPE8", "CPE8R", "CAX8", "CAX8R"),
+        None
+    ),
+    ("Tetra4Elem", ("C3D4",), (1, 0, 2, 3)),
+    ("Tetra10Elem", ("C3D10",), (1, 0, 2, 3, 4, 6, 5, 8, 7, 9)),
+    ("Hexa8Elem", ("C3D8", "C3D8R", "C3D8I"), (5, 6, 7, 4, 1, 2, 3, 0)),
+    (
+        "Hexa20Elem",
+        ("C3D20", "C3D20R", "C3D20RI"),
+        (5, 6, 7, 4, 1, 2, 3, 0, 13, 14, 15, 12, 9, 10, 11, 8, 17, 18, 19, 16)
+    ),
+    ("Penta6Elem", ("C3D6",), (4, 5, 3, 1, 2, 0)),
+    ("Penta15Elem", ("C3D15",), (4, 5, 3, 1, 2, 0, 10, 11, 9, 7, 8, 6, 13, 14, 12)),
+    ("Seg2Elem", ("B31", "B31R", "T3D2"), None),
+    ("Seg3Elem", ("B32", "B32R", "T3D3"), (0, 2, 1)),
+):
+    for _inp_type in _inp_types:
+        INP_ELEMENT_TYPES[_inp_type] = (_elem_key, _node_order)
+
+
+def _iter_inp_lines(file_name):
+    """yields the lines of an inp file, the *INCLUDE files are read in place
+    a stack of open files is used, thus nested includes do not recurse
+    """
+    path_start = os.path.split(file_name)[0]
+    files = [pyopen(file_name, "r")]
+    try:
+        while files:
+            line = files[-1].readline()
             if line == "":
-                f_include.close()
-                include = ""
-                line = f.readline()
-        else:
-            line = f.readline()
-        if line.strip() == "":
-            continue
-        elif line[0] == "*":  # start/end of a reading set
-            if line[0:2] == "**":  # comments
+                files.pop().close()
                 continue
             if line[:8].upper() == "*INCLUDE":
                 start = 1 + line.index("=")
                 include = line[start:].strip().strip('"')
                 include_path = os.path.normpath(include)
-                if os.path.isfile(include_path) is True:
-                    f_include = pyopen(include_path, "r")
-                else:
-                    path_start = os.path.split(file_name)[0]
-                    include_full_path = os.path.join(path_start, include_path)
-                    f_include = pyopen(include_full_path, "r")
+                if os.path.isfile(include_path) is not True:
+                    include_path = os.path.join(path_start, include_path)
+                files.append(pyopen(include_path, "r"))
                 continue
-            read_node = False
-            elm_category = []
-            number_of_nodes = 0
-            elm_type = ""
-            elm_2nd_line = False
-            error_seg3 = False
-            error_not_supported_elemtype = False
+            yield line
+    finally:
+        for f in files:
+            f.close()
 
-        # reading nodes
-        if (line[:5].upper() == "*NODE") and (model_definition is True):
-            read_node = True
-        elif read_node is True:
-            line_list = line.split(",")
-            number = int(line_list[0])
-            x = float(line_list[1])
-            y = float(line_list[2])
-            z = float(line_list[3])
-            nodes[number] = [x, y, z]
 
-        # reading elements
-        elif line[:8].upper() == "*ELEMENT":
-            line_list = line[8:].upper().split(",")
-            for line_part in line_list:
-                if line_part.lstrip()[:4] == "TYPE":
-                    elm_type = line_part.split("=")[1].strip()
+def read_inp_arrays(file_name):
+    """read the mesh of an .inp file into the binary mesh container
+    see importToolsFem.make_mesh_arrays() for the structure
+    the file is streamed, node and element data go directly into typed arrays
+    """
+    # ATM only mesh reading is supported (no boundary conditions)
+    import array
+    import numpy
+    from . import importToolsFem
 
-            if elm_type in ["S3", "CPS3", "CPE3", "CAX3"]:
-                elm_category = elements.tria3
-                number_of_nodes = 3
-            elif elm_type in ["S6", "CPS6", "CPE6", "CAX6"]:
-                elm_category = elements.tria6
-                number_of_nodes = 6
-            elif elm_type in ["S4", "S4R", "CPS4", "CPS4R", "CPE4", "CPE4R",
-                              "CAX4", "CAX4R"]:
-                elm_category = elements.quad4
-                number_of_nodes = 4
-            elif elm_type in ["S8", "S8R", "CPS8", "CPS8R", "CPE8", "CPE8R",
-                              "CAX8", "CAX8R"]:
-                elm_category = elements.quad8
-                number_of_nodes = 8
-            elif elm_type == "C3D4":
-                elm_category = elements.tetra4
-                number_of_nodes = 4
-            elif elm_type == "C3D10":
-                elm_category = elements.tetra10
-                number_of_nodes = 10
-            elif elm_type in ["C3D8", "C3D8R", "C3D8I"]:
-                elm_category = elements.hexa8
-                number_of_nodes = 8
-            elif elm_type in ["C3D20", "C3D20R", "C3D20RI"]:
-                elm_category = elements.hexa20
-                number_of_nodes = 20
-            elif elm_type == "C3D6":
-                elm_category = elements.penta6
-                number_of_nodes = 6
-            elif elm_type == "C3D15":
-                elm_category = elements.penta15
-                number_of_nodes = 15
-            elif elm_type in ["B31", "B31R", "T3D2"]:
-                elm_category = elements.seg2
-                number_of_nodes = 2
-            elif elm_type in ["B32", "B32R", "T3D3"]:
-                elm_category = elements.seg3
-                number_of_nodes = 3
-                error_seg3 = True  # to print "not supported"
-            else:
-                error_not_supported_elemtype = True
+    node_ids = array.array("i")
+    node_coords = array.array("d")
+    # element key: flat array of element id followed by its nodes
+    elements = {}
+    node_counts = dict(
+        (elem_key, count) for elem_key, dim, count in importToolsFem.FEM_MESH_ELEMENT_TYPES
+    )
+    not_supported = set()
+    model_definition = True
 
-        elif elm_category != [] and number_of_nodes > 0:
+    read_node = False
+    elm_data = None
+    for line in _iter_inp_lines(file_name):
+        if not line.strip():
+            continue
+        elif line[0] == "*":  # start/end of a reading set
+            if line[0:2] == "**":  # comments
+                continue
+            read_node = False
+            elm_data = None
+            keyword = line.split(",")[0].strip().upper()
+            if keyword == "*NODE" and model_definition is True:
+                read_node = True
+            elif keyword == "*ELEMENT":
+                elm_type = ""
+                for line_part in line[8:].upper().split(","):
+                    if line_part.lstrip()[:4] == "TYPE":
+                        elm_type = line_part.split("=")[1].strip()
+                if elm_type in INP_ELEMENT_TYPES:
+                    elem_key = INP_ELEMENT_TYPES[elm_type][0]
+                    elm_data = elements.setdefault(elem_key, array.array("i"))
+                else:
+                    not_supported.add(elm_type)
+            elif keyword == "*STEP":
+                model_definition = False
+        elif read_node is True:
             line_list = line.split(",")
-            if elm_2nd_line is False:
-                number = int(line_list[0])
-                elm_category[number] = []
-                pos = 1
-            else:
-                pos = 0
-                elm_2nd_line = False
-            for en in range(pos, pos + number_of_nodes - len(elm_category[number])):
-                try:
-                    enode = int(line_list[en])
-                    elm_category[number].append(enode)
-                except Exception:
-                    elm_2nd_line = True
-                    break
+            node_ids.append(int(line_list[0]))
+            node_coords.append(float(line_list[1]))
+            node_coords.append(float(line_list[2]))
+            node_coords.append(float(line_list[3]))
+        elif elm_data is not None:
+            # element id and nodes, long elements continue on the next lines
+            # thus all values of the block are read as one flat stream
+            line_list = line.split(",")
+            if not line_list[-1].strip():
+                line_list.pop()
+            elm_data.extend(map(int, line_list))
 
-        elif line[:5].upper() == "*STEP":
-            model_definition = False
-    if error_seg3 is True:  # to print "not supported"
+    if "Seg3Elem" in elements:  # to print "not supported"
         Console.PrintError("Error: seg3 (3-node beam element type) not supported, yet.\n")
-    elif error_not_supported_elemtype is True:
+    for elm_type in sorted(not_supported):
         Console.PrintError("Error: {} not supported.\n".format(elm_type))
-    f.close()
-
-    # switch from the CalculiX node numbering to the FreeCAD node numbering
-    # numbering do not change: tria3, tria6, quad4, quad8, seg2
-    for en in elements.tetra4:
-        n = elements.tetra4[en]
-        elements.tetra4[en] = [n[1], n[0], n[2], n[3]]
-    for en in elements.tetra10:
-        n = elements.tetra10[en]
-        elements.tetra10[en] = [n[1], n[0], n[2], n[3], n[4], n[6], n[5],
-                                n[8], n[7], n[9]]
-    for en in elements.hexa8:
-        n = elements.hexa8[en]
-        elements.hexa8[en] = [n[5], n[6], n[7], n[4], n[1], n[2], n[3], n[0]]
-    for en in elements.hexa20:
-        n = elements.hexa20[en]
-        elements.hexa20[en] = [n[5], n[6], n[7], n[4], n[1], n[2], n[3], n[0],
-                               n[13], n[14], n[15], n[12], n[9], n[10], n[11],
-                               n[8], n[17], n[18], n[19], n[16]]
-    for en in elements.penta6:
-        n = elements.penta6[en]
-        elements.penta6[en] = [n[4], n[5], n[3], n[1], n[2], n[0]]
-    for en in elements.penta15:
-        n = elements.penta15[en]
-        elements.penta15[en] = [n[4], n[5], n[3], n[1], n[2], n[0],
-                                n[10], n[11], n[9], n[7], n[8], n[6], n[13],
-                                n[14], n[12]]
-    for en in elements.seg3:
-        n = elements.seg3[en]
-        elements.seg3[en] = [n[0], n[2], n[1]]
 
-    return {
-        "Nodes": nodes,
-        "Seg2Elem": elements.seg2,
-        "Seg3Elem": elements.seg3,
-        "Tria3Elem": elements.tria3,
-        "Tria6Elem": elements.tria6,
-        "Quad4Elem": elements.quad4,
-        "Quad8Elem": elements.quad8,
-        "Tetra4Elem": elements.tetra4,
-        "Tetra10Elem": elements.tetra10,
-        "Hexa8Elem": elements.hexa8,
-        "Hexa20Elem": elements.hexa20,
-        "Penta6Elem": elements.penta6,
-        "Penta15Elem": elements.penta15
+    mesh_arrays = {
+        "Nodes": (
+            numpy.frombuffer(node_ids, dtype=numpy.int32),
+            numpy.frombuffer(node_coords, dtype=numpy.float64).reshape(-1, 3)
+        ),
+        "Groups": []
     }
+    node_orders = dict(INP_ELEMENT_TYPES.values())
+    for elem_key, elm_data in elements.items():
+        elm_data = numpy.frombuffer(elm_data, dtype=numpy.int32).reshape(
+            -1, node_counts[elem_key] + 1
+        )
+        elm_nodes = elm_data[:, 1:]
+        if node_orders[elem_key] is not None:
+            elm_nodes = elm_nodes[:, node_orders[elem_key]]
+        mesh_arrays[elem_key] = (elm_data[:, 0], numpy.ascontiguousarray(elm_nodes))
+    return mesh_arrays
+
+
+def read_inp(file_name):
+    """read .inp file and return the FEM mesh dictionary"""
+    mesh_arrays = read_inp_arrays(file_name)
+    node_ids, node_coords = mesh_arrays["Nodes"]
+    mesh_data = {"Nodes": dict(zip(node_ids.tolist(), node_coords.tolist()))}
+    for elem_key, node_order in set(INP_ELEMENT_TYPES.values()):
+        mesh_data[elem_key] = {}
+        if elem_key in mesh_arrays:
+            elm_ids, elm_nodes = mesh_arrays[elem_key]
+            mesh_data[elem_key] = dict(zip(elm_ids.tolist(), elm_nodes.tolist()))
+    return mesh_data
@@ -0,0 +1,152 @@
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD developers                                 *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+__title__ = "FreeCAD binary mesh reader and writer"
+__author__ = "FreeCAD developers"
+__url__ = "https://www.freecadweb.org"
+
+## @package importNpzMesh
+#  \ingroup FEM
+#  \brief FreeCAD binary mesh reader and writer for FEM workbench
+#
+#  The mesh is stored as compressed numpy arrays, one pair of arrays
+#  (ids, coordinates or ids, node ids) per entity type plus the groups,
+#  see importToolsFem.make_mesh_arrays() for the structure.
+#  Reading creates the FemMesh with a few bulk calls.
+
+import os
+
+import FreeCAD
+from FreeCAD import Console
+
+from . import importToolsFem
+
+
+# ************************************************************************************************
+# ********* generic FreeCAD import and export methods ********************************************
+# names are fix given from FreeCAD, these methods are called from FreeCAD
+# they are set in FEM modules Init.py
+
+if open.__module__ == "__builtin__":
+    # because we'll redefine open below (Python2)
+    pyopen = open
+elif open.__module__ == "io":
+    # because we'll redefine open below (Python3)
+    pyopen = open
+
+
+def open(
+    filename
+):
+    """called when freecad opens a file
+    a FEM mesh object is created in a new document"""
+
+    docname = os.path.splitext(os.path.basename(filename))[0]
+    return insert(filename, docname)
+
+
+def insert(
+    filename,
+    docname
+):
+    """called when freecad wants to import a file
+    a FEM mesh object is created in a existing document"""
+
+    try:
+        doc = FreeCAD.getDocument(docname)
+    except NameError:
+        doc = FreeCAD.newDocument(docname)
+    FreeCAD.ActiveDocument = doc
+
+    import_npz_mesh(filename, doc)
+    return doc
+
+
+def export(
+    objectslist,
+    filename
+):
+    "called when freecad exports a file"
+    if len(objectslist) != 1:
+        Console.PrintError("This exporter can only export one object.\n")
+        return
+    obj = objectslist[0]
+    if not obj.isDerivedFrom("Fem::FemMeshObject"):
+        Console.PrintError("No FEM mesh object selected.\n")
+        return
+
+    write(filename, obj.FemMesh)
+
+
+# ************************************************************************************************
+# ********* module specific methods **************************************************************
+# reader:
+# - a method uses a FemMesh instance, creates the FreeCAD document object and returns this object
+# - a method reads the binary mesh container and creates and returns a FemMesh
+#
+# writer:
+# - a method directly writes a FemMesh to the mesh file
+
+# ********* reader *******************************************************************************
+def import_npz_mesh(
+    filename,
+    doc
+):
+    """read a FemMesh from a binary mesh file
+    insert a FreeCAD FEM Mesh object in the given document
+    return the FEM mesh document object
+    """
+
+    mesh_name = os.path.basename(os.path.splitext(filename)[0])
+
+    mesh_object = None
+    femmesh = read(filename)
+    if femmesh:
+        mesh_object = doc.addObject("Fem::FemMeshObject", mesh_name)
+        mesh_object.FemMesh = femmesh
+
+    return mesh_object
+
+
+def read(
+    filename
+):
+    """read a FemMesh from a binary mesh file and return the FemMesh
+    """
+    # no document object is created, just the FemMesh is returned
+
+    mesh_arrays = importToolsFem.read_mesh_arrays(filename)
+    return importToolsFem.make_femmesh_from_arrays(mesh_arrays)
+
+
+# ********* writer *******************************************************************************
+def write(
+    filename,
+    fem_mesh
+):
+    """directly write a FemMesh to a binary mesh file
+    fem_mesh: a FemMesh"""
+
+    mesh_arrays = importToolsFem.make_mesh_arrays_from_femmesh(fem_mesh)
+    importToolsFem.write_mesh_arrays(mesh_arrays, filename)
@@ -29,6 +29,8 @@ __url__ = "https://www.freecadweb.org"
 #  \ingroup FEM
 #  \brief FreeCAD FEM import tools
 
+import numpy
+
 import FreeCAD
 from FreeCAD import Console
 
@@ -132,119 +134,172 @@ def get_MaxDimElementFromList(
     return elem_list[-1]
 
 
+# FEM mesh dictionary element keys with element dimension and number of nodes
+# elements are added to a FemMesh in this order
+FEM_MESH_ELEMENT_TYPES = (
+    ("Hexa8Elem", 3, 8),
+    ("Penta6Elem", 3, 6),
+    ("Tetra4Elem", 3, 4),
+    ("Tetra10Elem", 3, 10),
+    ("Penta15Elem", 3, 15),
+    ("Hexa20Elem", 3, 20),
+    ("Tria3Elem", 2, 3),
+    ("Tria6Elem", 2, 6),
+    ("Quad4Elem", 2, 4),
+    ("Quad8Elem", 2, 8),
+    ("Seg2Elem", 1, 2),
+    ("Seg3Elem", 1, 3),
+)
+
+
 def make_femmesh(
     mesh_data
 ):
     """ makes an FreeCAD FEM Mesh object from FEM Mesh data
     """
     import Fem
-    mesh = Fem.FemMesh()
     m = mesh_data
     if ("Nodes" in m) and (len(m["Nodes"]) > 0):
         FreeCAD.Console.PrintLog("Found: nodes\n")
-        if (
-            ("Seg2Elem" in m)
-            or ("Seg3Elem" in m)
-            or ("Tria3Elem" in m)
-            or ("Tria6Elem" in m)
-            or ("Quad4Elem" in m)
-            or ("Quad8Elem" in m)
-            or ("Tetra4Elem" in m)
-            or ("Tetra10Elem" in m)
-            or ("Penta6Elem" in m)
-            or ("Penta15Elem" in m)
-            or ("Hexa8Elem" in m)
-            or ("Hexa20Elem" in m)
-        ):
-
-            nds = m["Nodes"]
+        if any(elem_key in m for elem_key, dim, node_count in FEM_MESH_ELEMENT_TYPES):
             FreeCAD.Console.PrintLog("Found: elements\n")
-            for i in nds:
-                n = nds[i]
-                mesh.addNode(n[0], n[1], n[2], i)
-            elms_hexa8 = m["Hexa8Elem"]
-            for i in elms_hexa8:
-                e = elms_hexa8[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7]], i)
-            elms_penta6 = m["Penta6Elem"]
-            for i in elms_penta6:
-                e = elms_penta6[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5]], i)
-            elms_tetra4 = m["Tetra4Elem"]
-            for i in elms_tetra4:
-                e = elms_tetra4[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3]], i)
-            elms_tetra10 = m["Tetra10Elem"]
-            for i in elms_tetra10:
-                e = elms_tetra10[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7], e[8], e[9]], i)
-            elms_penta15 = m["Penta15Elem"]
-            for i in elms_penta15:
-                e = elms_penta15[i]
-                mesh.addVolume([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7], e[8], e[9],
-                                e[10], e[11], e[12], e[13], e[14]], i)
-            elms_hexa20 = m["Hexa20Elem"]
-            for i in elms_hexa20:
-                e = elms_hexa20[i]
-                mesh.addVolume([
-                    e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7], e[8], e[9],
-                    e[10], e[11], e[12], e[13], e[14], e[15], e[16], e[17], e[18], e[19]
-                ], i)
-            elms_tria3 = m["Tria3Elem"]
-            for i in elms_tria3:
-                e = elms_tria3[i]
-                mesh.addFace([e[0], e[1], e[2]], i)
-            elms_tria6 = m["Tria6Elem"]
-            for i in elms_tria6:
-                e = elms_tria6[i]
-                mesh.addFace([e[0], e[1], e[2], e[3], e[4], e[5]], i)
-            elms_quad4 = m["Quad4Elem"]
-            for i in elms_quad4:
-                e = elms_quad4[i]
-                mesh.addFace([e[0], e[1], e[2], e[3]], i)
-            elms_quad8 = m["Quad8Elem"]
-            for i in elms_quad8:
-                e = elms_quad8[i]
-                mesh.addFace([e[0], e[1], e[2], e[3], e[4], e[5], e[6], e[7]], i)
-            elms_seg2 = m["Seg2Elem"]
-            for i in elms_seg2:
-                e = elms_seg2[i]
-                mesh.addEdge([e[0], e[1]], i)
-            elms_seg3 = m["Seg3Elem"]
-            for i in elms_seg3:
-                e = elms_seg3[i]
-                mesh.addEdge([e[0], e[1], e[2]], i)
-            Console.PrintLog(
-                "imported mesh: {} nodes, {} HEXA8, {} PENTA6, {} TETRA4, {} TETRA10, {} PENTA15\n"
-                .format(
-                    len(nds),
-                    len(elms_hexa8),
-                    len(elms_penta6),
-                    len(elms_tetra4),
-                    len(elms_tetra10),
-                    len(elms_penta15)
-                )
-            )
-            Console.PrintLog(
-                "imported mesh: {} "
-                "HEXA20, {} TRIA3, {} TRIA6, {} QUAD4, {} QUAD8, {} SEG2, {} SEG3\n"
-                .format(
-                    len(elms_hexa20),
-                    len(elms_tria3),
-                    len(elms_tria6),
-                    len(elms_quad4),
-                    len(elms_quad8),
-                    len(elms_seg2),
-                    len(elms_seg3)
-                )
-            )
+            return make_femmesh_from_arrays(make_mesh_arrays(mesh_data))
         else:
             Console.PrintError("No Elements found!\n")
     else:
         Console.PrintError("No Nodes found!\n")
+    return Fem.FemMesh()
+
+
+def make_mesh_arrays(
+    mesh_data
+):
+    """
+    Converts the FEM mesh dictionary into the binary mesh container.
+    The container is a dictionary too, but instead of one entry per entity it
+    holds one pair of numpy arrays per entity type:
+        "Nodes": (ids as int32 array of shape (n,), coordinates as float64 array of shape (n, 3))
+        "Tetra10Elem": (ids as int32 array of shape (n,), node ids as int32 array of shape (n, 10))
+        ...
+        "Groups": list of (name, element type string, ids as int32 array)
+    Element types which do not appear in mesh data are left out.
+    """
+    mesh_arrays = {}
+    nds = mesh_data.get("Nodes", {})
+    mesh_arrays["Nodes"] = (
+        numpy.fromiter(nds.keys(), dtype=numpy.int32, count=len(nds)),
+        numpy.array([(n[0], n[1], n[2]) for n in nds.values()], dtype=numpy.float64).reshape(
+            len(nds), 3
+        )
+    )
+    for elem_key, dim, node_count in FEM_MESH_ELEMENT_TYPES:
+        elms = mesh_data.get(elem_key)
+        if not elms:
+            continue
+        mesh_arrays[elem_key] = (
+            numpy.fromiter(elms.keys(), dtype=numpy.int32, count=len(elms)),
+            numpy.array(list(elms.values()), dtype=numpy.int32).reshape(len(elms), node_count)
+        )
+    mesh_arrays["Groups"] = []
+    return mesh_arrays
+
+
+def make_mesh_arrays_from_femmesh(
+    femmesh
+):
+    """
+    Converts a FemMesh into the binary mesh container,
+    see make_mesh_arrays() for the structure. Groups are included.
+    """
+    mesh_arrays = make_mesh_arrays(make_dict_from_femmesh(femmesh))
+    mesh_arrays["Groups"] = [(
+        femmesh.getGroupName(group_num),
+        femmesh.getGroupElementType(group_num),
+        numpy.array(femmesh.getGroupElements(group_num), dtype=numpy.int32)
+    ) for group_num in femmesh.Groups]
+    return mesh_arrays
+
+
+def make_femmesh_from_arrays(
+    mesh_arrays
+):
+    """ makes an FreeCAD FEM Mesh object from the binary mesh container
+    nodes and elements are added with one bulk call per entity type
+    """
+    import Fem
+    mesh = Fem.FemMesh()
+    if "Nodes" not in mesh_arrays or len(mesh_arrays["Nodes"][0]) == 0:
+        Console.PrintError("No Nodes found!\n")
+        return mesh
+
+    node_ids, node_coords = mesh_arrays["Nodes"]
+    mesh.addNodes(
+        numpy.ascontiguousarray(node_coords, dtype=numpy.float64),
+        numpy.ascontiguousarray(node_ids, dtype=numpy.int32)
+    )
+    counts = []
+    for elem_key, dim, node_count in FEM_MESH_ELEMENT_TYPES:
+        if elem_key not in mesh_arrays:
+            continue
+        elem_ids, elem_nodes = mesh_arrays[elem_key]
+        if len(elem_ids) == 0:
+            continue
+        mesh.addElements(
+            dim,
+            node_count,
+            numpy.ascontiguousarray(elem_nodes, dtype=numpy.int32),
+            numpy.ascontiguousarray(elem_ids, dtype=numpy.int32)
+        )
+        counts.append("{} {}".format(len(elem_ids), elem_key[:-4].upper()))
+    for group_name, group_type, group_elements in mesh_arrays.get("Groups", []):
+        group_id = mesh.addGroup(group_name, group_type)
+        mesh.addGroupElements(group_id, numpy.asarray(group_elements).tolist())
+    Console.PrintLog(
+        "imported mesh: {} nodes, {}\n".format(len(node_ids), ", ".join(counts))
+    )
     return mesh
 
 
+def write_mesh_arrays(
+    mesh_arrays,
+    filename
+):
+    """
+    Writes the binary mesh container to a compressed numpy archive.
+    """
+    arrays = {}
+    for key, value in mesh_arrays.items():
+        if key == "Groups":
+            continue
+        arrays[key + "_ids"], arrays[key] = value
+    arrays["Groups_names"] = numpy.array([g[0] for g in mesh_arrays.get("Groups", [])], dtype=str)
+    arrays["Groups_types"] = numpy.array([g[1] for g in mesh_arrays.get("Groups", [])], dtype=str)
+    for i, group in enumerate(mesh_arrays.get("Groups", [])):
+        arrays["Groups_{}".format(i)] = numpy.asarray(group[2], dtype=numpy.int32)
+    # a file object is used, numpy would append .npz to a file name
+    with open(filename, "wb") as f:
+        numpy.savez_compressed(f, **arrays)
+
+
+def read_mesh_arrays(
+    filename
+):
+    """
+    Reads the binary mesh container from a file written by write_mesh_arrays().
+    """
+    mesh_arrays = {}
+    with numpy.load(filename, allow_pickle=False) as archive:
+        for key in ["Nodes"] + [elem_key for elem_key, dim, count in FEM_MESH_ELEMENT_TYPES]:
+            if key in archive.files:
+                mesh_arrays[key] = (archive[key + "_ids"], archive[key])
+        groups = []
+        if "Groups_names" in archive.files:
+            for i, (name, typ) in enumerate(zip(archive["Groups_names"], archive["Groups_types"])):
+                groups.append((str(name), str(typ), archive["Groups_{}".format(i)]))
+        mesh_arrays["Groups"] = groups
+    return mesh_arrays
+
+
 def make_dict_from_femmesh(
     femmesh
 ):
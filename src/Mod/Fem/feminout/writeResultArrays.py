@@ -0,0 +1,449 @@
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD developers                                 *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+__title__ = "FreeCAD result writer for binary VTU and XDMF"
+__author__ = "FreeCAD developers"
+__url__ = "https://www.freecadweb.org"
+
+## @package writeResultArrays
+#  \ingroup FEM
+#  \brief FreeCAD result writer for binary VTU and XDMF/HDF5 time series
+#
+#  The mesh is taken from the binary mesh container, see
+#  importToolsFem.make_mesh_arrays(), the result fields are numpy arrays
+#  ordered like the mesh nodes. All arrays are written as raw binary
+#  blocks, the mesh is written only once for a time series.
+#  A series is a list of (time, fields) tuples, fields is a dict
+#  {vtk field name: array (n,) or (n, 3)}.
+
+import os
+from xml.etree import ElementTree as ET
+
+import numpy
+
+from FreeCAD import Console
+
+from . import importToolsFem
+
+has_h5py = True
+try:
+    import h5py
+except ImportError:
+    has_h5py = False
+
+
+# names as in FemVTKTools.cpp, thus the files look like the ones from Fem.writeResult
+# the principal stress vectors get an own name, they share it with the scalars in FemVTKTools
+RESULT_VECTOR_FIELDS = {
+    "DisplacementVectors": "Displacement",
+    "PS1Vector": "Major Principal Stress Vector",
+    "PS2Vector": "Intermediate Principal Stress Vector",
+    "PS3Vector": "Minor Principal Stress Vector",
+}
+
+RESULT_SCALAR_FIELDS = {
+    "DisplacementLengths": "Displacement Magnitude",
+    "MaxShear": "Tresca Stress",
+    "NodeStressXX": "Stress xx component",
+    "NodeStressYY": "Stress yy component",
+    "NodeStressZZ": "Stress zz component",
+    "NodeStressXY": "Stress xy component",
+    "NodeStressXZ": "Stress xz component",
+    "NodeStressYZ": "Stress yz component",
+    "NodeStrainXX": "Strain xx component",
+    "NodeStrainYY": "Strain yy component",
+    "NodeStrainZZ": "Strain zz component",
+    "NodeStrainXY": "Strain xy component",
+    "NodeStrainXZ": "Strain xz component",
+    "NodeStrainYZ": "Strain yz component",
+    "Peeq": "Equivalent Plastic Strain",
+    "PrincipalMax": "Major Principal Stress",
+    "PrincipalMed": "Intermediate Principal Stress",
+    "PrincipalMin": "Minor Principal Stress",
+    "vonMises": "von Mises Stress",
+    "Temperature": "Temperature",
+    "MohrCoulomb": "MohrCoulomb",
+    "ReinforcementRatio_x": "ReinforcementRatio_x",
+    "ReinforcementRatio_y": "ReinforcementRatio_y",
+    "ReinforcementRatio_z": "ReinforcementRatio_z",
+}
+
+# mesh container element key: (vtk cell type, xdmf mixed topology type)
+# the node order of SMESH and VTK is the same, see FemVTKTools.cpp
+CELL_TYPES = {
+    "Seg2Elem": (3, 2),
+    "Seg3Elem": (21, 34),
+    "Tria3Elem": (5, 4),
+    "Tria6Elem": (22, 36),
+    "Quad4Elem": (9, 5),
+    "Quad8Elem": (23, 37),
+    "Tetra4Elem": (10, 6),
+    "Tetra10Elem": (24, 38),
+    "Penta6Elem": (13, 8),
+    "Penta15Elem": (26, 40),
+    "Hexa8Elem": (12, 9),
+    "Hexa20Elem": (25, 48),
+}
+
+VTK_TYPE_NAMES = {
+    numpy.dtype(numpy.float32): "Float32",
+    numpy.dtype(numpy.float64): "Float64",
+    numpy.dtype(numpy.int32): "Int32",
+    numpy.dtype(numpy.int64): "Int64",
+    numpy.dtype(numpy.uint8): "UInt8",
+}
+
+
+# ********* result object to arrays *********
+def make_result_fields(
+    result_obj,
+    node_ids
+):
+    """
+    Returns the result fields of a result object as dict
+    {vtk field name: float64 array} ordered like node_ids.
+    Empty result properties are skipped.
+    """
+    result_node_ids = numpy.asarray(result_obj.NodeNumbers, dtype=numpy.int64)
+    order = None
+    if len(result_node_ids) and not numpy.array_equal(result_node_ids, node_ids):
+        sorter = numpy.argsort(result_node_ids)
+        order = sorter[numpy.searchsorted(result_node_ids, node_ids, sorter=sorter)]
+    fields = {}
+    for prop, name in RESULT_VECTOR_FIELDS.items():
+        values = getattr(result_obj, prop, None)
+        if values and len(values) == len(result_node_ids):
+            fields[name] = numpy.array(values, dtype=numpy.float64).reshape(-1, 3)
+    for prop, name in RESULT_SCALAR_FIELDS.items():
+        values = getattr(result_obj, prop, None)
+        if values and len(values) == len(result_node_ids):
+            fields[name] = numpy.array(values, dtype=numpy.float64)
+    if order is not None:
+        fields = {name: values[order] for name, values in fields.items()}
+    return fields
+
+
+def make_result_series(
+    result_objs
+):
+    """
+    Returns the mesh container of the first result mesh and the series
+    [(time, fields)] of all result objects. All results need the same mesh.
+    """
+    femmesh = result_objs[0].Mesh.FemMesh
+    mesh_arrays = importToolsFem.make_mesh_arrays_from_femmesh(femmesh)
+    node_ids = mesh_arrays["Nodes"][0]
+    series = []
+    for step, result_obj in enumerate(result_objs):
+        time = getattr(result_obj, "Time", float(step))
+        series.append((time, make_result_fields(result_obj, node_ids)))
+    return mesh_arrays, series
+
+
+# ********* cells *********
+def get_cell_blocks(
+    mesh_arrays
+):
+    """
+    Returns [(elem_key, connectivity)] of the highest element dimension in the mesh,
+    the connectivity is given in zero based node indices.
+    """
+    node_ids = numpy.asarray(mesh_arrays["Nodes"][0])
+    sorter = numpy.argsort(node_ids)
+    blocks = []
+    max_dim = 0
+    for elem_key, dim, node_count in importToolsFem.FEM_MESH_ELEMENT_TYPES:
+        if elem_key not in mesh_arrays or len(mesh_arrays[elem_key][0]) == 0:
+            continue
+        if dim < max_dim:
+            continue
+        if dim > max_dim:
+            max_dim = dim
+            blocks = []
+        elem_nodes = numpy.asarray(mesh_arrays[elem_key][1])
+        conn = sorter[numpy.searchsorted(node_ids, elem_nodes, sorter=sorter)]
+        blocks.append((elem_key, conn.astype(numpy.int64)))
+    return blocks
+
+
+# ********* VTU *********
+class _AppendedData():
+    """collects the raw arrays of the appended data section of a VTU file"""
+
+    def __init__(self):
+        self.arrays = []
+        self.offset = 0
+
+    def add(self, parent, name, values, components=1):
+        values = numpy.ascontiguousarray(values)
+        ET.SubElement(
+            parent, "DataArray",
+            type=VTK_TYPE_NAMES[values.dtype],
+            Name=name,
+            NumberOfComponents=str(components),
+            format="appended",
+            offset=str(self.offset)
+        )
+        self.arrays.append(values)
+        # UInt64 block size header in front of every array
+        self.offset += 8 + values.nbytes
+
+    def write(self, fp):
+        fp.write(b"_")
+        for values in self.arrays:
+            fp.write(numpy.uint64(values.nbytes).tobytes())
+            # the buffer of the array is written, no copy and no Python objects
+            fp.write(memoryview(values).cast("B"))
+
+
+def write_vtu(
+    filename,
+    mesh_arrays,
+    fields,
+    cell_blocks=None
+):
+    """writes one VTU file with binary appended raw data"""
+    if cell_blocks is None:
+        cell_blocks = get_cell_blocks(mesh_arrays)
+    coords = numpy.asarray(mesh_arrays["Nodes"][1], dtype=numpy.float64)
+    num_cells = sum(len(conn) for elem_key, conn in cell_blocks)
+
+    root = ET.Element(
+        "VTKFile",
+        type="UnstructuredGrid",
+        version="1.0",
+        byte_order="LittleEndian" if numpy.little_endian else "BigEndian",
+        header_type="UInt64"
+    )
+    grid = ET.SubElement(root, "UnstructuredGrid")
+    piece = ET.SubElement(
+        grid, "Piece",
+        NumberOfPoints=str(len(coords)),
+        NumberOfCells=str(num_cells)
+    )
+    appended = _AppendedData()
+
+    point_data = ET.SubElement(piece, "PointData")
+    for name, values in fields.items():
+        values = numpy.asarray(values)
+        components = values.shape[1] if values.ndim == 2 else 1
+        appended.add(point_data, name, values, components)
+
+    points = ET.SubElement(piece, "Points")
+    appended.add(points, "Points", coords, 3)
+
+    cells = ET.SubElement(piece, "Cells")
+    if cell_blocks:
+        connectivity = numpy.concatenate([conn.ravel() for elem_key, conn in cell_blocks])
+        offsets = numpy.cumsum(numpy.concatenate([
+            numpy.full(len(conn), conn.shape[1], dtype=numpy.int64)
+            for elem_key, conn in cell_blocks
+        ]))
+        types = numpy.concatenate([
+            numpy.full(len(conn), CELL_TYPES[elem_key][0], dtype=numpy.uint8)
+            for elem_key, conn in cell_blocks
+        ])
+    else:
+        connectivity = offsets = numpy.zeros(0, dtype=numpy.int64)
+        types = numpy.zeros(0, dtype=numpy.uint8)
+    appended.add(cells, "connectivity", connectivity)
+    appended.add(cells, "offsets", offsets)
+    appended.add(cells, "types", types)
+
+    ET.SubElement(root, "AppendedData", encoding="raw").text = "@@APPENDED@@"
+    head, tail = ET.tostring(root).split(b"@@APPENDED@@")
+    with open(filename, "wb") as fp:
+        fp.write(b'<?xml version="1.0"?>\n')
+        fp.write(head)
+        appended.write(fp)
+        fp.write(tail)
+
+
+def write_vtu_series(
+    filename,
+    mesh_arrays,
+    series
+):
+    """
+    writes one VTU file per time step and a ParaView collection file (*.pvd)
+    which holds the time values
+    """
+    base, ext = os.path.splitext(filename)
+    cell_blocks = get_cell_blocks(mesh_arrays)
+    root = ET.Element("VTKFile", type="Collection", version="0.1")
+    collection = ET.SubElement(root, "Collection")
+    for step, (time, fields) in enumerate(series):
+        step_file = "{}_{:04d}.vtu".format(base, step)
+        write_vtu(step_file, mesh_arrays, fields, cell_blocks)
+        ET.SubElement(
+            collection, "DataSet",
+            timestep=repr(float(time)),
+            part="0",
+            file=os.path.basename(step_file)
+        )
+    with open(base + ".pvd", "wb") as fp:
+        fp.write(b'<?xml version="1.0"?>\n')
+        fp.write(ET.tostring(root))
+    Console.PrintLog("{} time steps written to {}\n".format(len(series), base + ".pvd"))
+
+
+# ********* XDMF + HDF5 *********
+def get_xdmf_mixed_topology(
+    cell_blocks
+):
+    """returns the XDMF mixed topology array: cell type, (node count,) nodes per cell"""
+    parts = []
+    for elem_key, conn in cell_blocks:
+        xdmf_type = CELL_TYPES[elem_key][1]
+        if xdmf_type == 2:
+            # polyline needs the node count in a mixed topology
+            head = [xdmf_type, conn.shape[1]]
+        else:
+            head = [xdmf_type]
+        head = numpy.tile(numpy.array(head, dtype=numpy.int64), (len(conn), 1))
+        parts.append(numpy.hstack((head, conn)).ravel())
+    if not parts:
+        return numpy.zeros(0, dtype=numpy.int64)
+    return numpy.concatenate(parts)
+
+
+def _xdmf_data_item(
+    parent,
+    h5_name,
+    path,
+    values
+):
+    item = ET.SubElement(
+        parent, "DataItem",
+        Dimensions=" ".join(str(d) for d in values.shape),
+        NumberType="Int" if values.dtype.kind == "i" else "Float",
+        Precision=str(values.dtype.itemsize),
+        Format="HDF"
+    )
+    item.text = "{}:{}".format(h5_name, path)
+    return item
+
+
+def write_xdmf_series(
+    filename,
+    mesh_arrays,
+    series
+):
+    """
+    writes a XDMF file with a temporal collection, the heavy data
+    is written to a HDF5 file with the same base name
+    """
+    if not has_h5py:
+        Console.PrintError(
+            "No h5py available (import h5py failure), "
+            "XDMF export of results won't work\n"
+        )
+        return
+    h5_file = os.path.splitext(filename)[0] + ".h5"
+    h5_name = os.path.basename(h5_file)
+    coords = numpy.ascontiguousarray(mesh_arrays["Nodes"][1], dtype=numpy.float64)
+    cell_blocks = get_cell_blocks(mesh_arrays)
+    topology = get_xdmf_mixed_topology(cell_blocks)
+    num_cells = sum(len(conn) for elem_key, conn in cell_blocks)
+
+    root = ET.Element("Xdmf", Version="3.0")
+    domain = ET.SubElement(root, "Domain")
+    collection = ET.SubElement(
+        domain, "Grid",
+        Name="results",
+        GridType="Collection",
+        CollectionType="Temporal"
+    )
+    with h5py.File(h5_file, "w") as h5:
+        h5.create_dataset("mesh/geometry", data=coords)
+        h5.create_dataset("mesh/topology", data=topology)
+        for step, (time, fields) in enumerate(series):
+            grid = ET.SubElement(
+                collection, "Grid",
+                Name="step_{}".format(step),
+                GridType="Uniform"
+            )
+            ET.SubElement(grid, "Time", Value=repr(float(time)))
+            topo = ET.SubElement(
+                grid, "Topology",
+                TopologyType="Mixed",
+                NumberOfElements=str(num_cells)
+            )
+            _xdmf_data_item(topo, h5_name, "/mesh/topology", topology)
+            geo = ET.SubElement(grid, "Geometry", GeometryType="XYZ")
+            _xdmf_data_item(geo, h5_name, "/mesh/geometry", coords)
+            for field_num, (name, values) in enumerate(fields.items()):
+                values = numpy.ascontiguousarray(values, dtype=numpy.float64)
+                path = "/step_{}/field_{}".format(step, field_num)
+                h5.create_dataset(path, data=values)
+                attribute = ET.SubElement(
+                    grid, "Attribute",
+                    Name=name,
+                    AttributeType="Vector" if values.ndim == 2 else "Scalar",
+                    Center="Node"
+                )
+                _xdmf_data_item(attribute, h5_name, path, values)
+
+    with open(filename, "wb") as fp:
+        fp.write(b'<?xml version="1.0"?>\n<!DOCTYPE Xdmf SYSTEM "Xdmf.dtd" []>\n')
+        fp.write(ET.tostring(root))
+    Console.PrintLog("{} time steps written to {}\n".format(len(series), filename))
+
+
+# ********* generic FreeCAD export method *********
+def export(
+    objectslist,
+    filename
+):
+    "called when freecad exports result objects"
+    result_objs = [
+        obj for obj in objectslist if obj.isDerivedFrom("Fem::FemResultObject") and obj.Mesh
+    ]
+    if not result_objs:
+        Console.PrintError("No result object with a result mesh selected.\n")
+        return
+    if len(result_objs) != len(objectslist):
+        Console.PrintWarning("Only result objects with a result mesh are exported.\n")
+    write_results(filename, sorted(result_objs, key=lambda obj: obj.Time))
+
+
+# ********* result objects *********
+def write_results(
+    filename,
+    result_objs
+):
+    """
+    writes one or more result objects of the same mesh
+    *.vtu: one result object, *.pvd: VTU time series, *.xdmf: XDMF/HDF5 time series
+    """
+    mesh_arrays, series = make_result_series(result_objs)
+    ext = os.path.splitext(filename)[1].lower()
+    if ext == ".vtu" and len(series) == 1:
+        write_vtu(filename, mesh_arrays, series[0][1])
+    elif ext in (".vtu", ".pvd"):
+        write_vtu_series(filename, mesh_arrays, series)
+    elif ext == ".xdmf":
+        write_xdmf_series(filename, mesh_arrays, series)
+    else:
+        Console.PrintError("Unknown result file extension: {}\n".format(ext))
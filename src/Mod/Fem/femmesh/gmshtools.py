@@ -27,9 +27,12 @@ __url__ = "https://www.freecadweb.org"
 ## \addtogroup FEM
 #  @{
 
+import hashlib
 import os
+import shutil
 import subprocess
 import sys
+import tempfile
 
 import FreeCAD
 from FreeCAD import Console
@@ -173,6 +176,8 @@ class GmshTools():
         self.temp_file_geo = ""
         self.mesh_name = ""
         self.gmsh_bin = ""
+        self.mesh_cache_file = None
+        self.returncode = None
         self.error = False
 
     def update_mesh_data(self):
@@ -192,12 +197,29 @@ class GmshTools():
             self.get_tmp_file_paths()
             self.get_gmsh_command()
             self.write_gmsh_input_files()
-            error = self.run_gmsh_with_geo()
+            error = self.run_gmsh_with_cache()
             self.read_and_set_new_mesh()
         except GmshError as e:
             error = str(e)
         return error
 
+    def run_gmsh_with_cache(self):
+        # Gmsh is only run if the mesh cache has no mesh for the input files
+        # thus the input files have to be written before
+        if self.load_cached_mesh():
+            return ""
+        # a mesh of a previous run must not be taken for the result of this one
+        if os.path.isfile(self.temp_file_mesh):
+            os.remove(self.temp_file_mesh)
+        error = self.run_gmsh_with_geo()
+        if not self.error and not os.path.isfile(self.temp_file_mesh):
+            Console.PrintError("Gmsh did not write a mesh file.\n")
+            self.error = True
+        # only meshes of runs without any error are cached
+        if self.returncode == 0 and "Error" not in error:
+            self.store_mesh_in_cache()
+        return error
+
     def start_logs(self):
         Console.PrintLog("\nGmsh FEM mesh run is being started.\n")
         Console.PrintLog("  Part to mesh: Name --> {},  Label --> {}, ShapeType --> {}\n".format(
@@ -914,6 +936,7 @@ class GmshTools():
                 stderr=subprocess.PIPE
             )
             output, error = p.communicate()
+            self.returncode = p.returncode
             if sys.version_info.major >= 3:
                 # output = output.decode("utf-8")
                 error = error.decode("utf-8")
@@ -942,6 +965,57 @@ class GmshTools():
 
         return new_err
 
+    def get_mesh_cache_key(self):
+        # the geo file holds all mesh parameter (regions, boundary layers, groups,
+        # algorithms, order, ...) and the brep file the geometry including placement
+        # the file paths in the geo file are replaced, thus equal parts of different
+        # objects or documents share the cache entry
+        sha = hashlib.sha1()
+        with open(self.temp_file_geo, "r") as geo:
+            geo_text = geo.read()
+        geo_text = geo_text.replace(self.temp_file_geometry, "<geometry>")
+        geo_text = geo_text.replace(self.temp_file_mesh, "<mesh>")
+        geo_text = geo_text.replace(self.temp_file_geo, "<geo>")
+        sha.update(geo_text.encode("utf-8"))
+        with open(self.temp_file_geometry, "rb") as brep:
+            for chunk in iter(lambda: brep.read(1 << 20), b""):
+                sha.update(chunk)
+        return sha.hexdigest()
+
+    def get_mesh_cache_file(self):
+        gmsh_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Gmsh")
+        if not gmsh_prefs.GetBool("UseMeshCache", True):
+            return None
+        cache_dir = get_mesh_cache_dir()
+        if not os.path.isdir(cache_dir):
+            try:
+                os.makedirs(cache_dir)
+            except OSError:
+                Console.PrintError("Mesh cache dir \'{}\' can not be created.\n".format(cache_dir))
+                return None
+        return os.path.join(cache_dir, self.get_mesh_cache_key() + ".unv")
+
+    def load_cached_mesh(self):
+        self.mesh_cache_file = self.get_mesh_cache_file()
+        if self.mesh_cache_file is None or not os.path.isfile(self.mesh_cache_file):
+            return False
+        shutil.copyfile(self.mesh_cache_file, self.temp_file_mesh)
+        # the modification time is the last use, the least recently used meshes are pruned
+        os.utime(self.mesh_cache_file, None)
+        Console.PrintMessage("  Mesh taken from cache: {}\n".format(self.mesh_cache_file))
+        return True
+
+    def store_mesh_in_cache(self):
+        if self.error or self.mesh_cache_file is None:
+            return
+        if not os.path.isfile(self.temp_file_mesh):
+            return
+        # copy to a temporary name first, a parallel run could read the cache file
+        tmp_cache_file = self.mesh_cache_file + ".{}.tmp".format(os.getpid())
+        shutil.copyfile(self.temp_file_mesh, tmp_cache_file)
+        os.replace(tmp_cache_file, self.mesh_cache_file)
+        prune_mesh_cache(os.path.dirname(self.mesh_cache_file))
+
     def read_and_set_new_mesh(self):
         if not self.error:
             fem_mesh = Fem.read(self.temp_file_mesh)
@@ -950,6 +1024,92 @@ class GmshTools():
         else:
             Console.PrintError("No mesh was created.\n")
 
+
+def get_mesh_cache_dir():
+    gmsh_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Gmsh")
+    cache_dir = gmsh_prefs.GetString("MeshCacheDir", "")
+    if not cache_dir:
+        cache_dir = os.path.join(tempfile.gettempdir(), "fcfem_gmsh_cache")
+    return cache_dir
+
+
+def prune_mesh_cache(cache_dir, max_size=None, max_age=None):
+    """remove meshes from the cache dir, which are older or too many
+
+    Meshes not used for max_age days are removed, then the least recently
+    used meshes until the cache is not bigger than max_size MB. The defaults
+    are the Gmsh preferences MeshCacheMaxSize (500 MB) and MeshCacheMaxAge
+    (30 days), 0 means no limit.
+    Returns the list of removed files.
+    """
+    import time
+
+    gmsh_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Gmsh")
+    if max_size is None:
+        max_size = gmsh_prefs.GetInt("MeshCacheMaxSize", 500)
+    if max_age is None:
+        max_age = gmsh_prefs.GetInt("MeshCacheMaxAge", 30)
+
+    entries = []
+    for name in os.listdir(cache_dir):
+        if not name.endswith(".unv"):
+            continue
+        path = os.path.join(cache_dir, name)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+    entries.sort(reverse=True)  # most recently used first
+
+    removed = []
+    total = 0
+    now = time.time()
+    for mtime, size, path in entries:
+        too_old = max_age > 0 and now - mtime > max_age * 86400
+        too_big = max_size > 0 and total + size > max_size * 1024 * 1024
+        if too_old or too_big:
+            try:
+                os.remove(path)
+                removed.append(path)
+                continue
+            except OSError:
+                pass
+        total += size
+    return removed
+
+
+def create_meshes(mesh_objs, analysis=None, max_workers=None):
+    """mesh several Gmsh mesh objects, the Gmsh processes run in parallel
+
+    The input files are written and the meshes are read in the calling
+    thread, only Gmsh itself runs in worker threads.
+    Returns a dictionary {mesh object name: error string}.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    errors = {}
+    gmsh_tools = []
+    for mesh_obj in mesh_objs:
+        gt = GmshTools(mesh_obj, analysis)
+        try:
+            gt.update_mesh_data()
+            gt.get_tmp_file_paths()
+            gt.get_gmsh_command()
+            gt.write_gmsh_input_files()
+        except GmshError as e:
+            errors[mesh_obj.Name] = str(e)
+            continue
+        gmsh_tools.append(gt)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        run_errors = list(executor.map(GmshTools.run_gmsh_with_cache, gmsh_tools))
+
+    for gt, error in zip(gmsh_tools, run_errors):
+        gt.read_and_set_new_mesh()
+        errors[gt.mesh_obj.Name] = error
+    return errors
+
 ##  @}
 
 
@@ -1008,6 +1168,19 @@ for len in max_mesh_sizes:
 
 """
 
+"""
+# mesh all Gmsh mesh objects of a document, Gmsh runs in parallel
+import ObjectsFem
+doc = App.ActiveDocument
+
+from femmesh.gmshtools import create_meshes
+mesh_objs = [o for o in doc.Objects if o.isDerivedFrom("Fem::FemMeshObjectPython")]
+errors = create_meshes(mesh_objs)
+print(errors)
+doc.recompute()
+
+"""
+
 """
 TODO
 class GmshTools should be splittet in two classes
@@ -38,6 +38,7 @@ import FreeCAD
 from . import writer
 from .. import run
 from .. import settings
+from .. import solveroutput
 from feminout import importCcxDatResults
 from feminout import importCcxFrdResults
 from femtools import femutils
@@ -91,12 +92,9 @@ class Solve(run.Solve):
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE)
         self.signalAbort.add(self._process.terminate)
-        # output = self._observeSolver(self._process)
+        self._observeSolver(self._process, solveroutput.CalculixProgressParser())
         self._process.communicate()
         self.signalAbort.remove(self._process.terminate)
-        # if not self.aborted:
-        #     self._updateOutput(output)
-        # del output   # get flake8 quiet
 
 
 class Results(run.Results):
@@ -39,6 +39,7 @@ import FreeCAD
 from . import writer
 from .. import run
 from .. import settings
+from .. import solveroutput
 from femtools import femutils
 from femtools import membertools
 
@@ -126,7 +127,7 @@ class Solve(run.Solve):
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE)
             self.signalAbort.add(self._process.terminate)
-            output = self._observeSolver(self._process)
+            output = self._observeSolver(self._process, solveroutput.ElmerProgressParser())
             self._process.communicate()
             self.signalAbort.remove(self._process.terminate)
             if not self.aborted:
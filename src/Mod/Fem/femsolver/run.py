@@ -46,6 +46,7 @@ import FreeCAD as App
 
 from . import settings
 from . import signal
+from . import solveroutput
 from . import task
 from femtools import femutils
 from femtools import membertools
@@ -393,14 +394,19 @@ class Machine(BaseTask):
         def statusProxy(line):
             self.pushStatus(line)
 
+        def progressProxy(event):
+            self.pushProgress(event)
+
         def killer():
             task.abort()
         self.signalAbort.add(killer)
         task.signalStatus.add(statusProxy)
+        task.signalProgress.add(progressProxy)
         task.start()
         task.join()
         self.signalAbort.remove(killer)
         task.signalStatus.remove(statusProxy)
+        task.signalProgress.remove(progressProxy)
 
     def _getTask(self, state):
         if state == CHECK:
@@ -457,18 +463,30 @@ class Check(BaseTask):
 
 class Solve(BaseTask):
 
-    def _observeSolver(self, process):
-        output = ""
-        line = femutils.pydecode(process.stdout.readline())
-        self.pushStatus(line)
-        output += line
-        line = femutils.pydecode(process.stdout.readline())
-        while line:
-            line = "\n%s" % line.rstrip()
-            self.pushStatus(line)
-            output += line
-            line = femutils.pydecode(process.stdout.readline())
-        return output
+    def _observeSolver(self, process, parser=None):
+        """Read stdout and stderr of *process* until both are closed.
+
+        The output is read in chunks on background threads. The status is
+        updated once per chunk and progress events found by *parser* are
+        forwarded to signalProgress. Returns the (possibly truncated) stdout,
+        see solveroutput.OutputReader.
+        """
+        reader = solveroutput.OutputReader(process.stdout, parser)
+        reader.signalOutput.add(self.pushStatus)
+        reader.signalProgress.add(self.pushProgress)
+        readers = [reader]
+        if process.stderr is not None:
+            # drain stderr too, a full stderr pipe would block the solver
+            readers.append(solveroutput.OutputReader(process.stderr))
+        for r in readers:
+            r.start()
+        for r in readers:
+            r.join()
+        if reader.droppedLines:
+            self.pushStatus(
+                "{} lines of solver output were dropped.\n"
+                .format(reader.droppedLines))
+        return reader.output
 
 
 class Prepare(BaseTask):
@@ -54,6 +54,7 @@ class ControlTaskPanel(QtCore.QObject):
     machineStatusCleared = QtCore.Signal()
     machineTimeChanged = QtCore.Signal(float)
     machineStateChanged = QtCore.Signal(float)
+    machineProgressChanged = QtCore.Signal(object)
 
     def __init__(self, machine):
         super(ControlTaskPanel, self).__init__()
@@ -89,6 +90,7 @@ class ControlTaskPanel(QtCore.QObject):
         self.machineStatusChanged.connect(self.form.appendStatus)
         self.machineStatusCleared.connect(self.form.clearStatus)
         self.machineTimeChanged.connect(self.form.setTime)
+        self.machineProgressChanged.connect(self.form.setProgress)
         self.machineStateChanged.connect(
             lambda: self.form.updateState(self.machine))
         self.machineChanged.connect(self._updateTimer)
@@ -168,6 +170,7 @@ class ControlTaskPanel(QtCore.QObject):
         machine.signalStarted.add(self._startedProxy)
         machine.signalStopped.add(self._stoppedProxy)
         machine.signalState.add(self._stateProxy)
+        machine.signalProgress.add(self._progressProxy)
 
     def _disconnectMachine(self):
         if self.machine is not None:
@@ -176,6 +179,7 @@ class ControlTaskPanel(QtCore.QObject):
             self.machine.signalStarted.remove(self._startedProxy)
             self.machine.signalStopped.remove(self._stoppedProxy)
             self.machine.signalState.remove(self._stateProxy)
+            self.machine.signalProgress.remove(self._progressProxy)
 
     def _startedProxy(self):
         self.machineStarted.emit(self.machine)
@@ -197,6 +201,9 @@ class ControlTaskPanel(QtCore.QObject):
         state = self.machine.state
         self.machineStateChanged.emit(state)
 
+    def _progressProxy(self, event):
+        self.machineProgressChanged.emit(event)
+
 
 class ControlWidget(QtGui.QWidget):
 
@@ -248,6 +255,8 @@ class ControlWidget(QtGui.QWidget):
         timeLyt.addWidget(timeHeaderLbl)
         timeLyt.addWidget(self._timeLbl)
         timeLyt.addStretch()
+        self._progressLbl = QtGui.QLabel()
+        timeLyt.addWidget(self._progressLbl)
         timeLyt.setContentsMargins(0, 0, 0, 0)
         self._timeWid = QtGui.QWidget()
         self._timeWid.setLayout(timeLyt)
@@ -279,6 +288,23 @@ class ControlWidget(QtGui.QWidget):
     @QtCore.Slot(str)
     def clearStatus(self):
         self._statusEdt.setPlainText("")
+        self._progressLbl.setText("")
+
+    @QtCore.Slot(object)
+    def setProgress(self, event):
+        # event is a femsolver.solveroutput.ProgressEvent
+        parts = []
+        if event.step is not None:
+            parts.append(self.tr("Step") + " %d" % event.step)
+        if event.increment is not None:
+            parts.append(self.tr("Increment") + " %d" % event.increment)
+        if event.iteration is not None:
+            parts.append(self.tr("Iteration") + " %d" % event.iteration)
+        if event.residual is not None:
+            parts.append(self.tr("Residual") + " %.3g" % event.residual)
+        if event.time is not None:
+            parts.append(self.tr("Time") + " %g" % event.time)
+        self._progressLbl.setText(", ".join(parts))
 
     @QtCore.Slot(float)
     def setTime(self, time):
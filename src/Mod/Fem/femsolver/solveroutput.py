@@ -0,0 +1,227 @@
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD developers                                 *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+__title__ = "FreeCAD FEM solver output"
+__author__ = "FreeCAD developers"
+__url__ = "https://www.freecadweb.org"
+
+## \addtogroup FEM
+#  @{
+
+import codecs
+import collections
+import re
+import threading
+
+from . import signal
+
+
+CHUNK_SIZE = 64 * 1024
+MAX_LINES = 100000
+
+
+# One progress report of a running solver. Fields the solver did
+# not report (yet) are None.
+ProgressEvent = collections.namedtuple(
+    "ProgressEvent", ["step", "increment", "iteration", "residual", "time"])
+
+
+class OutputReader(object):
+    """Reads the output stream of a solver process on a background thread.
+
+    The stream is read in chunks and decoded incrementally. Complete lines
+    are kept in a ring buffer of at most *maxLines* lines and passed to
+    *parser*, see :class:`CalculixProgressParser`. Slots in signalOutput
+    get the text of each chunk (complete lines only), slots in
+    signalProgress get a :class:`ProgressEvent` whenever the parser reports
+    one. Both are notified from the reader thread.
+    """
+
+    def __init__(self, stream, parser=None, maxLines=MAX_LINES):
+        self.stream = stream
+        self.parser = parser
+        self.signalOutput = set()
+        self.signalProgress = set()
+        self.progress = None
+        self.droppedLines = 0
+        self._lines = collections.deque(maxlen=maxLines)
+        self._partial = ""
+        self._thread = None
+
+    @property
+    def output(self):
+        text = "\n".join(self._lines)
+        if self._partial:
+            text = text + "\n" + self._partial if text else self._partial
+        return text
+
+    def start(self):
+        self._thread = threading.Thread(target=self._read)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def join(self):
+        if self._thread is not None:
+            self._thread.join()
+
+    def _read(self):
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        read = getattr(self.stream, "read1", self.stream.read)
+        while True:
+            data = read(CHUNK_SIZE)
+            if not data:
+                break
+            self._feed(decoder.decode(data))
+        self._feed(decoder.decode(b"", True))
+        if self._partial:
+            self._addLines([self._partial])
+            self._partial = ""
+
+    def _feed(self, text):
+        if not text:
+            return
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        if lines:
+            self._addLines(lines)
+
+    def _addLines(self, lines):
+        lines = [line.rstrip() for line in lines]
+        if self._lines.maxlen is not None:
+            overflow = len(self._lines) + len(lines) - self._lines.maxlen
+            self.droppedLines += max(overflow, 0)
+        self._lines.extend(lines)
+        signal.notify(self.signalOutput, "\n".join(lines) + "\n")
+        if self.parser is not None:
+            for line in lines:
+                event = self.parser.parse(line)
+                if event is not None:
+                    self.progress = event
+                    signal.notify(self.signalProgress, event)
+
+
+class _ProgressParser(object):
+
+    def __init__(self):
+        self.step = None
+        self.increment = None
+        self.iteration = None
+        self.residual = None
+        self.time = None
+
+    def parse(self, line):
+        raise NotImplementedError()
+
+    def _event(self):
+        return ProgressEvent(
+            self.step, self.increment, self.iteration,
+            self.residual, self.time)
+
+
+class CalculixProgressParser(_ProgressParser):
+    """Parses the stdout of CalculiX ccx.
+
+    A new event is reported when a step, increment or iteration starts,
+    when the total time of an increment is known and for every largest
+    residual force.
+    """
+
+    _STEP = re.compile(r"^\s*STEP\s+(\d+)\s*$")
+    _INCREMENT = re.compile(r"^\s*increment\s+(\d+)\s+attempt")
+    _ITERATION = re.compile(r"^\s*iteration\s+(\d+)\s*$")
+    _TIME = re.compile(r"^\s*actual total time\s*=\s*(\S+)")
+    _RESIDUAL = re.compile(r"^\s*largest residual force\s*=\s*(\S+)")
+
+    def parse(self, line):
+        match = self._STEP.match(line)
+        if match:
+            self.step = int(match.group(1))
+            self.increment = None
+            self.iteration = None
+            self.residual = None
+            return self._event()
+        match = self._INCREMENT.match(line)
+        if match:
+            self.increment = int(match.group(1))
+            self.iteration = None
+            self.residual = None
+            return self._event()
+        match = self._ITERATION.match(line)
+        if match:
+            self.iteration = int(match.group(1))
+            return self._event()
+        match = self._TIME.match(line)
+        if match:
+            self.time = _toFloat(match.group(1))
+            return self._event()
+        match = self._RESIDUAL.match(line)
+        if match:
+            self.residual = _toFloat(match.group(1))
+            return self._event()
+        return None
+
+
+class ElmerProgressParser(_ProgressParser):
+    """Parses the stdout of ElmerSolver.
+
+    Elmer time steps are reported as increments, steady state iterations
+    as iterations and the relative change of the nonlinear or steady state
+    iteration as residual.
+    """
+
+    _TIME = re.compile(r"^\s*MAIN:\s+Time:\s+(\d+)/\d+\s+(\S+)")
+    _ITERATION = re.compile(r"^\s*MAIN:\s+Steady state iteration:\s+(\d+)")
+    _CHANGE = re.compile(
+        r"^\s*ComputeChange:\s+(?:NS|SS)\s+\(ITER=\d+\)\s+\(NRM,RELC\):\s+\(\s*\S+\s+(\S+)")
+
+    def parse(self, line):
+        match = self._TIME.match(line)
+        if match:
+            self.increment = int(match.group(1))
+            self.time = _toFloat(match.group(2))
+            self.iteration = None
+            self.residual = None
+            return self._event()
+        match = self._ITERATION.match(line)
+        if match:
+            self.iteration = int(match.group(1))
+            return self._event()
+        match = self._CHANGE.match(line)
+        if match:
+            self.residual = _toFloat(match.group(1))
+            return self._event()
+        return None
+
+
+def _toFloat(text):
+    try:
+        return float(text)
+    except ValueError:
+        # Fortran writes exponents without "E" if they have three digits
+        try:
+            return float(re.sub(r"(\d)([+-]\d+)$", r"\1E\2", text))
+        except ValueError:
+            return None
+
+##  @}
@@ -147,3 +147,44 @@ class TestFemCommon(unittest.TestCase):
                 # to get an error message what was going wrong
                 __import__("{0}".format(mod))
             self.assertTrue(im, "Problem importing {0}".format(mod))
+
+    # ********************************************************************************************
+    def test_solver_output_progress(
+        self
+    ):
+        import io
+        from femsolver import solveroutput
+
+        ccx_stdout = (
+            b" STEP 1\n"
+            b"\n"
+            b" increment 1 attempt 1 \n"
+            b" actual total time=5.000000e-01\n"
+            b"\n"
+            b" iteration 1\n"
+            b" largest residual force= 1.25e-03 in node 4 and dof 1\n"
+            b" increment 2 attempt 1 \n"
+            b" actual total time=1.000000e+00"
+        )
+        reader = solveroutput.OutputReader(
+            io.BytesIO(ccx_stdout),
+            solveroutput.CalculixProgressParser(),
+            maxLines=4
+        )
+        events = []
+        reader.signalProgress.add(events.append)
+        reader.start()
+        reader.join()
+
+        self.assertEqual(len(events), 7)
+        self.assertEqual(
+            events[4],
+            solveroutput.ProgressEvent(
+                step=1, increment=1, iteration=1, residual=1.25e-03, time=0.5
+            )
+        )
+        self.assertEqual(reader.progress.increment, 2)
+        self.assertEqual(reader.progress.time, 1.0)
+        # ring buffer keeps the last lines only
+        self.assertEqual(reader.droppedLines, 5)
+        self.assertEqual(reader.output.splitlines()[-1], " actual total time=1.000000e+00")
@@ -117,3 +117,47 @@ class TestMaterialUnits(unittest.TestCase):
                         "Unit of quantity {} from material parameter {} is wrong."
                         .format(value, param)
                     )
+
+    # ********************************************************************************************
+    def test_material_card_index(
+        self
+    ):
+        # test the material card index is updated on new, changed and removed cards
+        import os
+        import tempfile
+        from materialtools.cardutils import MaterialCardIndex
+
+        def write_card(card_path, father, density):
+            card_name = os.path.splitext(os.path.basename(card_path))[0]
+            with open(card_path, "w") as f:
+                f.write(
+                    "; {0}\n; test card\n\n[General]\nName = {0}\nFather = {1}\n\n"
+                    "[Mechanical]\nDensity = {2}\n"
+                    .format(card_name, father, density)
+                )
+
+        mat_dir = tempfile.mkdtemp()
+        index_file = join(mat_dir, "MaterialCardIndex.json")
+        steel = join(mat_dir, "TestSteel.FCMat")
+        pla = join(mat_dir, "TestPLA.FCMat")
+        write_card(steel, "Metal", "7900 kg/m^3")
+        write_card(pla, "Thermoplast", "1250 kg/m^3")
+
+        index = MaterialCardIndex(index_file)
+        self.assertEqual(len(index.update_dir(mat_dir)), 2)
+        self.assertEqual(index.find_by_name("TestSteel"), [steel])
+        self.assertEqual(index.find_by_category("Thermoplast"), [pla])
+        self.assertEqual(sorted(index.find_by_property("Density")), sorted([steel, pla]))
+        self.assertEqual(index.find_by_property("Density", "7900 kg/m^3"), [steel])
+
+        # a new index is loaded from the index file
+        index = MaterialCardIndex(index_file)
+        self.assertEqual(index.get_mat_dict(steel)["Density"], "7900 kg/m^3")
+
+        # changed and removed cards
+        write_card(steel, "Metal", "7850.5 kg/m^3")
+        os.remove(pla)
+        dir_cards = index.update_dir(mat_dir)
+        self.assertEqual(dir_cards, [(steel, index.get_mat_dict(steel))])
+        self.assertEqual(index.find_by_property("Density", "7850.5 kg/m^3"), [steel])
+        self.assertEqual(index.find_by_category("Thermoplast"), [])
@@ -25,6 +25,7 @@ __title__ = "Mesh FEM unit tests"
 __author__ = "Bernd Hahnebach"
 __url__ = "https://www.freecadweb.org"
 
+import os
 import unittest
 from os.path import join
 
@@ -514,6 +515,28 @@ class TestMeshEleTetra10(unittest.TestCase):
             file_extension
         )
 
+    # ********************************************************************************************
+    def test_tetra10_meshnpz(
+        self
+    ):
+        # tetra10 element: reading from and writing to binary mesh file format
+
+        file_extension = "meshnpz"
+        outfile, testfile = self.get_file_paths(file_extension)
+
+        # directly use Python methods to read and write files
+        from feminout.importNpzMesh import write
+        write(outfile, self.femmesh)
+        from feminout.importNpzMesh import read
+        femmesh_testfile = read(outfile)
+        femmesh_outfile = read(testfile)
+
+        self.compare_mesh_files(
+            femmesh_testfile,
+            femmesh_outfile,
+            file_extension
+        )
+
     # ********************************************************************************************
     def test_tetra10_z88(
         self
@@ -703,3 +726,154 @@ class TestMeshGroups(unittest.TestCase):
                 format(elements_to_be_added, elements_returned)
             )
         )
+
+
+# ************************************************************************************************
+class TestMeshGmshCache(unittest.TestCase):
+    fcc_print("import TestMeshGmshCache")
+
+    # ********************************************************************************************
+    def setUp(
+        self
+    ):
+        # setUp is executed before every test
+        import tempfile
+        import ObjectsFem
+
+        # new document
+        self.document = FreeCAD.newDocument(self.__class__.__name__)
+        box = self.document.addObject("Part::Box", "Box")
+        self.document.recompute()
+        self.mesh_obj = ObjectsFem.makeMeshGmsh(self.document, "Mesh")
+        self.mesh_obj.Part = box
+
+        # the cache and the input files are in a temporary dir
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_dir = join(self.tmp_dir, "cache")
+        self.gmsh_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Fem/Gmsh")
+        self.old_cache_dir = self.gmsh_prefs.GetString("MeshCacheDir", "")
+        self.gmsh_prefs.SetString("MeshCacheDir", self.cache_dir)
+        with open(join(self.tmp_dir, "geo"), "w") as f:
+            f.write("Mesh.Algorithm = 2;\n")
+        with open(join(self.tmp_dir, "brep"), "w") as f:
+            f.write("box")
+
+    # ********************************************************************************************
+    def tearDown(
+        self
+    ):
+        # tearDown is executed after every test
+        import shutil
+        self.gmsh_prefs.SetString("MeshCacheDir", self.old_cache_dir)
+        shutil.rmtree(self.tmp_dir)
+        FreeCAD.closeDocument(self.document.Name)
+
+    # ********************************************************************************************
+    def test_00print(
+        self
+    ):
+        # since method name starts with 00 this will be run first
+        # this test just prints a line with stars
+
+        fcc_print("\n{0}\n{1} run FEM TestMeshGmshCache tests {2}\n{0}".format(
+            100 * "*",
+            10 * "*",
+            54 * "*"
+        ))
+
+    # ********************************************************************************************
+    def get_gmsh_tools(
+        self,
+        mesh_data="mesh",
+        returncode=0
+    ):
+        # Gmsh itself is not run, its run writes the given mesh data
+        from femmesh.gmshtools import GmshTools
+        gt = GmshTools(self.mesh_obj)
+        gt.temp_file_geo = join(self.tmp_dir, "geo")
+        gt.temp_file_geometry = join(self.tmp_dir, "brep")
+        gt.temp_file_mesh = join(self.tmp_dir, "mesh.unv")
+        gt.runs = 0
+
+        def run_gmsh_with_geo():
+            gt.runs += 1
+            gt.returncode = returncode
+            if mesh_data is not None:
+                with open(gt.temp_file_mesh, "w") as f:
+                    f.write(mesh_data)
+            return ""
+        gt.run_gmsh_with_geo = run_gmsh_with_geo
+        return gt
+
+    # ********************************************************************************************
+    def read_mesh(
+        self
+    ):
+        with open(join(self.tmp_dir, "mesh.unv"), "r") as f:
+            return f.read()
+
+    # ********************************************************************************************
+    def test_cache_hit_and_miss(
+        self
+    ):
+        gt = self.get_gmsh_tools("mesh 1")
+        gt.run_gmsh_with_cache()
+        self.assertEqual(gt.runs, 1)
+        self.assertTrue(os.path.isfile(gt.mesh_cache_file))
+
+        # same input files, the mesh is taken from the cache
+        gt = self.get_gmsh_tools("mesh 2")
+        gt.run_gmsh_with_cache()
+        self.assertEqual(gt.runs, 0)
+        self.assertEqual(self.read_mesh(), "mesh 1")
+
+        # changed geometry, Gmsh is run again
+        with open(join(self.tmp_dir, "brep"), "w") as f:
+            f.write("cylinder")
+        gt = self.get_gmsh_tools("mesh 3")
+        gt.run_gmsh_with_cache()
+        self.assertEqual(gt.runs, 1)
+        self.assertEqual(self.read_mesh(), "mesh 3")
+
+    # ********************************************************************************************
+    def test_cache_failed_run(
+        self
+    ):
+        # a mesh of a previous run is left in the working dir
+        with open(join(self.tmp_dir, "mesh.unv"), "w") as f:
+            f.write("old mesh")
+
+        # Gmsh fails without writing a mesh
+        gt = self.get_gmsh_tools(None, returncode=1)
+        gt.run_gmsh_with_cache()
+        self.assertTrue(gt.error)
+        self.assertFalse(os.path.isfile(join(self.tmp_dir, "mesh.unv")))
+        self.assertFalse(os.path.isfile(gt.mesh_cache_file))
+
+        # Gmsh writes a mesh, but returns an error
+        gt = self.get_gmsh_tools("broken mesh", returncode=1)
+        gt.run_gmsh_with_cache()
+        self.assertFalse(os.path.isfile(gt.mesh_cache_file))
+
+    # ********************************************************************************************
+    def test_cache_prune(
+        self
+    ):
+        import time
+        from femmesh.gmshtools import prune_mesh_cache
+        os.makedirs(self.cache_dir)
+        now = time.time()
+        for i, age in enumerate((0, 1, 2, 40)):
+            path = join(self.cache_dir, "{}.unv".format(i))
+            with open(path, "wb") as f:
+                f.write(b"x" * 400 * 1024)
+            os.utime(path, (now - age * 86400, now - age * 86400))
+
+        # too old
+        removed = prune_mesh_cache(self.cache_dir, max_size=0, max_age=30)
+        self.assertEqual(removed, [join(self.cache_dir, "3.unv")])
+
+        # too big, the least recently used are removed
+        removed = prune_mesh_cache(self.cache_dir, max_size=1, max_age=0)
+        self.assertEqual(removed, [join(self.cache_dir, "2.unv")])
+        self.assertEqual(sorted(os.listdir(self.cache_dir)), ["0.unv", "1.unv"])
@@ -460,3 +460,43 @@ class TestResult(unittest.TestCase):
             expected_dispabs,
             "Calculated displacement abs are not the expected values."
         )
+
+    # ********************************************************************************************
+    def test_write_vtu_series(
+        self
+    ):
+        import numpy
+        from xml.etree import ElementTree as ET
+        from feminout import writeResultArrays
+        from feminout.importToolsFem import read_mesh_arrays
+
+        mesh_arrays = read_mesh_arrays(join(
+            testtools.get_fem_test_home_dir(),
+            "mesh",
+            "tetra10_mesh.meshnpz"
+        ))
+        node_count = len(mesh_arrays["Nodes"][0])
+        series = [(
+            time,
+            {
+                "Displacement": numpy.full((node_count, 3), time),
+                "Temperature": numpy.full(node_count, 20.0 + time),
+            }
+        ) for time in (0.5, 1.0)]
+        pvd_file = join(testtools.get_fem_test_tmp_dir("result_vtu_series"), "series.pvd")
+        writeResultArrays.write_vtu_series(pvd_file, mesh_arrays, series)
+
+        datasets = ET.parse(pvd_file).getroot().findall("Collection/DataSet")
+        self.assertEqual([ds.get("timestep") for ds in datasets], ["0.5", "1.0"])
+
+        with open(pvd_file.replace("series.pvd", datasets[1].get("file")), "rb") as fp:
+            vtu_content = fp.read()
+        xml_part, raw_part = vtu_content.split(b'<AppendedData encoding="raw">_', 1)
+        arrays = ET.fromstring(xml_part + b"</VTKFile>").iter("DataArray")
+        offsets = {array.get("Name"): int(array.get("offset")) for array in arrays}
+        # every appended array starts with an UInt64 byte count
+        start = offsets["Temperature"]
+        nbytes = int(numpy.frombuffer(raw_part[start:start + 8], dtype=numpy.uint64)[0])
+        temperature = numpy.frombuffer(raw_part[start + 8:start + 8 + nbytes], dtype=numpy.float64)
+        self.assertEqual(len(temperature), node_count)
+        self.assertTrue(numpy.all(temperature == 21.0))
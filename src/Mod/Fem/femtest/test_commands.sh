@@ -29,6 +29,7 @@ make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_material.TestMaterialUnits
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshCommon
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshEleTetra10
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshGroups
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshGmshCache
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_object.TestObjectCreate
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_object.TestObjectType
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_open.TestObjectOpen
@@ -45,10 +46,12 @@ make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_ccxtools.TestCcxTools.test_the
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_ccxtools.TestCcxTools.test_thermomech_spine
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_common.TestFemCommon.test_adding_refshaps
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_common.TestFemCommon.test_pyimport_all_FEM_modules
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_common.TestFemCommon.test_solver_output_progress
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_femimport.TestFemImport.test_import_fem
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_femimport.TestObjectExistance.test_objects_existance
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_material.TestMaterialUnits.test_known_quantity_units
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_material.TestMaterialUnits.test_material_card_quantities
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_material.TestMaterialUnits.test_material_card_index
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshCommon.test_mesh_seg2_python
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshCommon.test_mesh_seg3_python
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshCommon.test_unv_save_load
@@ -58,10 +61,14 @@ make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshEleTetra10.test_t
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshEleTetra10.test_tetra10_unv
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshEleTetra10.test_tetra10_vkt
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshEleTetra10.test_tetra10_yml
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshEleTetra10.test_tetra10_meshnpz
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshEleTetra10.test_tetra10_z88
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshGroups.test_add_groups
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshGroups.test_delete_groups
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshGroups.test_add_group_elements
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshGmshCache.test_cache_hit_and_miss
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshGmshCache.test_cache_failed_run
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_mesh.TestMeshGmshCache.test_cache_prune
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_object.TestObjectCreate.test_femobjects_make
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_object.TestObjectType.test_femobjects_type
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_object.TestObjectType.test_femobjects_isoftype
@@ -75,6 +82,7 @@ make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_result.TestResult.test_stress_
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_result.TestResult.test_stress_principal_reinforced
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_result.TestResult.test_rho
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_result.TestResult.test_disp_abs
+make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_result.TestResult.test_write_vtu_series
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_calculix.TestSolverCalculix.test_box_frequency
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_calculix.TestSolverCalculix.test_box_static
 make -j 4 && ./bin/FreeCADCmd -t femtest.app.test_solver_calculix.TestSolverCalculix.test_ccx_buckling_flexuralbuckling
@@ -139,6 +147,11 @@ unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
     'femtest.app.test_common.TestFemCommon.test_pyimport_all_FEM_modules'
 ))
 
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
+    'femtest.app.test_common.TestFemCommon.test_solver_output_progress'
+))
+
 import unittest
 unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
     'femtest.app.test_femimport.TestFemImport.test_import_fem'
@@ -159,6 +172,11 @@ unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
     'femtest.app.test_material.TestMaterialUnits.test_material_card_quantities'
 ))
 
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
+    'femtest.app.test_material.TestMaterialUnits.test_material_card_index'
+))
+
 import unittest
 unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
     'femtest.app.test_mesh.TestMeshCommon.test_mesh_seg2_python'
@@ -204,6 +222,11 @@ unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
     'femtest.app.test_mesh.TestMeshEleTetra10.test_tetra10_yml'
 ))
 
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
+    'femtest.app.test_mesh.TestMeshEleTetra10.test_tetra10_meshnpz'
+))
+
 import unittest
 unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
     'femtest.app.test_mesh.TestMeshEleTetra10.test_tetra10_z88'
@@ -224,6 +247,21 @@ unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
     'femtest.app.test_mesh.TestMeshGroups.test_add_group_elements'
 ))
 
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
+    'femtest.app.test_mesh.TestMeshGmshCache.test_cache_hit_and_miss'
+))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
+    'femtest.app.test_mesh.TestMeshGmshCache.test_cache_failed_run'
+))
+
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
+    'femtest.app.test_mesh.TestMeshGmshCache.test_cache_prune'
+))
+
 import unittest
 unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
     'femtest.app.test_object.TestObjectCreate.test_femobjects_make'
@@ -289,6 +327,11 @@ unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
     'femtest.app.test_result.TestResult.test_disp_abs'
 ))
 
+import unittest
+unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
+    'femtest.app.test_result.TestResult.test_write_vtu_series'
+))
+
 import unittest
 unittest.TextTestRunner().run(unittest.TestLoader().loadTestsFromName(
     'femtest.app.test_solver_calculix.TestSolverCalculix.test_box_frequency'
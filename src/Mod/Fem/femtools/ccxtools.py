@@ -35,6 +35,7 @@ import subprocess
 
 import FreeCAD
 
+from femsolver import solveroutput
 from femtools import femutils
 from femtools import membertools
 
@@ -68,6 +69,8 @@ class FemToolsCcx(QtCore.QRunnable, QtCore.QObject):
     """
 
     finished = QtCore.Signal(int)
+    # femsolver.solveroutput.ProgressEvent, emitted from a reader thread
+    progress = QtCore.Signal(object)
 
     def __init__(self, analysis=None, solver=None, test_mode=False):
         """The constructor
@@ -527,10 +530,21 @@ class FemToolsCcx(QtCore.QRunnable, QtCore.QObject):
             shell=False,
             env=_env
         )
-        self.ccx_stdout, self.ccx_stderr = p.communicate()
-        if sys.version_info.major >= 3:
-            self.ccx_stdout = self.ccx_stdout.decode()
-            self.ccx_stderr = self.ccx_stderr.decode()
+        # read the output in chunks on background threads
+        # progress events are emitted while ccx is running
+        stdout_reader = solveroutput.OutputReader(
+            p.stdout,
+            solveroutput.CalculixProgressParser()
+        )
+        stdout_reader.signalProgress.add(self.progress.emit)
+        stderr_reader = solveroutput.OutputReader(p.stderr)
+        stdout_reader.start()
+        stderr_reader.start()
+        stdout_reader.join()
+        stderr_reader.join()
+        p.wait()
+        self.ccx_stdout = stdout_reader.output
+        self.ccx_stderr = stderr_reader.output
         os.putenv("OMP_NUM_THREADS", ont_backup)
         QtCore.QDir.setCurrent(cwd)
         return p.returncode
@@ -32,10 +32,43 @@
 import re
 from . import Utils
 import time
+import bisect
+from array import array
 
 
 INSTANCE_DEFINITION_RE = re.compile("#(\d+)[^\S\n]?=[^\S\n]?(.*?)\((.*)\)[^\S\n]?;[\\r]?$")
 
+# a record ends with a ; outside of strings and comments. Unterminated strings
+# and comments at the end of a chunk are matched too, the rest of the chunk is
+# then kept for the next one.
+RECORD_END_RE = re.compile(br"'[^']*(?:'|\Z)|/\*(?:.*?\*/|.*\Z)|;", re.DOTALL)
+INSTANCE_START_RE = re.compile(br"\s*#(\d+)\s*=\s*([A-Za-z0-9_]*)\s*\(")
+INSTANCE_ATTRIBUTES_RE = re.compile(r"\s*#\d+\s*=\s*[A-Za-z0-9_]*\s*\((.*)\)\s*;\s*$", re.DOTALL)
+REFERENCE_RE = re.compile(br"'[^']*'|#(\d+)")
+
+def iter_records(fp, chunk_size=1 << 20):
+    """ Reads a Part21 file opened in binary mode in chunks of chunk_size bytes
+    and yields (offset, record) for each record terminated by a ;
+    The record includes the whitespace and comments in front of it.
+    """
+    offset = 0
+    buf = b''
+    while True:
+        chunk = fp.read(chunk_size)
+        buf += chunk
+        start = 0
+        for match in RECORD_END_RE.finditer(buf):
+            if match.end() == len(buf) and match.group(0) != b';' and chunk:
+                # unterminated string or comment, continue with the next chunk
+                break
+            if match.group(0) == b';':
+                yield offset + start, buf[start:match.end()]
+                start = match.end()
+        offset += start
+        buf = buf[start:]
+        if not chunk:
+            break
+
 def map_string_to_num(stri):
     """ Take a string, check whether it is an integer, a float or not
     """
@@ -125,15 +158,10 @@ class Part21Parser:
     def parse_file(self):
         init_time = time.time()
         print("Parsing file %s..."%self._filename)
-        fp = open(self._filename)
-        while True:
-            line = fp.readline()
-            if not line:
-                break
-            # there may be a multiline definition. In this case, we read lines until we found
-            # a ;
-            while (line.find(';') == -1): #it's a multiline
-                line = line.replace("\n","").replace("\r","") + fp.readline()
+        fp = open(self._filename, 'rb')
+        for offset, record in iter_records(fp):
+            # multiline definitions are joined
+            line = record.decode('latin-1').strip().replace("\n","").replace("\r","")
             # parse line
             match_instance_definition = INSTANCE_DEFINITION_RE.search(line)  # id,name,attrs
             if match_instance_definition:
@@ -155,6 +183,243 @@ class Part21Parser:
         print('done in %fs.'%(time.time()-init_time))
         print('schema: - %s entities %i'%(self._schema_name,len(list(self._instances_definition.keys()))))
 
+class Part21Index(object):
+    """
+    Index of the instances of a Part21 file, built in one pass over the file,
+    which is read in chunks. The file is never held in memory as a whole.
+    For each instance, the id, the byte offset and length of its record and
+    the entity name are stored in arrays sorted by id. The attributes of an
+    instance are read from the file and parsed when they are accessed:
+    >>> index = Part21Index("Product1.stp")
+    >>> index.get_entity_name(17)
+    'PRODUCT_DEFINITION'
+    >>> index.get_attributes(17)
+    ["''", "' '", '#6', '#3']
+    >>> index.get_references(17)
+    [6, 3]
+    The reference graph (references and referrers of all instances) is built
+    on first use with a second pass over the file.
+    """
+    def __init__(self, filename, chunk_size=1 << 20):
+        self._filename = filename
+        self._chunk_size = chunk_size
+        self._schema_name = ""
+        self._ids = array('q')
+        self._offsets = array('q')
+        self._lengths = array('l')
+        self._name_indices = array('l')
+        self._entity_names = []
+        self._file_order = None
+        self._references = None
+        self._referrers = None
+        self._fp = None
+        self.build_index()
+
+    def build_index(self):
+        init_time = time.time()
+        names = {}
+        ids = self._ids
+        offsets = self._offsets
+        lengths = self._lengths
+        name_indices = self._name_indices
+        with open(self._filename, 'rb') as fp:
+            for offset, record in iter_records(fp, self._chunk_size):
+                match = INSTANCE_START_RE.match(record)
+                if match:
+                    instance_id, entity_name = match.groups()
+                    if entity_name not in names:
+                        names[entity_name] = len(self._entity_names)
+                        self._entity_names.append(entity_name.decode('latin-1'))
+                    ids.append(int(instance_id))
+                    offsets.append(offset + match.start(1) - 1)
+                    lengths.append(len(record) - match.start(1) + 1)
+                    name_indices.append(names[entity_name])
+                elif not ids and b'FILE_SCHEMA' in record:
+                    line = record.decode('latin-1').strip()
+                    self._schema_name = line.split("'")[1].split("'")[0].split(" ")[0].lower()
+        # the ids are sorted for lookup with bisect, most files are written sorted
+        if any(ids[i] > ids[i + 1] for i in range(len(ids) - 1)):
+            order = sorted(range(len(ids)), key=ids.__getitem__)
+            # position in the file of the instances, used for the reference graph
+            self._file_order = array('q', order)
+            self._ids = array('q', [ids[i] for i in order])
+            self._offsets = array('q', [offsets[i] for i in order])
+            self._lengths = array('l', [lengths[i] for i in order])
+            self._name_indices = array('l', [name_indices[i] for i in order])
+        print('Indexed %i instances of %s in %fs.' % (len(self._ids), self._filename, time.time() - init_time))
+
+    def close(self):
+        if self._fp:
+            self._fp.close()
+            self._fp = None
+
+    def get_schema_name(self):
+        return self._schema_name
+
+    def get_number_of_instances(self):
+        return len(self._ids)
+
+    def get_instance_ids(self):
+        return self._ids
+
+    def _position(self, instance_id):
+        pos = bisect.bisect_left(self._ids, instance_id)
+        if pos == len(self._ids) or self._ids[pos] != instance_id:
+            raise KeyError(instance_id)
+        return pos
+
+    def __contains__(self, instance_id):
+        pos = bisect.bisect_left(self._ids, instance_id)
+        return pos < len(self._ids) and self._ids[pos] == instance_id
+
+    def get_entity_name(self, instance_id):
+        return self._entity_names[self._name_indices[self._position(instance_id)]]
+
+    def get_instances_of(self, entity_name):
+        """ Returns the ids of all instances of the given entity, e.g. 'PRODUCT_DEFINITION'
+        """
+        entity_name = entity_name.upper()
+        if entity_name not in self._entity_names:
+            return []
+        name_index = self._entity_names.index(entity_name)
+        return [self._ids[i] for i, n in enumerate(self._name_indices) if n == name_index]
+
+    def _read_record(self, pos):
+        if self._fp is None:
+            self._fp = open(self._filename, 'rb')
+        self._fp.seek(self._offsets[pos])
+        return self._fp.read(self._lengths[pos])
+
+    def get_record(self, instance_id):
+        """ Returns the record of an instance as it is in the file, e.g.
+        "#17=PRODUCT_DEFINITION('',' ',#6,#3) ;"
+        """
+        return self._read_record(self._position(instance_id)).decode('latin-1')
+
+    def get_attributes(self, instance_id):
+        """ Returns the attributes of an instance as nested lists of strings,
+        see Utils.parse_attributes. Complex instances return [].
+        """
+        match = INSTANCE_ATTRIBUTES_RE.match(self.get_record(instance_id))
+        if not match:
+            return []
+        return Utils.parse_attributes(match.group(1))
+
+    def _get_record_references(self, record):
+        return [int(ref) for ref in REFERENCE_RE.findall(record[record.index(b'=') + 1:]) if ref]
+
+    def get_references(self, instance_id):
+        """ Returns the ids of the instances an instance refers to, in order of appearance
+        """
+        if self._references is not None:
+            return list(self._get_graph_references(self._position(instance_id)))
+        return self._get_record_references(self._read_record(self._position(instance_id)))
+
+    def build_reference_graph(self):
+        """ Reads the references of all instances in a second pass over the file.
+        They are stored in file order in compressed sparse row form: the
+        references of the n-th instance of the file are refs[starts[n]:starts[n+1]]
+        """
+        if self._references is not None:
+            return
+        init_time = time.time()
+        starts = array('q', [0])
+        refs = array('q')
+        with open(self._filename, 'rb') as fp:
+            for offset, record in iter_records(fp, self._chunk_size):
+                if INSTANCE_START_RE.match(record):
+                    refs.extend(self._get_record_references(record))
+                    starts.append(len(refs))
+        self._references = (starts, refs)
+        print('Built reference graph of %i references in %fs.' % (len(refs), time.time() - init_time))
+
+    def _get_graph_references(self, pos):
+        starts, refs = self._references
+        if self._file_order is not None:
+            pos = self._file_order[pos]
+        return refs[starts[pos]:starts[pos + 1]]
+
+    def get_referrers(self, instance_id):
+        """ Returns the ids of the instances which refer to an instance
+        """
+        if self._referrers is None:
+            self.build_reference_graph()
+            # count the referrers of each instance, then fill them in
+            counts = array('q', [0]) * (len(self._ids) + 1)
+            for pos in range(len(self._ids)):
+                for ref in self._get_graph_references(pos):
+                    if ref in self:
+                        counts[self._position(ref) + 1] += 1
+            for pos in range(len(self._ids)):
+                counts[pos + 1] += counts[pos]
+            referrers = array('q', [0]) * counts[-1]
+            fill = array('q', counts)
+            for pos in range(len(self._ids)):
+                for ref in self._get_graph_references(pos):
+                    if ref in self:
+                        ref_pos = self._position(ref)
+                        referrers[fill[ref_pos]] = self._ids[pos]
+                        fill[ref_pos] += 1
+            self._referrers = (counts, referrers)
+        pos = self._position(instance_id)
+        counts, referrers = self._referrers
+        return list(referrers[counts[pos]:counts[pos + 1]])
+
+    def walk(self, instance_id):
+        """ Yields the ids of all instances reachable from an instance, depth first,
+        each instance once
+        """
+        visited = set()
+        stack = [instance_id]
+        while stack:
+            current = stack.pop()
+            if current in visited or current not in self:
+                continue
+            visited.add(current)
+            yield current
+            stack.extend(reversed(self.get_references(current)))
+
+    def get_product_name(self, product_definition_id):
+        """ Returns the name (or else the id) of the product of a product_definition
+        """
+        formation = int(self.get_attributes(product_definition_id)[2][1:])
+        product = int(self.get_attributes(formation)[2][1:])
+        # some systems only write the product id
+        product_id, name = self.get_attributes(product)[:2]
+        return name.strip("'") or product_id.strip("'")
+
+    def get_product_definition_children(self, product_definition_id):
+        """ Returns (next_assembly_usage_occurrence id, child product_definition id)
+        of the direct children of a product_definition in the assembly tree
+        """
+        children = []
+        for referrer in self.get_referrers(product_definition_id):
+            if self.get_entity_name(referrer) == 'NEXT_ASSEMBLY_USAGE_OCCURRENCE':
+                attributes = self.get_attributes(referrer)
+                if attributes[3] == '#%i' % product_definition_id:
+                    children.append((referrer, int(attributes[4][1:])))
+        return children
+
+    def get_product_definition_roots(self):
+        """ Returns the product_definitions which are not a child of another one
+        """
+        children = set()
+        for occurrence in self.get_instances_of('NEXT_ASSEMBLY_USAGE_OCCURRENCE'):
+            children.add(int(self.get_attributes(occurrence)[4][1:]))
+        return [pd for pd in self.get_instances_of('PRODUCT_DEFINITION') if pd not in children]
+
+    def get_product_definition_tree(self, product_definition_id=None):
+        """ Returns the assembly tree as nested tuples
+        (product_definition id, product name, [children])
+        Without product_definition_id, a list of the trees of all roots is returned.
+        """
+        if product_definition_id is None:
+            return [self.get_product_definition_tree(pd) for pd in self.get_product_definition_roots()]
+        return (product_definition_id,
+                self.get_product_name(product_definition_id),
+                [self.get_product_definition_tree(child)
+                 for occurrence, child in self.get_product_definition_children(product_definition_id)])
+
 class EntityInstancesFactory(object):
     '''
     This class creates entity instances from the str definition
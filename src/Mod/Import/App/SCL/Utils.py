@@ -31,6 +31,8 @@
 
 ''' This module provide string utils'''
 
+import re
+
 def process_nested_parent_str(attr_str,idx=0):
     '''
     The first letter should be a parenthesis
@@ -60,6 +62,47 @@ def process_nested_parent_str(attr_str,idx=0):
     params.append(current_param)
     return params,k
 
+ATTRIBUTE_TOKEN_RE = re.compile(r"'(?:[^']|'')*'|\"[^\"]*\"|[(),]|[^'\"(),]+")
+
+def parse_attributes(attr_str):
+    '''
+    Same as process_nested_parent_str, but parentheses and commas inside of
+    strings are kept, whitespace outside of strings is removed and the
+    string is tokenized in one pass (without copying the rest of the string
+    for each nested list).
+    input string: "'A, (b)', #5, (1., 2.)"
+    output: ["'A, (b)'", '#5', ['1.', '2.']]
+    '''
+    params = []
+    stack = []
+    current_param = ''
+    for token in ATTRIBUTE_TOKEN_RE.findall(attr_str):
+        if token == ',':
+            if current_param is not None:
+                params.append(current_param)
+            current_param = ''
+        elif token == '(':
+            stack.append(params)
+            params = []
+            current_param = ''
+        elif token == ')':
+            if current_param is not None:
+                params.append(current_param)
+            nested = params
+            params = stack.pop()
+            params.append(nested)
+            # the nested list is the current parameter
+            current_param = None
+        elif token[0] in "'\"":
+            current_param = (current_param or '') + token
+        else:
+            token = token.strip()
+            if token:
+                current_param = (current_param or '') + token
+    if current_param is not None:
+        params.append(current_param)
+    return params
+
 if __name__=="__main__":
     print(process_nested_parent_str2("'A'")[0])
     print(process_nested_parent_str2("30.0,0.0,5.0")[0])
@@ -139,22 +139,14 @@ def import_materials(category='Solid', template=False):
 
 def add_cards_from_a_dir(materials, cards, icons, mat_dir, icon, template=False):
     # fill materials and icons
-    import glob
-    from importFCMat import read
-    dir_path_list = glob.glob(mat_dir + '/*' + ".FCMat")
     mat_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Material/Cards")
     delete_duplicates = mat_prefs.GetBool("DeleteDuplicates", True)
+    # the cards are only parsed if they are new or changed since they were indexed
+    dir_cards = get_material_index().update_dir(mat_dir)
     # duplicates are indicated on equality of mat dict
     # TODO if the unit is different two cards would be different too
-    for a_path in dir_path_list:
-        try:
-            mat_dict = read(a_path)
-        except Exception:
-            FreeCAD.Console.PrintError(
-                'Error on reading card data. The card data will be empty for card:\n{}\n'
-                .format(a_path)
-            )
-            mat_dict = {}
+    known_mat_dicts = set([get_mat_dict_key(mat_dict) for mat_dict in materials.values()])
+    for a_path, mat_dict in dir_cards:
         card_name = os.path.splitext(os.path.basename(a_path))[0]
         if (card_name == 'TEMPLATE') and (template is False):
             continue
@@ -163,7 +155,9 @@ def add_cards_from_a_dir(materials, cards, icons, mat_dir, icon, template=False)
             cards[a_path] = card_name
             icons[a_path] = icon
         else:
-            if mat_dict not in materials.values():
+            mat_dict_key = get_mat_dict_key(mat_dict)
+            if mat_dict_key not in known_mat_dicts:
+                known_mat_dicts.add(mat_dict_key)
                 materials[a_path] = mat_dict
                 cards[a_path] = card_name
                 icons[a_path] = icon
@@ -171,6 +165,171 @@ def add_cards_from_a_dir(materials, cards, icons, mat_dir, icon, template=False)
     return (materials, cards, icons)
 
 
+def get_mat_dict_key(mat_dict):
+    # hashable equivalent of a mat dict, used to find duplicates
+    return frozenset(mat_dict.items())
+
+
+def read_card(card_path):
+    from importFCMat import read
+    try:
+        return read(card_path)
+    except Exception:
+        FreeCAD.Console.PrintError(
+            'Error on reading card data. The card data will be empty for card:\n{}\n'
+            .format(card_path)
+        )
+        return {}
+
+
+# ***** material card index **********************************************************************
+'''
+The material card index keeps the parsed cards of all material directories
+which have been read, to not parse every card whenever a material editor or
+a material task panel is opened. It is stored as json in the user app data dir.
+
+data model:
+entries = { card_path: {'mtime': mtime, 'size': size, 'mat_dict': mat_dict}, ... }
+
+- a card is parsed again if its modification time or size has changed
+- cards which have been removed are dropped on the next update of their directory
+- cards can be looked up by card name or material name, by category (Father or
+  KindOfMaterial) and by material property
+
+from materialtools.cardutils import get_material_index
+index = get_material_index()
+index.update_dir(some_dir)
+index.find_by_name('Steel-Generic')
+index.find_by_category('Metal')
+index.find_by_property('YoungsModulus')
+index.find_by_property('Density', '7900 kg/m^3')
+'''
+
+
+class MaterialCardIndex(object):
+
+    def __init__(self, index_file=None):
+        if index_file is None:
+            index_file = join(FreeCAD.ConfigGet("UserAppData"), "MaterialCardIndex.json")
+        self.index_file = index_file
+        self.entries = {}
+        self.modified = False
+        self._lookup = None  # (names, categories, properties), built on first lookup
+        self.load()
+
+    def load(self):
+        import json
+        # an empty index_file means the index is not persistent
+        if not self.index_file or not os.path.isfile(self.index_file):
+            return
+        try:
+            with open(self.index_file, "r") as f:
+                self.entries = json.load(f)
+        except Exception:
+            FreeCAD.Console.PrintWarning(
+                'Material card index could not be read and will be rebuilt: {}\n'
+                .format(self.index_file)
+            )
+            self.entries = {}
+
+    def save(self):
+        import json
+        if not self.index_file or not self.modified:
+            return
+        try:
+            with open(self.index_file, "w") as f:
+                json.dump(self.entries, f)
+            self.modified = False
+        except Exception:
+            FreeCAD.Console.PrintWarning(
+                'Material card index could not be written: {}\n'
+                .format(self.index_file)
+            )
+
+    def get_card(self, card_path):
+        # returns the mat dict of a card, the card is only read if it is not indexed or changed
+        stat = os.stat(card_path)
+        entry = self.entries.get(card_path)
+        if entry is None or entry["mtime"] != stat.st_mtime or entry["size"] != stat.st_size:
+            entry = {"mtime": stat.st_mtime, "size": stat.st_size, "mat_dict": read_card(card_path)}
+            self.entries[card_path] = entry
+            self.modified = True
+            self._lookup = None
+        return entry["mat_dict"]
+
+    def update_dir(self, mat_dir):
+        # indexes the cards of a directory, returns list of (card_path, mat_dict)
+        # the mat dicts are copies, thus they can be changed by the caller
+        import glob
+        dir_path_list = glob.glob(mat_dir + '/*' + ".FCMat")
+        dir_cards = [(a_path, dict(self.get_card(a_path))) for a_path in dir_path_list]
+        # drop cards of this directory which do not exist anymore
+        dir_paths = set(dir_path_list)
+        norm_dir = os.path.normpath(mat_dir)
+        for a_path in list(self.entries.keys()):
+            if a_path not in dir_paths and os.path.normpath(os.path.dirname(a_path)) == norm_dir:
+                del self.entries[a_path]
+                self.modified = True
+                self._lookup = None
+        self.save()
+        return dir_cards
+
+    def get_lookup(self):
+        if self._lookup is None:
+            names = {}
+            categories = {}
+            properties = {}
+            for a_path, entry in self.entries.items():
+                mat_dict = entry["mat_dict"]
+                card_name = os.path.splitext(os.path.basename(a_path))[0]
+                for name in set([card_name, mat_dict.get("Name")]):
+                    if name:
+                        names.setdefault(name, []).append(a_path)
+                for category in set([mat_dict.get("Father"), mat_dict.get("KindOfMaterial")]):
+                    if category:
+                        categories.setdefault(category, []).append(a_path)
+                for param in mat_dict:
+                    properties.setdefault(param, []).append(a_path)
+            self._lookup = (names, categories, properties)
+        return self._lookup
+
+    def find_by_name(self, name):
+        # card paths of the cards with the given card name or material name
+        return sorted(self.get_lookup()[0].get(name, []))
+
+    def find_by_category(self, category):
+        # card paths of the cards with the given Father or KindOfMaterial
+        return sorted(self.get_lookup()[1].get(category, []))
+
+    def find_by_property(self, param, value=None):
+        # card paths of the cards which have the property, optional with the given value
+        card_paths = self.get_lookup()[2].get(param, [])
+        if value is not None:
+            card_paths = [
+                a_path for a_path in card_paths
+                if self.entries[a_path]["mat_dict"][param] == value
+            ]
+        return sorted(card_paths)
+
+    def get_mat_dict(self, card_path):
+        return self.entries[card_path]["mat_dict"]
+
+
+material_index = None
+
+
+def get_material_index():
+    # the index is kept for the whole session
+    # with the parameter UseMaterialCardIndex set to False the cards are read on every call
+    global material_index
+    mat_prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Material/Cards")
+    if mat_prefs.GetBool("UseMaterialCardIndex", True) is False:
+        return MaterialCardIndex(index_file="")
+    if material_index is None:
+        material_index = MaterialCardIndex()
+    return material_index
+
+
 def output_trio(trio):
     materials, cards, icons = trio
     FreeCAD.Console.PrintMessage('\n\n')
@@ -73,6 +73,67 @@ class TestImportCSG(unittest.TestCase):
 
         FreeCAD.closeDocument("CSG")
 
+    def test_parser_tables(self):
+        lexer, parser = importCSG.getParser()
+        self.assertTrue (importCSG.getParser() == (lexer, parser))
+        if importCSG.params.GetBool('persistParserTables',True):
+            self.assertTrue (os.path.isfile(importCSG.getParserTableFile()))
+
+    def test_open_csg_flatten(self):
+        testfile = join(self.test_dir, "CSG.csg")
+        flatten = importCSG.params.GetBool('flattenImport',False)
+        importCSG.params.SetBool('flattenImport',True)
+        try:
+            doc = importCSG.open(testfile)
+        finally:
+            importCSG.params.SetBool('flattenImport',flatten)
+
+        # Only the three booleans remain, their operands are not kept as objects
+        self.assertEqual (len(doc.Objects), 3)
+        union = doc.getObject("union")
+        intersection = doc.getObject("intersection")
+        difference = doc.getObject("difference")
+        self.assertAlmostEqual (union.Shape.Volume, 4454.9224, 3)
+        self.assertAlmostEqual (intersection.Shape.Volume, 3108.8677, 3)
+        self.assertAlmostEqual (difference.Shape.Volume, 266.1323, 3)
+        self.assertAlmostEqual (union.Shape.BoundBox.Center.x, -24.0, 6)
+        self.assertAlmostEqual (difference.Shape.BoundBox.Center.x, 24.0, 6)
+        FreeCAD.closeDocument("CSG")
+
+    def test_import_flatten_nested(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filename = temp_dir + os.path.sep + "nested.csg"
+            f = open(filename,"w+")
+            f.write(
+"""
+difference() {
+	union() {
+		cube(size = [10, 10, 10], center = false);
+		multmatrix([[1, 0, 0, 10], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]) {
+			cube(size = [10, 10, 10], center = false);
+		}
+		multmatrix([[1, 0, 0, 20], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]) {
+			cube(size = [10, 10, 10], center = false);
+		}
+	}
+	cube(size = [5, 5, 20], center = false);
+	multmatrix([[1, 0, 0, 25], [0, 1, 0, 0], [0, 0, 1, 0], [0, 0, 0, 1]]) {
+		cube(size = [5, 5, 20], center = false);
+	}
+}
+"""
+                )
+            f.close()
+            flatten = importCSG.params.GetBool('flattenImport',False)
+            importCSG.params.SetBool('flattenImport',True)
+            try:
+                doc = importCSG.open(filename)
+            finally:
+                importCSG.params.SetBool('flattenImport',flatten)
+            self.assertEqual (len(doc.Objects), 1)
+            self.assertAlmostEqual (doc.Objects[0].Shape.Volume, 3000.0 - 2*250.0, 6)
+            FreeCAD.closeDocument(doc.Name)
+
     def test_import_sphere(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             filename = temp_dir + os.path.sep + "sphere.scad"
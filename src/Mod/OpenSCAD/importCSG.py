@@ -54,6 +54,13 @@ else:
 hassetcolor=[]
 alreadyhidden=[]
 
+# Built on first use by getParser
+csglexer = None
+csgparser = None
+
+# Flatten mode: boolean subtrees are evaluated into shapes, see flatShape
+flatten = False
+
 # Get the token map from the lexer.  This is required.
 import tokrules
 from tokrules import tokens
@@ -152,29 +159,65 @@ def insert(filename,docname):
         pathName = os.path.dirname(os.path.normpath(filename))
         processcsg(filename)
 
+def getParserTableFile():
+    "returns the file the parser tables are kept in, None if it can't be written"
+    tabledir = os.path.join(FreeCAD.getUserAppDataDir(), 'OpenSCAD')
+    try:
+        if not os.path.isdir(tabledir):
+            os.makedirs(tabledir)
+    except OSError:
+        return None
+    return os.path.join(tabledir, 'importCSG_parsetab.pickle')
+
+def getParser():
+    """returns the lexer and the parser, they are built once per session.
+    The parser tables are kept in the user data directory, so they are
+    generated only once and not for every import"""
+    global csglexer
+    global csgparser
+    if csglexer is None:
+        if printverbose: print('Start Lex')
+        csglexer = lex.lex(module=tokrules)
+        if printverbose: print('End Lex')
+    if csgparser is None:
+        if printverbose: print('Load Parser')
+        tablefile = None
+        if params.GetBool('persistParserTables',True):
+            tablefile = getParserTableFile()
+        # No debug out otherwise Linux has protection exception
+        if tablefile:
+            try:
+                csgparser = yacc.yacc(debug=False,picklefile=tablefile)
+            except Exception:
+                # unreadable table file, generate the tables again
+                FreeCAD.Console.PrintWarning('Rebuilding CSG parser tables %s\n' % tablefile)
+                try:
+                    os.unlink(tablefile)
+                except OSError:
+                    pass
+                csgparser = yacc.yacc(debug=False,picklefile=tablefile)
+        else:
+            csgparser = yacc.yacc(debug=False)
+        if printverbose: print('Parser Loaded')
+    return csglexer, csgparser
+
 def processcsg(filename):
     global doc
+    global flatten
 
     if printverbose: print ('ImportCSG Version 0.6a')
-    # Build the lexer
-    if printverbose: print('Start Lex')
-    lex.lex(module=tokrules)
-    if printverbose: print('End Lex')
-
-    # Build the parser   
-    if printverbose: print('Load Parser')
-    # No debug out otherwise Linux has protection exception
-    parser = yacc.yacc(debug=False)
-    if printverbose: print('Parser Loaded')
+    # Build the lexer and the parser
+    lexer, parser = getParser()
+    flatten = params.GetBool('flattenImport',False)
     # Give the lexer some input
     #f=open('test.scad', 'r')
     f = io.open(filename, 'r', encoding="utf8")
-    #lexer.input(f.read())
+    lexer.lineno = 1
 
     if printverbose: print('Start Parser')
     # Swap statements to enable Parser debugging
-    #result = parser.parse(f.read(),debug=1)
-    result = parser.parse(f.read())
+    #result = parser.parse(f.read(),lexer=lexer,debug=1)
+    result = parser.parse(f.read(),lexer=lexer)
     f.close()
     if printverbose:
         print('End Parser')
@@ -579,6 +622,42 @@ def p_error(p):
     if printverbose: print("Syntax error in input!")
     if printverbose: print(p)
 
+def removeSubtree(lst):
+    "removes the objects in lst and the objects they are built from"
+    toremove = []
+    for obj in lst:
+        for subobj in [obj] + obj.OutListRecursive:
+            if subobj not in toremove:
+                toremove.append(subobj)
+    names = set(subobj.Name for subobj in toremove)
+    for subobj in toremove:
+        # keep objects that are still used outside of the subtree
+        if all(parent.Name in names for parent in subobj.InList):
+            if subobj in hassetcolor: hassetcolor.remove(subobj)
+            if subobj in alreadyhidden: alreadyhidden.remove(subobj)
+            doc.removeObject(subobj.Name)
+
+def flatShapes(lst):
+    "returns the shapes of the objects in lst, recomputed if necessary"
+    shapes = []
+    for obj in lst:
+        if obj.isTouched() or obj.Shape.isNull():
+            obj.recompute(True)
+        shapes.append(obj.Shape)
+    return shapes
+
+def flatShape(name,shape,lst):
+    """Flatten mode: puts the shape evaluated from the objects in lst into a
+    single Part::Feature and removes the objects, so only the top level
+    of the CSG tree ends up in the document"""
+    obj = doc.addObject('Part::Feature',name)
+    obj.Shape = shape
+    if gui:
+        obj.ViewObject.ShapeColor = lst[0].ViewObject.ShapeColor
+        obj.ViewObject.Transparency = lst[0].ViewObject.Transparency
+    removeSubtree(lst)
+    return obj
+
 def fuse(lst,name):
     global doc
     if printverbose: print("Fuse")
@@ -587,6 +666,11 @@ def fuse(lst,name):
         myfuse = placeholder('group',[],'{}')
     elif len(lst) == 1:
        return lst[0]
+    elif flatten:
+       if printverbose: print("Flat Fuse")
+       shapes = flatShapes(lst)
+       # all siblings in one multi operand operation
+       myfuse = flatShape(name,shapes[0].multiFuse(shapes[1:]),lst)
     # Is this Multi Fuse
     elif len(lst) > 2:
        if printverbose: print("Multi Fuse")
@@ -623,6 +707,10 @@ def p_difference_action(p):
         mycut_unused = placeholder('group',[],'{}')
     elif (len(p[5]) == 1 ): #single object
         p[0] = p[5]
+    elif flatten:
+        shapes = flatShapes(p[5])
+        # the tools are cut away in one operation, no fuse needed
+        p[0] = [flatShape(p[1],shapes[0].cut(shapes[1:]),p[5])]
     else:
 # Cut using Fuse    
         mycut = doc.addObject('Part::Cut',p[1])
@@ -644,8 +732,14 @@ def p_intersection_action(p):
     'intersection_action : intersection LPAREN RPAREN OBRACE block_list EBRACE'
 
     if printverbose: print("intersection")
+    if (len(p[5]) > 1 and flatten):
+       shape = None
+       # several tools would be united by a single common, so one at a time
+       for tool in flatShapes(p[5]):
+           shape = tool if shape is None else shape.common(tool)
+       mycommon = flatShape(p[1],shape,p[5])
     # Is this Multi Common
-    if (len(p[5]) > 2):
+    elif (len(p[5]) > 2):
        if printverbose: print("Multi Common")
        mycommon = doc.addObject('Part::MultiCommon',p[1])
        mycommon.Shapes = p[5]
@@ -70,6 +70,7 @@
 #endif
 
 #include <Base/GeometryPyCXX.h>
+#include <Base/Interpreter.h>
 #include <Base/Matrix.h>
 #include <Base/Rotation.h>
 #include <Base/MatrixPy.h>
@@ -1155,7 +1156,13 @@ PyObject*  TopoShapePy::generalFuse(PyObject *args)
     }
     try {
         std::vector<TopTools_ListOfShape> map;
-        TopoDS_Shape gfaResultShape = this->getTopoShapePtr()->generalFuse(shapeVec,tolerance,&map);
+        TopoDS_Shape gfaResultShape;
+        {
+            // no Python objects are used by the fusion, other Python threads
+            // (e.g. the worker pool of BOPTools.GeneralFuseCache) may run meanwhile
+            Base::PyGILStateRelease unlock;
+            gfaResultShape = this->getTopoShapePtr()->generalFuse(shapeVec,tolerance,&map);
+        }
 
         Py::Object shapePy = shape2pyshape(gfaResultShape);
 
@@ -0,0 +1,167 @@
+#/***************************************************************************
+# *   Copyright (c) 2026 FreeCAD developers                                *
+# *                                                                         *
+# *   This file is part of the FreeCAD CAx development system.              *
+# *                                                                         *
+# *   This library is free software; you can redistribute it and/or         *
+# *   modify it under the terms of the GNU Library General Public           *
+# *   License as published by the Free Software Foundation; either          *
+# *   version 2 of the License, or (at your option) any later version.      *
+# *                                                                         *
+# *   This library  is distributed in the hope that it will be useful,      *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this library; see the file COPYING.LIB. If not,    *
+# *   write to the Free Software Foundation, Inc., 59 Temple Place,         *
+# *   Suite 330, Boston, MA  02111-1307, USA                                *
+# *                                                                         *
+# ***************************************************************************/
+
+__title__="BOPTools.GeneralFuseCache module"
+__url__ = "http://www.freecadweb.org"
+__doc__ = "Cache of parsed generalFuse results, and splitting of generalFuse into independent groups of shapes."
+
+import collections
+
+import FreeCAD
+from .GeneralFuseResult import GeneralFuseResult
+from .Utils import HashableShape
+
+# key = (tuple of HashableShapes of input shapes, tolerance, tag). Value = GeneralFuseResult.
+# Most recently used entries are at the end.
+_cache = collections.OrderedDict()
+
+def _params():
+    return FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Part/Boolean")
+
+def cacheSize():
+    "cacheSize(): max number of generalFuse results kept in cache. 0 disables the cache."
+    return _params().GetInt("GeneralFuseCacheSize", 20)
+
+def clearCache():
+    "clearCache(): removes all cached generalFuse results."
+    _cache.clear()
+
+def useIndependentGroups():
+    """useIndependentGroups(): True if generalFuse is to be run separately on groups of
+    shapes that do not touch each other. Pieces then come in a different order than from a
+    single generalFuse, so it is off by default."""
+    return _params().GetBool("GeneralFuseIndependentGroups", False)
+
+def makeKey(key_shapes, tolerance, tag):
+    return (tuple([HashableShape(sh) for sh in key_shapes]), tolerance, tag)
+
+def _lookup(key):
+    result = _cache.get(key)
+    if result is not None:
+        _cache.move_to_end(key)
+    return result
+
+def _store(key, result):
+    size = cacheSize()
+    if size <= 0:
+        return
+    _cache[key] = result
+    _cache.move_to_end(key)
+    while len(_cache) > size:
+        _cache.popitem(last= False)
+
+def generalFuse(source_shapes, tolerance = 0.0, tag = "", prepare = None, key_shapes = None):
+    """generalFuse(source_shapes, tolerance = 0.0, tag = "", prepare = None, key_shapes = None):
+    returns GeneralFuseResult of source_shapes, from cache if the same shapes were fused before.
+
+    prepare: function that takes the new GeneralFuseResult, e.g. to split aggregates. The
+    prepared result is cached, so the returned result must not be modified.
+
+    tag: string naming what prepare does, it is part of the cache key.
+
+    key_shapes: shapes to use for cache key instead of source_shapes. Use if source_shapes
+    are made on the fly (e.g. wrapped into compounds), and are new on every call."""
+
+    return generalFuseGroups([source_shapes], tolerance, tag, prepare, [key_shapes] if key_shapes is not None else None)[0]
+
+def generalFuseGroups(list_of_source_shapes, tolerance = 0.0, tag = "", prepare = None, list_of_key_shapes = None, max_workers = None):
+    """generalFuseGroups(list_of_source_shapes, tolerance = 0.0, tag = "", prepare = None, list_of_key_shapes = None, max_workers = None):
+    like generalFuse, for a list of independent lists of shapes. Returns list of
+    GeneralFuseResults. generalFuse of lists not found in cache is run in a pool of
+    threads; parsing and prepare run in the calling thread."""
+
+    if list_of_key_shapes is None:
+        list_of_key_shapes = list_of_source_shapes
+    keys = [makeKey(key_shapes, tolerance, tag) for key_shapes in list_of_key_shapes]
+    results = [_lookup(key) for key in keys]
+    to_compute = [i for i in range(len(results)) if results[i] is None]
+
+    def fuse(shapes):
+        return shapes[0].generalFuse(shapes[1:], tolerance)
+
+    if len(to_compute) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers= max_workers) as executor:
+            gfa_returns = list(executor.map(fuse, [list_of_source_shapes[i] for i in to_compute]))
+    else:
+        gfa_returns = [fuse(list_of_source_shapes[i]) for i in to_compute]
+
+    for i, gfa_return in zip(to_compute, gfa_returns):
+        result = GeneralFuseResult(list_of_source_shapes[i], gfa_return)
+        if prepare is not None:
+            prepare(result)
+        _store(keys[i], result)
+        results[i] = result
+    return results
+
+def generalFuseIndependent(list_of_shapes, tolerance = 0.0, tag = "", prepare = None, list_of_key_shapes = None):
+    """generalFuseIndependent(list_of_shapes, tolerance = 0.0, tag = "", prepare = None, list_of_key_shapes = None):
+    cached generalFuse of list_of_shapes. If enabled in preferences, shapes are split into
+    groups that can't intersect, and every group is fused separately (in parallel). Returns
+    list of GeneralFuseResults, one per group. See generalFuseGroups."""
+
+    if list_of_key_shapes is None:
+        list_of_key_shapes = list_of_shapes
+    if useIndependentGroups() and len(list_of_shapes) > 1:
+        groups = splitIntoIndependentGroups(list_of_shapes, tolerance)
+    else:
+        groups = [list(range(len(list_of_shapes)))]
+    return generalFuseGroups(
+        [[list_of_shapes[i] for i in group] for group in groups],
+        tolerance, tag, prepare,
+        [[list_of_key_shapes[i] for i in group] for group in groups])
+
+def splitIntoIndependentGroups(list_of_shapes, tolerance = 0.0):
+    """splitIntoIndependentGroups(list_of_shapes, tolerance = 0.0): finds groups of shapes
+    whose bounding boxes (enlarged by tolerance) overlap, directly or through other shapes.
+    Shapes of different groups can't intersect. Returns list of lists of indexes into
+    list_of_shapes, in order of first appearance."""
+
+    boxes = []
+    for sh in list_of_shapes:
+        bb = sh.BoundBox
+        bb.enlarge(tolerance + 1e-7) # 1e-7 = Precision::Confusion()
+        boxes.append(bb)
+
+    parent = list(range(len(list_of_shapes)))
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # sweep along X: only boxes whose X ranges overlap are tested
+    active = []
+    for i in sorted(range(len(boxes)), key= lambda i: boxes[i].XMin):
+        bb = boxes[i]
+        active = [j for j in active if boxes[j].XMax >= bb.XMin]
+        for j in active:
+            if bb.intersect(boxes[j]):
+                ri, rj = find(i), find(j)
+                if ri != rj:
+                    parent[max(ri, rj)] = min(ri, rj)
+        active.append(i)
+
+    groups = collections.OrderedDict()
+    for i in range(len(list_of_shapes)):
+        groups.setdefault(find(i), []).append(i)
+    return list(groups.values())
@@ -62,6 +62,11 @@ def myCustomFusionRoutine(list_of_shapes):
         # key = HashableShape (element). Value = set of ints
         self._element_to_source = {} 
 
+        # dictionary for finding, which bits of pieces are attached to a joint (bit is one
+        # dimension higher than joint: vertex->edges, edge->faces, face->solids).
+        # key = HashableShape (joint). Value = list of HashableShapes (bits)
+        self._joint_to_bits = {}
+
         self._freeze()
 
     def __init__(self, source_shapes, generalFuse_return):
@@ -176,6 +181,16 @@ def myCustomFusionRoutine(list_of_shapes):
                 else:
                     self._element_to_source[el_h] = set(self._sources_of_piece[iPiece])
 
+        # ancestor index, needed by makeSplitPieces
+        compound = self.gfa_return[0]
+        for bits, joint_extractor in [(compound.Edges, lambda sh: sh.Vertexes),
+                                      (compound.Faces, lambda sh: sh.Edges),
+                                      (compound.Solids, lambda sh: sh.Faces)]:
+            for bit in bits:
+                bit_h = HashableShape(bit)
+                for joint in joint_extractor(bit):
+                    self._joint_to_bits.setdefault(HashableShape(joint), []).append(bit_h)
+
     def indexOfPiece(self, piece_shape):
         "indexOfPiece(piece_shape): returns index of piece_shape in list of pieces"
         return self._piece_to_index[HashableShape(piece_shape)]
@@ -323,21 +338,18 @@ def myCustomFusionRoutine(list_of_shapes):
 
         # for each joint, test if all bits it's connected to are from same number of sources.
         # If not, this is a joint for splitting
-        # FIXME: this is slow, and maybe can be optimized
         splits = []
         for joint in joint_extractor(shape):
-            joint_overlap_count = len(self._element_to_source[HashableShape(joint)])
+            joint_h = HashableShape(joint)
+            joint_overlap_count = len(self._element_to_source[joint_h])
             if joint_overlap_count > 1:
-                # find elements in pieces that are connected to joint
-                for bit in bit_extractor(self.gfa_return[0]):
-                    for joint_bit in joint_extractor(bit):
-                        if joint_bit.isSame(joint):
-                            #bit is connected to joint!
-                            bit_overlap_count = len(self._element_to_source[HashableShape(bit)])
-                            assert(bit_overlap_count <= joint_overlap_count)
-                            if bit_overlap_count < joint_overlap_count:
-                                if len(splits) == 0 or splits[-1] is not joint:
-                                    splits.append(joint)
+                # elements in pieces that are connected to joint, see parse_elements
+                bit_overlap_counts = [len(self._element_to_source[bit_h]) for bit_h in self._joint_to_bits.get(joint_h, [])]
+                if len(bit_overlap_counts) == 0:
+                    continue
+                assert(max(bit_overlap_counts) <= joint_overlap_count)
+                if min(bit_overlap_counts) < joint_overlap_count:
+                    splits.append(joint)
         if len(splits)==0:
             #shape was not split - no split points found
             return [shape]
@@ -28,7 +28,7 @@ __doc__ = "JoinFeatures functions that operate on shapes."
 import Part
 from . import ShapeMerge
 from . import generalFuseIsAvailable
-from .GeneralFuseResult import GeneralFuseResult
+from . import GeneralFuseCache
 from .Utils import compoundLeaves
 
 def shapeOfMaxSize(list_of_shapes):
@@ -82,9 +82,21 @@ def connect(list_of_shapes, tolerance = 0.0):
             result = connect_legacy(result, list_of_shapes[i], tolerance)
         return result
 
-    pieces, map = list_of_shapes[0].generalFuse(list_of_shapes[1:], tolerance)
-    ao = GeneralFuseResult(list_of_shapes, (pieces, map))
-    ao.splitAggregates()
+    keepers = []
+    # groups of shapes that can't intersect are independent, see GeneralFuseCache
+    for ao in GeneralFuseCache.generalFuseIndependent(list_of_shapes, tolerance, "Split", lambda ao: ao.splitAggregates()):
+        keepers.extend(connectedPieces(ao))
+
+
+    #merge, and we are done!
+    #print len(keepers)," pieces to keep"
+    # the pieces may come from the cache, which must not be changed through the result
+    return ShapeMerge.mergeShapes(keepers).copy()
+
+def connectedPieces(ao):
+    """connectedPieces(ao): selects pieces of GeneralFuseResult ao, that remain after
+    connect: the largest dangling piece of every source, and intersection pieces
+    touching them."""
     #print len(ao.pieces)," pieces total"
 
     keepers = []
@@ -110,11 +122,7 @@ def connect(list_of_shapes, tolerance = 0.0):
             break
         keepers.extend(keepers_2_add)
         touch_test_list = Part.Compound(keepers_2_add)
-
-
-    #merge, and we are done!
-    #print len(keepers)," pieces to keep"
-    return ShapeMerge.mergeShapes(keepers)
+    return keepers
 
 def connect_legacy(shape1, shape2, tolerance = 0.0):
     """connect_legacy(shape1, shape2, tolerance = 0.0): alternative implementation of
@@ -68,51 +68,94 @@ def splitIntoGroupsBySharing(list_of_shapes, element_extractor, split_connection
 
     split_connections = set([HashableShape(element) for element in split_connections])
 
-    groups = [] #list of tuples (shapes,elements). Shapes is a list of plain shapes. Elements is a set of HashableShapes - all elements of shapes in the group, excluding split_connections.
+    # Disjoint-set forest over indexes into list_of_shapes. Every element is owned by the
+    # first shape it was found in; the group of an element is the root of its owner.
+    # The data of a group is kept on its root:
+    #   order: position of the group in the list of groups. Joined groups are moved to
+    #     the front of the list (negative, decreasing), new groups are appended (positive).
+    #   first, last: linked list of shapes of the group (via next_shape), to join groups
+    #     without copying lists of shapes.
+    parent = []
+    size = []
+    order = []
+    first = []
+    last = []
+    next_shape = []
+    owner = {} # HashableShape -> index of shape
+    n_appended = 0
+    n_joined = 0
+
+    def find(i):
+        root = i
+        while parent[root] != root:
+            root = parent[root]
+        while parent[i] != root: # path compression
+            parent[i], i = root, parent[i]
+        return root
 
     # add shapes to the list of groups, one by one. If not connected to existing groups,
     # new group is created. If connected, shape is added to groups, and the groups are joined.
-    for shape in list_of_shapes:
-        shape_elements = set([HashableShape(element) for element in element_extractor(shape)])
-        shape_elements.difference_update(split_connections)
+    for iShape, shape in enumerate(list_of_shapes):
+        parent.append(iShape)
+        size.append(1)
+        order.append(0)
+        first.append(iShape)
+        last.append(iShape)
+        next_shape.append(-1)
+
         #search if shape is connected to any groups
-        connected_to = []
-        for iGroup in range(len(groups)):
-            connected = False
-            for element in shape_elements:
-                if element in groups[iGroup][1]:
-                    connected_to.append(iGroup)
-                    connected = True
-                    break
-        # test if we need to join groups
-        if len(connected_to)>1:
-            #shape bridges a gap between some groups. Join them into one.
-            #rebuilding list of groups. First, add the new "supergroup", then add the rest
-            groups_new = []
-
-            supergroup = (list(),set())
-            for iGroup in connected_to:
-                supergroup[0].extend( groups[iGroup][0] )# merge lists of shapes
-                supergroup[1].update( groups[iGroup][1] )# merge lists of elements
-            groups_new.append(supergroup)
-
-            for iGroup in range(len(groups)):
-                if not iGroup in connected_to: #fixme: inefficient!
-                    groups_new.append(groups[iGroup])
-            groups = groups_new
-            connected_to = [0]
-
-        # add shape to the group it is connected to (if to many, the groups should have been unified by the above code snippet)
-        if len(connected_to) > 0:
-            iGroup = connected_to[0]
-            groups[iGroup][0].append(shape)
-            groups[iGroup][1].update( shape_elements )
+        connected_to = set()
+        for element in element_extractor(shape):
+            element = HashableShape(element)
+            if element in split_connections:
+                continue
+            iOwner = owner.get(element)
+            if iOwner is None:
+                owner[element] = iShape
+            else:
+                connected_to.add(find(iOwner))
+
+        if len(connected_to) == 0:
+            n_appended += 1
+            order[iShape] = n_appended
+            continue
+
+        # groups are joined in the order of the list of groups
+        roots = sorted(connected_to, key= lambda root: order[root])
+        iFirst = first[roots[0]]
+        iLast = last[roots[0]]
+        for root in roots[1:]:
+            next_shape[iLast] = first[root]
+            iLast = last[root]
+        next_shape[iLast] = iShape
+
+        # union by size
+        new_root = max(roots, key= lambda root: size[root])
+        for root in roots:
+            if root != new_root:
+                parent[root] = new_root
+                size[new_root] += size[root]
+        parent[iShape] = new_root
+        size[new_root] += 1
+        first[new_root] = iFirst
+        last[new_root] = iShape
+        if len(roots) > 1:
+            #shape bridges a gap between some groups. The joined group goes to the front.
+            n_joined += 1
+            order[new_root] = -n_joined
         else:
-            newgroup = ([shape], shape_elements)
-            groups.append(newgroup)
+            order[new_root] = order[roots[0]]
 
-    # done. Discard unnecessary data and return result.
-    return [shapes for shapes,elements in groups]
+    # done. Collect shapes of groups and return result.
+    groups = []
+    for root in sorted([i for i in range(len(parent)) if parent[i] == i], key= lambda root: order[root]):
+        shapes = []
+        iShape = first[root]
+        while iShape != -1:
+            shapes.append(list_of_shapes[iShape])
+            iShape = next_shape[iShape]
+        groups.append(shapes)
+    return groups
 
 def mergeSolids(list_of_solids_compsolids, flag_single = False, split_connections = [], bool_compsolid = False):
     """mergeSolids(list_of_solids, flag_single = False): merges touching solids that share
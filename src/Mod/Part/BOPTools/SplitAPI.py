@@ -27,7 +27,7 @@ __doc__ = "Split functions that operate on list_of_shapes."
 
 import Part
 from . import ShapeMerge
-from .GeneralFuseResult import GeneralFuseResult
+from . import GeneralFuseCache
 from . import Utils
 import FreeCAD
 
@@ -40,24 +40,31 @@ def booleanFragments(list_of_shapes, mode, tolerance = 0.0):
     "Standard" - return generalFuse as is.
     "Split" - wires and shells will be split at intersections.
     "CompSolid" - solids will be extracted from result of generelFuse, and compsolids will
-    be made from them; all other stuff is discarded."""
+    be made from them; all other stuff is discarded.
 
-    pieces, map = list_of_shapes[0].generalFuse(list_of_shapes[1:], tolerance)
+    Results are cached, see GeneralFuseCache. The returned shape is a copy, so it
+    can be modified without changing the cache."""
+
+    if mode not in ("Standard", "CompSolid", "Split"):
+        raise ValueError("Unknown mode: {mode}".format(mode= mode))
+    if mode == "Split":
+        results = GeneralFuseCache.generalFuseIndependent(list_of_shapes, tolerance, "Split", lambda gr: gr.splitAggregates())
+        return Part.Compound([piece for gr in results for piece in gr.pieces]).copy()
+
+    results = GeneralFuseCache.generalFuseIndependent(list_of_shapes, tolerance)
+    if len(results) == 1:
+        pieces = results[0].gfa_return[0]
+    else:
+        pieces = Part.Compound([piece for gr in results for piece in gr.pieces])
     if mode == "Standard":
-        return pieces
+        return pieces.copy()
     elif mode == "CompSolid":
         solids = pieces.Solids
         if len(solids) < 1:
             raise ValueError("No solids in the result. Can't make CompSolid.")
         elif len(solids) == 1:
             FreeCAD.Console.PrintWarning("Part_BooleanFragments: only one solid in the result, generating trivial compsolid.")
-        return ShapeMerge.mergeSolids(solids, bool_compsolid= True)
-    elif mode == "Split":
-        gr = GeneralFuseResult(list_of_shapes, (pieces,map))
-        gr.splitAggregates()
-        return Part.Compound(gr.pieces)
-    else:
-        raise ValueError("Unknown mode: {mode}".format(mode= mode))
+        return ShapeMerge.mergeSolids(solids, bool_compsolid= True).copy()
 
 def slice(base_shape, tool_shapes, mode, tolerance = 0.0):
     """slice(base_shape, tool_shapes, mode, tolerance = 0.0): functional part of
@@ -67,13 +74,22 @@ def slice(base_shape, tool_shapes, mode, tolerance = 0.0):
     "Standard" - return like generalFuse: edges, faces and solids are split, but wires,
     shells, compsolids get extra segments but remain in one piece.
     "Split" - wires and shells will be split at intersections, too.
-    "CompSolid" - slice a solid and glue it back together to make a compsolid"""
+    "CompSolid" - slice a solid and glue it back together to make a compsolid
+
+    Results are cached, see GeneralFuseCache. The returned shape is a copy."""
 
     shapes = [base_shape] + [Part.Compound([tool_shape]) for tool_shape in tool_shapes] # hack: putting tools into compounds will prevent contamination of result with pieces of tools
     if len(shapes) < 2:
         raise ValueError("No slicing objects supplied!")
-    pieces, map = shapes[0].generalFuse(shapes[1:], tolerance)
-    gr = GeneralFuseResult(shapes, (pieces,map))
+    key_shapes = [base_shape] + list(tool_shapes)
+    if mode == "Split":
+        gr = GeneralFuseCache.generalFuse(shapes, tolerance, "SliceSplit",
+                                          lambda gr: gr.splitAggregates(gr.piecesFromSource(gr.source_shapes[0])),
+                                          key_shapes)
+    else:
+        gr = GeneralFuseCache.generalFuse(shapes, tolerance, key_shapes= key_shapes)
+    # the result may come from cache, its source shapes are then not the ones made above
+    shapes = gr.source_shapes
     if mode == "Standard":
         result = gr.piecesFromSource(shapes[0])
     elif mode == "CompSolid":
@@ -84,19 +100,19 @@ def slice(base_shape, tool_shapes, mode, tolerance = 0.0):
             FreeCAD.Console.PrintWarning("Part_Slice: only one solid in the result, generating trivial compsolid.")
         result = ShapeMerge.mergeSolids(solids, bool_compsolid= True).childShapes()
     elif mode == "Split":
-        gr.splitAggregates(gr.piecesFromSource(shapes[0]))
         result = gr.piecesFromSource(shapes[0])
-    return result[0] if len(result) == 1 else Part.Compound(result)
+    return (result[0] if len(result) == 1 else Part.Compound(result)).copy()
 
 def xor(list_of_shapes, tolerance = 0.0):
     """xor(list_of_shapes, tolerance = 0.0): boolean XOR operation."""
+    key_shapes = list_of_shapes
     list_of_shapes = Utils.upgradeToAggregateIfNeeded(list_of_shapes)
-    pieces, map = list_of_shapes[0].generalFuse(list_of_shapes[1:], tolerance)
-    gr = GeneralFuseResult(list_of_shapes, (pieces,map))
-    gr.explodeCompounds()
-    gr.splitAggregates()
+    def prepare(gr):
+        gr.explodeCompounds()
+        gr.splitAggregates()
     pieces_to_keep = []
-    for piece in gr.pieces:
-        if len(gr.sourcesOfPiece(piece)) % 2 == 1:
-            pieces_to_keep.append(piece)
-    return Part.Compound(pieces_to_keep)
+    for gr in GeneralFuseCache.generalFuseIndependent(list_of_shapes, tolerance, "XOR", prepare, key_shapes):
+        for piece in gr.pieces:
+            if len(gr.sourcesOfPiece(piece)) % 2 == 1:
+                pieces_to_keep.append(piece)
+    return Part.Compound(pieces_to_keep).copy()
@@ -25,6 +25,7 @@ from FreeCAD import Units
 App = FreeCAD
 
 from parttests.regression_tests import RegressionTests
+from parttests.boptools_tests import BOPToolsTests
 
 #---------------------------------------------------------------------------
 # define the test cases to test the FreeCAD Part module
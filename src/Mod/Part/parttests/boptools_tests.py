@@ -0,0 +1,170 @@
+"""Tests and scaling benchmarks for BOPTools.
+
+The benchmarks can be run from the Python console, e.g.::
+
+    from parttests import boptools_tests
+    boptools_tests.benchmark_split_into_groups((1000, 10000, 100000))
+    boptools_tests.benchmark_slice_shell(5000)
+"""
+
+import time
+import unittest
+
+import FreeCAD
+import Part
+from BOPTools import ShapeMerge
+from BOPTools.Utils import HashableShape
+
+
+def makeFaceLoop(face_count):
+    """makeFaceLoop(face_count): returns the faces of an extruded closed polygon, each
+    face shares its vertical edges with the neighbouring faces."""
+    import math
+    points = [FreeCAD.Vector(math.cos(2 * math.pi * i / face_count),
+                             math.sin(2 * math.pi * i / face_count),
+                             0.0) * face_count
+              for i in range(face_count)]
+    points.append(points[0])
+    return Part.makePolygon(points).extrude(FreeCAD.Vector(0, 0, 1)).Faces
+
+
+def splitIntoGroupsBySharing_reference(list_of_shapes, element_extractor, split_connections = []):
+    """Straightforward version of ShapeMerge.splitIntoGroupsBySharing, testing every shape
+    against every group. Used to compare results and order of groups."""
+    split_connections = set([HashableShape(element) for element in split_connections])
+    groups = []
+    for shape in list_of_shapes:
+        shape_elements = set([HashableShape(element) for element in element_extractor(shape)])
+        shape_elements.difference_update(split_connections)
+        connected_to = [iGroup for iGroup in range(len(groups))
+                        if not shape_elements.isdisjoint(groups[iGroup][1])]
+        if len(connected_to) > 1:
+            supergroup = (list(), set())
+            for iGroup in connected_to:
+                supergroup[0].extend(groups[iGroup][0])
+                supergroup[1].update(groups[iGroup][1])
+            groups = [supergroup] + [groups[iGroup] for iGroup in range(len(groups))
+                                     if iGroup not in connected_to]
+            connected_to = [0]
+        if connected_to:
+            groups[connected_to[0]][0].append(shape)
+            groups[connected_to[0]][1].update(shape_elements)
+        else:
+            groups.append(([shape], shape_elements))
+    return [shapes for shapes, elements in groups]
+
+
+def makeInterleavedFaceLoop(face_count, group_size = 10):
+    """makeInterleavedFaceLoop(face_count, group_size): returns (faces, split_edges) for
+    ShapeMerge.splitIntoGroupsBySharing. The faces of makeFaceLoop are reordered, so that
+    groups are joined all the time, and split_edges cut the loop into groups of
+    group_size faces."""
+    faces = makeFaceLoop(face_count)
+    split_edges = [ShapeMerge.findSharedElements([faces[i - 1], faces[i]], lambda sh: sh.Edges)[0]
+                   for i in range(0, face_count, group_size)]
+    return faces[0::2] + faces[1::2], split_edges
+
+
+def benchmark_split_into_groups(face_counts = (1000, 10000, 100000), group_size = 10):
+    """benchmark_split_into_groups(face_counts, group_size): times
+    ShapeMerge.splitIntoGroupsBySharing on loops of faces. The faces are fed in an
+    interleaved order, so that groups are joined all the time. Returns list of
+    (face_count, seconds)."""
+    results = []
+    for face_count in face_counts:
+        faces, split_edges = makeInterleavedFaceLoop(face_count, group_size)
+        start = time.time()
+        groups = ShapeMerge.splitIntoGroupsBySharing(faces, lambda sh: sh.Edges, split_edges)
+        seconds = time.time() - start
+        FreeCAD.Console.PrintMessage(
+            "splitIntoGroupsBySharing: {n} faces, {g} groups, {t:.3f} s\n"
+            .format(n= face_count, g= len(groups), t= seconds))
+        results.append((face_count, seconds))
+    return results
+
+
+def sliceShellAcross(face_count):
+    """sliceShellAcross(face_count): slices the shell of makeFaceLoop with a plane
+    through the middle, in Split mode. Returns the pieces of the shell."""
+    from BOPTools import SplitAPI
+    shell = Part.Shell(makeFaceLoop(face_count))
+    size = 4.0 * face_count
+    plane = Part.makePlane(size, size, FreeCAD.Vector(-size / 2, -size / 2, 0.5))
+    return SplitAPI.slice(shell, [plane], "Split").childShapes()
+
+
+def benchmark_slice_shell(face_count = 5000):
+    """benchmark_slice_shell(face_count): times Slice (Split mode) of a shell of
+    face_count faces with a plane, which splits the shell in two. Returns seconds."""
+    start = time.time()
+    pieces = sliceShellAcross(face_count)
+    seconds = time.time() - start
+    FreeCAD.Console.PrintMessage(
+        "Slice: shell of {n} faces, {p} pieces, {t:.3f} s\n"
+        .format(n= face_count, p= len(pieces), t= seconds))
+    return seconds
+
+
+class BOPToolsTests(unittest.TestCase):
+
+    def test_split_into_groups_by_sharing(self):
+        faces = makeFaceLoop(60)
+        split_edges = [ShapeMerge.findSharedElements([faces[i - 1], faces[i]], lambda sh: sh.Edges)[0]
+                       for i in (0, 7, 20, 21, 45)]
+        for order in (faces, faces[0::2] + faces[1::2], faces[::-1], faces[0::3] + faces[2::3] + faces[1::3]):
+            groups = ShapeMerge.splitIntoGroupsBySharing(order, lambda sh: sh.Edges, split_edges)
+            expected = splitIntoGroupsBySharing_reference(order, lambda sh: sh.Edges, split_edges)
+            self.assertEqual(len(groups), 5)
+            self.assertEqual([[HashableShape(f) for f in group] for group in groups],
+                             [[HashableShape(f) for f in group] for group in expected])
+
+    def test_split_into_groups_interleaved(self):
+        # timing is left to benchmark_split_into_groups
+        faces, split_edges = makeInterleavedFaceLoop(4000, 10)
+        groups = ShapeMerge.splitIntoGroupsBySharing(faces, lambda sh: sh.Edges, split_edges)
+        self.assertEqual(len(groups), 400)
+        self.assertEqual(set(len(group) for group in groups), {10})
+        self.assertEqual(len(set(HashableShape(f) for group in groups for f in group)), 4000)
+
+    def test_slice_shell(self):
+        pieces = sliceShellAcross(200)
+        self.assertEqual(len(pieces), 2)
+        self.assertEqual([piece.ShapeType for piece in pieces], ["Shell", "Shell"])
+        self.assertEqual([len(piece.Faces) for piece in pieces], [200, 200])
+
+    def test_general_fuse_cache(self):
+        from BOPTools import GeneralFuseCache, SplitAPI
+        GeneralFuseCache.clearCache()
+        boxes = [Part.makeBox(2, 2, 2, FreeCAD.Vector(4 * i, 0, 0)) for i in range(4)]
+        boxes += [Part.makeBox(2, 2, 2, FreeCAD.Vector(4 * i + 1, 1, 1)) for i in range(4)]
+        result1 = SplitAPI.booleanFragments(boxes, "Standard")
+        bound_box = result1.BoundBox
+        self.assertEqual(len(GeneralFuseCache._cache), 1)
+
+        # the result is a copy, changing it doesn't change the cached result
+        result1.translate(FreeCAD.Vector(100, 0, 0))
+        result2 = SplitAPI.booleanFragments(boxes, "Standard")
+        self.assertEqual(len(GeneralFuseCache._cache), 1)
+        self.assertFalse(result1.isSame(result2))
+        self.assertAlmostEqual(result2.BoundBox.XMin, bound_box.XMin)
+        self.assertEqual(len(result1.Solids), len(result2.Solids))
+
+        # a changed input shape is a new cache entry
+        boxes[0] = Part.makeBox(2, 2, 2, FreeCAD.Vector(0, 0, 0))
+        result3 = SplitAPI.booleanFragments(boxes, "Standard")
+        self.assertEqual(len(GeneralFuseCache._cache), 2)
+        self.assertEqual(len(result2.Solids), len(result3.Solids))
+
+    def test_general_fuse_independent_groups(self):
+        from BOPTools import GeneralFuseCache
+        boxes = [Part.makeBox(2, 2, 2, FreeCAD.Vector(4 * i, 0, 0)) for i in range(4)]
+        boxes += [Part.makeBox(2, 2, 2, FreeCAD.Vector(4 * i + 1, 1, 1)) for i in range(4)]
+        groups = GeneralFuseCache.splitIntoIndependentGroups(boxes)
+        self.assertEqual(groups, [[0, 4], [1, 5], [2, 6], [3, 7]])
+
+        GeneralFuseCache.clearCache()
+        results = GeneralFuseCache.generalFuseGroups([[boxes[i] for i in group] for group in groups])
+        pieces = [piece for gr in results for piece in gr.pieces]
+        whole = boxes[0].generalFuse(boxes[1:])[0]
+        self.assertEqual(len(pieces), len(whole.childShapes()))
+        self.assertAlmostEqual(sum([piece.Volume for piece in pieces]), whole.Volume)
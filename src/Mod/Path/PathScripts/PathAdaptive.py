@@ -29,8 +29,12 @@ import PathScripts.PathGeom as PathGeom
 import Path
 import FreeCAD
 import time
-import json
+import array
+import base64
+import hashlib
 import math
+import sys
+import zlib
 import area
 
 from PySide import QtCore
@@ -70,6 +74,132 @@ def convertTo2d(pathArray):
     return output
 
 
+# Results of the adaptive algorithm are stored in the document in a compact
+# form: the input state is reduced to a hash and the output packed into
+# arrays of floats and ints, compressed. Unpacked results are also kept in
+# memory, keyed by the hash of their input state.
+ResultCache = {}
+ResultCacheMax = 16
+ResultFormat = "1"
+
+
+def _toBytes(typecode, values):
+    a = array.array(typecode, values)
+    if sys.byteorder == 'big':
+        a.byteswap()
+    return a.tobytes()
+
+
+def _fromBytes(typecode, data):
+    a = array.array(typecode)
+    a.frombytes(data)
+    if sys.byteorder == 'big':
+        a.byteswap()
+    return a
+
+
+def hashInputState(inputState):
+    '''hashInputState(inputState) ... returns a hash of all values of inputState.
+    The geometry is hashed as packed floats, the same state restored from JSON
+    (lists instead of tuples) has the same hash.'''
+    h = hashlib.sha1()
+    for key in sorted(inputState):
+        value = inputState[key]
+        h.update(key.encode('utf-8'))
+        if key in ['geometry', 'stockGeometry']:
+            h.update(_toBytes('q', [len(value)]))
+            for path in value:
+                h.update(_toBytes('q', [len(path)]))
+                h.update(_toBytes('d', [c for pt in path for c in pt]))
+        else:
+            h.update(repr(value).encode('utf-8'))
+    return h.hexdigest()
+
+
+def packResults(adaptiveResults):
+    '''packResults(adaptiveResults) ... returns adaptiveResults as compressed, base64 encoded string.'''
+    ints = [len(adaptiveResults)]
+    floats = []
+    for region in adaptiveResults:
+        paths = region["AdaptivePaths"]
+        ints.extend([int(region["ReturnMotionType"]), len(paths)])
+        floats.extend(region["HelixCenterPoint"][0:2])
+        floats.extend(region["StartPoint"][0:2])
+        for motionType, points in paths:
+            ints.extend([int(motionType), len(points)])
+            floats.extend([c for pt in points for c in pt[0:2]])
+    ints = _toBytes('q', ints)
+    data = _toBytes('q', [len(ints)]) + ints + _toBytes('d', floats)
+    return ResultFormat + ":" + base64.b64encode(zlib.compress(data)).decode('ascii')
+
+
+def unpackResults(packed):
+    '''unpackResults(packed) ... returns the adaptive results stored by packResults,
+    or None if packed can't be read.'''
+    version, _, data = packed.partition(":")
+    if version != ResultFormat:
+        return None
+    try:
+        data = zlib.decompress(base64.b64decode(data))
+        size = _fromBytes('q', data[0:8])[0]
+        ints = _fromBytes('q', data[8:8 + size])
+        floats = _fromBytes('d', data[8 + size:])
+    except Exception as e:  # pylint: disable=broad-except
+        PathLog.warning("Cannot read stored adaptive paths: %s" % e)
+        return None
+
+    adaptiveResults = []
+    i = 1
+    f = 0
+    for _ in range(ints[0]):
+        returnMotionType, pathCount = ints[i], ints[i + 1]
+        i += 2
+        region = {
+            "HelixCenterPoint": (floats[f], floats[f + 1]),
+            "StartPoint": (floats[f + 2], floats[f + 3]),
+            "AdaptivePaths": [],
+            "ReturnMotionType": returnMotionType}
+        f += 4
+        for _ in range(pathCount):
+            motionType, count = ints[i], ints[i + 1]
+            i += 2
+            coords = floats[f:f + 2 * count]
+            f += 2 * count
+            region["AdaptivePaths"].append((motionType, list(zip(coords[0::2], coords[1::2]))))
+        adaptiveResults.append(region)
+    return adaptiveResults
+
+
+def cacheResults(inputHash, adaptiveResults):
+    if len(ResultCache) >= ResultCacheMax:
+        ResultCache.clear()
+    ResultCache[inputHash] = adaptiveResults
+
+
+def storedResults(obj, inputHash):
+    '''storedResults(obj, inputHash) ... returns the results for inputHash from the
+    cache or from obj, None if they have to be calculated.'''
+    adaptiveResults = ResultCache.get(inputHash)
+    if adaptiveResults is None and obj.AdaptiveInputHash == inputHash and obj.AdaptiveOutputCache:
+        adaptiveResults = unpackResults(obj.AdaptiveOutputCache)
+        if adaptiveResults is not None:
+            cacheResults(inputHash, adaptiveResults)
+    return adaptiveResults
+
+
+def storeResults(obj, inputHash, adaptiveResults):
+    '''storeResults(obj, inputHash, adaptiveResults) ... stores the results in the cache,
+    and in obj unless StoreOutput is turned off.'''
+    cacheResults(inputHash, adaptiveResults)
+    packed = ""
+    if getattr(obj, 'StoreOutput', True):
+        packed = packResults(adaptiveResults)
+    if obj.AdaptiveInputHash != inputHash:
+        obj.AdaptiveInputHash = inputHash
+    if obj.AdaptiveOutputCache != packed:
+        obj.AdaptiveOutputCache = packed
+
+
 sceneGraph = None
 scenePathNodes = []  # for scene cleanup aftewards
 topZ = 10
@@ -490,15 +620,8 @@ def Execute(op, obj):
             "stockToLeave": float(obj.StockToLeave)
         }
 
-        inputStateChanged = False
-        adaptiveResults = None
-
-        if obj.AdaptiveOutputState is not None and obj.AdaptiveOutputState != "":
-            adaptiveResults = obj.AdaptiveOutputState
-
-        if json.dumps(obj.AdaptiveInputState) != json.dumps(inputStateObject):
-            inputStateChanged = True
-            adaptiveResults = None
+        inputHash = hashInputState(inputStateObject)
+        adaptiveResults = storedResults(obj, inputHash)
 
         # progress callback fn, if return true it will stop processing
         def progressFn(tpaths):
@@ -516,7 +639,7 @@ def Execute(op, obj):
 
         start = time.time()
 
-        if inputStateChanged or adaptiveResults is None:
+        if adaptiveResults is None:
             a2d = area.Adaptive2d()
             a2d.stepOverFactor = 0.01 * obj.StepOver
             a2d.toolDiameter = float(op.tool.Diameter)
@@ -531,7 +654,7 @@ def Execute(op, obj):
             # EXECUTE
             results = a2d.Execute(stockPath2d, path2d, progressFn)
 
-            # need to convert results to python object to be JSON serializable
+            # convert results to python objects, to be packed and cached
             adaptiveResults = []
             for result in results:
                 adaptiveResults.append({
@@ -545,8 +668,7 @@ def Execute(op, obj):
 
         if not obj.StopProcessing:
             PathLog.info("*** Done. Elapsed time: %f sec\n\n" % (time.time()-start))
-            obj.AdaptiveOutputState = adaptiveResults
-            obj.AdaptiveInputState = inputStateObject
+            storeResults(obj, inputHash, adaptiveResults)
 
         else:
             PathLog.info("*** Processing cancelled (after: %f sec).\n\n" % (time.time()-start))
@@ -650,12 +772,8 @@ class PathAdaptive(PathOp.ObjectOp):
 
         obj.addProperty("App::PropertyBool", "UseHelixArcs", "Adaptive", "Use Arcs (G2) for helix ramp")
 
-        obj.addProperty("App::PropertyPythonObject", "AdaptiveInputState",
-                        "Adaptive", "Internal input state")
-        obj.addProperty("App::PropertyPythonObject", "AdaptiveOutputState",
-                        "Adaptive", "Internal output state")
-        obj.setEditorMode('AdaptiveInputState', 2)  # hide this property
-        obj.setEditorMode('AdaptiveOutputState', 2)  # hide this property
+        obj.addProperty("App::PropertyBool", "StoreOutput", "Adaptive", "Store the calculated paths in the document, so they don't have to be recalculated after loading it")
+        self.addResultProperties(obj)
         obj.addProperty("App::PropertyAngle", "HelixAngle", "Adaptive", "Helix ramp entry angle (degrees)")
         obj.addProperty("App::PropertyAngle", "HelixConeAngle", "Adaptive", "Helix cone angle (degrees)")
         obj.addProperty("App::PropertyLength", "HelixDiameterLimit", "Adaptive", "Limit helix entry diameter, if limit larger than tool diameter or 0, tool diameter is used")
@@ -678,8 +796,7 @@ class PathAdaptive(PathOp.ObjectOp):
         obj.HelixAngle = 5
         obj.HelixConeAngle = 0
         obj.HelixDiameterLimit = 0.0
-        obj.AdaptiveInputState = ""
-        obj.AdaptiveOutputState = ""
+        obj.StoreOutput = True
         obj.StockToLeave = 0
         obj.KeepToolDownRatio = 3.0
         obj.UseHelixArcs = False
@@ -703,16 +820,44 @@ class PathAdaptive(PathOp.ObjectOp):
                             "UseOutline",
                             "Adaptive",
                             "Uses the outline of the base geometry.")
+        if not hasattr(obj, "StoreOutput"):
+            obj.addProperty("App::PropertyBool", "StoreOutput", "Adaptive", "Store the calculated paths in the document, so they don't have to be recalculated after loading it")
+            obj.StoreOutput = True
+
+        if not hasattr(obj, "AdaptiveOutputCache"):
+            self.addResultProperties(obj)
+        if hasattr(obj, "AdaptiveOutputState"):
+            # convert the results stored by older versions
+            inputState = obj.AdaptiveInputState
+            outputState = obj.AdaptiveOutputState
+            if inputState and outputState:
+                try:
+                    obj.AdaptiveInputHash = hashInputState(inputState)
+                    obj.AdaptiveOutputCache = packResults(outputState)
+                except Exception as e:  # pylint: disable=broad-except
+                    # the paths are just recalculated
+                    PathLog.warning("Cannot convert stored adaptive paths: %s" % e)
+            obj.removeProperty("AdaptiveInputState")
+            obj.removeProperty("AdaptiveOutputState")
+
         FeatureExtensions.initialize_properties(obj)
 
+    def addResultProperties(self, obj):
+        obj.addProperty("App::PropertyString", "AdaptiveInputHash",
+                        "Adaptive", "Internal hash of the input state")
+        obj.addProperty("App::PropertyString", "AdaptiveOutputCache",
+                        "Adaptive", "Internal packed output state")
+        obj.setEditorMode('AdaptiveInputHash', 2)  # hide this property
+        obj.setEditorMode('AdaptiveOutputCache', 2)  # hide this property
+
 
 def SetupProperties():
     setup = ["Side", "OperationType", "Tolerance", "StepOver",
              "LiftDistance", "KeepToolDownRatio", "StockToLeave",
              "ForceInsideOut", "FinishingProfile", "Stopped",
-             "StopProcessing", "UseHelixArcs", "AdaptiveInputState",
-             "AdaptiveOutputState", "HelixAngle", "HelixConeAngle",
-             "HelixDiameterLimit", "UseOutline"]
+             "StopProcessing", "UseHelixArcs", "StoreOutput",
+             "HelixAngle", "HelixConeAngle", "HelixDiameterLimit",
+             "UseOutline"]
     return setup
 
 
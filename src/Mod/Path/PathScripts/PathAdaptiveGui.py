@@ -202,8 +202,8 @@ class TaskPanelOpPage(PathOpGui.TaskPanelPage):
         self.setupToolController(obj, self.form.ToolController)
         self.setupCoolant(obj, self.form.coolantController)
         self.form.StopButton.setChecked(obj.Stopped)
-        obj.setEditorMode('AdaptiveInputState', 2)  # hide this property
-        obj.setEditorMode('AdaptiveOutputState', 2)  # hide this property
+        obj.setEditorMode('AdaptiveInputHash', 2)  # hide this property
+        obj.setEditorMode('AdaptiveOutputCache', 2)  # hide this property
         obj.setEditorMode('StopProcessing', 2)  # hide this property
         obj.setEditorMode('Stopped', 2)  # hide this property
 
@@ -237,8 +237,8 @@ class TaskPanelOpPage(PathOpGui.TaskPanelPage):
 
         self.updateToolController(obj, self.form.ToolController)
         self.updateCoolant(obj, self.form.coolantController)
-        obj.setEditorMode('AdaptiveInputState', 2)  # hide this property
-        obj.setEditorMode('AdaptiveOutputState', 2)  # hide this property
+        obj.setEditorMode('AdaptiveInputHash', 2)  # hide this property
+        obj.setEditorMode('AdaptiveOutputCache', 2)  # hide this property
         obj.setEditorMode('StopProcessing', 2)  # hide this property
         obj.setEditorMode('Stopped', 2)  # hide this property
 
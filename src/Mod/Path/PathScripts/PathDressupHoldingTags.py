@@ -27,6 +27,7 @@ import PathScripts.PathGeom as PathGeom
 import PathScripts.PathLog as PathLog
 import PathScripts.PathUtil as PathUtil
 import PathScripts.PathUtils as PathUtils
+import bisect
 import copy
 import math
 
@@ -94,6 +95,45 @@ def debugCone(vector, r1, r2, height, label, color=None):
             obj.ViewObject.ShapeColor = color
 
 
+# The solid of a tag only depends on its dimensions and the tool radius, all
+# tags of a dressup usually share it and it doesn't change between recomputes.
+# The solids are built at the origin and cached, each tag gets a copy of it
+# moved into place.
+TagSolids = {}
+TagSolidsMax = 256
+
+
+def tagSolid(shape, radius):
+    '''tagSolid(shape, radius) ... returns a copy of the solid for shape, which is one
+    of ('cylinder', r, height), ('cone', r1, r2, height) or ('sphere', r), at the origin
+    and with its top edge filleted with radius.'''
+    radius = FreeCAD.Units.Quantity(radius, FreeCAD.Units.Length).Value
+    key = (shape, round(radius, 9))
+    solid = TagSolids.get(key)
+    if solid is None:
+        if shape[0] == 'cylinder':
+            PathLog.debug("Part.makeCylinder(%f, %f)" % shape[1:])
+            solid = Part.makeCylinder(*shape[1:])
+        elif shape[0] == 'cone':
+            PathLog.debug("Part.makeCone(%f, %f, %f)" % shape[1:])
+            solid = Part.makeCone(*shape[1:])
+        else:
+            PathLog.debug("Part.makeSphere(%f)" % shape[1:])
+            solid = Part.makeSphere(*shape[1:])
+        if not PathGeom.isRoughly(0, radius):
+            PathLog.debug("makeFillet(%.4f)" % radius)
+            solid = solid.makeFillet(radius, [solid.Edges[0]])
+        if len(TagSolids) >= TagSolidsMax:
+            TagSolids.clear()
+        TagSolids[key] = solid
+    return solid.copy()
+
+
+def clearTagSolids():
+    '''clearTagSolids() ... empties the cache of tag solids.'''
+    TagSolids.clear()
+
+
 class Tag:
     def __init__(self, nr, x, y, width, height, angle, radius, enabled=True):
         PathLog.track("%.2f, %.2f, %.2f, %.2f, %.2f, %.2f, %d" % (x, y, width, height, angle, radius, enabled))
@@ -139,9 +179,8 @@ class Tag:
         if PathGeom.isRoughly(90, self.angle) and height > 0:
             # cylinder
             self.isSquare = True
-            self.solid = Part.makeCylinder(r1, height)
+            shape = ('cylinder', r1, height)
             radius = min(min(self.radius, r1), self.height)
-            PathLog.debug("Part.makeCylinder(%f, %f)" % (r1, height))
         elif self.angle > 0.0 and height > 0.0:
             # cone
             rad = math.radians(self.angle)
@@ -158,12 +197,13 @@ class Tag:
                 height = r1 * tangens * 1.01
                 self.actualHeight = height
             self.r2 = r2
-            PathLog.debug("Part.makeCone(%f, %f, %f)" % (r1, r2, height))
-            self.solid = Part.makeCone(r1, r2, height)
+            shape = ('cone', r1, r2, height)
         else:
             # degenerated case - no tag
-            PathLog.debug("Part.makeSphere(%f / 10000)" % (r1))
-            self.solid = Part.makeSphere(r1 / 10000)
+            shape = ('sphere', r1 / 10000)
+        radius = min(self.radius, radius)
+        self.realRadius = radius
+        self.solid = tagSolid(shape, radius)
         if not PathGeom.isRoughly(0, R):  # testing is easier if the solid is not rotated
             angle = -PathGeom.getAngle(self.originAt(0)) * 180 / math.pi
             PathLog.debug("solid.rotate(%f)" % angle)
@@ -171,11 +211,6 @@ class Tag:
         orig = self.originAt(z - 0.01 * self.actualHeight)
         PathLog.debug("solid.translate(%s)" % orig)
         self.solid.translate(orig)
-        radius = min(self.radius, radius)
-        self.realRadius = radius
-        if not PathGeom.isRoughly(0, radius.Value):
-            PathLog.debug("makeFillet(%.4f)" % radius)
-            self.solid = self.solid.makeFillet(radius, [self.solid.Edges[0]])
 
     def filterIntersections(self, pts, face):
         if type(face.Surface) == Part.Cone or type(face.Surface) == Part.Cylinder or type(face.Surface) == Part.Toroid:
@@ -238,6 +273,60 @@ class Tag:
             Part.show(e)
 
 
+class TagIndex:
+    '''TagIndex(tags) ... grid over the xy footprints of the enabled tags.
+    An edge can only intersect a tag if their bounding boxes overlap, the index
+    finds those tags without testing every single one of them.'''
+
+    def __init__(self, tags):
+        self.boxes = {}
+        for i, tag in enumerate(tags):
+            if tag.enabled and tag.solid:
+                bb = tag.solid.BoundBox
+                self.boxes[i] = (bb.XMin, bb.YMin, bb.XMax, bb.YMax)
+        self.cell = 1.0
+        if self.boxes:
+            self.cell = max([max(b[2] - b[0], b[3] - b[1]) for b in self.boxes.values()] + [PathGeom.Tolerance])
+        self.grid = {}
+        for i, box in self.boxes.items():
+            for key in self.cellsOf(box):
+                self.grid.setdefault(key, []).append(i)
+        self.edge = None
+        self.candidates = []
+
+    def cellsOf(self, box):
+        x0, y0, x1, y1 = [int(math.floor(v / self.cell)) for v in box]
+        return [(x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)]
+
+    def tagsFor(self, edge):
+        '''tagsFor(edge) ... returns the sorted indices of all tags edge might intersect.'''
+        if edge is not self.edge:
+            bb = edge.BoundBox
+            tol = PathGeom.Tolerance
+            box = (bb.XMin - tol, bb.YMin - tol, bb.XMax + tol, bb.YMax + tol)
+            cells = self.cellsOf(box)
+            if len(cells) > len(self.grid):
+                # edge is long compared to the tags, faster to go through the occupied cells
+                cells = self.grid.keys()
+            found = set()
+            for key in cells:
+                found.update(self.grid.get(key, []))
+            def overlaps(b):
+                return b[0] <= box[2] and box[0] <= b[2] and b[1] <= box[3] and box[1] <= b[3]
+            self.candidates = sorted([i for i in found if overlaps(self.boxes[i])])
+            self.edge = edge
+        return self.candidates
+
+    def nextTag(self, edge, t):
+        '''nextTag(edge, t) ... returns the index of the first tag >= t edge might intersect,
+        or None if there is no such tag.'''
+        candidates = self.tagsFor(edge)
+        i = bisect.bisect_left(candidates, t)
+        if i < len(candidates):
+            return candidates[i]
+        return None
+
+
 class MapWireToTag:
     def __init__(self, edge, tag, i, segm, maxZ, hSpeed, vSpeed):
         debugEdge(edge, 'MapWireToTag(%.2f, %.2f, %.2f)' % (i.x, i.y, i.z))
@@ -856,6 +945,7 @@ class ObjectTagDressup:
 
         self.mappers = []
         mapper = None
+        tagIndex = TagIndex(tags)
 
         tc = PathDressup.toolController(obj.Base)
         horizFeed = tc.HorizFeed.Value
@@ -881,9 +971,18 @@ class ObjectTagDressup:
                     edge = None
 
             if edge:
-                tIndex = (t + lastTag) % len(tags)
-                t += 1
-                i = tags[tIndex].intersects(edge, edge.FirstParameter)
+                if t < len(tags):
+                    # tags out of reach of the edge can't intersect it, skip them
+                    tIndex = tagIndex.nextTag(edge, t)
+                    t = len(tags) if tIndex is None else tIndex + 1
+                else:
+                    tIndex = (t + lastTag) % len(tags)
+                    t += 1
+                    if not tIndex in tagIndex.tagsFor(edge):
+                        tIndex = None
+                i = None
+                if tIndex is not None:
+                    i = tags[tIndex].intersects(edge, edge.FirstParameter)
                 if i and self.isValidTagStartIntersection(edge, i):
                     mapper = MapWireToTag(edge, tags[tIndex], i, segm, pathData.maxZ, hSpeed = horizFeed, vSpeed = vertFeed)
                     self.mappers.append(mapper)
@@ -21,6 +21,7 @@
 # ***************************************************************************
 
 import FreeCAD
+import Part
 import Path
 import PathScripts.PathDressup as PathDressup
 import PathScripts.PathGeom as PathGeom
@@ -28,6 +29,7 @@ import PathScripts.PathLog as PathLog
 import PathScripts.PathStock as PathStock
 import PathScripts.PathUtil as PathUtil
 import PathScripts.PathUtils as PathUtils
+import math
 
 from PySide import QtCore
 
@@ -41,6 +43,235 @@ def _vstr(v):
     return '-'
 
 
+class Boundary(object):
+    '''Boundary(shape) ... clips moves against an arbitrary solid with OCC booleans.
+    Moves which don't get near the solid's bounding box are rejected without a boolean.'''
+
+    def __init__(self, shape):
+        self.shape = shape
+        self.bb = shape.BoundBox
+
+    def clipEdge(self, cmd, edge):
+        if not self.bb.intersect(edge.BoundBox):
+            return ([], [cmd])
+        return (edge.common(self.shape).Edges, edge.cut(self.shape).Edges)
+
+    def clip(self, cmd, pos):
+        '''clip(cmd, pos) ... returns the lists (inside, outside) of the move cmd starting at pos,
+        None if the move has no extent. A move entirely on one side of the boundary is returned
+        as [cmd], the pieces of a move crossing the boundary are returned as edges.'''
+        edge = PathGeom.edgeForCmd(cmd, pos)
+        if not edge:
+            return None
+        return self.clipEdge(cmd, edge)
+
+
+class BoundaryConvex(Boundary):
+    '''Base class for convex boundaries, lines and arcs in the XY plane are clipped analytically,
+    helices are left to OCC. Derived classes implement isInside, lineInterval and circleCrossings.'''
+
+    def __init__(self, shape, zmin, zmax):
+        super(BoundaryConvex, self).__init__(shape)
+        self.zmin = zmin
+        self.zmax = zmax
+
+    def lineEdges(self, cmd, begin, end, t0, t1):
+        length = (end - begin).Length
+        if t1 - t0 < PathGeom.Tolerance / length:
+            return ([], [cmd])
+        if t0 <= PathGeom.Tolerance / length and t1 >= 1 - PathGeom.Tolerance / length:
+            return ([cmd], [])
+        p0 = begin + (end - begin) * t0
+        p1 = begin + (end - begin) * t1
+        inside = [Part.Edge(Part.LineSegment(p0, p1))]
+        outside = []
+        if t0 > PathGeom.Tolerance / length:
+            outside.append(Part.Edge(Part.LineSegment(begin, p0)))
+        if t1 < 1 - PathGeom.Tolerance / length:
+            outside.append(Part.Edge(Part.LineSegment(p1, end)))
+        return (inside, outside)
+
+    def arcEdges(self, cmd, edge):
+        z = edge.Vertexes[0].Point.z
+        if z < self.zmin - PathGeom.Tolerance or z > self.zmax + PathGeom.Tolerance:
+            return ([], [cmd])
+        curve = edge.Curve
+        first = edge.FirstParameter
+        last = edge.LastParameter
+        params = [first]
+        for pt in self.circleCrossings(curve.Center, curve.Radius):
+            u = curve.parameter(FreeCAD.Vector(pt.x, pt.y, z))
+            while u < first:
+                u += 2 * math.pi
+            if u - first > PathGeom.Tolerance / curve.Radius and last - u > PathGeom.Tolerance / curve.Radius:
+                params.append(u)
+        params.append(last)
+        params.sort()
+
+        # classify the pieces between the crossings and join neighbours on the same side
+        pieces = []
+        for u0, u1 in zip(params, params[1:]):
+            if (u1 - u0) * curve.Radius < PathGeom.Tolerance:
+                continue
+            isIn = self.isInside(edge.valueAt((u0 + u1) / 2))
+            if pieces and pieces[-1][2] == isIn:
+                pieces[-1][1] = u1
+            else:
+                pieces.append([u0, u1, isIn])
+        if len(pieces) == 1:
+            return ([cmd], []) if pieces[0][2] else ([], [cmd])
+        inside = [curve.toShape(u0, u1) for u0, u1, isIn in pieces if isIn]
+        outside = [curve.toShape(u0, u1) for u0, u1, isIn in pieces if not isIn]
+        return (inside, outside)
+
+    def clip(self, cmd, pos):
+        end = PathGeom.commandEndPoint(cmd, pos)
+        if cmd.Name in PathGeom.CmdMoveArc:
+            edge = PathGeom.edgeForCmd(cmd, pos)
+            if not self.bb.intersect(edge.BoundBox):
+                return ([], [cmd])
+            if type(edge.Curve) == Part.Circle and PathGeom.isRoughly(math.fabs(edge.Curve.Axis.z), 1):
+                return self.arcEdges(cmd, edge)
+            # helix
+            return self.clipEdge(cmd, edge)
+        if PathGeom.pointsCoincide(pos, end):
+            return None
+        if self.isInside(pos) and self.isInside(end):
+            return ([cmd], [])
+        interval = self.lineInterval(pos, end)
+        if interval is None:
+            return ([], [cmd])
+        return self.lineEdges(cmd, pos, end, interval[0], interval[1])
+
+    def zInterval(self, begin, end, t0, t1):
+        '''zInterval(begin, end, t0, t1) ... restricts the interval [t0, t1] of the line to the boundary's z range.'''
+        dz = end.z - begin.z
+        if PathGeom.isRoughly(dz, 0):
+            if begin.z < self.zmin - PathGeom.Tolerance or begin.z > self.zmax + PathGeom.Tolerance:
+                return None
+            return (t0, t1)
+        ta = (self.zmin - begin.z) / dz
+        tb = (self.zmax - begin.z) / dz
+        t0 = max(t0, min(ta, tb))
+        t1 = min(t1, max(ta, tb))
+        if t0 > t1:
+            return None
+        return (t0, t1)
+
+
+class BoundaryBox(BoundaryConvex):
+    '''BoundaryBox(shape) ... clipping against an axis aligned box, the boundary is the shape's bounding box.'''
+
+    def __init__(self, shape):
+        bb = shape.BoundBox
+        super(BoundaryBox, self).__init__(shape, bb.ZMin, bb.ZMax)
+
+    def isInside(self, pt):
+        tol = PathGeom.Tolerance
+        bb = self.bb
+        return (bb.XMin - tol <= pt.x <= bb.XMax + tol and bb.YMin - tol <= pt.y <= bb.YMax + tol
+                and bb.ZMin - tol <= pt.z <= bb.ZMax + tol)
+
+    def lineInterval(self, begin, end):
+        t0, t1 = 0.0, 1.0
+        bb = self.bb
+        for b, e, lo, hi in ((begin.x, end.x, bb.XMin, bb.XMax), (begin.y, end.y, bb.YMin, bb.YMax)):
+            d = e - b
+            if PathGeom.isRoughly(d, 0):
+                if b < lo - PathGeom.Tolerance or b > hi + PathGeom.Tolerance:
+                    return None
+                continue
+            ta = (lo - b) / d
+            tb = (hi - b) / d
+            t0 = max(t0, min(ta, tb))
+            t1 = min(t1, max(ta, tb))
+            if t0 > t1:
+                return None
+        return self.zInterval(begin, end, t0, t1)
+
+    def circleCrossings(self, center, radius):
+        bb = self.bb
+        points = []
+        for x in (bb.XMin, bb.XMax):
+            if math.fabs(x - center.x) <= radius:
+                dy = math.sqrt(radius * radius - (x - center.x) ** 2)
+                points.extend([FreeCAD.Vector(x, center.y + dy, 0), FreeCAD.Vector(x, center.y - dy, 0)])
+        for y in (bb.YMin, bb.YMax):
+            if math.fabs(y - center.y) <= radius:
+                dx = math.sqrt(radius * radius - (y - center.y) ** 2)
+                points.extend([FreeCAD.Vector(center.x + dx, y, 0), FreeCAD.Vector(center.x - dx, y, 0)])
+        return points
+
+
+class BoundaryCylinder(BoundaryConvex):
+    '''BoundaryCylinder(shape, center, radius) ... clipping against a cylinder with a vertical axis.'''
+
+    def __init__(self, shape, center, radius):
+        bb = shape.BoundBox
+        super(BoundaryCylinder, self).__init__(shape, bb.ZMin, bb.ZMax)
+        self.center = center
+        self.radius = radius
+
+    def isInside(self, pt):
+        tol = PathGeom.Tolerance
+        dx = pt.x - self.center.x
+        dy = pt.y - self.center.y
+        return dx * dx + dy * dy <= (self.radius + tol) ** 2 and self.zmin - tol <= pt.z <= self.zmax + tol
+
+    def lineInterval(self, begin, end):
+        dx = end.x - begin.x
+        dy = end.y - begin.y
+        fx = begin.x - self.center.x
+        fy = begin.y - self.center.y
+        a = dx * dx + dy * dy
+        c = fx * fx + fy * fy - self.radius * self.radius
+        if PathGeom.isRoughly(a, 0):
+            # vertical move
+            if c > 2 * self.radius * PathGeom.Tolerance:
+                return None
+            return self.zInterval(begin, end, 0.0, 1.0)
+        b = 2 * (fx * dx + fy * dy)
+        disc = b * b - 4 * a * c
+        if disc < 0:
+            return None
+        disc = math.sqrt(disc)
+        t0 = max(0.0, (-b - disc) / (2 * a))
+        t1 = min(1.0, (-b + disc) / (2 * a))
+        if t0 > t1:
+            return None
+        return self.zInterval(begin, end, t0, t1)
+
+    def circleCrossings(self, center, radius):
+        v = FreeCAD.Vector(self.center.x - center.x, self.center.y - center.y, 0)
+        d = v.Length
+        if PathGeom.isRoughly(d, 0) or d > radius + self.radius or d < math.fabs(radius - self.radius):
+            return []
+        phi = math.atan2(v.y, v.x)
+        alpha = math.acos(max(-1.0, min(1.0, (radius * radius + d * d - self.radius * self.radius) / (2 * radius * d))))
+        return [center + FreeCAD.Vector(math.cos(phi + a), math.sin(phi + a), 0) * radius for a in (alpha, -alpha)]
+
+
+def createBoundary(shape):
+    '''createBoundary(shape) ... returns the clipping engine for shape. Axis aligned boxes (all stocks
+    created by PathStock.CreateFromBase and CreateBox without a rotation) and cylinders with a vertical
+    axis (PathStock.CreateCylinder) are clipped analytically, any other solid with OCC booleans.'''
+    if shape.isNull() or not shape.Solids:
+        return Boundary(shape)
+    bb = shape.BoundBox
+    volume = shape.Volume
+    tolerance = max(volume, 1) * 1e-7
+    if PathGeom.isRoughly(volume, bb.XLength * bb.YLength * bb.ZLength, tolerance):
+        return BoundaryBox(shape)
+    for face in shape.Faces:
+        surface = face.Surface
+        if type(surface) == Part.Cylinder and PathGeom.isRoughly(math.fabs(surface.Axis.z), 1):
+            radius = surface.Radius
+            if (PathGeom.isRoughly(volume, math.pi * radius * radius * bb.ZLength, tolerance)
+                    and PathGeom.isRoughly(bb.XLength, 2 * radius) and PathGeom.isRoughly(bb.YLength, 2 * radius)):
+                return BoundaryCylinder(shape, surface.Center, radius)
+    return Boundary(shape)
+
+
 class DressupPathBoundary(object):
 
     def __init__(self, obj, base, job):
@@ -106,7 +337,7 @@ class DressupPathBoundary(object):
             self.strG1ZsafeHeight = Path.Command('G1', {'Z': self.safeHeight, 'F': tc.VertFeed.Value})
             self.strG0ZclearanceHeight = Path.Command('G0', {'Z': self.clearanceHeight})
 
-            boundary = obj.Stock.Shape
+            boundary = createBoundary(obj.Stock.Shape)
             cmd = obj.Base.Path.Commands[0]
             pos = cmd.Placement.Base # bogus m/c position to create first edge
             bogusX = True
@@ -119,10 +350,9 @@ class DressupPathBoundary(object):
                         bogusX = ( 'X' not in cmd.Parameters  )
                     if bogusY :
                         bogusY = ( 'Y' not in cmd.Parameters  )
-                    edge = PathGeom.edgeForCmd(cmd, pos)
-                    if edge:
-                        inside = edge.common(boundary).Edges
-                        outside = edge.cut(boundary).Edges
+                    clipped = boundary.clip(cmd, pos)
+                    if clipped:
+                        inside, outside = clipped
                         if not obj.Inside:  # UI "inside boundary" param
                             tmp = inside
                             inside = outside
@@ -35,6 +35,11 @@ controllers.
 Only gcodes that are supported by Path are imported. Thus things like G43
 are suppressed.
 
+The file is streamed in chunks, so large files can be imported without
+reading them into memory first. importPaths() returns the Path of each
+tool segment without creating any objects, e.g. to simulate or compare
+gcode from other CAM systems.
+
 Importing gcode is inherently dangerous because context cannot be safely
 assumed. The user should carefully examine the resulting gcode!
 
@@ -42,14 +47,15 @@ Read the Path Workbench documentation to know how to create Path objects
 from GCode.
 '''
 
+import io
 import os
+import re
+import time
 import FreeCAD
+import Path
 import PathScripts.PathUtils as PathUtils
 import PathScripts.PathLog as PathLog
-import re
 import PathScripts.PathCustom as PathCustom
-import PathScripts.PathCustomGui as PathCustomGui
-import PathScripts.PathOpGui as PathOpGui
 from PySide import QtCore
 
 # LEVEL = PathLog.Level.DEBUG
@@ -64,6 +70,23 @@ if LEVEL == PathLog.Level.DEBUG:
 if open.__module__ in ['__builtin__', 'io']:
     pythonopen = open
 
+# gcodes that are supported by Path, by their number
+SUPPORTED = [0, 1, 2, 3, 81, 82, 83, 90, 91]
+
+# gcodes which stay active for following lines with just axis words
+MODAL = [0, 1, 2, 3, 81, 82, 83]
+
+AXIS = ["X", "Y", "Z", "A", "B", "C", "U", "V", "W"]
+
+# the file is read in chunks of about this many bytes
+CHUNKSIZE = 1 << 20
+
+COMMENT = re.compile(r'\([^)]*\)?|;.*')
+LINENUMBER = re.compile(r'^[nN]\d+')
+GWORD = re.compile(r'[gG]\s*0*(\d+)(?![\d.])')
+TOOLCHANGE = re.compile(r'[mM]\s*0*6(?![\d.])')
+TOOLNUMBER = re.compile(r'[tT]\s*(\d+)')
+
 
 def open(filename):
     "called when freecad opens a file."
@@ -82,102 +105,144 @@ def matchToolController(op, toolnumber):
     return toolcontrollers[0]
 
 
-def insert(filename, docname):
-    "called when freecad imports a file"
+class Importer(object):
+    """Importer(chunksize) ... streaming gcode tokenizer.
+
+    The gcode is read in chunks and split on tool changes into segments,
+    each segment holds the supported commands of one tool, one per line.
+    Line numbers and comments are removed and lines with only axis words
+    get the modal command that is active for them.
+    """
+
+    def __init__(self, chunksize=CHUNKSIZE):
+        self.chunksize = chunksize
+        self.lines = 0
+        self.seconds = 0.0
+
+    def segments(self, stream):
+        '''segments(stream) ... generator of (toolnumber, gcode) for each tool segment
+        of stream, gcode being the list of its supported commands.'''
+        start = time.time()
+        toolnumber = 0
+        nexttool = 0
+        lastcommand = None
+        output = []
+        while True:
+            chunk = stream.readlines(self.chunksize)
+            if not chunk:
+                break
+            self.lines += len(chunk)
+            for lin in chunk:
+                if '(' in lin or ';' in lin:
+                    lin = COMMENT.sub('', lin)
+                lin = lin.strip()
+                if not lin:
+                    continue
+
+                # remove line numbers
+                if lin[0] in 'nN':
+                    lin = LINENUMBER.sub('', lin, 1).strip()
+                    if not lin:
+                        continue
+
+                first = lin[0].upper()
+                if first in 'MT':
+                    # a tool is selected with T and changed with M6
+                    t = TOOLNUMBER.search(lin)
+                    if t:
+                        nexttool = int(t.group(1))
+                    if TOOLCHANGE.search(lin):
+                        if output:
+                            self.seconds += time.time() - start
+                            yield (toolnumber, output)
+                            start = time.time()
+                            output = []
+                        toolnumber = nexttool
+                    continue
+
+                if first == 'G':
+                    # if the line starts with a supported command, store it
+                    words = [int(g) for g in GWORD.findall(lin)]
+                    if words and words[0] in SUPPORTED:
+                        output.append(lin)
+                        for g in words:
+                            if g in MODAL:
+                                lastcommand = "G%d" % g
+
+                # modal commands have no G but have axis moves. append those too.
+                elif first in AXIS and lastcommand:
+                    output.append(lastcommand + " " + lin)
+
+                # Anything else not a G code or an axis move is ignored.
+
+        self.seconds += time.time() - start
+        if output:
+            yield (toolnumber, output)
+
+    def paths(self, stream):
+        '''paths(stream) ... generator of (toolnumber, path) for each tool segment of stream.
+        The Path of a segment is built from all its gcode at once.'''
+        for toolnumber, gcode in self.segments(stream):
+            yield (toolnumber, Path.Path("\n".join(gcode)))
+
+    def linesPerSecond(self):
+        '''linesPerSecond() ... throughput of the tokenizer so far.'''
+        if self.seconds <= 0:
+            return 0
+        return self.lines / self.seconds
+
+    def report(self):
+        return "%d lines in %.2fs (%d lines/s)" % (self.lines, self.seconds, self.linesPerSecond())
+
+
+def importPaths(filename):
+    '''importPaths(filename) ... returns a list of (toolnumber, path) for each tool
+    segment of the gcode file, without creating any objects. Used to load gcode
+    for simulation or comparison.'''
     PathLog.track(filename)
-    gfile = pythonopen(filename)
-    gcode = gfile.read()
-    gfile.close()
+    importer = Importer()
+    with pythonopen(filename) as gfile:
+        paths = list(importer.paths(gfile))
+    PathLog.info("imported %s\n" % importer.report())
+    return paths
 
-    # Regular expression to match tool changes in the format 'M6 Tn'
-    p = re.compile('[mM]+?\s?0?6\s?T\d*\s')
 
-    # split the gcode on tool changes
-    paths = re.split('([mM]+?\s?0?6\s?T\d*\s)', gcode)
+def insert(filename, docname):
+    "called when freecad imports a file"
+    import PathScripts.PathCustomGui as PathCustomGui
+    import PathScripts.PathOpGui as PathOpGui
+    PathLog.track(filename)
 
     # iterate the gcode sections and add customs for each
-    toolnumber = 0
-
-    for path in paths:
-
-        # if the section is a tool change, extract the tool number
-        m = p.match(path)
-        if m:
-            toolnumber = int(m.group().split('T')[-1])
-            continue
-
-        # Parse the gcode and throw away any empty lists
-        gcode = parse(path)
-        if len(gcode) == 0:
-            continue
-
-        # Create a custom and viewobject
-        obj = PathCustom.Create("Custom")
-        res = PathOpGui.CommandResources('Custom', PathCustom.Create,
-                PathCustomGui.TaskPanelOpPage,
-                'Path_Custom',
-                QtCore.QT_TRANSLATE_NOOP('Path_Custom', 'Custom'), '', '')
-        obj.ViewObject.Proxy = PathOpGui.ViewProvider(obj.ViewObject, res)
-        obj.ViewObject.Proxy.setDeleteObjectsOnReject(False)
-
-        # Set the gcode and try to match a tool controller
-        obj.Gcode = gcode
-        obj.ToolController = matchToolController(obj, toolnumber)
-
+    importer = Importer()
+    with pythonopen(filename) as gfile:
+        for toolnumber, gcode in importer.segments(gfile):
+
+            # Create a custom and viewobject
+            obj = PathCustom.Create("Custom")
+            res = PathOpGui.CommandResources('Custom', PathCustom.Create,
+                    PathCustomGui.TaskPanelOpPage,
+                    'Path_Custom',
+                    QtCore.QT_TRANSLATE_NOOP('Path_Custom', 'Custom'), '', '')
+            obj.ViewObject.Proxy = PathOpGui.ViewProvider(obj.ViewObject, res)
+            obj.ViewObject.Proxy.setDeleteObjectsOnReject(False)
+
+            # Set the gcode and try to match a tool controller
+            obj.Gcode = gcode
+            obj.ToolController = matchToolController(obj, toolnumber)
+
+    PathLog.info("imported %s\n" % importer.report())
     FreeCAD.ActiveDocument.recompute()
 
 
-
 def parse(inputstring):
     "parse(inputstring): returns a parsed output string"
 
-    supported = ['G0', 'G00',
-                 'G1', 'G01',
-                 'G2', 'G02',
-                 'G3', 'G03',
-                 'G81', 'G82', 'G83',
-                 'G90', 'G91']
-
-    axis = ["X", "Y", "Z", "A", "B", "C", "U", "V", "W"]
-
     print("preprocessing...")
     PathLog.track(inputstring)
-    # split the input by line
-    lines = inputstring.splitlines()
     output = []
-    lastcommand = None
-
-    for lin in lines:
-        # remove any leftover trailing and preceding spaces
-        lin = lin.strip()
-
-        # discard empty lines
-        if not lin:
-            continue
-
-        # remove line numbers
-        if lin[0].upper() in ["N"]:
-            lin = lin.split(" ", 1)
-            if len(lin) >= 1:
-                lin = lin[1].strip()
-            else:
-                continue
-
-        # Anything else not a G/M code or an axis move is ignored.
-        if lin[0] not in ["G", "M", "X", "Y", "Z", "A", "B", "C", "U", "V", "W"]:
-            continue
-
-        # if the remaining line is supported, store it
-        currcommand = lin.split()[0]
-
-        if currcommand in supported:
-            output.append(lin)
-            lastcommand = currcommand
-
-        # modal commands have no G or M but have axis moves. append those too.
-        elif currcommand[0] in axis and lastcommand:
-            output.append(lastcommand + " " + lin)
-
+    for toolnumber, gcode in Importer().segments(io.StringIO(inputstring)):
+        output.extend(gcode)
     print("done preprocessing.")
     return output
 
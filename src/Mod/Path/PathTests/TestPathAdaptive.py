@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD developers                                 *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+import json
+import math
+
+import PathScripts.PathAdaptive as PathAdaptive
+
+from PathTests.PathTestUtils import PathTestBase
+
+
+def adaptiveResults(regions=2, paths=5, points=200):
+    '''adaptiveResults(regions, paths, points) ... returns results in the form
+    PathAdaptive converts the output of the adaptive algorithm to.'''
+    results = []
+    for r in range(regions):
+        adaptivePaths = []
+        for p in range(paths):
+            pts = [(r * 100 + math.cos(i * 0.1) * (p + 1), math.sin(i * 0.1) * (p + 1) / 3.0) for i in range(points)]
+            adaptivePaths.append((p % 3, pts))
+        results.append({
+            "HelixCenterPoint": (r * 100 + 0.125, -1.0 / 3),
+            "StartPoint": (r * 100 + 1.5, 0.0),
+            "AdaptivePaths": adaptivePaths,
+            "ReturnMotionType": r % 2})
+    return results
+
+
+class TestPathAdaptive(PathTestBase):
+    """Unit tests for storing the results of the Adaptive operation."""
+
+    def test00(self):
+        """Verify packed results are restored exactly."""
+        results = adaptiveResults()
+        packed = PathAdaptive.packResults(results)
+        self.assertTrue(isinstance(packed, str))
+        self.assertEqual(PathAdaptive.unpackResults(packed), results)
+        # much smaller than the JSON the results used to be stored as
+        self.assertLess(len(packed), len(json.dumps(results)) / 2)
+
+        self.assertEqual(PathAdaptive.unpackResults(PathAdaptive.packResults([])), [])
+        self.assertIsNone(PathAdaptive.unpackResults("0:abc"))
+        self.assertIsNone(PathAdaptive.unpackResults("1:not packed"))
+
+    def test01(self):
+        """Verify results restored from old documents are packed the same way."""
+        results = adaptiveResults(regions=3, paths=2, points=20)
+        restored = json.loads(json.dumps(results))
+        self.assertEqual(PathAdaptive.packResults(restored), PathAdaptive.packResults(results))
+
+    def test02(self):
+        """Verify the hash of the input state."""
+        state = {
+            "tool": 5.0,
+            "tolerance": 0.1,
+            "geometry": [[(0.0, 0.0), (10.0, 0.0), (10.0, 10.0)], [(1.0, 1.0), (2.0, 2.0)]],
+            "stockGeometry": [[(-1.0, -1.0), (11.0, -1.0), (11.0, 11.0), (-1.0, 11.0)]],
+            "stepover": 20.0,
+            "operationType": "Clearing",
+            "side": "Inside",
+            "forceInsideOut": False}
+        h = PathAdaptive.hashInputState(state)
+        # state as restored by older versions
+        self.assertEqual(PathAdaptive.hashInputState(json.loads(json.dumps(state))), h)
+
+        changed = dict(state)
+        changed["geometry"] = [[(0.0, 0.0), (10.0, 0.0), (10.0, 10.0), (1.0, 1.0), (2.0, 2.0)]]
+        self.assertNotEqual(PathAdaptive.hashInputState(changed), h)
+        changed = dict(state)
+        changed["forceInsideOut"] = True
+        self.assertNotEqual(PathAdaptive.hashInputState(changed), h)
+        changed = dict(state)
+        changed["tool"] = 5.0 + 1e-12
+        self.assertNotEqual(PathAdaptive.hashInputState(changed), h)
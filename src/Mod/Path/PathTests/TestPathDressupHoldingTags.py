@@ -20,11 +20,13 @@
 # *                                                                         *
 # ***************************************************************************
 
+import Part
+import PathScripts.PathDressupHoldingTags as PathDressupHoldingTags
 import PathTests.PathTestUtils as PathTestUtils
 import math
 
 from FreeCAD import Vector
-from PathScripts.PathDressupHoldingTags import Tag
+from PathScripts.PathDressupHoldingTags import Tag, TagIndex
 
 class TestHoldingTags(PathTestUtils.PathTestBase):
     """Unit tests for the HoldingTags dressup."""
@@ -68,3 +70,48 @@ class TestHoldingTags(PathTestUtils.PathTestBase):
         print(h)
         self.assertConeAt(tag.solid, Vector(0,0,-h * 0.01), 2.5, 0, h)
 
+
+    def test05(self):
+        """Verify tags of the same size share a cached solid and still end up in their own place."""
+        PathDressupHoldingTags.clearTagSolids()
+        tag1 = Tag(0, 100, 200, 4, 5, 90, 0, True)
+        tag1.createSolidsAt(17, 0)
+        tag2 = Tag(1, -30, 10, 4, 5, 90, 0, True)
+        tag2.createSolidsAt(3, 0)
+        self.assertEqual(len(PathDressupHoldingTags.TagSolids), 1)
+        self.assertCylinderAt(tag1.solid, Vector(100, 200, 17 - 5 * 0.01), 2, 5 * 1.01)
+        self.assertCylinderAt(tag2.solid, Vector(-30, 10, 3 - 5 * 0.01), 2, 5 * 1.01)
+
+        # a different tool radius is a different solid
+        tag3 = Tag(2, 100, 200, 4, 5, 90, 0, True)
+        tag3.createSolidsAt(17, 1)
+        self.assertEqual(len(PathDressupHoldingTags.TagSolids), 2)
+        self.assertRoughly(tag3.solid.BoundBox.XLength, 6)
+
+    def test06(self):
+        """Verify the tag index only returns tags an edge can reach."""
+        tags = []
+        for i in range(10):
+            tag = Tag(i, i * 10, 0, 4, 5, 90, 0, i != 7)
+            tag.createSolidsAt(0, 1)
+            tags.append(tag)
+        index = TagIndex(tags)
+
+        edge = Part.Edge(Part.LineSegment(Vector(-5, 0, 0), Vector(100, 0, 0)))
+        self.assertEqual(index.tagsFor(edge), [0, 1, 2, 3, 4, 5, 6, 8, 9])
+        self.assertEqual(index.nextTag(edge, 7), 8)
+
+        edge = Part.Edge(Part.LineSegment(Vector(18, -5, 0), Vector(33, 5, 0)))
+        self.assertEqual(index.tagsFor(edge), [2, 3])
+        self.assertEqual(index.nextTag(edge, 0), 2)
+        self.assertIsNone(index.nextTag(edge, 4))
+
+        edge = Part.Edge(Part.LineSegment(Vector(0, 10, 0), Vector(100, 10, 0)))
+        self.assertEqual(index.tagsFor(edge), [])
+
+        # every tag the index skips really doesn't intersect the edge
+        for edge in [Part.Edge(Part.Circle(Vector(45, 0, 0), Vector(0, 0, 1), r)) for r in (4, 15, 31)]:
+            reachable = index.tagsFor(edge)
+            for i, tag in enumerate(tags):
+                if not i in reachable:
+                    self.assertIsNone(tag.intersects(edge, edge.FirstParameter))
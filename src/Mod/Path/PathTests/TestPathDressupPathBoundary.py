@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD developers                                 *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+import FreeCAD
+import Part
+import Path
+import PathScripts.PathDressupPathBoundary as PathDressupPathBoundary
+import PathScripts.PathGeom as PathGeom
+
+from FreeCAD import Vector
+from PathTests.PathTestUtils import PathTestBase
+
+
+class TestDressupPathBoundary(PathTestBase):
+    """Unit tests for the clipping engines of the Boundary dressup."""
+
+    moves = '''
+    G0 X-5 Y5 Z3
+    G1 X15 Y5 Z3
+    G1 X5 Y-5 Z3
+    G1 X5 Y5 Z12
+    G1 X5 Y5 Z-2
+    G1 X-3 Y-3 Z-3
+    G1 X2 Y2 Z2
+    G1 X8 Y2 Z2
+    G2 X8 Y8 Z2 I0 J3 K0
+    G3 X14 Y8 Z2 I3 J0 K0
+    G2 X2 Y8 Z2 I-6 J0 K0
+    G1 X10 Y10 Z2
+    G3 X-2 Y10 Z2 I-6 J0 K0
+    G2 X4 Y4 Z2 I3 J-3 K0
+    G1 X2 Y5 Z6
+    G2 X8 Y5 Z4 I3 J0 K0
+    '''
+
+    def clipLengths(self, boundary, commands):
+        lengths = []
+        pos = Vector()
+        for cmd in commands:
+            if cmd.Name not in PathGeom.CmdMoveAll:
+                continue
+            clipped = boundary.clip(cmd, pos)
+            if clipped:
+                edge = PathGeom.edgeForCmd(cmd, pos)
+                inside, outside = [sum([edge.Length if e is cmd else e.Length for e in pieces]) for pieces in clipped]
+                lengths.append((cmd, inside, outside))
+            pos = PathGeom.commandEndPoint(cmd, pos)
+        return lengths
+
+    def assertClippedLikeOCC(self, shape, commands, engine):
+        boundary = PathDressupPathBoundary.createBoundary(shape)
+        self.assertTrue(type(boundary) == engine)
+        occ = PathDressupPathBoundary.Boundary(shape)
+        lengths = self.clipLengths(boundary, commands)
+        expected = self.clipLengths(occ, commands)
+        self.assertEqual(len(lengths), len(expected))
+        for (cmd, inside, outside), (_, occInside, occOutside) in zip(lengths, expected):
+            self.assertRoughly(inside, occInside, 0.0001)
+            self.assertRoughly(outside, occOutside, 0.0001)
+
+    def test00(self):
+        '''Verify boxes and vertical cylinders get an analytic engine.'''
+        box = Part.makeBox(10, 10, 5, Vector(1, 2, 3))
+        self.assertTrue(type(PathDressupPathBoundary.createBoundary(box)) == PathDressupPathBoundary.BoundaryBox)
+        cylinder = Part.makeCylinder(5, 5, Vector(5, 5, 0))
+        self.assertTrue(type(PathDressupPathBoundary.createBoundary(cylinder)) == PathDressupPathBoundary.BoundaryCylinder)
+
+        box.rotate(Vector(), Vector(0, 0, 1), 30)
+        self.assertTrue(type(PathDressupPathBoundary.createBoundary(box)) == PathDressupPathBoundary.Boundary)
+        cylinder.rotate(Vector(), Vector(1, 0, 0), 90)
+        self.assertTrue(type(PathDressupPathBoundary.createBoundary(cylinder)) == PathDressupPathBoundary.Boundary)
+        cone = Part.makeCone(5, 3, 5)
+        self.assertTrue(type(PathDressupPathBoundary.createBoundary(cone)) == PathDressupPathBoundary.Boundary)
+
+    def test01(self):
+        '''Verify moves are clipped against a box like OCC does.'''
+        box = Part.makeBox(10, 10, 5)
+        self.assertClippedLikeOCC(box, Path.Path(self.moves).Commands, PathDressupPathBoundary.BoundaryBox)
+
+    def test02(self):
+        '''Verify moves are clipped against a cylinder like OCC does.'''
+        cylinder = Part.makeCylinder(5, 5, Vector(5, 5, 0))
+        self.assertClippedLikeOCC(cylinder, Path.Path(self.moves).Commands, PathDressupPathBoundary.BoundaryCylinder)
+
+    def test03(self):
+        '''Verify the test fixture's toolpath is clipped like OCC does.'''
+        with open(FreeCAD.getHomePath() + 'Mod/Path/PathTests/test_linuxcnc_00.ngc') as f:
+            commands = Path.Path(f.read()).Commands
+        box = Part.makeBox(6, 12, 6, Vector(2, -1, 5))
+        self.assertClippedLikeOCC(box, commands, PathDressupPathBoundary.BoundaryBox)
+        cylinder = Part.makeCylinder(4, 4, Vector(5, 5, 6))
+        self.assertClippedLikeOCC(cylinder, commands, PathDressupPathBoundary.BoundaryCylinder)
+
+    def test04(self):
+        '''Verify moves away from an arbitrary solid are rejected by bounding box.'''
+        cone = Part.makeCone(5, 3, 5)
+        boundary = PathDressupPathBoundary.createBoundary(cone)
+        cmd = Path.Command('G1', {'X': 20, 'Y': 20, 'Z': 0})
+        self.assertEqual(boundary.clip(cmd, Vector(10, 20, 0)), ([], [cmd]))
+        cmd = Path.Command('G1', {'X': 0, 'Y': 0, 'Z': 0})
+        self.assertEqual(boundary.clip(cmd, Vector(0, 0, 0)), None)
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+# ***************************************************************************
+# *   Copyright (c) 2026 FreeCAD developers                                 *
+# *                                                                         *
+# *   This program is free software; you can redistribute it and/or modify  *
+# *   it under the terms of the GNU Lesser General Public License (LGPL)    *
+# *   as published by the Free Software Foundation; either version 2 of     *
+# *   the License, or (at your option) any later version.                   *
+# *   for detail see the LICENCE text file.                                 *
+# *                                                                         *
+# *   This program is distributed in the hope that it will be useful,       *
+# *   but WITHOUT ANY WARRANTY; without even the implied warranty of        *
+# *   MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the         *
+# *   GNU Library General Public License for more details.                  *
+# *                                                                         *
+# *   You should have received a copy of the GNU Library General Public     *
+# *   License along with this program; if not, write to the Free Software   *
+# *   Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  *
+# *   USA                                                                   *
+# *                                                                         *
+# ***************************************************************************
+
+
+import io
+import os
+import random
+import tempfile
+import time
+
+import FreeCAD
+import PathScripts.post.gcode_pre as gcode_pre
+
+from PathTests.PathTestUtils import PathTestBase
+
+# The benchmark can be run from the Python console, e.g.:
+#
+#   from PathTests import TestPathGcodePre
+#   TestPathGcodePre.benchmark(2000000)
+
+
+def generateGcode(fp, lines, tools=4, seed=0):
+    '''generateGcode(fp, lines, tools=4, seed=0) ... writes lines of gcode in the
+    style of other CAM systems to fp: line numbers, comments, modal axis words
+    and tool changes. Returns the number of supported commands written.'''
+    rnd = random.Random(seed)
+    perTool = max(1, (lines + tools - 1) // tools)
+    fp.write("%\n(generated by TestPathGcodePre)\nG90\nG21 G17\n")
+    written = 1
+    for n in range(lines):
+        if n % perTool == 0:
+            fp.write("N%d T%d M6 (tool %d)\nG43 H%d\n" % (n, n // perTool + 1, n // perTool + 1, n // perTool + 1))
+            fp.write("G0 Z5.000\n")
+            written += 1
+            continue
+        x = rnd.uniform(-100, 100)
+        y = rnd.uniform(-100, 100)
+        kind = n % 10
+        if kind == 0:
+            fp.write("N%d G1 X%.3f Y%.3f Z-1.000 F600\n" % (n, x, y))
+        elif kind == 1:
+            fp.write("G2 X%.3f Y%.3f I%.3f J0.000 ; arc\n" % (x, y, rnd.uniform(1, 10)))
+        elif kind == 2:
+            fp.write("(comment %d)\n" % n)
+            continue
+        else:
+            fp.write("X%.3f Y%.3f\n" % (x, y))
+        written += 1
+    fp.write("M5\nM30\n%\n")
+    return written
+
+
+def benchmark(lines=1000000):
+    '''benchmark(lines) ... imports a generated gcode file of lines and prints the
+    throughput. Returns the lines per second.'''
+    fd, filename = tempfile.mkstemp(suffix='.ngc')
+    try:
+        with os.fdopen(fd, 'w') as fp:
+            generateGcode(fp, lines)
+        importer = gcode_pre.Importer()
+        start = time.time()
+        with open(filename) as fp:
+            paths = list(importer.paths(fp))
+        seconds = time.time() - start
+        commands = sum([path.Size for tool, path in paths])
+        FreeCAD.Console.PrintMessage("gcode_pre: %s, %d commands in %d tools, %.2fs total\n" %
+                (importer.report(), commands, len(paths), seconds))
+        return importer.linesPerSecond()
+    finally:
+        os.remove(filename)
+
+
+class TestPathGcodePre(PathTestBase):
+    """Unit tests for the streaming gcode importer."""
+
+    def test00(self):
+        """Verify line numbers, comments and modal axis words."""
+        gcode = """%
+N10 G90 (absolute)
+N20 G0 X1 Y2
+N30 X3 Y4 ; still rapid
+G43 H1
+g1x5y6f100
+N40 Y7
+(just a comment)
+Z-1
+G81 X1 Y1 Z-2 R1
+X2
+"""
+        self.assertEqual(gcode_pre.parse(gcode), [
+            'G90', 'G0 X1 Y2', 'G0 X3 Y4', 'g1x5y6f100', 'G1 Y7', 'G1 Z-1',
+            'G81 X1 Y1 Z-2 R1', 'G81 X2'])
+
+    def test01(self):
+        """Verify gcode is split on tool changes."""
+        gcode = """G0 Z5
+M6 T1
+G1 X1
+T2
+G0 Z10
+N100 M06
+X2
+M6 T3
+M6 T4
+G1 Y3
+"""
+        segments = list(gcode_pre.Importer(chunksize=8).segments(io.StringIO(gcode)))
+        self.assertEqual(segments, [
+            (0, ['G0 Z5']),
+            (1, ['G1 X1', 'G0 Z10']),
+            (2, ['G0 X2']),
+            (4, ['G1 Y3'])])
+
+    def test02(self):
+        """Verify generated gcode is imported in chunks, into one Path per tool."""
+        fp = io.StringIO()
+        written = generateGcode(fp, 5000, tools=3)
+        fp.seek(0)
+        importer = gcode_pre.Importer(chunksize=4096)
+        paths = list(importer.paths(fp))
+        # the setup before the first tool change is a segment of its own
+        self.assertEqual([tool for tool, path in paths], [0, 1, 2, 3])
+        self.assertEqual(sum([path.Size for tool, path in paths]), written)
+        self.assertEqual(importer.lines, len(fp.getvalue().splitlines()))
+        self.assertTrue(importer.linesPerSecond() > 0)
+        self.assertEqual([cmd.Name for cmd in paths[0][1].Commands], ['G90'])
+        for tool, path in paths[1:]:
+            self.assertEqual(path.Commands[0].Name, 'G0')
+            self.assertEqual(set([cmd.Name for cmd in path.Commands]), set(['G0', 'G1', 'G2']))
@@ -25,14 +25,17 @@ import TestApp
 from PathTests.TestPathLog   import TestPathLog
 from PathTests.TestPathPreferences  import TestPathPreferences
 from PathTests.TestPathPropertyBag  import TestPathPropertyBag
+from PathTests.TestPathAdaptive import TestPathAdaptive
 from PathTests.TestPathCore  import TestPathCore
 #from PathTests.TestPathPost  import PathPostTestCases
+from PathTests.TestPathGcodePre import TestPathGcodePre
 from PathTests.TestPathGeom  import TestPathGeom
 from PathTests.TestPathOpTools  import TestPathOpTools
 from PathTests.TestPathUtil  import TestPathUtil
 from PathTests.TestPathDepthParams import depthTestCases
 from PathTests.TestPathDressupHoldingTags import TestHoldingTags
 from PathTests.TestPathDressupDogbone import TestDressupDogbone
+from PathTests.TestPathDressupPathBoundary import TestDressupPathBoundary
 from PathTests.TestPathStock import TestPathStock
 from PathTests.TestPathTool import TestPathTool
 from PathTests.TestPathToolBit  import TestPathToolBit
@@ -48,13 +51,16 @@ from PathTests.TestPathVcarve  import TestPathVcarve
 # dummy usage to get flake8 and lgtm quiet
 False if TestApp.__name__ else True
 False if TestPathLog.__name__ else True
+False if TestPathAdaptive.__name__ else True
 False if TestPathCore.__name__ else True
+False if TestPathGcodePre.__name__ else True
 False if TestPathGeom.__name__ else True
 False if TestPathOpTools.__name__ else True
 False if TestPathUtil.__name__ else True
 False if depthTestCases.__name__ else True
 False if TestHoldingTags.__name__ else True
 False if TestDressupDogbone.__name__ else True
+False if TestDressupPathBoundary.__name__ else True
 False if TestPathStock.__name__ else True
 False if TestPathTool.__name__ else True
 False if TestPathTooltable.__name__ else True
@@ -369,6 +369,24 @@ void Sheet::setCell(CellAddress address, const char * value)
     setContent(address, value);
 }
 
+/**
+  * Set a number of cells at once. The cell property is only signalled once,
+  * after all cells have been set.
+  *
+  * @param values     Cell addresses and string values of expressions.
+  *
+  */
+
+void Sheet::setCells(const std::vector<std::pair<CellAddress, std::string> > &values)
+{
+    PropertySheet::AtomicPropertyChange signaller(cells);
+
+    for (std::vector<std::pair<CellAddress, std::string> >::const_iterator i = values.begin(); i != values.end(); ++i)
+        setCell(i->first, i->second.c_str());
+
+    signaller.tryInvoke();
+}
+
 /**
   * Get the Python object for the Sheet.
   *
@@ -89,6 +89,53 @@ PyObject* SheetPy::set(PyObject *args)
     Py_Return;
 }
 
+PyObject* SheetPy::setCells(PyObject *args)
+{
+    PyObject *values;
+
+    if (!PyArg_ParseTuple(args, "O:setCells", &values))
+        return 0;
+
+    Sheet * sheet = getSheetPtr();
+    std::vector<std::pair<CellAddress, std::string> > cells;
+
+    try {
+        Py::Sequence items(PyDict_Check(values) ? Py::Object(PyDict_Items(values), true) : Py::Object(values));
+
+        cells.reserve(items.size());
+        for (Py::Sequence::iterator it = items.begin(); it != items.end(); ++it) {
+            char *address;
+            char *contents;
+
+            Py::Object item(*it);
+            if (!PyTuple_Check(item.ptr())) {
+                PyErr_SetString(PyExc_TypeError, "setCells expects (address, contents) tuples");
+                return 0;
+            }
+            if (!PyArg_ParseTuple(item.ptr(), "ss", &address, &contents))
+                return 0;
+
+            /* Check to see if address is really an alias first */
+            std::string cellAddress = sheet->getAddressFromAlias(address);
+            if (cellAddress.size() > 0)
+                cells.push_back(std::make_pair(stringToAddress(cellAddress.c_str()), std::string(contents)));
+            else
+                cells.push_back(std::make_pair(stringToAddress(address), std::string(contents)));
+        }
+
+        sheet->setCells(cells);
+    }
+    catch (const Py::Exception &) {
+        return 0;
+    }
+    catch (const Base::Exception & e) {
+        PyErr_SetString(PyExc_ValueError, e.what());
+        return 0;
+    }
+
+    Py_Return;
+}
+
 PyObject* SheetPy::get(PyObject *args)
 {
     char *address;
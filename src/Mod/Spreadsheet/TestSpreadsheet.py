@@ -32,6 +32,85 @@ from FreeCAD import Units
 
 v = Base.Vector
 
+XLSX_NS = 'xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"'
+XLSX_REL_NS = 'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+
+
+def makeXLSXWorkbook(filename, rows, cols):
+    """ Writes an XLSX workbook with two sheets. Sheet1 has rows x cols cells:
+    shared strings in column A, inline strings in column B, numbers in the
+    following columns and a row sum formula in the last column. Sheet2 has a
+    formula referring to Sheet1. The first number of Sheet1 is named 'First'. """
+    import zipfile
+
+    def column(i):
+        name = ''
+        i += 1
+        while i:
+            i, r = divmod(i - 1, 26)
+            name = chr(65 + r) + name
+        return name
+
+    last = column(cols - 1)
+    sheet1 = ['<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n',
+              '<worksheet ' + XLSX_NS + '><sheetData>']
+    for r in range(1, rows + 1):
+        sheet1.append('<row r="{}">'.format(r))
+        sheet1.append('<c r="A{}" t="s"><v>{}</v></c>'.format(r, r - 1))
+        sheet1.append('<c r="B{}" t="inlineStr"><is><t>inline{}</t></is></c>'.format(r, r))
+        for c in range(2, cols - 1):
+            sheet1.append('<c r="{}{}"><v>{}</v></c>'.format(column(c), r, r * c))
+        sheet1.append('<c r="{0}{1}"><f>SUM(C{1}:{2}{1})</f><v>0</v></c>'.format(last, r, column(cols - 2)))
+        sheet1.append('</row>')
+    sheet1.append('</sheetData></worksheet>')
+
+    strings = ['<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n',
+               '<sst {} count="{}" uniqueCount="{}">'.format(XLSX_NS, rows, rows)]
+    for r in range(1, rows + 1):
+        strings.append('<si><t>shared{}</t></si>'.format(r))
+    strings.append('</sst>')
+
+    sheet2 = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+              '<worksheet ' + XLSX_NS + '><sheetData><row r="1">'
+              '<c r="A1"><f>Sheet1!C1*2</f><v>0</v></c>'
+              '</row></sheetData></worksheet>')
+
+    workbook = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                '<workbook ' + XLSX_NS + ' ' + XLSX_REL_NS + '><sheets>'
+                '<sheet name="Sheet1" sheetId="1" r:id="rId1"/>'
+                '<sheet name="Sheet2" sheetId="2" r:id="rId2"/>'
+                '</sheets><definedNames>'
+                '<definedName name="First">Sheet1!$C$1</definedName>'
+                '</definedNames></workbook>')
+
+    rels = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+            '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet2.xml"/>'
+            '</Relationships>')
+
+    with zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED) as z:
+        z.writestr('xl/workbook.xml', workbook)
+        z.writestr('xl/_rels/workbook.xml.rels', rels)
+        z.writestr('xl/sharedStrings.xml', ''.join(strings))
+        z.writestr('xl/worksheets/sheet1.xml', ''.join(sheet1))
+        z.writestr('xl/worksheets/sheet2.xml', sheet2)
+
+
+def benchmarkImportXLSX(rows=1000, cols=100):
+    """ Times the import of a generated workbook of rows x cols cells. """
+    import time
+    import importXLSX
+    filename = os.path.join(tempfile.gettempdir(), 'benchmark_{}x{}.xlsx'.format(rows, cols))
+    makeXLSXWorkbook(filename, rows, cols)
+    start = time.time()
+    doc = importXLSX.open(filename)
+    seconds = time.time() - start
+    FreeCAD.Console.PrintMessage('importXLSX: {} cells in {:.2f} s\n'.format(rows * cols, seconds))
+    FreeCAD.closeDocument(doc.Name)
+    os.remove(filename)
+    return seconds
+
 #----------------------------------------------------------------------------------
 # define the functions to test the FreeCAD Spreadsheet module and expression engine
 #----------------------------------------------------------------------------------
@@ -1143,6 +1222,37 @@ class SpreadsheetCases(unittest.TestCase):
         self.doc.recompute()
         sheet.setAlias('C3','test')
 
+    def testSetCells(self):
+        """ Test setting a number of cells at once """
+        sheet = self.doc.addObject('Spreadsheet::Sheet','Spreadsheet')
+        sheet.setAlias('B1', 'alias')
+        sheet.setCells([('A1', '1'), ('alias', '=A1+1'), ('C1', 'text')])
+        sheet.setCells({'A2': '=B1*2'})
+        self.doc.recompute()
+        self.assertEqual(sheet.A1, 1)
+        self.assertEqual(sheet.B1, 2)
+        self.assertEqual(sheet.C1, 'text')
+        self.assertEqual(sheet.A2, 4)
+        self.assertRaises(TypeError, sheet.setCells, [['A3', '1']])
+
+    def testImportXLSX(self):
+        """ Test the XLSX importer on a generated workbook """
+        import importXLSX
+        filename = os.path.join(self.TempPath, 'testImportXLSX.xlsx')
+        makeXLSXWorkbook(filename, 20, 6)
+        importXLSX.insert(filename, self.doc.Name)
+        os.remove(filename)
+        sheet1 = self.doc.getObject('Sheet1')
+        sheet2 = self.doc.getObject('Sheet2')
+        self.assertEqual(sheet1.get('A1'), 'shared1')
+        self.assertEqual(sheet1.get('A20'), 'shared20')
+        self.assertEqual(sheet1.get('B7'), 'inline7')
+        self.assertEqual(sheet1.get('D3'), 9)
+        self.assertEqual(sheet1.getContents('F3'), '=sum(C3:E3)')
+        self.assertEqual(sheet1.get('F3'), 3 * (2 + 3 + 4))
+        self.assertEqual(sheet1.getAlias('C1'), 'First')
+        self.assertEqual(sheet2.get('A1'), 4)
+
     def tearDown(self):
         #closing doc
         FreeCAD.closeDocument(self.doc.Name)
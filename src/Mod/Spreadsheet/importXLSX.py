@@ -29,6 +29,13 @@ __url__    = ["https://www.freecadweb.org"]
 '''
 This library imports an Excel-XLSX-file into FreeCAD.
 
+Version 1.2:
+The worksheets, shared strings and the workbook are streamed with iterparse
+instead of being loaded as DOM trees. Cells are set in bulk per sheet, and
+formulas are translated once per distinct formula text.
+Added support for shared formulas (the cached value is imported), rich text
+shared strings and defined names of quoted sheet names.
+
 Version 1.1, Nov. 2016:
 Changed parser, adds rad-unit to trigonometric functions in order
 to give the same result in FreeCAD.
@@ -54,9 +61,12 @@ known issues:
 
 
 import zipfile
-import xml.dom.minidom
 import FreeCAD as App
 import sys
+import time
+
+try: from xml.etree.cElementTree import iterparse
+except ImportError: from xml.etree.ElementTree import iterparse
 
 try: import FreeCADGui
 except ValueError: gui = False
@@ -315,105 +325,156 @@ class FormulaTranslator(object):
 
 
 
-def getText(nodelist):
-  rc = []
-  for node in nodelist:
-    if node.nodeType == node.TEXT_NODE:
-      rc.append(node.data)
-    if sys.version_info.major >= 3:
-      return ''.join(rc)
-    else:
-      return ''.join(rc).encode('utf8')
-
-
-def handleWorkSheet(theDom, actSheet, strList):
-  rows = theDom.getElementsByTagName("row")
-  for row in rows:
-    handleCells(row.getElementsByTagName("c"), actSheet, strList)
-
-
-def handleCells(cellList, actCellSheet, sList):
-  for cell in cellList:
-    cellAtts = cell.attributes
-    refRef = cellAtts.getNamedItem("r")
-    ref = getText(refRef.childNodes)
-
-    refType = cellAtts.getNamedItem("t")
-    if refType:
-      cellType = getText(refType.childNodes)
-    else:
-      cellType = 'n'   # FIXME: some cells don't have t and s attributes
-
-    #print("reference: ", ref, ' Cell type: ', cellType)
+def localName(tag):
+  ''' Returns the tag name of an iterparse element without namespace.'''
+  return tag.rpartition('}')[2]
+
+
+def toStr(text):
+  if sys.version_info.major >= 3:
+    return text
+  else:
+    return text.encode('utf8')
+
+
+def readWorkBook(theBookFile, theRelsFile=None):
+  ''' Streams xl/workbook.xml and returns the list of (sheetName, sheetFile)
+  and the list of (aliasName, aliasRef) of the defined names.
+  The sheet files are looked up in xl/_rels/workbook.xml.rels if given,
+  otherwise they are derived from the sheetId.'''
+  targets = {}
+  if theRelsFile is not None:
+    for event, elem in iterparse(theRelsFile):
+      if localName(elem.tag) == 'Relationship':
+        targets[elem.get('Id')] = elem.get('Target').rpartition('/')[2]
+  sheets = []
+  aliases = []
+  for event, elem in iterparse(theBookFile):
+    name = localName(elem.tag)
+    if name == 'sheet':
+      relId = None
+      for key in elem.keys():
+        if localName(key) == 'id':
+          relId = elem.get(key)
+      if relId in targets:
+        sheetFile = targets[relId]
+      else:
+        sheetFile = "sheet" + elem.get('sheetId') + '.xml'
+      sheets.append((toStr(elem.get('name')), sheetFile))
+    elif name == 'definedName':
+      aliases.append((toStr(elem.get('name')), toStr(elem.text or '')))
+  return sheets, aliases
+
+
+def readStrings(theStringFile):
+  ''' Streams xl/sharedStrings.xml and returns the list of shared strings.
+  The text runs of rich text strings are joined, phonetic runs are skipped.'''
+  sList = []
+  parts = []
+  phonetic = 0
+  for event, elem in iterparse(theStringFile, events=('start', 'end')):
+    name = localName(elem.tag)
+    if event == 'start':
+      if name == 'rPh':
+        phonetic += 1
+    elif name == 't':
+      if not phonetic:
+        parts.append(elem.text or '')
+    elif name == 'rPh':
+      phonetic -= 1
+    elif name == 'si':
+      sList.append(toStr(''.join(parts)))
+      parts = []
+      elem.clear()
+  return sList
+
+
+def readWorkSheet(theSheetFile, sList, formulaDict):
+  ''' Streams a worksheet and returns the list of (reference, contents) of its cells.
+  formulaDict caches the translated formulas across the worksheets.'''
+  cells = []
+  for event, elem in iterparse(theSheetFile):
+    name = localName(elem.tag)
+    if name == 'row':
+      # the cells of the row have been handled, free their memory
+      elem.clear()
+      continue
+    if name != 'c':
+      continue
+
+    ref = elem.get('r')
+    cellType = elem.get('t', 'n')   # FIXME: some cells don't have t and s attributes
+    theFormula = None
+    theValue = None
+    theString = None
+    for child in elem:
+      childName = localName(child.tag)
+      if childName == 'f':
+        theFormula = child.text
+      elif childName == 'v':
+        theValue = child.text
+      elif childName == 'is':
+        theString = ''.join([t.text or '' for t in child.iter() if localName(t.tag) == 't'])
+
+    if theString is not None and cellType == 'inlineStr':
+      cells.append((ref, toStr(theString)))
+
+    if theFormula:
+      if theFormula not in formulaDict:
+        formulaDict[theFormula] = FormulaTranslator().translateForm(toStr(theFormula))
+      cells.append((ref, formulaDict[theFormula]))
+    elif theValue is not None:
+      # also the cached value of a shared formula, which has no formula text
+      if cellType == 'n':
+        cells.append((ref, theValue))
+      if cellType == 's':
+        cells.append((ref, sList[int(theValue)]))
+  return cells
+
+
+def importWorkBook(z, theDoc):
+  ''' Imports the worksheets of the opened XLSX zipfile z into theDoc.
+  Returns the dict of sheet name: (Spreadsheet::Sheet, sheet file).'''
+  startTime = time.time()
+  names = z.namelist()
+
+  theRelsFile = None
+  if 'xl/_rels/workbook.xml.rels' in names:
+    theRelsFile = z.open('xl/_rels/workbook.xml.rels')
+  sheets, aliases = readWorkBook(z.open('xl/workbook.xml'), theRelsFile)
 
-    if cellType == 'inlineStr':
-      iStringList = cell.getElementsByTagName("is")
-      #print('iString: ', iStringList)
-      for stringEle in iStringList:
-        tElement = stringEle.getElementsByTagName('t')[0]
-        theString = getText(tElement.childNodes)
+  sheetDict = dict()
+  for sheetName, sheetFile in sheets:
+    # add FreeCAD-spreadsheet
+    sheetDict[sheetName] = (theDoc.addObject('Spreadsheet::Sheet', sheetName), sheetFile)
 
-        #print('theString: ', theString)
-        actCellSheet.set(ref, theString)
+  for aliasName, aliasRef in aliases:
+    if '$' in aliasRef and ':' not in aliasRef:
+      refList = aliasRef.split('!$')
+      adressList = refList[1].split('$')
+      sheetName = refList[0]
+      if sheetName.startswith("'") and sheetName.endswith("'"):
+        sheetName = sheetName[1:-1].replace("''", "'")
+      if sheetName in sheetDict:
+        actSheet, sheetFile = sheetDict[sheetName]
+        actSheet.setAlias(adressList[0]+adressList[1], aliasName)
 
-    formulaRef = cell.getElementsByTagName("f")
-    if len(formulaRef)==1:
-      theFormula = getText(formulaRef[0].childNodes)
-      #print("theFormula: ", theFormula)
-      fTrans = FormulaTranslator()
-      actCellSheet.set(ref, fTrans.translateForm(theFormula))
+  stringList = []
+  if 'xl/sharedStrings.xml' in names:
+    stringList = readStrings(z.open('xl/sharedStrings.xml'))
 
-    else:
-      valueRef = cell.getElementsByTagName("v")
-      #print('valueRef: ', valueRef)
-      if len(valueRef)==1:
-        valueRef = cell.getElementsByTagName("v")[0]
-        if valueRef:
-          theValue = getText(valueRef.childNodes)
-          #print("theValue: ", theValue)
-          if cellType == 'n':
-            actCellSheet.set(ref, theValue)
-          if cellType == 's':
-            actCellSheet.set(ref, (sList[int(theValue)]))
-
-
-def handleWorkBook(theBook, sheetDict, Doc):
-  theSheets = theBook.getElementsByTagName("sheet")
-  #print("theSheets: ", theSheets)
-  for sheet in theSheets:
-    sheetAtts = sheet.attributes
-    nameRef = sheetAtts.getNamedItem("name")
-    sheetName = getText(nameRef.childNodes)
-    #print("table name: ", sheetName)
-    idRef = sheetAtts.getNamedItem("sheetId")
-    sheetFile = "sheet" + getText(idRef.childNodes) + '.xml'
-    #print("sheetFile: ", sheetFile)
-    # add FreeCAD-spreadsheet
-    sheetDict[sheetName] = (Doc.addObject('Spreadsheet::Sheet', sheetName), sheetFile)
+  cellCount = 0
+  formulaDict = dict()
+  for sheetName, sheetFile in sheets:
+    theSheet = sheetDict[sheetName][0]
+    cells = readWorkSheet(z.open('xl/worksheets/' + sheetFile), stringList, formulaDict)
+    theSheet.setCells(cells)
+    cellCount += len(cells)
 
-  theAliases = theBook.getElementsByTagName("definedName")
-  for theAlias in theAliases:
-    aliAtts = theAlias.attributes
-    nameRef = aliAtts.getNamedItem("name")
-    aliasName = getText(nameRef.childNodes)
-    #print("aliasName: ", aliasName)
+  App.Console.PrintLog("importXLSX: {} cells of {} sheets read in {:.2f} s\n".format(
+      cellCount, len(sheets), time.time() - startTime))
+  return sheetDict
 
-    aliasRef = getText(theAlias.childNodes)
-    if '$' in aliasRef:
-      refList = aliasRef.split('!$')
-      adressList = refList[1].split('$')
-      #print("aliasRef: ", aliasRef)
-      #print('Sheet Name: ', refList[0])
-      #print('Adress: ', adressList[0] + adressList[1])
-      actSheet, sheetFile = sheetDict[refList[0]]
-      actSheet.setAlias(adressList[0]+adressList[1], aliasName)
-
-def handleStrings(theStr, sList):
-  print('process Strings: ')
-  stringElements = theStr.getElementsByTagName('t')
-  for sElem in stringElements:
-    print('string: ', getText(sElem.childNodes))
-    sList.append(getText(sElem.childNodes))
 
 def open(nameXLSX):
 
@@ -421,29 +482,7 @@ def open(nameXLSX):
     z=zipfile.ZipFile(nameXLSX)
 
     theDoc = App.newDocument()
-
-    sheetDict = dict()
-    stringList = []
-
-    theBookFile=z.open('xl/workbook.xml')
-    theBook = xml.dom.minidom.parse(theBookFile)
-    handleWorkBook(theBook, sheetDict, theDoc)
-    theBook.unlink()
-
-    if 'xl/sharedStrings.xml' in z.namelist():
-      theStringFile=z.open('xl/sharedStrings.xml')
-      theStrings = xml.dom.minidom.parse(theStringFile)
-      handleStrings(theStrings, stringList)
-      theStrings.unlink()
-
-    for sheetSpec in sheetDict:
-      #print("sheetSpec: ", sheetSpec)
-      theSheet, sheetFile = sheetDict[sheetSpec]
-      f=z.open('xl/worksheets/' + sheetFile)
-      myDom = xml.dom.minidom.parse(f)
-
-      handleWorkSheet(myDom, theSheet, stringList)
-      myDom.unlink()
+    importWorkBook(z, theDoc)
 
     z.close()
     # This is needed more than once, otherwise some references are not calculated!
@@ -459,34 +498,11 @@ def insert(nameXLSX,docname):
           theDoc=App.newDocument(docname)
   App.ActiveDocument = theDoc
 
-  sheetDict = dict()
-  stringList = []
-
   z=zipfile.ZipFile(nameXLSX)
-  theBookFile=z.open('xl/workbook.xml')
-  theBook = xml.dom.minidom.parse(theBookFile)
-  handleWorkBook(theBook, sheetDict, theDoc)
-  theBook.unlink()
-
-  if 'xl/sharedStrings.xml' in z.namelist():
-    theStringFile=z.open('xl/sharedStrings.xml')
-    theStrings = xml.dom.minidom.parse(theStringFile)
-    handleStrings(theStrings, stringList)
-    theStrings.unlink()
-
-  for sheetSpec in sheetDict:
-    #print("sheetSpec: ", sheetSpec)
-    theSheet, sheetFile = sheetDict[sheetSpec]
-    f=z.open('xl/worksheets/' + sheetFile)
-    myDom = xml.dom.minidom.parse(f)
-
-    handleWorkSheet(myDom, theSheet, stringList)
-    myDom.unlink()
+  importWorkBook(z, theDoc)
 
   z.close()
   # This is needed more than once, otherwise some references are not calculated!
   theDoc.recompute()
   theDoc.recompute()
   theDoc.recompute()
-
-
@@ -89,6 +89,10 @@ void StartGui::Workbench::loadStartPage()
         str << "class WebPage(object):" << std::endl;
         str << "    def __init__(self):" << std::endl;
         str << "        self.browser=WebGui.openBrowserWindow(u\"" << escapedstr.c_str() << "\")" << std::endl;
+        str << "        self.refresh()" << std::endl;
+        // rebuild the page once the file thumbnails have been loaded in the background
+        str << "        StartPage.setRefreshCallback(self.refresh)" << std::endl;
+        str << "    def refresh(self):" << std::endl;
 #if defined(FC_OS_WIN32)
         str << "        self.browser.setHtml(StartPage.handle(), App.getResourceDir() + 'Mod/Start/StartPage/')" << std::endl;
 #else
@@ -96,11 +100,7 @@ void StartGui::Workbench::loadStartPage()
 #endif
         str << "    def onChange(self, par, reason):" << std::endl;
         str << "        if reason == 'RecentFiles':" << std::endl;
-#if defined(FC_OS_WIN32)
-        str << "            self.browser.setHtml(StartPage.handle(), App.getResourceDir() + 'Mod/Start/StartPage/')" << std::endl;
-#else
-        str << "            self.browser.setHtml(StartPage.handle(), 'file://' + App.getResourceDir() + 'Mod/Start/StartPage/')" << std::endl;
-#endif
+        str << "            self.refresh()" << std::endl;
         str << std::endl;
         str << "class WebView(object):" << std::endl;
         str << "    def __init__(self):" << std::endl;
@@ -25,7 +25,7 @@
 # the html code of the start page. It is built only once per FreeCAD session for now...
 
 import six
-import sys,os,FreeCAD,FreeCADGui,tempfile,time,zipfile,re
+import sys,os,FreeCAD,FreeCADGui,tempfile,time,zipfile,re,json,hashlib,threading
 from . import TranslationTexts
 from PySide import QtCore,QtGui
 
@@ -36,6 +36,11 @@ iconprovider = QtGui.QFileIconProvider()
 iconbank = {} # to store already created icons so we don't overpollute the temp dir
 tempfolder = None # store icons inside a subfolder in temp dir
 defaulticon = None # store a default icon for problematic file types
+infocache = None # persistent cache of the information read from FCStd files
+loader = None # reads FCStd files in the background
+firstpaint = True # the custom folders are only partially rendered until the loader has run
+extensions = None # file types openable by FreeCAD
+gnomethumbnails = None # gnome thumbnail libs, if available
 
 
 def encode(text):
@@ -63,11 +68,14 @@ def isOpenableByFreeCAD(filename):
 
     "check if FreeCAD can handle this file type"
 
+    global extensions
+
     if os.path.isdir(filename):
         return False
     if os.path.basename(filename)[0] == ".":
         return False
-    extensions = [key.lower() for key in FreeCAD.getImportType().keys()]
+    if extensions is None:
+        extensions = [key.lower() for key in FreeCAD.getImportType().keys()]
     ext = os.path.splitext(filename)[1].lower()
     if ext:
         if ext[0] == ".":
@@ -78,6 +86,252 @@ def isOpenableByFreeCAD(filename):
 
 
 
+class FileInfoCache:
+
+    """Persistent cache of the information and thumbnails stored in FCStd files.
+    Entries are keyed by path and are valid as long as the size and the
+    modification time of the file are unchanged."""
+
+    def __init__(self,folder=None):
+
+        if not folder:
+            folder = os.path.join(FreeCAD.getUserAppDataDir(),"StartPage")
+        self.folder = folder
+        self.indexfile = os.path.join(folder,"FileInfoCache.json")
+        self.lock = threading.Lock()
+        self.modified = False
+        self.entries = {}
+        if os.path.exists(self.indexfile):
+            try:
+                with open(self.indexfile,"r") as f:
+                    self.entries = json.load(f)
+            except Exception:
+                FreeCAD.Console.PrintWarning("Cannot read the Start page cache: "+self.indexfile+"\n")
+
+    def get(self,filename,s):
+
+        "returns the cached entry of a file with the given os.stat result, or None"
+
+        with self.lock:
+            entry = self.entries.get(filename)
+        if entry and (entry["size"] == s.st_size) and (entry["mtime"] == s.st_mtime):
+            if (not entry["image"]) or os.path.exists(entry["image"]):
+                return entry
+        return None
+
+    def read(self,filename):
+
+        """reads the information and thumbnail of a FCStd file, stores it in the cache and returns the entry.
+        Files that can't be read get an entry with valid set to False, so they are not read again
+        until they change"""
+
+        try:
+            s = os.stat(filename)
+        except OSError:
+            return None
+        entry = {"size":s.st_size,"mtime":s.st_mtime,"valid":True,"author":"","company":"","license":"","descr":"","image":""}
+        try:
+            zfile=zipfile.ZipFile(filename)
+            try:
+                self.readZip(filename,s,zfile,entry)
+            finally:
+                zfile.close()
+        except Exception as e:
+            print("Cannot read file: ",filename,e)
+            entry = self.invalidEntry(s)
+        self.store(filename,entry)
+        return entry
+
+    def readZip(self,filename,s,zfile,entry):
+
+        "fills the entry with the information and thumbnail of an opened FCStd file"
+
+        files=zfile.namelist()
+        # check for meta-file if it's really a FreeCAD document
+        if files and files[0] == "Document.xml":
+            doc = str(zfile.read(files[0]))
+            doc = doc.replace("\n"," ")
+            r = re.findall("Property name=\"CreatedBy.*?String value=\"(.*?)\"/>",doc)
+            if r:
+                author = r[0]
+                # remove email if present in author field
+                if "&lt;" in author:
+                    author = author.split("&lt;")[0].strip()
+                entry["author"] = author
+            r = re.findall("Property name=\"Company.*?String value=\"(.*?)\"/>",doc)
+            if r:
+                entry["company"] = r[0]
+            r = re.findall("Property name=\"License.*?String value=\"(.*?)\"/>",doc)
+            if r:
+                entry["license"] = r[0]
+            r = re.findall("Property name=\"Comment.*?String value=\"(.*?)\"/>",doc)
+            if r:
+                entry["descr"] = r[0]
+            if "thumbnails/Thumbnail.png" in files:
+                data = zfile.read("thumbnails/Thumbnail.png")
+                # the name changes with the file, so the browser doesn't show an outdated image
+                key = "%s|%d|%f" % (filename,s.st_size,s.st_mtime)
+                image = os.path.join(self.folder,hashlib.md5(key.encode("utf8")).hexdigest()+".png")
+                try:
+                    if not os.path.isdir(self.folder):
+                        os.makedirs(self.folder)
+                    with open(image,"wb") as thumb:
+                        thumb.write(data)
+                except OSError:
+                    # the file is fine, it is shown without its thumbnail
+                    FreeCAD.Console.PrintWarning("Cannot write the Start page thumbnail: "+image+"\n")
+                else:
+                    entry["image"] = image
+
+    def invalidEntry(self,s):
+
+        "returns the entry of a file that can't be read, with the given os.stat result"
+
+        return {"size":s.st_size,"mtime":s.st_mtime,"valid":False,"author":"","company":"","license":"","descr":"","image":""}
+
+    def store(self,filename,entry):
+
+        "stores the entry of a file, and removes the thumbnail of its previous entry"
+
+        with self.lock:
+            old = self.entries.get(filename)
+            self.entries[filename] = entry
+            self.modified = True
+        if old and old["image"] and (old["image"] != entry["image"]) and os.path.exists(old["image"]):
+            os.remove(old["image"])
+
+    def save(self):
+
+        "writes the cache index to disk if it has changed"
+
+        with self.lock:
+            if not self.modified:
+                return
+            entries = dict(self.entries)
+            self.modified = False
+        try:
+            if not os.path.isdir(self.folder):
+                os.makedirs(self.folder)
+            with open(self.indexfile,"w") as f:
+                json.dump(entries,f)
+        except Exception:
+            FreeCAD.Console.PrintWarning("Cannot write the Start page cache: "+self.indexfile+"\n")
+
+
+
+class InfoLoader(QtCore.QObject):
+
+    """Reads FCStd files into the file information cache in a background thread.
+    The refresh callback is run in the GUI thread once the queue is empty."""
+
+    finished = QtCore.Signal()
+
+    def __init__(self):
+
+        QtCore.QObject.__init__(self)
+        self.lock = threading.Lock()
+        self.queue = []
+        self.failed = set() # (filename,mtime,size) of files that couldn't be read
+        self.thread = None
+        self.callback = None
+        self.finished.connect(self.onFinished)
+
+    def add(self,filename):
+
+        "queues a file to be read, unless it couldn't be read before and is unchanged"
+
+        try:
+            s = os.stat(filename)
+        except OSError:
+            return
+        with self.lock:
+            if (filename,s.st_mtime,s.st_size) in self.failed:
+                return
+            if not filename in self.queue:
+                self.queue.append(filename)
+
+    def start(self):
+
+        "starts the background thread if it is not already running"
+
+        with self.lock:
+            if self.thread:
+                return
+            self.thread = threading.Thread(target=self.run)
+            self.thread.daemon = True
+        self.thread.start()
+
+    def run(self):
+
+        while True:
+            with self.lock:
+                if not self.queue:
+                    self.thread = None
+                    break
+                filename = self.queue.pop(0)
+            entry = None
+            try:
+                entry = getInfoCache().read(filename)
+            except Exception as e:
+                print("Cannot read file: ",filename,e)
+            if (entry is None) or (not entry["valid"]):
+                try:
+                    s = os.stat(filename)
+                except OSError:
+                    continue
+                with self.lock:
+                    self.failed.add((filename,s.st_mtime,s.st_size))
+                if entry is None:
+                    getInfoCache().store(filename,getInfoCache().invalidEntry(s))
+        getInfoCache().save()
+        self.finished.emit()
+
+    def onFinished(self):
+
+        global firstpaint
+
+        firstpaint = False
+        if self.callback:
+            try:
+                self.callback()
+            except Exception:
+                # the start page has been closed
+                self.callback = None
+
+
+
+def getInfoCache():
+
+    "returns the file information cache"
+
+    global infocache
+
+    if infocache is None:
+        infocache = FileInfoCache()
+    return infocache
+
+
+
+def getLoader():
+
+    "returns the background loader of file information"
+
+    global loader
+
+    if loader is None:
+        loader = InfoLoader()
+    return loader
+
+
+
+def setRefreshCallback(callback):
+
+    "sets a function to be called to rebuild the page when the file information has been loaded"
+
+    getLoader().callback = callback
+
+
+
 def getInfo(filename):
 
     "returns available file information"
@@ -102,19 +356,25 @@ def getInfo(filename):
 
     def getFreeDesktopThumbnail(filename):
         "if we have gnome libs available, try to find a system-generated thumbnail"
+        global gnomethumbnails
         path = os.path.abspath(filename)
         thumb = None
-        try:
-            import gnome.ui
-            import gnomevfs
-        except Exception:
+        if gnomethumbnails is None:
+            try:
+                import gnome.ui
+                import gnomevfs
+            except Exception:
+                gnomethumbnails = False
+            else:
+                gnomethumbnails = (gnome.ui,gnomevfs)
+        if not gnomethumbnails:
             # alternative method
             import hashlib
             fhash = hashlib.md5(("file://"+path).encode("utf8")).hexdigest()
             thumb = os.path.join(os.path.expanduser("~"),".thumbnails","normal",fhash+".png")
         else:
-            uri = gnomevfs.get_uri_from_local_path(path)
-            thumb = gnome.ui.thumbnail_path_for_uri(uri, "normal")
+            uri = gnomethumbnails[1].get_uri_from_local_path(path)
+            thumb = gnomethumbnails[0].thumbnail_path_for_uri(uri, "normal")
         if thumb and os.path.exists(thumb):
             return thumb
         return None
@@ -138,41 +398,21 @@ def getInfo(filename):
 
         # get additional info from fcstd files
         if filename.lower().endswith(".fcstd"):
-            try:
-                zfile=zipfile.ZipFile(filename)
-            except Exception:
-                print("Cannot read file: ",filename)
+            entry = getInfoCache().get(filename,s)
+            if entry is None:
+                # not in the cache yet: the card shows the default icon until the file has been read
+                getLoader().add(filename)
+            elif not entry["valid"]:
                 return None
-            files=zfile.namelist()
-            # check for meta-file if it's really a FreeCAD document
-            if files[0] == "Document.xml":
-                doc = str(zfile.read(files[0]))
-                doc = doc.replace("\n"," ")
-                r = re.findall("Property name=\"CreatedBy.*?String value=\"(.*?)\"/>",doc)
-                if r:
-                    author = r[0]
-                    # remove email if present in author field
-                    if "&lt;" in author:
-                        author = author.split("&lt;")[0].strip()
-                r = re.findall("Property name=\"Company.*?String value=\"(.*?)\"/>",doc)
-                if r:
-                    company = r[0]
-                r = re.findall("Property name=\"License.*?String value=\"(.*?)\"/>",doc)
-                if r:
-                    lic = r[0]
-                r = re.findall("Property name=\"Comment.*?String value=\"(.*?)\"/>",doc)
-                if r:
-                    descr = r[0]
-                if "thumbnails/Thumbnail.png" in files:
-                    if filename in iconbank:
-                        image = iconbank[filename]
-                    else:
-                        imagedata=zfile.read("thumbnails/Thumbnail.png")
-                        image = tempfile.mkstemp(dir=tempfolder,suffix='.png')[1]
-                        thumb = open(image,"wb")
-                        thumb.write(imagedata)
-                        thumb.close()
-                        iconbank[filename] = image
+            else:
+                author = entry["author"]
+                if entry["company"]:
+                    company = entry["company"]
+                if entry["license"]:
+                    lic = entry["license"]
+                descr = entry["descr"]
+                if entry["image"]:
+                    image = entry["image"]
 
         # use image itself as icon if it's an image file
         if os.path.splitext(filename)[1].lower() in [".jpg",".jpeg",".png",".svg"]:
@@ -265,7 +505,7 @@ def handle():
 
     "builds the HTML code of the start page"
 
-    global iconbank,tempfolder
+    global iconbank,tempfolder,extensions
 
     # reuse stuff from previous runs to reduce temp dir clutter
 
@@ -276,6 +516,7 @@ def handle():
         tempfolder = Start.tempfolder
     else:
         tempfolder = tempfile.mkdtemp(prefix="FreeCADStartThumbnails")
+    extensions = None
 
     # build the html page skeleton
 
@@ -410,6 +651,11 @@ def handle():
 
     SECTION_CUSTOM = encode("")
     cfolders = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Start").GetString("ShowCustomFolder","")
+    # the number of files rendered per custom folder until the background loader has run, 0 for no limit
+    limit = 0
+    truncated = False
+    if firstpaint:
+        limit = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/Mod/Start").GetInt("ShowCustomFolderLimit",100)
     if cfolders:
         dn = 0
         for cfolder in cfolders.split(";;"): # allow several paths separated by ;;
@@ -420,15 +666,30 @@ def handle():
             else:
                 SECTION_CUSTOM += encode("<h2>"+os.path.basename(os.path.normpath(cfolder))+"</h2>")
                 SECTION_CUSTOM += "<ul>"
+                count = 0
                 for basename in os.listdir(cfolder):
                     filename = os.path.join(cfolder,basename)
-                    SECTION_CUSTOM += encode(buildCard(filename,method="LoadCustom.py?filename="+str(dn)+"_"))
+                    if limit and (count >= limit):
+                        # rendered once the loader has run, meanwhile only read the FCStd files
+                        truncated = True
+                        if filename.lower().endswith(".fcstd") and os.path.isfile(filename) and not getInfoCache().get(filename,os.stat(filename)):
+                            getLoader().add(filename)
+                        continue
+                    card = buildCard(filename,method="LoadCustom.py?filename="+str(dn)+"_")
+                    if card:
+                        count += 1
+                        SECTION_CUSTOM += encode(card)
                 SECTION_CUSTOM += "</ul>"
                 # hide the custom section tooltip if custom section is set (users know about it if they enabled it)
                 HTML = HTML.replace("id=\"customtip\"","id=\"customtip\" style=\"display:none;\"")
                 dn += 1
     HTML = HTML.replace("SECTION_CUSTOM",SECTION_CUSTOM)
 
+    # read the uncached files in the background, the page is rebuilt when done
+
+    if truncated or getLoader().queue:
+        getLoader().start()
+
     # build IMAGE_SRC paths
 
     HTML = HTML.replace("IMAGE_SRC_USERHUB",'file:///'+os.path.join(resources_dir, 'images/userhub.png').replace('\\','/'))
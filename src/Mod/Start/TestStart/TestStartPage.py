@@ -147,6 +147,50 @@ class TestStartPage(unittest.TestCase):
         elif infoCount > 0:
             FreeCAD.Console.PrintWarning("The Start page is valid HTML, but the W3C sent back {} informative messages:\n{}.".format(infoCount,validationResultString))
 
+    def test_file_info_cache(self):
+        """Check that the information read from a FCStd file is cached until the file changes."""
+        import os
+        import tempfile
+        import time
+        import zipfile
+        folder = tempfile.mkdtemp()
+        filename = os.path.join(folder, "test.FCStd")
+        with zipfile.ZipFile(filename, "w") as zfile:
+            zfile.writestr("Document.xml", '<Property name="CreatedBy" type="App::PropertyString"><String value="Tester"/></Property>')
+            zfile.writestr("thumbnails/Thumbnail.png", b"PNG")
+
+        cache = StartPage.FileInfoCache(os.path.join(folder, "cache"))
+        self.assertIsNone(cache.get(filename, os.stat(filename)))
+        entry = cache.read(filename)
+        self.assertEqual(entry["author"], "Tester")
+        self.assertTrue(os.path.exists(entry["image"]))
+        cache.save()
+
+        cache = StartPage.FileInfoCache(os.path.join(folder, "cache"))
+        self.assertEqual(cache.get(filename, os.stat(filename)), entry)
+        os.utime(filename, (time.time() + 10, time.time() + 10))
+        self.assertIsNone(cache.get(filename, os.stat(filename)))
+
+    def test_file_info_cache_broken_file(self):
+        """Check that a file that can't be read is cached as invalid and not queued again."""
+        import os
+        import tempfile
+        folder = tempfile.mkdtemp()
+        filename = os.path.join(folder, "broken.FCStd")
+        with open(filename, "wb") as f:
+            f.write(b"not a zip file")
+
+        cache = StartPage.FileInfoCache(os.path.join(folder, "cache"))
+        entry = cache.read(filename)
+        self.assertFalse(entry["valid"])
+        self.assertEqual(cache.get(filename, os.stat(filename)), entry)
+
+        loader = StartPage.InfoLoader()
+        loader.failed.add((filename, os.stat(filename).st_mtime, os.stat(filename).st_size))
+        loader.add(filename)
+        self.assertEqual(loader.queue, [])
+
+
     def sanitize (self, html):
 
         # Anonymize all local filenames